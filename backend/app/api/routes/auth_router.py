@@ -11,6 +11,7 @@ import logging
 
 from app.database import get_db
 from app.services import AuthorInfoService, LoginLogService
+from app.utils.db_offload import offload
 from app.utils.dependencies import get_current_user
 from app.schemas.auth_schemas import (
     AuthorInfoResponse, AuthorInfoCreate, AuthorInfoUpdate,
@@ -55,18 +56,18 @@ async def login_user(
     elif "x-real-ip" in request.headers:
         client_ip = request.headers["x-real-ip"]
     
-    login_log_service = LoginLogService()
+    login_log_service = offload(LoginLogService())
     
     try:
         # 사용자 인증 및 JWT 토큰 생성
-        auth_service = AuthorInfoService()
-        auth_result = auth_service.authenticate_and_create_tokens(
+        auth_service = offload(AuthorInfoService())
+        auth_result = await auth_service.authenticate_and_create_tokens(
             db, login_data.user_id, login_data.password
         )
         
         if not auth_result:
             # 로그인 실패 로그 기록
-            login_log_service.create_login_log(
+            await login_log_service.create_login_log(
                 db=db,
                 user_id=login_data.user_id,
                 ip_address=client_ip,
@@ -80,7 +81,7 @@ async def login_user(
         
         # 로그인 성공 로그 기록
         try:
-            login_log_service.create_login_log(
+            await login_log_service.create_login_log(
                 db=db,
                 user_id=login_data.user_id,
                 ip_address=client_ip,
@@ -105,7 +106,7 @@ async def login_user(
     except Exception as e:
         # 로그인 오류 로그 기록
         try:
-            login_log_service.create_login_log(
+            await login_log_service.create_login_log(
                 db=db,
                 user_id=login_data.user_id,
                 ip_address=client_ip,
@@ -133,8 +134,8 @@ async def refresh_token(
     """
     try:
         # 리프레시 토큰을 사용하여 새로운 액세스 토큰 생성
-        auth_service = AuthorInfoService()
-        token_result = auth_service.refresh_access_token(db, token_request.refresh_token)
+        auth_service = offload(AuthorInfoService())
+        token_result = await auth_service.refresh_access_token(db, token_request.refresh_token)
         
         if not token_result:
             raise HTTPException(
@@ -170,8 +171,8 @@ async def get_current_user_info(
     JWT 토큰을 통해 인증된 사용자의 상세 정보를 반환합니다.
     """
     try:
-        auth_service = AuthorInfoService()
-        user_info = auth_service.get_by_user_id(db, current_user["user_id"])
+        auth_service = offload(AuthorInfoService())
+        user_info = await auth_service.get_by_user_id(db, current_user["user_id"])
         
         if not user_info:
             raise HTTPException(
@@ -437,8 +438,8 @@ async def change_password(
     - **new_password**: 새 비밀번호
     """
     try:
-        author_info_service = AuthorInfoService()
-        success = author_info_service.update_password(
+        author_info_service = offload(AuthorInfoService())
+        success = await author_info_service.update_password(
             db=db,
             user_id=user_id,
             current_password=current_password,
@@ -474,8 +475,8 @@ async def get_user_permissions(
     - **user_id**: 사용자 ID
     """
     try:
-        author_info_service = AuthorInfoService()
-        permissions = author_info_service.get_user_permissions(db=db, user_id=user_id)
+        author_info_service = offload(AuthorInfoService())
+        permissions = await author_info_service.get_user_permissions(db=db, user_id=user_id)
         
         return UserPermissionResponse(
             user_id=user_id,
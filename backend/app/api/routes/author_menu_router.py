@@ -14,6 +14,7 @@ from app.schemas.auth_schemas import (
     AuthorMenuPagination
 )
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.db_offload import offload
 
 # 권한 메뉴 라우터
 author_menu_router = APIRouter(
@@ -43,8 +44,8 @@ async def get_author_menus(
     - **menu_id**: 메뉴 ID로 필터링
     """
     try:
-        author_menu_service = AuthorMenuService()
-        author_menus = author_menu_service.get_multi(
+        author_menu_service = offload(AuthorMenuService())
+        author_menus = await author_menu_service.get_multi(
             db=db,
             skip=skip,
             limit=limit
@@ -61,7 +62,7 @@ async def get_author_menus(
                 filtered_menus.append(menu)
             author_menus = filtered_menus
         
-        total_count = author_menu_service.count(db=db)
+        total_count = await author_menu_service.count(db=db)
         
         return AuthorMenuPagination(
             items=author_menus,
@@ -89,8 +90,8 @@ async def get_menus_by_author(
     - **author_code**: 권한 코드
     """
     try:
-        author_menu_service = AuthorMenuService()
-        menus = author_menu_service.get_by_author_code(db=db, author_code=author_code)
+        author_menu_service = offload(AuthorMenuService())
+        menus = await author_menu_service.get_by_author_code(db=db, author_code=author_code)
         return menus
         
     except Exception as e:
@@ -112,8 +113,8 @@ async def get_authors_by_menu(
     - **menu_id**: 메뉴 ID
     """
     try:
-        author_menu_service = AuthorMenuService()
-        authors = author_menu_service.get_by_menu_id(db=db, menu_id=menu_id)
+        author_menu_service = offload(AuthorMenuService())
+        authors = await author_menu_service.get_by_menu_id(db=db, menu_id=menu_id)
         return authors
         
     except Exception as e:
@@ -140,9 +141,9 @@ async def create_author_menu(
     - **delete_at**: 삭제 권한 (Y/N)
     """
     try:
-        author_menu_service = AuthorMenuService()
+        author_menu_service = offload(AuthorMenuService())
         # 중복 확인
-        existing_menu = author_menu_service.check_permission(
+        existing_menu = await author_menu_service.check_permission(
             db=db,
             author_code=author_menu_data.author_code,
             menu_id=author_menu_data.menu_id
@@ -154,7 +155,7 @@ async def create_author_menu(
                 detail=f"이미 존재하는 권한 메뉴입니다: {author_menu_data.author_code}-{author_menu_data.menu_id}"
             )
         
-        author_menu = author_menu_service.create(db=db, obj_in=author_menu_data)
+        author_menu = await author_menu_service.create(db=db, obj_in=author_menu_data)
         return author_menu
         
     except HTTPException:
@@ -182,16 +183,16 @@ async def manage_permission(
     - **grant**: True면 권한 부여, False면 권한 취소
     """
     try:
-        author_menu_service = AuthorMenuService()
+        author_menu_service = offload(AuthorMenuService())
         if grant:
-            success = author_menu_service.grant_permission(
+            success = await author_menu_service.grant_permission(
                 db=db,
                 author_code=author_code,
                 menu_id=menu_id
             )
             message = "권한이 부여되었습니다"
         else:
-            success = author_menu_service.revoke_permission(
+            success = await author_menu_service.revoke_permission(
                 db=db,
                 author_code=author_code,
                 menu_id=menu_id
@@ -229,8 +230,8 @@ async def delete_author_menu(
     - **menu_id**: 메뉴 ID
     """
     try:
-        author_menu_service = AuthorMenuService()
-        author_menu = author_menu_service.check_permission(
+        author_menu_service = offload(AuthorMenuService())
+        author_menu = await author_menu_service.check_permission(
             db=db,
             author_code=author_code,
             menu_id=menu_id
@@ -242,7 +243,7 @@ async def delete_author_menu(
                 detail=f"권한 메뉴를 찾을 수 없습니다: {author_code}-{menu_id}"
             )
         
-        author_menu_service.remove(db=db, id=author_menu.author_code)
+        await author_menu_service.remove(db=db, id=author_menu.author_code)
         
         return {"message": f"권한 메뉴가 삭제되었습니다: {author_code}-{menu_id}"}
         
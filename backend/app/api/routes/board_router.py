@@ -5,14 +5,18 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 import json
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.services import BbsMasterService, BbsService, CommentService
 from app.services.file_service import FileService, FileDetailService
 from app.utils.dependencies import get_current_user
+from app.utils.cursor import InvalidCursorError
+from app.utils.page_total import TOTAL_STRATEGY_PATTERN
+from app.utils.db_offload import offload
 from app.schemas.board_schemas import (
     BbsMasterResponse, BbsMasterCreate, BbsMasterUpdate,
     BbsResponse, BbsCreate, BbsUpdate,
@@ -44,11 +48,11 @@ comment_router = APIRouter(
 )
 
 # 서비스 인스턴스는 각 함수에서 생성
-bbs_master_service = BbsMasterService()
-bbs_service = BbsService()
-comment_service = CommentService()
-file_service = FileService()
-file_detail_service = FileDetailService()
+bbs_master_service = offload(BbsMasterService())
+bbs_service = offload(BbsService())
+comment_service = offload(CommentService())
+file_service = offload(FileService())
+file_detail_service = offload(FileDetailService())
 
 
 # ==================== 게시판 마스터 API ====================
@@ -71,8 +75,8 @@ async def get_bbs_masters(
     - **use_at**: 사용 여부로 필터링
     """
     try:
-        bbs_master_service = BbsMasterService()
-        bbs_masters = bbs_master_service.search_boards(
+        bbs_master_service = offload(BbsMasterService())
+        bbs_masters = await bbs_master_service.search_boards(
             db=db,
             search_term=search,
             use_at=use_at,
@@ -80,7 +84,7 @@ async def get_bbs_masters(
             limit=limit
         )
         
-        total_count = bbs_master_service.count(db=db)
+        total_count = await bbs_master_service.count(db=db)
         
         return BbsMasterPagination(
             items=bbs_masters,
@@ -99,14 +103,14 @@ async def get_bbs_masters(
 @bbs_master_router.get("/active", response_model=List[BbsMasterResponse], summary="활성 게시판 목록 조회")
 async def get_active_bbs_masters(
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     활성화된 게시판 마스터 목록을 조회합니다.
     """
     try:
         bbs_master_service = BbsMasterService()
-        active_boards = bbs_master_service.get_active_boards(db=db)
+        active_boards = await bbs_master_service.get_active_boards_async(db=db)
         return active_boards
         
     except Exception as e:
@@ -120,7 +124,7 @@ async def get_active_bbs_masters(
 async def get_bbs_master(
     bbs_id: str,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 게시판 마스터의 상세 정보를 조회합니다.
@@ -129,7 +133,7 @@ async def get_bbs_master(
     """
     try:
         bbs_master_service = BbsMasterService()
-        bbs_master = bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_id)
+        bbs_master = await bbs_master_service.get_by_bbs_id_async(db=db, bbs_id=bbs_id)
         
         if not bbs_master:
             raise HTTPException(
@@ -164,15 +168,15 @@ async def create_bbs_master(
     """
     try:
         # 중복 확인
-        bbs_master_service = BbsMasterService()
-        existing_board = bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_master_data.bbs_id)
+        bbs_master_service = offload(BbsMasterService())
+        existing_board = await bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_master_data.bbs_id)
         if existing_board:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"이미 존재하는 게시판 ID입니다: {bbs_master_data.bbs_id}"
             )
         
-        bbs_master = bbs_master_service.create(db=db, obj_in=bbs_master_data)
+        bbs_master = await bbs_master_service.create(db=db, obj_in=bbs_master_data)
         return bbs_master
         
     except HTTPException:
@@ -197,15 +201,15 @@ async def update_bbs_master(
     - **bbs_id**: 수정할 게시판 ID
     """
     try:
-        bbs_master_service = BbsMasterService()
-        bbs_master = bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_id)
+        bbs_master_service = offload(BbsMasterService())
+        bbs_master = await bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_id)
         if not bbs_master:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"게시판을 찾을 수 없습니다: {bbs_id}"
             )
         
-        updated_bbs_master = bbs_master_service.update(
+        updated_bbs_master = await bbs_master_service.update(
             db=db,
             db_obj=bbs_master,
             obj_in=bbs_master_data
@@ -234,8 +238,8 @@ async def delete_bbs_master(
     - **bbs_id**: 삭제할 게시판 ID
     """
     try:
-        bbs_master_service = BbsMasterService()
-        bbs_master = bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_id)
+        bbs_master_service = offload(BbsMasterService())
+        bbs_master = await bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_id)
         if not bbs_master:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -268,52 +272,58 @@ async def delete_bbs_master(
 async def get_posts(
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 최대 레코드 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정하면 skip 무시)"),
+    total_mode: str = Query("capped", pattern=TOTAL_STRATEGY_PATTERN, description="전체 개수 산출 방식 (exact, estimated, capped, none)"),
     bbs_id: Optional[str] = Query(None, description="게시판 ID"),
     search: Optional[str] = Query(None, description="검색어 (제목, 내용)"),
     author: Optional[str] = Query(None, description="작성자"),
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    게시글 목록을 조회합니다.
+    게시글 목록을 최신순으로 조회합니다.
     
     - **skip**: 건너뛸 레코드 수 (페이징)
     - **limit**: 조회할 최대 레코드 수
+    - **cursor**: 다음 페이지 커서 (깊은 페이지도 OFFSET 없이 조회)
+    - **total_mode**: 전체 개수 산출 방식 (exact: COUNT, estimated: 통계 추정치, capped: 상한까지만 계산, none: 계산 안 함)
     - **bbs_id**: 게시판 ID로 필터링
     - **search**: 검색어 (제목, 내용에서 검색)
     - **author**: 작성자로 필터링
     """
     try:
         bbs_service = BbsService()
-        if bbs_id:
-            posts = bbs_service.get_board_posts(
-                db=db,
-                bbs_id=bbs_id,
-                skip=skip,
-                limit=limit
-            )
-        else:
-            posts = bbs_service.search_posts(
-                db=db,
-                search_term=search,
-                author=author,
-                skip=skip,
-                limit=limit
-            )
-        
-        total_count = bbs_service.count(db=db)
+        posts, next_cursor = await bbs_service.search_posts_page_async(
+            db=db,
+            bbs_id=bbs_id,
+            search_term=search,
+            author=author,
+            cursor=cursor,
+            skip=skip,
+            limit=limit
+        )
         
-        # posts가 None인 경우 빈 리스트로 처리
-        if posts is None:
-            posts = []
+        page_total = await bbs_service.count_posts_async(
+            db=db,
+            bbs_id=bbs_id,
+            search_term=search,
+            author=author,
+            strategy=total_mode
+        )
         
         return BbsPagination(
             items=posts,
-            total=total_count,
+            total=page_total.total,
+            total_type=page_total.total_type,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None
         )
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -335,8 +345,8 @@ async def get_popular_posts(
     - **limit**: 조회할 최대 레코드 수
     """
     try:
-        bbs_service = BbsService()
-        popular_posts = bbs_service.get_popular_posts(
+        bbs_service = offload(BbsService())
+        popular_posts = await bbs_service.get_popular_posts(
             db=db,
             days=days,
             limit=limit
@@ -355,7 +365,7 @@ async def get_popular_posts(
 async def get_post(
     ntt_id: int,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 게시글의 상세 정보를 조회합니다 (첨부파일 정보 포함).
@@ -364,7 +374,7 @@ async def get_post(
     """
     try:
         bbs_service = BbsService()
-        post = bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
+        post = await bbs_service.get_by_ntt_id_async(db=db, ntt_id=ntt_id)
         
         if not post:
             raise HTTPException(
@@ -372,13 +382,14 @@ async def get_post(
                 detail=f"게시글을 찾을 수 없습니다: {ntt_id}"
             )
         
-        # 조회수 증가
-        bbs_service.increase_view_count(db=db, ntt_id=ntt_id)
+        # 조회수 증가 (UPDATE 한 번으로 증가시키고 응답 값만 맞춤)
+        if await bbs_service.increase_view_count_async(db=db, ntt_id=ntt_id):
+            post.rdcnt = (post.rdcnt or 0) + 1
         
         # 첨부파일 정보 조회
         attached_files = []
         if post.atch_file_id:
-            files = file_detail_service.get_files_by_group(db, post.atch_file_id)
+            files = await file_detail_service.get_files_by_group_async(db, post.atch_file_id)
             attached_files = [
                 FileInfo(
                     file_sn=f.file_sn,
@@ -421,16 +432,16 @@ async def create_post(
     """
     try:
         # 게시판 존재 확인
-        bbs_master_service = BbsMasterService()
-        board = bbs_master_service.get_by_bbs_id(db=db, bbs_id=post_data.bbs_id)
+        bbs_master_service = offload(BbsMasterService())
+        board = await bbs_master_service.get_by_bbs_id(db=db, bbs_id=post_data.bbs_id)
         if not board:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"게시판을 찾을 수 없습니다: {post_data.bbs_id}"
             )
         
-        bbs_service = BbsService()
-        post = bbs_service.create(db=db, obj_in=post_data)
+        bbs_service = offload(BbsService())
+        post = await bbs_service.create(db=db, obj_in=post_data)
         return post
         
     except HTTPException:
@@ -466,8 +477,8 @@ async def create_post_with_files(
     """
     try:
         # 게시판 존재 확인
-        bbs_master_service = BbsMasterService()
-        board = bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_id)
+        bbs_master_service = offload(BbsMasterService())
+        board = await bbs_master_service.get_by_bbs_id(db=db, bbs_id=bbs_id)
         if not board:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -487,7 +498,7 @@ async def create_post_with_files(
             # 빈 파일 제거
             valid_files = [f for f in files if f.filename and f.size > 0]
             if valid_files:
-                atch_file_id = file_service.create_file_group(db, current_user.get('user_id'))
+                atch_file_id = await file_service.create_file_group(db, current_user.get('user_id'))
         
         # 게시글 생성 데이터 준비
         create_data = {
@@ -501,8 +512,8 @@ async def create_post_with_files(
         }
         
         # 게시글 생성
-        bbs_service = BbsService()
-        new_post = bbs_service.create(db=db, obj_in=create_data)
+        bbs_service = offload(BbsService())
+        new_post = await bbs_service.create(db=db, obj_in=create_data)
         
         # 파일 업로드 처리
         uploaded_files = []
@@ -511,7 +522,7 @@ async def create_post_with_files(
                 if file.filename and file.size > 0:
                     try:
                         # 파일 업로드
-                        file_detail = file_detail_service.upload_file(
+                        file_detail = await file_detail_service.upload_file(
                             db=db,
                             atch_file_id=atch_file_id,
                             file_data=file.file,
@@ -563,15 +574,15 @@ async def update_post(
     - **ntt_id**: 수정할 게시글 ID
     """
     try:
-        bbs_service = BbsService()
-        post = bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
+        bbs_service = offload(BbsService())
+        post = await bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"게시글을 찾을 수 없습니다: {ntt_id}"
             )
         
-        updated_post = bbs_service.update(
+        updated_post = await bbs_service.update(
             db=db,
             db_obj=post,
             obj_in=post_data
@@ -614,8 +625,8 @@ async def update_post_with_files(
     """
     try:
         # 게시글 존재 확인
-        bbs_service = BbsService()
-        existing_post = bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
+        bbs_service = offload(BbsService())
+        existing_post = await bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
         if not existing_post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -623,8 +634,8 @@ async def update_post_with_files(
             )
         
         # 게시판 정보 확인 (파일 첨부 가능 여부)
-        bbs_master_service = BbsMasterService()
-        board = bbs_master_service.get_by_bbs_id(db=db, bbs_id=existing_post.bbs_id)
+        bbs_master_service = offload(BbsMasterService())
+        board = await bbs_master_service.get_by_bbs_id(db=db, bbs_id=existing_post.bbs_id)
         if files and board.file_atch_posbl_at != 'Y':
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -639,7 +650,7 @@ async def update_post_with_files(
             file_sns_to_delete = [int(sn.strip()) for sn in delete_file_sns.split(',') if sn.strip().isdigit()]
             for file_sn in file_sns_to_delete:
                 try:
-                    file_detail_service.delete_file(db, file_sn, current_user.get('user_id'))
+                    await file_detail_service.delete_file(db, file_sn, current_user.get('user_id'))
                 except Exception as e:
                     continue
         
@@ -651,12 +662,12 @@ async def update_post_with_files(
             if valid_files:
                 # 첨부파일 ID가 없으면 새로 생성
                 if not atch_file_id:
-                    atch_file_id = file_service.create_file_group(db, current_user.get('user_id'))
+                    atch_file_id = await file_service.create_file_group(db, current_user.get('user_id'))
                 
                 # 파일 업로드
                 for file in valid_files:
                     try:
-                        file_detail = file_detail_service.upload_file(
+                        file_detail = await file_detail_service.upload_file(
                             db=db,
                             atch_file_id=atch_file_id,
                             file_data=file.file,
@@ -683,12 +694,12 @@ async def update_post_with_files(
         update_data['last_updusr_id'] = current_user.get('user_id')
         
         # 게시글 수정
-        updated_post = bbs_service.update(db=db, db_obj=existing_post, obj_in=update_data)
+        updated_post = await bbs_service.update(db=db, db_obj=existing_post, obj_in=update_data)
         
         # 현재 첨부파일 목록 조회
         current_files = []
         if updated_post.atch_file_id:
-            current_files = file_detail_service.get_files_by_group(db, updated_post.atch_file_id)
+            current_files = await file_detail_service.get_files_by_group(db, updated_post.atch_file_id)
         
         # 응답 데이터 준비
         response_data = updated_post.__dict__.copy()
@@ -727,7 +738,7 @@ async def download_file(
     """
     try:
         # 파일 정보 조회
-        file_info = file_detail_service.get_by_file_sn(db, file_sn)
+        file_info = await file_detail_service.get_by_file_sn(db, file_sn)
         if not file_info:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -735,7 +746,7 @@ async def download_file(
             )
         
         # 파일 다운로드 처리
-        file_response = file_detail_service.download_file(db, file_sn, current_user.get('user_id'))
+        file_response = await file_detail_service.download_file(db, file_sn, current_user.get('user_id'))
         
         if not file_response:
             raise HTTPException(
@@ -766,8 +777,8 @@ async def delete_post(
     - **ntt_id**: 삭제할 게시글 ID
     """
     try:
-        bbs_service = BbsService()
-        post = bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
+        bbs_service = offload(BbsService())
+        post = await bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -806,15 +817,15 @@ async def recommend_post(
     - **ntt_id**: 추천할 게시글 ID
     """
     try:
-        bbs_service = BbsService()
-        post = bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
+        bbs_service = offload(BbsService())
+        post = await bbs_service.get_by_ntt_id(db=db, ntt_id=ntt_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"게시글을 찾을 수 없습니다: {ntt_id}"
             )
         
-        bbs_service.increase_recommend_count(db=db, ntt_id=ntt_id)
+        await bbs_service.increase_recommend_count(db=db, ntt_id=ntt_id)
         
         return {"message": f"게시글을 추천했습니다: {ntt_id}"}
         
@@ -841,7 +852,7 @@ async def get_post_comments(
     - **ntt_id**: 게시글 ID
     """
     try:
-        comments = comment_service.get_post_comments(db=db, ntt_id=ntt_id)
+        comments = await comment_service.get_post_comments(db=db, ntt_id=ntt_id)
         return comments
         
     except Exception as e:
@@ -869,8 +880,8 @@ async def get_comments(
     - **author**: 작성자로 필터링
     """
     try:
-        comment_service = CommentService()
-        comments = comment_service.search_comments(
+        comment_service = offload(CommentService())
+        comments = await comment_service.search_comments(
             db=db,
             search_term=search,
             author=author,
@@ -878,7 +889,7 @@ async def get_comments(
             limit=limit
         )
         
-        total_count = comment_service.count(db=db)
+        total_count = await comment_service.count(db=db)
         
         return CommentPagination(
             items=comments,
@@ -909,16 +920,16 @@ async def create_comment(
     """
     try:
         # 게시글 존재 확인
-        bbs_service = BbsService()
-        post = bbs_service.get_by_ntt_id(db=db, ntt_id=comment_data.ntt_id)
+        bbs_service = offload(BbsService())
+        post = await bbs_service.get_by_ntt_id(db=db, ntt_id=comment_data.ntt_id)
         if not post:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"게시글을 찾을 수 없습니다: {comment_data.ntt_id}"
             )
         
-        comment_service = CommentService()
-        comment = comment_service.create(db=db, obj_in=comment_data)
+        comment_service = offload(CommentService())
+        comment = await comment_service.create(db=db, obj_in=comment_data)
         return comment
         
     except HTTPException:
@@ -943,15 +954,15 @@ async def update_comment(
     - **comment_id**: 수정할 댓글 ID
     """
     try:
-        comment_service = CommentService()
-        comment = comment_service.get(db=db, id=comment_id)
+        comment_service = offload(CommentService())
+        comment = await comment_service.get(db=db, id=comment_id)
         if not comment:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"댓글을 찾을 수 없습니다: {comment_id}"
             )
         
-        updated_comment = comment_service.update(
+        updated_comment = await comment_service.update(
             db=db,
             db_obj=comment,
             obj_in=comment_data
@@ -980,8 +991,8 @@ async def delete_comment(
     - **comment_id**: 삭제할 댓글 ID
     """
     try:
-        comment_service = CommentService()
-        comment = comment_service.get(db=db, id=comment_id)
+        comment_service = offload(CommentService())
+        comment = await comment_service.get(db=db, id=comment_id)
         if not comment:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
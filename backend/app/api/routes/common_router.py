@@ -5,10 +5,12 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.utils.dependencies import get_current_user
+from app.utils.db_offload import offload
 from app.services import CmmnGrpCodeService, CmmnCodeService
 from app.schemas.common_schemas import (
     CmmnGrpCodeResponse, CmmnGrpCodeCreate, CmmnGrpCodeUpdate,
@@ -55,8 +57,8 @@ async def get_group_codes(
     - **use_yn**: 사용 여부로 필터링
     """
     try:
-        grp_code_service = CmmnGrpCodeService()
-        group_codes = grp_code_service.search_group_codes(
+        grp_code_service = offload(CmmnGrpCodeService())
+        group_codes = await grp_code_service.search_group_codes(
             db=db,
             search_term=search,
             use_yn=use_yn,
@@ -64,7 +66,7 @@ async def get_group_codes(
             limit=limit
         )
         
-        total_count = grp_code_service.count(db=db)
+        total_count = await grp_code_service.count(db=db)
         
         return CmmnGrpCodePagination(
             items=group_codes,
@@ -83,14 +85,14 @@ async def get_group_codes(
 @grp_code_router.get("/active", response_model=List[CmmnGrpCodeResponse], summary="활성 그룹 코드 목록 조회")
 async def get_active_group_codes(
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     활성화된 공통 그룹 코드 목록을 조회합니다.
     """
     try:
         grp_code_service = CmmnGrpCodeService()
-        active_codes = grp_code_service.get_active_group_codes(db=db)
+        active_codes = await grp_code_service.get_active_group_codes_async(db=db)
         return active_codes
         
     except Exception as e:
@@ -109,8 +111,8 @@ async def get_group_code_statistics(
     공통 그룹 코드 통계 정보를 조회합니다.
     """
     try:
-        grp_code_service = CmmnGrpCodeService()
-        statistics = grp_code_service.get_group_code_statistics(db=db)
+        grp_code_service = offload(CmmnGrpCodeService())
+        statistics = await grp_code_service.get_group_code_statistics(db=db)
         return statistics
         
     except Exception as e:
@@ -124,7 +126,7 @@ async def get_group_code_statistics(
 async def get_group_code(
     group_code_id: str,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 공통 그룹 코드의 상세 정보를 조회합니다 (하위 코드 포함).
@@ -133,7 +135,7 @@ async def get_group_code(
     """
     try:
         grp_code_service = CmmnGrpCodeService()
-        group_code = grp_code_service.get_by_group_code_id(db=db, group_code_id=group_code_id)
+        group_code = await grp_code_service.get_by_group_code_id_async(db=db, group_code_id=group_code_id)
         
         if not group_code:
             raise HTTPException(
@@ -143,7 +145,7 @@ async def get_group_code(
         
         # 하위 코드 조회
         code_service = CmmnCodeService()
-        sub_codes = code_service.get_codes_by_group(db=db, group_code_id=group_code_id)
+        sub_codes = await code_service.get_codes_by_group_async(db=db, group_code_id=group_code_id)
         
         return CmmnGrpCodeWithCodes(
             **group_code.__dict__,
@@ -173,9 +175,9 @@ async def create_group_code(
     - **group_code_dc**: 그룹 코드 설명
     """
     try:
-        grp_code_service = CmmnGrpCodeService()
+        grp_code_service = offload(CmmnGrpCodeService())
         # 중복 확인
-        existing_code = grp_code_service.get_by_group_code_id(
+        existing_code = await grp_code_service.get_by_group_code_id(
             db=db, 
             group_code_id=group_code_data.code_id
         )
@@ -185,7 +187,7 @@ async def create_group_code(
                 detail=f"이미 존재하는 그룹 코드 ID입니다: {group_code_data.code_id}"
             )
         
-        group_code = grp_code_service.create_group_code(db=db, group_data=group_code_data.dict(), user_id=current_user['user_id'])
+        group_code = await grp_code_service.create_group_code(db=db, group_data=group_code_data.dict(), user_id=current_user['user_id'])
         return group_code
         
     except HTTPException:
@@ -212,16 +214,16 @@ async def create_group_code_with_codes(
     - **codes_data**: 하위 코드 목록
     """
     try:
-        grp_code_service = CmmnGrpCodeService()
+        grp_code_service = offload(CmmnGrpCodeService())
         # 중복 확인
-        existing_code = grp_code_service.get_by_group_code_id(db=db, group_code_id=group_code_id)
+        existing_code = await grp_code_service.get_by_group_code_id(db=db, group_code_id=group_code_id)
         if existing_code:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"이미 존재하는 그룹 코드 ID입니다: {group_code_id}"
             )
         
-        group_code_with_codes = grp_code_service.create_with_codes(
+        group_code_with_codes = await grp_code_service.create_with_codes(
             db=db,
             group_code_data=group_code_data,
             codes_data=codes_data
@@ -250,15 +252,15 @@ async def update_group_code(
     - **group_code_id**: 수정할 그룹 코드 ID
     """
     try:
-        grp_code_service = CmmnGrpCodeService()
-        group_code = grp_code_service.get_by_group_code_id(db=db, group_code_id=group_code_id)
+        grp_code_service = offload(CmmnGrpCodeService())
+        group_code = await grp_code_service.get_by_group_code_id(db=db, group_code_id=group_code_id)
         if not group_code:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"그룹 코드를 찾을 수 없습니다: {group_code_id}"
             )
         
-        updated_group_code = grp_code_service.update_group_code(
+        updated_group_code = await grp_code_service.update_group_code(
             db=db,
             group_code_id=group_code_id,
             update_data=group_code_data.dict(exclude_unset=True),
@@ -287,15 +289,15 @@ async def delete_group_code(
     - **group_code_id**: 삭제할 그룹 코드 ID
     """
     try:
-        grp_code_service = CmmnGrpCodeService()
-        group_code = grp_code_service.get_by_group_code_id(db=db, group_code_id=group_code_id)
+        grp_code_service = offload(CmmnGrpCodeService())
+        group_code = await grp_code_service.get_by_group_code_id(db=db, group_code_id=group_code_id)
         if not group_code:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"그룹 코드를 찾을 수 없습니다: {group_code_id}"
             )
         
-        grp_code_service.delete_group_code(group_code_id=group_code_id, user_id="system", db=db)
+        await grp_code_service.delete_group_code(group_code_id=group_code_id, user_id="system", db=db)
         
         return {"message": f"그룹 코드가 삭제되었습니다: {group_code_id}"}
         
@@ -329,14 +331,14 @@ async def get_codes(
     - **use_yn**: 사용 여부로 필터링
     """
     try:
-        code_service = CmmnCodeService()
+        code_service = offload(CmmnCodeService())
         if group_code_id:
-            codes = code_service.get_codes_by_group(
+            codes = await code_service.get_codes_by_group(
                 db=db,
                 group_code_id=group_code_id
             )
         else:
-            codes = code_service.search_codes(
+            codes = await code_service.search_codes(
                 db=db,
                 group_id=group_code_id,
                 search_term=search,
@@ -344,7 +346,7 @@ async def get_codes(
                 limit=limit
             )
         
-        total_count = code_service.count(db=db)
+        total_count = await code_service.count(db=db)
         
         return CmmnCodePagination(
             items=codes,
@@ -364,7 +366,7 @@ async def get_codes(
 async def get_codes_by_group(
     group_code_id: str,
     use_at: Optional[str] = Query(None, description="사용 여부 (Y/N)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 그룹의 공통 코드 목록을 조회합니다.
@@ -374,7 +376,7 @@ async def get_codes_by_group(
     """
     try:
         code_service = CmmnCodeService()
-        codes = code_service.get_codes_by_group(
+        codes = await code_service.get_codes_by_group_async(
             db=db,
             group_code_id=group_code_id
         )
@@ -396,8 +398,8 @@ async def get_code_statistics(
     공통 코드 통계 정보를 조회합니다.
     """
     try:
-        code_service = CmmnCodeService()
-        statistics = code_service.get_code_statistics(db=db)
+        code_service = offload(CmmnCodeService())
+        statistics = await code_service.get_code_statistics(db=db)
         return CmmnCodeStatistics(**statistics)
         
     except Exception as e:
@@ -420,8 +422,8 @@ async def get_code(
     - **code_id**: 코드 ID
     """
     try:
-        code_service = CmmnCodeService()
-        code = code_service.get_by_code_id(db=db, group_id=group_id, code_id=code_id)
+        code_service = offload(CmmnCodeService())
+        code = await code_service.get_by_code_id(db=db, group_id=group_id, code_id=code_id)
         
         if not code:
             raise HTTPException(
@@ -455,8 +457,8 @@ async def create_code(
     """
     try:
         # 그룹 코드 존재 확인
-        grp_code_service = CmmnGrpCodeService()
-        group_code = grp_code_service.get_by_group_code_id(
+        grp_code_service = offload(CmmnGrpCodeService())
+        group_code = await grp_code_service.get_by_group_code_id(
             db=db, 
             group_code_id=code_data.group_code_id
         )
@@ -467,15 +469,15 @@ async def create_code(
             )
         
         # 중복 확인
-        code_service = CmmnCodeService()
-        existing_code = code_service.get_by_code_id(db=db, group_id=code_data.code_id, code_id=code_data.code)
+        code_service = offload(CmmnCodeService())
+        existing_code = await code_service.get_by_code_id(db=db, group_id=code_data.code_id, code_id=code_data.code)
         if existing_code:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"이미 존재하는 코드입니다: {code_data.code}"
             )
         
-        code = code_service.create_code(db=db, code_data=code_data.dict(), user_id=code_data.frst_register_id)
+        code = await code_service.create_code(db=db, code_data=code_data.dict(), user_id=code_data.frst_register_id)
         return code
         
     except HTTPException:
@@ -501,15 +503,15 @@ async def update_code(
     - **code_id**: 수정할 코드 ID
     """
     try:
-        code_service = CmmnCodeService()
-        code = code_service.get_by_code_id(db=db, group_id=group_id, code_id=code_id)
+        code_service = offload(CmmnCodeService())
+        code = await code_service.get_by_code_id(db=db, group_id=group_id, code_id=code_id)
         if not code:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"공통 코드를 찾을 수 없습니다: {code_id}"
             )
         
-        updated_code = code_service.update_code(
+        updated_code = await code_service.update_code(
             db=db,
             group_id=group_id,
             code_id=code_id,
@@ -541,15 +543,15 @@ async def delete_code(
     - **code_id**: 삭제할 코드 ID
     """
     try:
-        code_service = CmmnCodeService()
-        code = code_service.get_by_code_id(db=db, group_id=group_id, code_id=code_id)
+        code_service = offload(CmmnCodeService())
+        code = await code_service.get_by_code_id(db=db, group_id=group_id, code_id=code_id)
         if not code:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"공통 코드를 찾을 수 없습니다: {code_id}"
             )
         
-        code_service.delete_code(
+        await code_service.delete_code(
             db=db,
             group_id=group_id,
             code_id=code_id,
@@ -581,23 +583,23 @@ async def copy_codes(
     """
     try:
         # 그룹 코드 존재 확인
-        grp_code_service = CmmnGrpCodeService()
-        source_group = grp_code_service.get_by_group_code_id(db=db, group_code_id=source_group_id)
+        grp_code_service = offload(CmmnGrpCodeService())
+        source_group = await grp_code_service.get_by_group_code_id(db=db, group_code_id=source_group_id)
         if not source_group:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"원본 그룹 코드를 찾을 수 없습니다: {source_group_id}"
             )
         
-        target_group = grp_code_service.get_by_group_code_id(db=db, group_code_id=target_group_id)
+        target_group = await grp_code_service.get_by_group_code_id(db=db, group_code_id=target_group_id)
         if not target_group:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"대상 그룹 코드를 찾을 수 없습니다: {target_group_id}"
             )
         
-        code_service = CmmnCodeService()
-        copied_codes = code_service.copy_codes_between_groups(
+        code_service = offload(CmmnCodeService())
+        copied_codes = await code_service.copy_codes_between_groups(
             db=db,
             source_group_id=source_group_id,
             target_group_id=target_group_id
@@ -625,8 +627,8 @@ async def update_sort_order(
     - **sort_updates**: 정렬 순서 업데이트 목록
     """
     try:
-        code_service = CmmnCodeService()
-        code_service.update_sort_order(db=db, sort_updates=sort_updates)
+        code_service = offload(CmmnCodeService())
+        await code_service.update_sort_order(db=db, sort_updates=sort_updates)
         
         return {"message": "정렬 순서가 업데이트되었습니다"}
         
@@ -14,6 +14,7 @@ from pathlib import Path
 
 from app.database import get_db
 from app.services import FileService, FileDetailService
+from app.utils.db_offload import offload
 from app.utils.dependencies import get_current_user
 from app.schemas.file_schemas import (
     FileResponse as FileResponseSchema, FileCreate, FileUpdate, FileGroupCreate,
@@ -38,8 +39,8 @@ file_detail_router = APIRouter(
 )
 
 # 서비스 인스턴스
-file_service = FileService()
-file_detail_service = FileDetailService()
+file_service = offload(FileService())
+file_detail_service = offload(FileDetailService())
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -69,14 +70,14 @@ async def get_file_groups(
     - **search**: 검색어
     """
     try:
-        file_groups = file_service.search_file_groups(
+        file_groups = await file_service.search_file_groups(
             db=db,
             search_term=search,
             skip=skip,
             limit=limit
         )
         
-        total_count = file_service.count(db=db)
+        total_count = await file_service.count(db=db)
         
         return FilePagination(
             items=file_groups,
@@ -94,14 +95,17 @@ async def get_file_groups(
 
 @file_router.get("/statistics", response_model=FileStatistics, summary="파일 통계 조회")
 async def get_file_statistics(
+    days: Optional[int] = Query(None, ge=1, le=366, description="업로드 추세 조회 일수 (기본값: FILE_STATS_TREND_DAYS)"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     파일 통계 정보를 조회합니다.
+    
+    - **days**: 업로드 추세 조회 일수 (업로드가 없는 날은 0건)
     """
     try:
-        statistics = file_service.get_file_statistics(db=db)
+        statistics = await file_service.get_file_statistics(db=db, days=days)
         return statistics
         
     except Exception as e:
@@ -123,7 +127,7 @@ async def get_file_group(
     - **atch_file_id**: 첨부파일 ID
     """
     try:
-        file_group = file_service.get_by_atch_file_id(db=db, atch_file_id=atch_file_id)
+        file_group = await file_service.get_by_atch_file_id(db=db, atch_file_id=atch_file_id)
         
         if not file_group:
             raise HTTPException(
@@ -132,7 +136,7 @@ async def get_file_group(
             )
         
         # 파일 목록 조회
-        file_details = file_detail_service.get_files_by_group(db=db, atch_file_id=atch_file_id)
+        file_details = await file_detail_service.get_files_by_group(db=db, atch_file_id=atch_file_id)
         
         return FileWithDetails(
             **file_group.__dict__,
@@ -161,7 +165,7 @@ async def create_file_group(
     """
     try:
         # 파일 그룹 생성 (서비스에서 자동으로 UUID 생성)
-        file_group = file_service.create_file_group(
+        file_group = await file_service.create_file_group(
             db=db, 
             file_group_data=file_data.model_dump(),
             user_id=current_user.get('user_id', 'system')
@@ -224,7 +228,7 @@ async def delete_file_group(
     - **atch_file_id**: 삭제할 첨부파일 ID
     """
     try:
-        file_group = file_service.get_by_atch_file_id(db=db, atch_file_id=atch_file_id)
+        file_group = await file_service.get_by_atch_file_id(db=db, atch_file_id=atch_file_id)
         if not file_group:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -272,7 +276,7 @@ async def upload_file_process(
     try:
         # 1. 파일 그룹 생성
         file_group_data = {"use_at": use_at}
-        file_group = file_service.create_file_group(
+        file_group = await file_service.create_file_group(
             db=db,
             file_group_data=file_group_data,
             user_id=current_user['user_id']
@@ -287,7 +291,7 @@ async def upload_file_process(
         for file in files:
             try:
                 # 파일 업로드 및 상세정보 생성
-                file_detail = file_detail_service.upload_file(
+                file_detail = await file_detail_service.upload_file(
                     db=db,
                     atch_file_id=atch_file_id,
                     file_data=file.file,
@@ -345,7 +349,7 @@ async def get_file_details(
     """
     try:
         if atch_file_id:
-            file_details = file_detail_service.get_files_by_group(
+            file_details = await file_detail_service.get_files_by_group(
                 db=db,
                 atch_file_id=atch_file_id
             )
@@ -355,14 +359,14 @@ async def get_file_details(
                 file_extsn=file_extsn,
                 atch_file_id=atch_file_id
             )
-            file_details = file_detail_service.search_files(
+            file_details = await file_detail_service.search_files(
                 db=db,
                 search_params=search_params,
                 skip=skip,
                 limit=limit
             )
         
-        total_count = file_detail_service.count(db=db)
+        total_count = await file_detail_service.count(db=db)
         
         return FileDetailPagination(
             items=file_details,
@@ -387,7 +391,7 @@ async def get_file_statistics_by_type(
     파일 유형별 통계 정보를 조회합니다.
     """
     try:
-        statistics = file_detail_service.get_file_statistics_by_type(db=db)
+        statistics = await file_detail_service.get_file_statistics_by_type(db=db)
         return statistics
         
     except Exception as e:
@@ -443,7 +447,7 @@ async def upload_file(
     """
     try:
         # 파일 그룹 존재 확인
-        file_group = file_service.get_by_atch_file_id(db=db, atch_file_id=atch_file_id)
+        file_group = await file_service.get_by_atch_file_id(db=db, atch_file_id=atch_file_id)
         if not file_group:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -451,7 +455,7 @@ async def upload_file(
             )
         
         # 파일 검증
-        validation_result = file_detail_service.validate_file(
+        validation_result = await file_detail_service.validate_file(
             filename=file.filename,
             file_size=file.size if hasattr(file, 'size') else 0
         )
@@ -463,7 +467,7 @@ async def upload_file(
             )
         
         # 파일 업로드
-        uploaded_file = file_detail_service.upload_file(
+        uploaded_file = await file_detail_service.upload_file(
             db=db,
             atch_file_id=atch_file_id,
             file_data=file.file,
@@ -502,7 +506,7 @@ async def download_file(
     - **file_sn**: 파일 일련번호
     """
     try:
-        file_detail = file_detail_service.get_by_file_sn(db=db, atch_file_id=atch_file_id, file_sn=file_sn)
+        file_detail = await file_detail_service.get_by_file_sn(db=db, atch_file_id=atch_file_id, file_sn=file_sn)
         
         if not file_detail:
             raise HTTPException(
@@ -518,7 +522,7 @@ async def download_file(
             )
         
         # 다운로드 기록
-        file_detail_service.record_download(db=db, file_sn=file_sn)
+        await file_detail_service.record_download(db=db, file_sn=file_sn)
         
         return FileResponse(
             path=str(file_path),
@@ -588,14 +592,14 @@ async def delete_file_detail(
     - **delete_physical**: 물리적 파일도 삭제할지 여부
     """
     try:
-        file_detail = file_detail_service.get_by_file_sn(db=db, atch_file_id=atch_file_id, file_sn=file_sn)
+        file_detail = await file_detail_service.get_by_file_sn(db=db, atch_file_id=atch_file_id, file_sn=file_sn)
         if not file_detail:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"파일을 찾을 수 없습니다: {file_sn}"
             )
         
-        file_detail_service.delete_file(
+        await file_detail_service.delete_file(
             db=db,
             atch_file_id=atch_file_id,
             file_sn=file_sn,
@@ -627,7 +631,7 @@ async def validate_file(
     - **file_size**: 파일 크기 (바이트)
     """
     try:
-        validation_result = file_detail_service.validate_file(
+        validation_result = await file_detail_service.validate_file(
             filename=filename,
             file_size=file_size
         )
@@ -650,7 +654,7 @@ async def cleanup_orphaned_files(
     데이터베이스에 기록되지 않은 고아 파일들을 정리합니다.
     """
     try:
-        cleaned_count = file_detail_service.cleanup_orphaned_files(
+        cleaned_count = await file_detail_service.cleanup_orphaned_files(
             db=db
         )
         
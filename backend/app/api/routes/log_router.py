@@ -4,18 +4,24 @@
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from app.database import get_db
 from app.services import LoginLogService
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.cursor import InvalidCursorError
+from app.utils.db_offload import offload
+from app.utils.export_jobs import get_export_job_manager
+from app.utils.page_total import TOTAL_STRATEGY_PATTERN
+from app.utils.record_stream import RECORD_MEDIA_TYPES
 from app.schemas.log_schemas import (
     LoginLogResponse, LoginLogCreate, LoginLogUpdate,
     LoginLogPagination, LoginLogSearchParams, LoginLogStatistics,
     SecurityAlertResponse, SuspiciousActivityResponse,
-    SessionManagementResponse, LogExportResponse, LogAnalysisResponse,
+    SessionManagementResponse, LogExportRequest, LogExportResponse, LogAnalysisResponse,
     LogAnalysisSimpleResponse
 )
 
@@ -35,6 +41,8 @@ log_router = APIRouter(
 async def get_login_logs(
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 최대 레코드 수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정하면 skip 무시)"),
+    total_mode: str = Query("estimated", pattern=TOTAL_STRATEGY_PATTERN, description="전체 개수 산출 방식 (exact, estimated, capped, none)"),
     user_id: Optional[str] = Query(None, description="사용자 ID"),
     ip_address: Optional[str] = Query(None, description="IP 주소"),
     login_result: Optional[str] = Query(None, description="로그인 결과 (SUCCESS/FAILURE)"),
@@ -48,6 +56,8 @@ async def get_login_logs(
     
     - **skip**: 건너뛸 레코드 수 (페이징)
     - **limit**: 조회할 최대 레코드 수
+    - **cursor**: 다음 페이지 커서 (깊은 페이지도 OFFSET 없이 조회)
+    - **total_mode**: 전체 개수 산출 방식 (exact: COUNT, estimated: 통계 추정치, capped: 상한까지만 계산, none: 계산 안 함)
     - **user_id**: 사용자 ID로 필터링
     - **ip_address**: IP 주소로 필터링
     - **login_result**: 로그인 결과로 필터링
@@ -55,36 +65,43 @@ async def get_login_logs(
     - **end_date**: 종료 날짜
     """
     try:
-        log_service = LoginLogService()
+        log_service = offload(LoginLogService())
+        error_occrrnc_at = {"SUCCESS": "N", "FAILURE": "Y"}.get((login_result or "").upper())
         search_params = LoginLogSearchParams(
-            user_id=user_id,
-            ip_address=ip_address,
-            login_result=login_result,
+            login_id=user_id,
+            login_ip=ip_address,
+            error_occrrnc_at=error_occrrnc_at,
             start_date=start_date,
             end_date=end_date
         )
         
-        logs = log_service.search_logs(
+        logs, next_cursor = await log_service.search_logs_page(
             db=db,
             search_params=search_params,
+            cursor=cursor,
             skip=skip,
             limit=limit
         )
         
-        total_count = log_service.count(db=db)
+        page_total = await log_service.count_logs(db=db, search_params=search_params, strategy=total_mode)
         
-        # 페이지네이션 정보 계산
-        pages = (total_count + limit - 1) // limit
-        page = (skip // limit) + 1
+        # 페이지네이션 정보 계산 (커서 조회는 현재 페이지 번호가 없음)
+        page = None if cursor else (skip // limit) + 1
         
         return LoginLogPagination(
             items=logs,
-            total=total_count,
+            total=page_total.total,
+            total_type=page_total.total_type,
             page=page,
             size=limit,
-            pages=pages
+            pages=page_total.pages(limit),
+            cursor=cursor,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None
         )
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -106,8 +123,8 @@ async def get_recent_logs(
     - **limit**: 조회할 최대 레코드 수
     """
     try:
-        log_service = LoginLogService()
-        recent_logs = log_service.get_recent_logs(
+        log_service = offload(LoginLogService())
+        recent_logs = await log_service.get_recent_logs(
             db=db,
             hours=hours,
             limit=limit
@@ -138,8 +155,8 @@ async def get_user_logs(
     - **limit**: 조회할 최대 레코드 수
     """
     try:
-        log_service = LoginLogService()
-        user_logs = log_service.get_user_logs(
+        log_service = offload(LoginLogService())
+        user_logs = await log_service.get_user_logs(
             db=db,
             user_id=user_id,
             days=days,
@@ -169,8 +186,8 @@ async def get_failed_attempts(
     - **limit**: 조회할 최대 레코드 수
     """
     try:
-        log_service = LoginLogService()
-        failed_attempts = log_service.get_failed_attempts(
+        log_service = offload(LoginLogService())
+        failed_attempts = await log_service.get_failed_attempts(
             db=db,
             hours=hours,
             limit=limit
@@ -202,8 +219,8 @@ async def create_login_log(
     - **failure_reason**: 실패 사유 (실패 시)
     """
     try:
-        log_service = LoginLogService()
-        log = log_service.create_login_log(
+        log_service = offload(LoginLogService())
+        log = await log_service.create_login_log(
             db=db,
             user_id=log_data.user_id,
             ip_address=log_data.login_ip,
@@ -233,15 +250,15 @@ async def update_login_log(
     - **log_id**: 수정할 로그 ID
     """
     try:
-        log_service = LoginLogService()
-        log = log_service.get_by_log_id(db=db, log_id=log_id)
+        log_service = offload(LoginLogService())
+        log = await log_service.get_by_log_id(db=db, log_id=log_id)
         if not log:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"로그인 로그를 찾을 수 없습니다: {log_id}"
             )
         
-        updated_log = log_service.update(
+        updated_log = await log_service.update(
             db=db,
             db_obj=log,
             obj_in=log_data
@@ -270,15 +287,15 @@ async def delete_login_log(
     - **log_id**: 삭제할 로그 ID
     """
     try:
-        log_service = LoginLogService()
-        log = log_service.get_by_log_id(db=db, log_id=log_id)
+        log_service = offload(LoginLogService())
+        log = await log_service.get_by_log_id(db=db, log_id=log_id)
         if not log:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"로그인 로그를 찾을 수 없습니다: {log_id}"
             )
         
-        log_service.delete(db=db, id=log_id)
+        await log_service.delete(db=db, id=log_id)
         
         return {"message": f"로그인 로그가 삭제되었습니다: {log_id}"}
         
@@ -304,8 +321,8 @@ async def get_login_statistics(
     - **days**: 조회 기간 (일)
     """
     try:
-        log_service = LoginLogService()
-        statistics = log_service.get_login_statistics(db=db, days=days)
+        log_service = offload(LoginLogService())
+        statistics = await log_service.get_login_statistics(db=db, days=days)
         return statistics
         
     except Exception as e:
@@ -326,8 +343,8 @@ async def get_daily_statistics(
     - **days**: 조회 기간 (일)
     """
     try:
-        log_service = LoginLogService()
-        daily_stats = log_service.get_daily_login_stats(db=db, days=days)
+        log_service = offload(LoginLogService())
+        daily_stats = await log_service.get_daily_login_stats(db=db, days=days)
         return daily_stats
         
     except Exception as e:
@@ -348,8 +365,8 @@ async def get_hourly_statistics(
     - **days**: 조회 기간 (일)
     """
     try:
-        log_service = LoginLogService()
-        hourly_stats = log_service.get_hourly_login_stats(db=db, days=days)
+        log_service = offload(LoginLogService())
+        hourly_stats = await log_service.get_hourly_login_stats(db=db, days=days)
         return hourly_stats
         
     except Exception as e:
@@ -372,8 +389,8 @@ async def get_top_ip_statistics(
     - **limit**: 조회할 최대 레코드 수
     """
     try:
-        log_service = LoginLogService()
-        top_ips = log_service.get_top_ip_addresses(db=db, days=days, limit=limit)
+        log_service = offload(LoginLogService())
+        top_ips = await log_service.get_top_ip_addresses(db=db, days=days, limit=limit)
         return top_ips
         
     except Exception as e:
@@ -398,8 +415,8 @@ async def get_security_alerts(
     - **alert_type**: 알림 유형으로 필터링
     """
     try:
-        log_service = LoginLogService()
-        alerts = log_service.get_security_alerts(
+        log_service = offload(LoginLogService())
+        alerts = await log_service.get_security_alerts(
             db=db,
             hours=hours,
             alert_type=alert_type
@@ -427,8 +444,8 @@ async def get_suspicious_activities(
     - **severity**: 심각도로 필터링
     """
     try:
-        log_service = LoginLogService()
-        suspicious_activities = log_service.get_suspicious_activities(
+        log_service = offload(LoginLogService())
+        suspicious_activities = await log_service.get_suspicious_activities(
             db=db,
             hours=hours,
             severity=severity
@@ -456,8 +473,8 @@ async def get_repeated_failures(
     - **min_attempts**: 최소 시도 횟수
     """
     try:
-        log_service = LoginLogService()
-        repeated_failures = log_service.get_repeated_login_failures(
+        log_service = offload(LoginLogService())
+        repeated_failures = await log_service.get_repeated_login_failures(
             db=db,
             hours=hours,
             min_attempts=min_attempts
@@ -483,8 +500,8 @@ async def get_unusual_login_times(
     - **days**: 조회 기간 (일)
     """
     try:
-        log_service = LoginLogService()
-        unusual_logins = log_service.get_unusual_login_times(db=db, days=days)
+        log_service = offload(LoginLogService())
+        unusual_logins = await log_service.get_unusual_login_times(db=db, days=days)
         return unusual_logins
         
     except Exception as e:
@@ -505,8 +522,8 @@ async def get_new_ip_logins(
     - **days**: 조회 기간 (일)
     """
     try:
-        log_service = LoginLogService()
-        new_ip_logins = log_service.get_new_ip_logins(db=db, days=days)
+        log_service = offload(LoginLogService())
+        new_ip_logins = await log_service.get_new_ip_logins(db=db, days=days)
         return new_ip_logins
         
     except Exception as e:
@@ -526,8 +543,8 @@ async def get_active_sessions(
     현재 활성 세션을 조회합니다.
     """
     try:
-        log_service = LoginLogService()
-        active_sessions = log_service.get_active_sessions(db=db)
+        log_service = offload(LoginLogService())
+        active_sessions = await log_service.get_active_sessions(db=db)
         return active_sessions
         
     except Exception as e:
@@ -548,8 +565,8 @@ async def get_user_sessions(
     - **user_id**: 사용자 ID
     """
     try:
-        log_service = LoginLogService()
-        user_sessions = log_service.get_user_sessions(db=db, user_id=user_id)
+        log_service = offload(LoginLogService())
+        user_sessions = await log_service.get_user_sessions(db=db, user_id=user_id)
         return user_sessions
         
     except Exception as e:
@@ -564,18 +581,22 @@ async def get_user_sessions(
 @log_router.post("/cleanup", summary="오래된 로그 정리")
 async def cleanup_old_logs(
     days: int = Query(90, ge=30, le=365, description="보관 기간 (일)"),
+    mode: Optional[str] = Query(None, pattern="^(drop|detach)$", description="지난 파티션 정리 방식 (drop, detach)"),
     db: Session = Depends(get_db)
 ):
     """
     지정된 기간보다 오래된 로그를 정리합니다.
     
+    보관 기간이 지난 월별 파티션은 통째로 삭제(drop)하거나 분리(detach)합니다.
+    
     - **days**: 보관 기간 (일)
+    - **mode**: 지난 파티션 정리 방식 (기본값: LOG_RETENTION_MODE)
     """
     try:
-        log_service = LoginLogService()
-        deleted_count = log_service.cleanup_old_logs(db=db, days=days)
+        log_service = offload(LoginLogService())
+        result = await log_service.cleanup_old_logs(db=db, days_to_keep=days, mode=mode)
         
-        return {"message": f"{deleted_count}개의 오래된 로그가 정리되었습니다"}
+        return {"message": f"{result['deleted_count']}개의 오래된 로그가 정리되었습니다", **result}
         
     except Exception as e:
         raise HTTPException(
@@ -584,40 +605,106 @@ async def cleanup_old_logs(
         )
 
 
-@log_router.get("/export", response_model=LogExportResponse, summary="로그 데이터 내보내기")
+@log_router.get("/export", summary="로그 데이터 내보내기")
 async def export_logs(
-    format: str = Query("csv", description="내보내기 형식 (csv, json, excel)"),
+    format: str = Query("csv", description="내보내기 형식 (csv, ndjson, json)"),
     start_date: Optional[datetime] = Query(None, description="시작 날짜"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜"),
     user_id: Optional[str] = Query(None, description="사용자 ID"),
+    compress: bool = Query(False, description="gzip 압축 여부"),
     current_user: dict = Depends(get_current_user_from_bearer),
     db: Session = Depends(get_db)
 ):
     """
-    로그 데이터를 내보냅니다.
+    로그 데이터를 파일로 스트리밍합니다.
     
-    - **format**: 내보내기 형식 (csv, json, excel)
+    - **format**: 내보내기 형식 (csv, ndjson, json)
     - **start_date**: 시작 날짜
     - **end_date**: 종료 날짜
     - **user_id**: 사용자 ID로 필터링
+    - **compress**: gzip 압축 여부 (.gz 파일로 내려받음)
+    
+    파일로 저장한 뒤 내려받으려면 POST /logs/export/jobs를 사용합니다.
     """
+    log_service = offload(LoginLogService())
     try:
-        log_service = LoginLogService()
-        export_data = log_service.export_logs(
+        chunks = await log_service.export_logs(
             db=db,
             format=format,
             start_date=start_date,
             end_date=end_date,
-            user_id=user_id
-        )
-        
-        return {"status": "success", "data": export_data, "format": format}
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"로그 데이터 내보내기 중 오류가 발생했습니다: {str(e)}"
+            user_id=user_id,
+            compress=compress
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    def stream():
+        # get_db 정리는 응답 전송 전에 끝나므로 스트림이 다시 연 연결은 여기서 반환
+        try:
+            yield from chunks
+        finally:
+            db.close()
+    
+    file_name = f"login_logs_{datetime.now():%Y%m%d_%H%M%S}.{format}"
+    media_type = RECORD_MEDIA_TYPES[format]
+    if compress:
+        file_name += ".gz"
+        media_type = "application/gzip"
+    
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+    )
+
+
+@log_router.post(
+    "/export/jobs",
+    response_model=LogExportResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="로그 데이터 내보내기 작업 등록"
+)
+async def create_export_job(
+    export_request: LogExportRequest,
+    request: Request,
+    current_user: dict = Depends(get_current_user_from_bearer)
+):
+    """
+    로그 데이터를 서버에서 파일로 저장하는 작업을 등록합니다.
+    
+    - **start_date**, **end_date**: 기간
+    - **login_ids**: 특정 접속 ID만 내보내기
+    - **include_successful**, **include_failed**: 성공/실패 로그인 포함 여부
+    - **export_format**: 내보내기 형식 (csv, ndjson, json)
+    - **compress**: gzip 압축 여부
+    
+    응답의 status_url로 진행률을 조회하고, 완료되면 download_url로 내려받습니다.
+    """
+    statement = LoginLogService().export_statement(
+        start_date=export_request.start_date,
+        end_date=export_request.end_date,
+        login_ids=export_request.login_ids,
+        include_successful=export_request.include_successful,
+        include_failed=export_request.include_failed
+    )
+    manager = get_export_job_manager()
+    try:
+        job = manager.submit(
+            "login_logs",
+            statement,
+            format=export_request.export_format,
+            compress=export_request.compress,
+            owner=current_user.get("user_id"),
+            metadata={"format": export_request.export_format, "export_time": datetime.now().isoformat()}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return LogExportResponse(
+        **manager.describe(job),
+        status_url=request.url_for("get_export_job", export_id=job.export_id).path
+    )
 
 
 @log_router.get("/analysis", response_model=LogAnalysisSimpleResponse, summary="로그 분석")
@@ -634,8 +721,8 @@ async def analyze_logs(
     - **analysis_type**: 분석 유형
     """
     try:
-        log_service = LoginLogService()
-        analysis_result = log_service.analyze_logs(
+        log_service = offload(LoginLogService())
+        analysis_result = await log_service.analyze_logs(
             db=db,
             days=days,
             analysis_type=analysis_type
@@ -662,8 +749,8 @@ async def get_login_log(
     - **log_id**: 로그 ID
     """
     try:
-        log_service = LoginLogService()
-        log = log_service.get_by_log_id(db=db, log_id=log_id)
+        log_service = offload(LoginLogService())
+        log = await log_service.get_by_log_id(db=db, log_id=log_id)
         
         if not log:
             raise HTTPException(
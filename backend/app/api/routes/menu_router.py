@@ -3,19 +3,24 @@
 메뉴 정보 관리를 위한 FastAPI 라우터를 정의합니다.
 """
 
+from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.services import MenuInfoService
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.db_offload import offload
+from app.utils.record_stream import RECORD_MEDIA_TYPES, iter_records
 from app.schemas.menu_schemas import (
     MenuInfoResponse, MenuInfoCreate, MenuInfoUpdate,
     MenuInfoPagination, MenuTreeNode, MenuWithPermission,
     MenuTreeWithPermission, MenuSearchParams, MenuMoveRequest,
     MenuOrderUpdate, MenuCopyRequest, MenuStatistics,
-    MenuPathResponse, MenuValidationResponse, MenuExportResponse,
+    MenuPathResponse, MenuValidationResponse,
     MenuImportRequest
 )
 
@@ -29,6 +34,21 @@ menu_router = APIRouter(
 # 서비스 인스턴스는 각 함수에서 생성
 
 
+def _menu_tree_response(request: Request, entry) -> Response:
+    """
+    캐시된 메뉴 트리 본문을 ETag와 함께 반환합니다.
+    
+    If-None-Match가 현재 ETag와 일치하면 본문 없이 304를 반환합니다.
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in candidates or entry.etag in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
 # ==================== 메뉴 기본 CRUD API ====================
 
 @menu_router.get("/", response_model=MenuInfoPagination, summary="메뉴 목록 조회")
@@ -40,7 +60,7 @@ async def get_menus(
     upper_menu_id: Optional[str] = Query(None, description="상위 메뉴 ID"),
     use_at: Optional[str] = Query(None, description="사용 여부 (Y/N)"),
     current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     메뉴 목록을 조회합니다.
@@ -55,14 +75,14 @@ async def get_menus(
     try:
         menu_service = MenuInfoService()
         
-        menus = menu_service.search_menus(
+        menus = await menu_service.search_menus_async(
             db=db,
             search_term=search,
             skip=skip,
             limit=limit
         )
         
-        total_count = menu_service.count(db=db)
+        total_count = await menu_service.count_async(db=db)
         
         return MenuInfoPagination(
             items=menus,
@@ -81,19 +101,22 @@ async def get_menus(
 
 @menu_router.get("/tree", response_model=List[MenuTreeNode], summary="메뉴 트리 조회")
 async def get_menu_tree(
-    use_at: Optional[str] = Query("Y", description="사용 여부 (Y/N)"),
+    request: Request,
+    use_at: Optional[str] = Query("Y", pattern="^[YN]$", description="사용 여부 (Y/N)"),
     current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     계층형 메뉴 트리를 조회합니다.
     
+    메뉴가 변경되기 전까지 캐시된 트리를 반환하며, ETag/If-None-Match를 지원합니다.
+    
     - **use_at**: 사용 여부로 필터링
     """
     try:
         menu_service = MenuInfoService()
-        menu_tree = menu_service.get_menu_tree(db=db, use_at=use_at)
-        return menu_tree
+        entry = await menu_service.get_cached_menu_tree_async(db=db, use_at=use_at)
+        return _menu_tree_response(request, entry)
         
     except Exception as e:
         raise HTTPException(
@@ -104,18 +127,21 @@ async def get_menu_tree(
 
 @menu_router.get("/tree/public", response_model=List[MenuTreeNode], summary="공개 메뉴 트리 조회")
 async def get_public_menu_tree(
-    use_at: Optional[str] = Query("Y", description="사용 여부 (Y/N)"),
-    db: Session = Depends(get_db)
+    request: Request,
+    use_at: Optional[str] = Query("Y", pattern="^[YN]$", description="사용 여부 (Y/N)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     계층형 메뉴 트리를 조회합니다.
     
+    메뉴가 변경되기 전까지 캐시된 트리를 반환하며, ETag/If-None-Match를 지원합니다.
+    
     - **use_at**: 사용 여부로 필터링
     """
     try:
         menu_service = MenuInfoService()
-        menu_tree = menu_service.get_menu_tree(db=db, use_at=use_at)
-        return menu_tree
+        entry = await menu_service.get_cached_menu_tree_async(db=db, use_at=use_at)
+        return _menu_tree_response(request, entry)
         
     except Exception as e:
         raise HTTPException(
@@ -128,7 +154,7 @@ async def get_public_menu_tree(
 async def get_root_menus(
     use_at: Optional[str] = Query('Y', description="사용 여부 (Y/N)"),
     current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     루트 메뉴 목록을 조회합니다.
@@ -137,7 +163,7 @@ async def get_root_menus(
     """
     try:
         menu_service = MenuInfoService()
-        root_menus = menu_service.get_root_menus(db=db, use_at=use_at)
+        root_menus = await menu_service.get_root_menus_async(db=db, use_at=use_at)
         return root_menus
         
     except Exception as e:
@@ -156,8 +182,8 @@ async def get_menu_statistics(
     메뉴 통계 정보를 조회합니다.
     """
     try:
-        menu_service = MenuInfoService()
-        statistics = menu_service.get_menu_statistics(db=db)
+        menu_service = offload(MenuInfoService())
+        statistics = await menu_service.get_menu_statistics(db=db)
         return statistics
         
     except Exception as e:
@@ -179,7 +205,7 @@ async def update_menu_order(
     - **order_request**: {"menu_orders": [{"menu_id": "MENU1", "menu_ordr": 1}, ...]}
     """
     try:
-        menu_service = MenuInfoService()
+        menu_service = offload(MenuInfoService())
         
         # menu_orders 추출 및 변환
         menu_orders = order_request.get('menu_orders', [])
@@ -191,7 +217,7 @@ async def update_menu_order(
                 'menu_ordr': order_info.get('menu_ordr')
             })
         
-        success = menu_service.update_menu_order(
+        success = await menu_service.update_menu_order(
             db=db, 
             menu_orders=converted_orders,
             user_id=current_user.get('user_id', 'system')
@@ -216,7 +242,7 @@ async def update_menu_order(
 async def get_menu(
     menu_id: str,
     current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 메뉴의 상세 정보를 조회합니다.
@@ -225,7 +251,7 @@ async def get_menu(
     """
     try:
         menu_service = MenuInfoService()
-        menu = menu_service.get_by_menu_id(db=db, menu_id=menu_id)
+        menu = await menu_service.get_by_menu_id_async(db=db, menu_id=menu_id)
         
         if not menu:
             raise HTTPException(
@@ -249,7 +275,7 @@ async def get_child_menus(
     menu_id: str,
     use_at: Optional[str] = Query(None, description="사용 여부 (Y/N)"),
     current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 메뉴의 하위 메뉴 목록을 조회합니다.
@@ -259,7 +285,7 @@ async def get_child_menus(
     """
     try:
         menu_service = MenuInfoService()
-        child_menus = menu_service.get_child_menus(db=db, parent_menu_id=menu_id, use_at=use_at)
+        child_menus = await menu_service.get_child_menus_async(db=db, parent_menu_id=menu_id, use_at=use_at)
         return child_menus
         
     except Exception as e:
@@ -281,15 +307,15 @@ async def get_menu_breadcrumb(
     - **menu_id**: 메뉴 ID
     """
     try:
-        menu_service = MenuInfoService()
-        menu = menu_service.get_by_menu_id(db=db, menu_id=menu_id)
+        menu_service = offload(MenuInfoService())
+        menu = await menu_service.get_by_menu_id(db=db, menu_id=menu_id)
         if not menu:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"메뉴를 찾을 수 없습니다: {menu_id}"
             )
         
-        breadcrumb_menus = menu_service.get_menu_breadcrumb(db=db, menu_id=menu_id)
+        breadcrumb_menus = await menu_service.get_menu_breadcrumb(db=db, menu_id=menu_id)
         
         # MenuInfo 객체들을 MenuPathResponse 형식으로 변환
         breadcrumb_response = []
@@ -340,9 +366,9 @@ async def create_menu(
     - **menu_url**: 메뉴 URL
     """
     try:
-        menu_service = MenuInfoService()
+        menu_service = offload(MenuInfoService())
         # 중복 확인
-        existing_menu = menu_service.get_by_menu_id(db=db, menu_id=menu_data.menu_no)
+        existing_menu = await menu_service.get_by_menu_id(db=db, menu_id=menu_data.menu_no)
         if existing_menu:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -351,14 +377,14 @@ async def create_menu(
         
         # 상위 메뉴 존재 확인
         if hasattr(menu_data, 'upper_menu_no') and menu_data.upper_menu_no:
-            parent_menu = menu_service.get_by_menu_id(db=db, menu_id=menu_data.upper_menu_no)
+            parent_menu = await menu_service.get_by_menu_id(db=db, menu_id=menu_data.upper_menu_no)
             if not parent_menu:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"상위 메뉴를 찾을 수 없습니다: {menu_data.upper_menu_no}"
                 )
         
-        menu = menu_service.create_menu(db=db, menu_data=menu_data)
+        menu = await menu_service.create_menu(db=db, menu_data=menu_data)
         return menu
         
     except HTTPException:
@@ -383,8 +409,8 @@ async def update_menu(
     - **menu_id**: 수정할 메뉴 ID
     """
     try:
-        menu_service = MenuInfoService()
-        menu = menu_service.get_by_menu_id(db=db, menu_id=menu_id)
+        menu_service = offload(MenuInfoService())
+        menu = await menu_service.get_by_menu_id(db=db, menu_id=menu_id)
         if not menu:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -399,14 +425,14 @@ async def update_menu(
                     detail="자기 자신을 상위 메뉴로 설정할 수 없습니다"
                 )
             
-            parent_menu = menu_service.get_by_menu_id(db=db, menu_id=menu_data.upper_menu_no)
+            parent_menu = await menu_service.get_by_menu_id(db=db, menu_id=menu_data.upper_menu_no)
             if not parent_menu:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"상위 메뉴를 찾을 수 없습니다: {menu_data.upper_menu_no}"
                 )
         
-        updated_menu = menu_service.update(
+        updated_menu = await menu_service.update(
             db=db,
             db_obj=menu,
             obj_in=menu_data
@@ -435,8 +461,8 @@ async def delete_menu(
     - **menu_id**: 삭제할 메뉴 ID
     """
     try:
-        menu_service = MenuInfoService()
-        menu = menu_service.get_by_menu_id(db=db, menu_id=menu_id)
+        menu_service = offload(MenuInfoService())
+        menu = await menu_service.get_by_menu_id(db=db, menu_id=menu_id)
         if not menu:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -444,14 +470,14 @@ async def delete_menu(
             )
         
         # 하위 메뉴 존재 확인
-        child_menus = menu_service.get_child_menus(db=db, parent_menu_id=menu_id)
+        child_menus = await menu_service.get_child_menus(db=db, parent_menu_id=menu_id)
         if child_menus:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="하위 메뉴가 존재하는 메뉴는 삭제할 수 없습니다"
             )
         
-        menu_service.soft_delete(db=db, menu_id=menu_id, user_id=current_user.get('user_id', 'system'))
+        await menu_service.soft_delete(db=db, menu_id=menu_id, user_id=current_user.get('user_id', 'system'))
         
         return {"message": f"메뉴가 삭제되었습니다: {menu_id}"}
         
@@ -480,15 +506,15 @@ async def move_menu(
     - **new_order**: 새로운 정렬 순서
     """
     try:
-        menu_service = MenuInfoService()
-        menu = menu_service.get_by_menu_id(db=db, menu_id=move_request.target_menu_id)
+        menu_service = offload(MenuInfoService())
+        menu = await menu_service.get_by_menu_id(db=db, menu_id=move_request.target_menu_id)
         if not menu:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"메뉴를 찾을 수 없습니다: {move_request.target_menu_id}"
             )
         
-        success = menu_service.move_menu(
+        success = await menu_service.move_menu(
             db=db,
             menu_no=move_request.target_menu_id,
             new_parent_id=move_request.new_parent_id,
@@ -498,7 +524,7 @@ async def move_menu(
         
         if success:
             # 이동된 메뉴 정보를 다시 조회하여 반환
-            updated_menu = menu_service.get_by_menu_id(db=db, menu_id=move_request.target_menu_id)
+            updated_menu = await menu_service.get_by_menu_id(db=db, menu_id=move_request.target_menu_id)
             return updated_menu
         else:
             raise HTTPException(
@@ -534,8 +560,8 @@ async def copy_menu(
     - **copy_children**: 하위 메뉴도 함께 복사할지 여부
     """
     try:
-        menu_service = MenuInfoService()
-        source_menu = menu_service.get_by_menu_id(db=db, menu_id=copy_request.source_menu_id)
+        menu_service = offload(MenuInfoService())
+        source_menu = await menu_service.get_by_menu_id(db=db, menu_id=copy_request.source_menu_id)
         if not source_menu:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -543,14 +569,14 @@ async def copy_menu(
             )
         
         # 중복 확인
-        existing_menu = menu_service.get_by_menu_id(db=db, menu_id=copy_request.new_menu_id)
+        existing_menu = await menu_service.get_by_menu_id(db=db, menu_id=copy_request.new_menu_id)
         if existing_menu:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"이미 존재하는 메뉴 ID입니다: {copy_request.new_menu_id}"
             )
         
-        copied_menu = menu_service.copy_menu(
+        copied_menu = await menu_service.copy_menu(
             db=db,
             source_menu_id=copy_request.source_menu_id,
             new_menu_id=copy_request.new_menu_id,
@@ -582,8 +608,8 @@ async def validate_menu(
     - **menu_data**: 검증할 메뉴 데이터
     """
     try:
-        menu_service = MenuInfoService()
-        validation_result = menu_service.validate_menu_data(db=db, menu_data=menu_data)
+        menu_service = offload(MenuInfoService())
+        validation_result = await menu_service.validate_menu_data(db=db, menu_data=menu_data)
         return validation_result
         
     except Exception as e:
@@ -593,34 +619,50 @@ async def validate_menu(
         )
 
 
-@menu_router.get("/export/json", response_model=MenuExportResponse, summary="메뉴 데이터 내보내기")
+@menu_router.get("/export/json", summary="메뉴 데이터 내보내기")
 async def export_menu_data(
-    format: str = Query("json", description="내보내기 형식 (json, csv)"),
+    format: str = Query("json", description="내보내기 형식 (json, ndjson, csv)"),
     include_inactive: bool = Query(False, description="비활성 메뉴 포함 여부"),
+    compress: bool = Query(False, description="gzip 압축 여부"),
     current_user: dict = Depends(get_current_user_from_bearer),
     db: Session = Depends(get_db)
 ):
     """
-    메뉴 데이터를 내보냅니다.
+    메뉴 데이터를 파일로 스트리밍합니다.
     
-    - **format**: 내보내기 형식 (json, csv)
+    - **format**: 내보내기 형식 (json, ndjson, csv)
     - **include_inactive**: 비활성 메뉴 포함 여부
+    - **compress**: gzip 압축 여부 (.gz 파일로 내려받음)
     """
+    menu_service = MenuInfoService()
     try:
-        menu_service = MenuInfoService()
-        export_data = menu_service.export_menu_data(
+        chunks = menu_service.export_menu_data(
             db=db,
             format=format,
-            include_inactive=include_inactive
-        )
-        
-        return export_data
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"메뉴 데이터 내보내기 중 오류가 발생했습니다: {str(e)}"
+            include_inactive=include_inactive,
+            compress=compress
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    def stream():
+        # get_db 정리는 응답 전송 전에 끝나므로 스트림이 다시 연 연결은 여기서 반환
+        try:
+            yield from chunks
+        finally:
+            db.close()
+    
+    file_name = f"menu_export_{datetime.now():%Y%m%d_%H%M%S}.{format}"
+    media_type = RECORD_MEDIA_TYPES[format]
+    if compress:
+        file_name += ".gz"
+        media_type = "application/gzip"
+    
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+    )
 
 
 @menu_router.post("/import", summary="메뉴 데이터 가져오기")
@@ -632,17 +674,17 @@ async def import_menu_data(
     """
     메뉴 데이터를 가져옵니다.
     
-    - **data**: 가져올 메뉴 데이터
-    - **format**: 데이터 형식 (json, csv)
-    - **overwrite**: 기존 데이터 덮어쓰기 여부
+    - **menu_data**: 가져올 메뉴 데이터
+    - **overwrite_existing**: 기존 데이터 덮어쓰기 여부
+    - **validate_only**: 검증만 수행 여부
     """
     try:
-        menu_service = MenuInfoService()
-        result = menu_service.import_menu_data(
+        menu_service = offload(MenuInfoService())
+        result = await menu_service.import_menu_data(
             db=db,
-            data=import_request.data,
-            format=import_request.format,
-            overwrite=import_request.overwrite
+            data=import_request.menu_data,
+            overwrite=import_request.overwrite_existing,
+            validate_only=import_request.validate_only
         )
         
         return result
@@ -651,4 +693,47 @@ async def import_menu_data(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"메뉴 데이터 가져오기 중 오류가 발생했습니다: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@menu_router.post("/import/stream", summary="메뉴 데이터 파일 가져오기")
+async def import_menu_file(
+    file: UploadFile = File(..., description="메뉴 데이터 파일"),
+    format: str = Query("json", description="파일 형식 (json, ndjson, csv)"),
+    overwrite: bool = Query(False, description="기존 메뉴 덮어쓰기 여부"),
+    validate_only: bool = Query(False, description="검증만 수행 여부"),
+    current_user: dict = Depends(get_current_user_from_bearer),
+    db: Session = Depends(get_db)
+):
+    """
+    업로드한 메뉴 데이터 파일을 레코드 단위로 읽으며 가져옵니다.
+    
+    파일 전체를 메모리에 올리지 않으므로 큰 JSON/NDJSON/CSV 파일에 사용합니다.
+    JSON은 메뉴 배열 또는 내보내기 파일 형식({"data": [...]})을 지원합니다.
+    
+    - **file**: 메뉴 데이터 파일
+    - **format**: 파일 형식 (json, ndjson, csv)
+    - **overwrite**: 기존 메뉴 덮어쓰기 여부
+    - **validate_only**: 검증만 수행 여부
+    """
+    try:
+        menu_service = offload(MenuInfoService())
+        return await menu_service.import_menu_data(
+            db=db,
+            data=iter_records(file.file, format),
+            format=format,
+            overwrite=overwrite,
+            validate_only=validate_only
+        )
+        
+    except ValueError as e:
+        # 지원하지 않는 형식 또는 파일 파싱 오류
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"메뉴 데이터 가져오기 중 오류가 발생했습니다: {str(e)}"
+        )
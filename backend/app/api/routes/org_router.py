@@ -17,6 +17,7 @@ from app.schemas.user_schemas import (
 )
 from app.services.user_service import OrgService
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.db_offload import offload
 
 router = APIRouter(prefix="/organizations", tags=["조직 관리"])
 
@@ -36,8 +37,8 @@ async def create_organization(
     - **parent_org_no**: 상급부서번호 (선택)
     - **org_ordr**: 조직순번 (선택)
     """
-    service = OrgService()
-    return service.create(db, org_data, current_user_id)
+    service = offload(OrgService())
+    return await service.create(db, org_data, current_user_id)
 
 
 @router.get("/", response_model=OrgPagination, summary="조직 목록 조회")
@@ -50,8 +51,8 @@ async def get_organizations(
     """
     조직 목록을 페이지네이션으로 조회합니다.
     """
-    service = OrgService()
-    orgs, total = service.get_multi(db, skip=skip, limit=limit)
+    service = offload(OrgService())
+    orgs, total = await service.get_multi(db, skip=skip, limit=limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -76,8 +77,8 @@ async def get_organization_tree(
     
     - **parent_org_no**: 상위 조직번호 (없으면 최상위 조직부터)
     """
-    service = OrgService()
-    return service.get_organization_tree(db, parent_org_no)
+    service = offload(OrgService())
+    return await service.get_organization_tree(db, parent_org_no)
 
 
 @router.get("/{org_no}", response_model=OrgResponse, summary="조직 상세 조회")
@@ -91,8 +92,8 @@ async def get_organization(
     
     - **org_no**: 조직번호
     """
-    service = OrgService()
-    org = service.get(db, org_no)
+    service = offload(OrgService())
+    org = await service.get(db, org_no)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -115,8 +116,8 @@ async def update_organization(
     - **org_no**: 조직번호
     - **org_data**: 수정할 조직 정보
     """
-    service = OrgService()
-    org = service.update(db, org_no, org_data, current_user.get("user_id"))
+    service = offload(OrgService())
+    org = await service.update(db, org_no, org_data, current_user.get("user_id"))
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -136,14 +137,14 @@ async def delete_organization(
     
     - **org_no**: 조직번호
     """
-    service = OrgService()
-    org = service.get(db, org_no)
+    service = offload(OrgService())
+    org = await service.get(db, org_no)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="조직을 찾을 수 없습니다."
         )
-    service.remove(db, org_no)
+    await service.remove(db, org_no)
     return {"message": "조직이 성공적으로 삭제되었습니다."}
 
 
@@ -158,8 +159,8 @@ async def get_child_organizations(
     
     - **org_no**: 상위 조직번호
     """
-    service = OrgService()
-    return service.get_child_organizations(db, org_no)
+    service = offload(OrgService())
+    return await service.get_child_organizations(db, org_no)
 
 
 @router.get("/{org_no}/path", response_model=List[OrgResponse], summary="조직 경로 조회")
@@ -173,5 +174,5 @@ async def get_organization_path(
     
     - **org_no**: 조직번호
     """
-    service = OrgService()
-    return service.get_organization_path(db, org_no)
\ No newline at end of file
+    service = offload(OrgService())
+    return await service.get_organization_path(db, org_no)
\ No newline at end of file
@@ -15,6 +15,7 @@ from app.schemas.system_schemas import (
 )
 from app.services.system_service import ProgrmListService
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.db_offload import offload
 
 router = APIRouter(prefix="/programs", tags=["프로그램 관리"])
 
@@ -36,8 +37,8 @@ async def create_program(
     - **progrm_dc**: 프로그램설명 (선택)
     - **url**: URL (선택)
     """
-    service = ProgrmListService()
-    return service.create(db, program_data, current_user.get('user_id'))
+    service = offload(ProgrmListService())
+    return await service.create(db, program_data, current_user.get('user_id'))
 
 
 @router.get("/", response_model=ProgrmListPagination, summary="프로그램 목록 조회")
@@ -50,8 +51,8 @@ async def get_programs(
     """
     프로그램 목록을 페이지네이션으로 조회합니다.
     """
-    service = ProgrmListService()
-    programs, total = service.get_multi(db, skip=skip, limit=limit)
+    service = offload(ProgrmListService())
+    programs, total = await service.get_multi(db, skip=skip, limit=limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -91,8 +92,8 @@ async def search_programs(
         url=url
     )
     
-    service = ProgrmListService()
-    programs, total = service.search_programs(db, search_params, skip, limit)
+    service = offload(ProgrmListService())
+    programs, total = await service.search_programs(db, search_params, skip, limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -117,8 +118,8 @@ async def get_program(
     
     - **progrm_file_nm**: 프로그램파일명
     """
-    service = ProgrmListService()
-    program = service.get_by_file_name(db, progrm_file_nm)
+    service = offload(ProgrmListService())
+    program = await service.get_by_file_name(db, progrm_file_nm)
     if not program:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -140,14 +141,14 @@ async def update_program(
     - **progrm_file_nm**: 프로그램파일명
     - **program_data**: 수정할 프로그램 정보
     """
-    service = ProgrmListService()
-    program = service.get_by_file_name(db, progrm_file_nm)
+    service = offload(ProgrmListService())
+    program = await service.get_by_file_name(db, progrm_file_nm)
     if not program:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로그램을 찾을 수 없습니다."
         )
-    return service.update(db, program, program_data, last_updt_user_id=current_user.get('user_id'))
+    return await service.update(db, program, program_data, last_updt_user_id=current_user.get('user_id'))
 
 
 @router.delete("/{progrm_file_nm}", summary="프로그램 삭제")
@@ -161,12 +162,12 @@ async def delete_program(
     
     - **progrm_file_nm**: 프로그램파일명
     """
-    service = ProgrmListService()
-    program = service.get_by_file_name(db, progrm_file_nm)
+    service = offload(ProgrmListService())
+    program = await service.get_by_file_name(db, progrm_file_nm)
     if not program:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로그램을 찾을 수 없습니다."
         )
-    service.remove(db, progrm_file_nm)
+    await service.remove(db, progrm_file_nm)
     return {"message": "프로그램이 성공적으로 삭제되었습니다."}
\ No newline at end of file
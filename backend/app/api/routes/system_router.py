@@ -5,10 +5,11 @@
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_pool_metrics, get_async_pool_metrics
 from app.models.system_models import SysLog, WebLog
 from app.schemas.system_schemas import (
     # SysLog 스키마
@@ -19,8 +20,19 @@ from app.schemas.system_schemas import (
     LogSearchParams,
     LogStatistics, SystemHealthCheck, DashboardSummary
 )
-from app.services.system_service import SysLogService, WebLogService, SystemMonitoringService
+from app.database.partitioning import cleanup_log_table
+from app.middleware.ip_filter import get_ip_access_rules
+from app.models.log_models import APIUsageLog
+from app.schemas.log_schemas import LogExportResponse
+from app.services.system_service import SysLogService, WebLogService
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.cursor import InvalidCursorError
+from app.utils.db_offload import get_db_offloader, offload
+from app.utils.export_jobs import EXPORT_COMPLETED, ExportJob, get_export_job_manager
+from app.utils.loop_monitor import get_loop_lag_monitor
+from app.utils.page_total import TOTAL_STRATEGY_PATTERN
+from app.utils.record_stream import RECORD_MEDIA_TYPES
+from app.utils.system_snapshot import DASHBOARD, HEALTH, get_system_snapshot_engine
 
 router = APIRouter(prefix="/system", tags=["시스템 관리"])
 
@@ -46,35 +58,48 @@ async def create_syslog(
     - **error_cn**: 에러내용 (선택)
     - **rqester_id**: 요청자ID (선택)
     """
-    service = SysLogService()
-    return service.create(db, log_data)
+    service = offload(SysLogService())
+    return await service.create(db, log_data)
 
 
 @router.get("/logs/", response_model=SysLogPagination, summary="시스템 로그 목록 조회")
 async def get_system_logs(
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정하면 skip 무시)"),
+    total_mode: str = Query("estimated", pattern=TOTAL_STRATEGY_PATTERN, description="전체 개수 산출 방식 (exact, estimated, capped, none)"),
     current_user: dict = Depends(get_current_user_from_bearer),
     db: Session = Depends(get_db)
 ):
     """
-    시스템 로그 목록을 페이지네이션으로 조회합니다.
+    시스템 로그 목록을 페이지네이션으로 조회합니다. (발생일 최신순)
     
     - **skip**: 건너뛸 개수 (기본값: 0)
     - **limit**: 조회할 개수 (기본값: 100, 최대: 1000)
+    - **cursor**: 다음 페이지 커서 (깊은 페이지도 OFFSET 없이 조회)
+    - **total_mode**: 전체 개수 산출 방식 (exact: COUNT, estimated: 통계 추정치, capped: 상한까지만 계산, none: 계산 안 함)
     """
-    service = SysLogService()
-    logs, total = service.get_multi(db, skip=skip, limit=limit)
+    service = offload(SysLogService())
+    try:
+        logs, next_cursor = await service.get_page_after(
+            db, cursor=cursor, skip=skip, limit=limit, order_by="occrrnc_de", order_desc=True
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    page_total = await service.count_total(db, total_mode)
     
-    pages = (total + limit - 1) // limit
-    page = (skip // limit) + 1
+    page = None if cursor else (skip // limit) + 1
     
     return SysLogPagination(
         items=logs,
-        total=total,
+        total=page_total.total,
+        total_type=page_total.total_type,
         page=page,
         size=limit,
-        pages=pages
+        pages=page_total.pages(limit),
+        cursor=cursor,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
     )
 
 
@@ -113,8 +138,8 @@ async def search_system_logs(
         rqester_id=rqester_id
     )
     
-    service = SysLogService()
-    logs, total = service.search_logs(db, search_params, skip, limit)
+    service = offload(SysLogService())
+    logs, total = await service.search_logs(db, search_params, skip, limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -144,8 +169,92 @@ async def get_system_log_statistics(
     - 에러 발생 통계
     - 시간대별 통계
     """
-    service = SysLogService()
-    return service.get_log_statistics(db, start_date, end_date)
+    service = offload(SysLogService())
+    return await service.get_log_statistics(db, start_date, end_date)
+
+
+@router.get("/logs/export", summary="로그 데이터 내보내기")
+async def export_logs(
+    log_type: str = Query(..., description="로그 타입 (system, web)"),
+    start_date: Optional[date] = Query(None, description="시작일자"),
+    end_date: Optional[date] = Query(None, description="종료일자"),
+    format: str = Query("csv", description="내보내기 형식 (csv, ndjson, json)"),
+    compress: bool = Query(False, description="gzip 압축 여부"),
+    current_user: dict = Depends(get_current_user_from_bearer),
+    db: Session = Depends(get_db)
+):
+    """
+    로그 데이터를 지정된 형식의 파일로 스트리밍합니다.
+    
+    - **log_type**: 로그 타입 (system, web)
+    - **start_date**: 시작일자
+    - **end_date**: 종료일자 (포함)
+    - **format**: 내보내기 형식 (csv, ndjson, json)
+    - **compress**: gzip 압축 여부 (.gz 파일로 내려받음)
+    
+    파일로 저장한 뒤 내려받으려면 POST /system/logs/export/jobs를 사용합니다.
+    """
+    service = _export_service(log_type)
+    try:
+        chunks = service.export_logs(db, start_date, end_date, format, compress=compress)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    def stream():
+        # get_db 정리는 응답 전송 전에 끝나므로 스트림이 다시 연 연결은 여기서 반환
+        try:
+            yield from chunks
+        finally:
+            db.close()
+    
+    file_name = f"{log_type}_logs_{datetime.now():%Y%m%d_%H%M%S}.{format}"
+    media_type = RECORD_MEDIA_TYPES[format]
+    if compress:
+        file_name += ".gz"
+        media_type = "application/gzip"
+    
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+    )
+
+
+@router.post(
+    "/logs/export/jobs",
+    response_model=LogExportResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="로그 데이터 내보내기 작업 등록"
+)
+async def create_export_job(
+    request: Request,
+    log_type: str = Query(..., description="로그 타입 (system, web)"),
+    start_date: Optional[date] = Query(None, description="시작일자"),
+    end_date: Optional[date] = Query(None, description="종료일자"),
+    format: str = Query("csv", description="내보내기 형식 (csv, ndjson, json)"),
+    compress: bool = Query(False, description="gzip 압축 여부"),
+    current_user: dict = Depends(get_current_user_from_bearer)
+):
+    """
+    로그 데이터를 서버에서 파일로 저장하는 작업을 등록합니다.
+    
+    응답의 status_url로 진행률을 조회하고, 완료되면 download_url로 내려받습니다.
+    """
+    statement = _export_service(log_type).export_statement(start_date, end_date)
+    manager = get_export_job_manager()
+    try:
+        job = manager.submit(
+            f"{log_type}_logs",
+            statement,
+            format=format,
+            compress=compress,
+            owner=current_user.get("user_id"),
+            metadata={"format": format, "export_time": datetime.now().isoformat()}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return _export_job_response(request, job)
 
 
 @router.get("/logs/{log_id}", response_model=SysLogResponse, summary="시스템 로그 상세 조회")
@@ -159,8 +268,8 @@ async def get_system_log(
     
     - **log_id**: 로그ID
     """
-    service = SysLogService()
-    log = service.get_by_log_id(db, log_id)
+    service = offload(SysLogService())
+    log = await service.get_by_log_id(db, log_id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -182,14 +291,51 @@ async def update_system_log(
     - **log_id**: 로그ID
     - **log_data**: 수정할 로그 정보
     """
-    service = SysLogService()
-    log = service.get_by_log_id(db, log_id)
+    service = offload(SysLogService())
+    log = await service.get_by_log_id(db, log_id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="시스템 로그를 찾을 수 없습니다."
         )
-    return service.update(db, log, log_data)
+    return await service.update(db, log, log_data)
+
+
+# /logs/{log_id}보다 먼저 등록해야 cleanup이 log_id로 해석되지 않음
+@router.delete("/logs/cleanup", summary="오래된 로그 정리")
+async def cleanup_old_logs(
+    log_type: str = Query(..., description="로그 타입 (system, web, api)"),
+    days: int = Query(90, ge=1, description="보관 기간 (일)"),
+    mode: Optional[str] = Query(None, pattern="^(drop|detach)$", description="지난 파티션 정리 방식 (drop, detach)"),
+    current_user: dict = Depends(get_current_user_from_bearer),
+    db: Session = Depends(get_db)
+):
+    """
+    지정된 기간보다 오래된 로그를 정리합니다.
+    
+    보관 기간이 지난 월별 파티션은 통째로 삭제(drop)하거나 분리(detach)하고,
+    기준 시점이 걸친 파티션에서만 행을 삭제합니다.
+    
+    - **log_type**: 로그 타입 (system, web, api)
+    - **days**: 보관 기간 (일, 기본값: 90일)
+    - **mode**: 지난 파티션 정리 방식 (기본값: LOG_RETENTION_MODE)
+    """
+    if log_type == "system":
+        result = await offload(SysLogService()).cleanup_old_logs(db, days, mode)
+    elif log_type == "web":
+        result = await offload(WebLogService()).cleanup_old_logs(db, days, mode)
+    elif log_type == "api":
+        result = await get_db_offloader().run(cleanup_log_table, db, APIUsageLog.__table__, days, mode)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원하지 않는 로그 타입입니다. (system, web, api만 지원)"
+        )
+    
+    return {
+        "message": f"{days}일 이전의 {log_type} 로그가 정리되었습니다.",
+        **result
+    }
 
 
 @router.delete("/logs/{log_id}", summary="시스템 로그 삭제")
@@ -203,8 +349,8 @@ async def delete_system_log(
     
     - **log_id**: 로그ID
     """
-    service = SysLogService()
-    success = service.delete(db, log_id)
+    service = offload(SysLogService())
+    success = await service.delete(db, log_id)
     if success:
         return {"message": "시스템 로그가 성공적으로 삭제되었습니다."}
     else:
@@ -236,8 +382,8 @@ async def create_web_log(
     - **response_time**: 응답시간 (선택)
     - **user_id**: 사용자ID (선택)
     """
-    service = WebLogService()
-    return service.create(db, log_data)
+    service = offload(WebLogService())
+    return await service.create(db, log_data)
 
 
 @router.get("/web-logs/", response_model=WebLogPagination, summary="웹 로그 목록 조회")
@@ -250,8 +396,8 @@ async def get_web_logs(
     """
     웹 로그 목록을 페이지네이션으로 조회합니다.
     """
-    service = WebLogService()
-    logs, total = service.get_multi(db, skip=skip, limit=limit)
+    service = offload(WebLogService())
+    logs, total = await service.get_multi(db, skip=skip, limit=limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -300,8 +446,8 @@ async def search_web_logs(
         user_id=user_id
     )
     
-    service = WebLogService()
-    logs, total = service.search_logs(db, search_params, skip, limit)
+    service = offload(WebLogService())
+    logs, total = await service.search_logs(db, search_params, skip, limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -330,8 +476,8 @@ async def get_popular_pages(
     - **end_date**: 종료일시
     - **limit**: 조회할 개수 (기본값: 10)
     """
-    service = WebLogService()
-    return service.get_popular_pages(db, start_date, end_date, limit)
+    service = offload(WebLogService())
+    return await service.get_popular_pages(db, start_date, end_date, limit)
 
 
 @router.get("/web-logs/hourly-traffic", response_model=List[Dict[str, Any]], summary="시간대별 트래픽 조회")
@@ -345,8 +491,8 @@ async def get_hourly_traffic(
     
     - **target_date**: 대상일자 (기본값: 오늘)
     """
-    service = WebLogService()
-    return service.get_hourly_traffic(db, target_date)
+    service = offload(WebLogService())
+    return await service.get_hourly_traffic(db, target_date)
 
 
 @router.get("/web-logs/{conect_id}", response_model=WebLogResponse, summary="웹 로그 상세 조회")
@@ -360,8 +506,8 @@ async def get_web_log(
     
     - **conect_id**: 접속ID
     """
-    service = WebLogService()
-    log = service.get_by_conect_id(db, conect_id)
+    service = offload(WebLogService())
+    log = await service.get_by_conect_id(db, conect_id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -383,14 +529,14 @@ async def update_web_log(
     - **conect_id**: 접속ID
     - **log_data**: 수정할 로그 정보
     """
-    service = WebLogService()
-    log = service.get_by_conect_id(db, conect_id)
+    service = offload(WebLogService())
+    log = await service.get_by_conect_id(db, conect_id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="웹 로그를 찾을 수 없습니다."
         )
-    return service.update(db, log, log_data)
+    return await service.update(db, log, log_data)
 
 
 @router.delete("/web-logs/{conect_id}", summary="웹 로그 삭제")
@@ -404,14 +550,14 @@ async def delete_web_log(
     
     - **conect_id**: 접속ID
     """
-    service = WebLogService()
-    log = service.get_by_conect_id(db, conect_id)
+    service = offload(WebLogService())
+    log = await service.get_by_conect_id(db, conect_id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="웹 로그를 찾을 수 없습니다."
         )
-    service.remove(db, conect_id)
+    await service.remove(db, conect_id)
     return {"message": "웹 로그가 성공적으로 삭제되었습니다."}
 
 
@@ -422,8 +568,8 @@ async def delete_web_log(
 
 @router.get("/health", response_model=SystemHealthCheck, summary="시스템 상태 확인")
 async def get_system_health(
-    current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+    response: Response,
+    current_user: dict = Depends(get_current_user_from_bearer)
 ):
     """
     시스템의 전반적인 상태를 확인합니다.
@@ -432,17 +578,84 @@ async def get_system_health(
     - 시스템 리소스 사용량
     - 최근 에러 발생 현황
     - 서비스 가용성
+    - 이벤트 루프 지연과 루프를 가장 오래 막은 엔드포인트 (event_loop)
+    - 동기 DB 작업 스레드 풀 사용 현황 (db_offload)
+    
+    상태와 리소스 사용량은 백그라운드에서 주기적으로 계산한 스냅샷이며,
+    snapshot_at/snapshot_age(와 Age 헤더)로 계산 시각과 나이를 확인합니다.
+    event_loop/db_offload는 요청 시점의 값입니다.
     """
-    # 시스템 모니터링 서비스를 통해 상태 확인
-    monitoring_service = SystemMonitoringService()
+    snapshot = await get_system_snapshot_engine().get(HEALTH)
+    response.headers["Age"] = str(int(snapshot.age))
+    # 스냅샷은 여러 요청이 공유하므로 복사본에 요청 시점 지표를 추가
+    return snapshot.payload.model_copy(update={
+        "event_loop": get_loop_lag_monitor().get_stats(),
+        "db_offload": get_db_offloader().get_stats(),
+        "snapshot_at": snapshot.taken_at,
+        "snapshot_age": round(snapshot.age, 3)
+    })
+
+
+@router.get("/db-pool", summary="커넥션 풀 지표 조회")
+async def get_db_pool_metrics(
+    current_user: dict = Depends(get_current_user_from_bearer)
+) -> Dict[str, Any]:
+    """
+    이 워커 프로세스의 커넥션 풀 지표를 조회합니다.
+    
+    - 풀 크기, 사용 중/대기 중 연결 수, 오버플로
+    - 누적 연결/체크아웃/무효화/대기 시간 초과 횟수
+    - 연결 획득 대기 시간, 연결 점유 시간 히스토그램 (초)
     
-    return monitoring_service.get_system_health(db)
+    워커마다 풀이 따로 있으므로 응답의 pid로 워커를 구분합니다.
+    async_engine 항목은 get_async_db가 사용하는 비동기 엔진 풀입니다.
+    """
+    stats = get_pool_metrics().get_stats()
+    stats["async_engine"] = get_async_pool_metrics().get_stats()
+    return stats
+
+
+@router.get("/ip-rules", summary="IP 접근 규칙 상태 조회")
+async def get_ip_rules(
+    current_user: dict = Depends(get_current_user_from_bearer)
+) -> Dict[str, Any]:
+    """
+    이 워커 프로세스에 적용된 IP 접근 규칙 상태를 조회합니다.
+    
+    - 허용/차단 구간 수, 규칙 파일 경로와 감시 여부
+    - 건너뛴 잘못된 규칙, 마지막 파일 읽기 오류
+    """
+    return get_ip_access_rules().get_stats()
+
+
+@router.post("/ip-rules/reload", summary="IP 접근 규칙 다시 읽기")
+async def reload_ip_rules(
+    current_user: dict = Depends(get_current_user_from_bearer)
+) -> Dict[str, Any]:
+    """
+    IP_RULES_FILE 규칙 파일을 즉시 다시 읽어 이 워커의 IP 접근 규칙을 교체합니다.
+    
+    다른 워커는 규칙 파일 수정 시각을 IP_RULES_RELOAD_INTERVAL초마다 확인하여
+    스스로 다시 읽습니다. (SIGHUP으로도 다시 읽을 수 있음)
+    """
+    rules = get_ip_access_rules()
+    if not rules.rules_file:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="IP_RULES_FILE이 설정되지 않았습니다."
+        )
+    if not await get_db_offloader().run(rules.reload_file):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"IP 규칙 파일을 읽을 수 없습니다: {rules.last_error}"
+        )
+    return rules.get_stats()
 
 
 @router.get("/dashboard", response_model=DashboardSummary, summary="대시보드 요약 정보")
 async def get_dashboard_summary(
-    current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+    response: Response,
+    current_user: dict = Depends(get_current_user_from_bearer)
 ):
     """
     관리자 대시보드용 요약 정보를 조회합니다.
@@ -451,9 +664,16 @@ async def get_dashboard_summary(
     - 최근 활동 현황
     - 시스템 알림
     - 성능 지표
+    
+    백그라운드에서 주기적으로 계산한 스냅샷을 반환하며,
+    snapshot_at/snapshot_age(와 Age 헤더)로 계산 시각과 나이를 확인합니다.
     """
-    monitoring_service = SystemMonitoringService()
-    return monitoring_service.get_dashboard_summary(db)
+    snapshot = await get_system_snapshot_engine().get(DASHBOARD)
+    response.headers["Age"] = str(int(snapshot.age))
+    return snapshot.payload.model_copy(update={
+        "snapshot_at": snapshot.taken_at,
+        "snapshot_age": round(snapshot.age, 3)
+    })
 
 
 @router.get("/logs/user/{user_id}", response_model=SysLogPagination, summary="사용자별 로그 조회")
@@ -471,8 +691,8 @@ async def get_user_logs(
     - **user_id**: 사용자 ID
     - **days**: 조회 기간 (일, 기본값: 30일)
     """
-    service = SysLogService()
-    logs, total = service.get_user_logs(db, user_id, days, skip, limit)
+    service = offload(SysLogService())
+    logs, total = await service.get_user_logs(db, user_id, days, skip, limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -499,8 +719,8 @@ async def get_error_logs(
     
     - **days**: 조회 기간 (일, 기본값: 7일)
     """
-    service = SysLogService()
-    logs, total = service.get_error_logs(db, days, skip, limit)
+    service = offload(SysLogService())
+    logs, total = await service.get_error_logs(db, days, skip, limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -514,62 +734,74 @@ async def get_error_logs(
     )
 
 
-@router.get("/logs/export", summary="로그 데이터 내보내기")
-async def export_logs(
-    log_type: str = Query(..., description="로그 타입 (system, web)"),
-    start_date: Optional[date] = Query(None, description="시작일자"),
-    end_date: Optional[date] = Query(None, description="종료일자"),
-    format: str = Query("csv", description="내보내기 형식 (csv, json, excel)"),
-    current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+# ==================== 내보내기 작업 엔드포인트 ====================
+
+def _export_service(log_type: str):
+    """로그 타입별 내보내기 서비스"""
+    if log_type == "system":
+        return SysLogService()
+    if log_type == "web":
+        return WebLogService()
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="지원하지 않는 로그 타입입니다. (system, web만 지원)"
+    )
+
+
+def _get_own_export_job(export_id: str, current_user: dict) -> ExportJob:
+    """요청한 사용자의 내보내기 작업 (없거나 다른 사용자의 작업이면 404)"""
+    job = get_export_job_manager().get(export_id)
+    if job is None or (job.owner and job.owner != current_user.get("user_id")):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="내보내기 작업을 찾을 수 없습니다.")
+    return job
+
+
+def _export_job_response(request: Request, job: ExportJob) -> LogExportResponse:
+    """내보내기 작업 응답 (상태/다운로드 URL 포함)"""
+    download_url = None
+    if job.status == EXPORT_COMPLETED:
+        download_url = request.url_for("download_export_file", export_id=job.export_id).path
+    return LogExportResponse(
+        **get_export_job_manager().describe(job),
+        status_url=request.url_for("get_export_job", export_id=job.export_id).path,
+        download_url=download_url
+    )
+
+
+@router.get("/exports/{export_id}", response_model=LogExportResponse, summary="내보내기 작업 상태 조회")
+async def get_export_job(
+    export_id: str,
+    request: Request,
+    current_user: dict = Depends(get_current_user_from_bearer)
 ):
     """
-    로그 데이터를 지정된 형식으로 내보냅니다.
+    로그 내보내기 작업(로그인/시스템/웹 로그)의 상태와 진행률을 조회합니다.
     
-    - **log_type**: 로그 타입 (system, web)
-    - **start_date**: 시작일자
-    - **end_date**: 종료일자
-    - **format**: 내보내기 형식 (csv, json, excel)
+    - **status**: pending, running, completed, failed
+    - **record_count** / **total_count**: 기록한 레코드 수 / 전체 레코드 수
+    - **download_url**: 완료된 경우 다운로드 URL
     """
-    if log_type == "system":
-        service = SysLogService()
-        return service.export_logs(db, start_date, end_date, format)
-    elif log_type == "web":
-        service = WebLogService()
-        return service.export_logs(db, start_date, end_date, format)
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="지원하지 않는 로그 타입입니다. (system, web만 지원)"
-        )
+    return _export_job_response(request, _get_own_export_job(export_id, current_user))
 
 
-@router.delete("/logs/cleanup", summary="오래된 로그 정리")
-async def cleanup_old_logs(
-    log_type: str = Query(..., description="로그 타입 (system, web)"),
-    days: int = Query(90, ge=1, description="보관 기간 (일)"),
-    current_user: dict = Depends(get_current_user_from_bearer),
-    db: Session = Depends(get_db)
+@router.get("/exports/{export_id}/download", summary="내보내기 파일 다운로드")
+async def download_export_file(
+    export_id: str,
+    current_user: dict = Depends(get_current_user_from_bearer)
 ):
     """
-    지정된 기간보다 오래된 로그를 정리합니다.
-    
-    - **log_type**: 로그 타입 (system, web)
-    - **days**: 보관 기간 (일, 기본값: 90일)
+    완료된 로그 내보내기 작업의 파일을 내려받습니다.
     """
-    if log_type == "system":
-        service = SysLogService()
-        deleted_count = service.cleanup_old_logs(db, days)
-    elif log_type == "web":
-        service = WebLogService()
-        deleted_count = service.cleanup_old_logs(db, days)
-    else:
+    job = _get_own_export_job(export_id, current_user)
+    if job.status != EXPORT_COMPLETED:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="지원하지 않는 로그 타입입니다. (system, web만 지원)"
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"내보내기 작업이 완료되지 않았습니다. (상태: {job.status})"
         )
     
-    return {
-        "message": f"{days}일 이전의 {log_type} 로그가 정리되었습니다.",
-        "deleted_count": deleted_count
-    }
\ No newline at end of file
+    path = get_export_job_manager().path_of(job)
+    if not path.exists():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="내보내기 파일이 만료되었습니다.")
+    
+    media_type = "application/gzip" if job.compress else RECORD_MEDIA_TYPES[job.format]
+    return FileResponse(path, media_type=media_type, filename=job.file_name)
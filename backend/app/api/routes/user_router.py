@@ -25,6 +25,7 @@ from app.services.auth_service import AuthorInfoService
 from app.services.log_service import LoginLogService
 from app.utils.dependencies import get_current_user, get_current_user_id, verify_token_dependency
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.db_offload import offload
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -78,18 +79,18 @@ async def one_click_login(
     elif "x-real-ip" in request.headers:
         client_ip = request.headers["x-real-ip"]
     
-    login_log_service = LoginLogService()
+    login_log_service = offload(LoginLogService())
     
     try:
         # 사용자 인증 및 JWT 토큰 생성
-        auth_service = AuthorInfoService()
-        auth_result = auth_service.authenticate_and_create_tokens(
+        auth_service = offload(AuthorInfoService())
+        auth_result = await auth_service.authenticate_and_create_tokens(
             db, login_data.user_id, login_data.password
         )
         
         if not auth_result:
             # 로그인 실패 로그 기록
-            login_log_service.create_login_log(
+            await login_log_service.create_login_log(
                 db=db,
                 user_id=login_data.user_id,
                 ip_address=client_ip,
@@ -102,7 +103,7 @@ async def one_click_login(
             )
         
         # 로그인 성공 로그 기록
-        login_log_service.create_login_log(
+        await login_log_service.create_login_log(
             db=db,
             user_id=login_data.user_id,
             ip_address=client_ip,
@@ -128,7 +129,7 @@ async def one_click_login(
     except Exception as e:
         # 로그인 오류 로그 기록
         try:
-            login_log_service.create_login_log(
+            await login_log_service.create_login_log(
                 db=db,
                 user_id=login_data.user_id,
                 ip_address=client_ip,
@@ -157,8 +158,8 @@ async def get_my_profile(
     - **Authorization**: Bearer 토큰 필요
     """
     try:
-        service = UserInfoService()
-        user = service.get_by_user_id(db, current_user["user_id"])
+        service = offload(UserInfoService())
+        user = await service.get_by_user_id(db, current_user["user_id"])
         
         if not user:
             raise HTTPException(
@@ -187,8 +188,8 @@ async def update_my_profile(
     - **Authorization**: Bearer 토큰 필요
     """
     try:
-        service = UserInfoService()
-        user = service.get_by_user_id(db, current_user["user_id"])
+        service = offload(UserInfoService())
+        user = await service.get_by_user_id(db, current_user["user_id"])
         
         if not user:
             raise HTTPException(
@@ -196,7 +197,7 @@ async def update_my_profile(
                 detail="사용자를 찾을 수 없습니다."
             )
         
-        return service.update(db, user, user_data, current_user["user_id"])
+        return await service.update(db, user, user_data, current_user["user_id"])
     except Exception as e:
         logger.error(f"❌ 프로필 수정 실패: {str(e)}")
         raise HTTPException(
@@ -217,9 +218,9 @@ async def get_users_list(
     - **Authorization**: Bearer 토큰 필요
     """
     try:
-        service = UserInfoService()
-        users = service.get_multi(db, skip=skip, limit=limit)
-        total = service.count(db)
+        service = offload(UserInfoService())
+        users = await service.get_multi(db, skip=skip, limit=limit)
+        total = await service.count(db)
         
         pages = (total + limit - 1) // limit
         page = (skip // limit) + 1
@@ -259,8 +260,8 @@ async def create_user(
     """
     try:
         logger.info(f"🚀 사용자 생성 요청 - user_id: {user_data.user_id}, user_nm: {user_data.user_nm}")
-        service = UserInfoService()
-        result = service.create(db, user_data, current_user_id)
+        service = offload(UserInfoService())
+        result = await service.create(db, user_data, current_user_id)
         logger.info(f"✅ 사용자 생성 성공 - user_id: {result.user_id}")
         return result
     except Exception as e:
@@ -287,8 +288,8 @@ async def create_user_basic(
     """
     try:
         logger.info(f"🚀 기본 사용자 생성 요청 - user_id: {user_data.user_id}, user_nm: {user_data.user_nm}")
-        service = UserInfoService()
-        result = service.create(db, user_data, current_user_id)
+        service = offload(UserInfoService())
+        result = await service.create(db, user_data, current_user_id)
         logger.info(f"✅ 기본 사용자 생성 성공 - user_id: {result.user_id}")
         return result
     except Exception as e:
@@ -310,9 +311,9 @@ async def get_users(
     - **skip**: 건너뛸 개수 (기본값: 0)
     - **limit**: 조회할 개수 (기본값: 100, 최대: 1000)
     """
-    service = UserInfoService()
-    users = service.get_multi(db, skip=skip, limit=limit)
-    total = service.count(db)
+    service = offload(UserInfoService())
+    users = await service.get_multi(db, skip=skip, limit=limit)
+    total = await service.count(db)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -339,9 +340,9 @@ async def search_users(
     - **Authorization**: Bearer 토큰 필요
     """
     try:
-        service = UserInfoService()
+        service = offload(UserInfoService())
         # 검색 키워드로 사용자 검색 (OR 조건)
-        users, total = service.search_users_by_keyword(db, query)
+        users, total = await service.search_users_by_keyword(db, query)
         return users
     except Exception as e:
         logger.error(f"❌ 사용자 검색 실패: {str(e)}")
@@ -367,8 +368,8 @@ async def get_user_statistics(
     - 조직별 사용자 수
     - 최근 가입자 수
     """
-    service = UserInfoService()
-    return service.get_user_statistics(db)
+    service = offload(UserInfoService())
+    return await service.get_user_statistics(db)
 
 
 @router.get("/{user_id}", response_model=UserInfoResponse, summary="사용자 상세 조회")
@@ -382,8 +383,8 @@ async def get_user(
     
     - **user_id**: 업무사용자ID
     """
-    service = UserInfoService()
-    user = service.get_by_user_id(db, user_id)
+    service = offload(UserInfoService())
+    user = await service.get_by_user_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -405,14 +406,14 @@ async def update_user(
     - **user_id**: 업무사용자ID
     - **user_data**: 수정할 사용자 정보
     """
-    service = UserInfoService()
-    user = service.get_by_user_id(db, user_id)
+    service = offload(UserInfoService())
+    user = await service.get_by_user_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다."
         )
-    return service.update(db, user, user_data, current_user.get('user_id'))
+    return await service.update(db, user, user_data, current_user.get('user_id'))
 
 
 @router.delete("/{user_id}", summary="사용자 삭제")
@@ -426,14 +427,14 @@ async def delete_user(
     
     - **user_id**: 업무사용자ID
     """
-    service = UserInfoService()
-    user = service.get_by_user_id(db, user_id)
+    service = offload(UserInfoService())
+    user = await service.get_by_user_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다."
         )
-    service.delete(db, user.user_id)
+    await service.delete(db, user.user_id)
     return {"message": "사용자가 성공적으로 삭제되었습니다."}
 
 
@@ -448,8 +449,8 @@ async def lock_user(
     
     - **user_id**: 업무사용자ID
     """
-    service = UserInfoService()
-    return service.lock_user(db, user_id, current_user.get('user_id'))
+    service = offload(UserInfoService())
+    return await service.lock_user(db, user_id, current_user.get('user_id'))
 
 
 @router.post("/{user_id}/unlock", response_model=UserInfoResponse, summary="사용자 계정 잠금 해제")
@@ -463,5 +464,5 @@ async def unlock_user(
     
     - **user_id**: 업무사용자ID
     """
-    service = UserInfoService()
-    return service.unlock_user(db, user_id, current_user.get('user_id'))
\ No newline at end of file
+    service = offload(UserInfoService())
+    return await service.unlock_user(db, user_id, current_user.get('user_id'))
\ No newline at end of file
@@ -15,6 +15,9 @@ from app.schemas.user_schemas import (
 )
 from app.services.user_service import ZipService
 from app.utils.auth import get_current_user_from_bearer
+from app.utils.cursor import InvalidCursorError
+from app.utils.db_offload import offload
+from app.utils.page_total import TOTAL_STRATEGY_PATTERN
 
 router = APIRouter(prefix="/zip-codes", tags=["우편번호 관리"])
 
@@ -37,32 +40,44 @@ async def create_zip_code(
     - **li_buld_nm**: 리건물명 (선택)
     - **lnbr_dong_ho**: 지번동호 (선택)
     """
-    service = ZipService()
-    return service.create(db, zip_data, current_user_id)
+    service = offload(ZipService())
+    return await service.create(db, zip_data, current_user_id)
 
 
 @router.get("/", response_model=ZipPagination, summary="우편번호 목록 조회")
 async def get_zip_codes(
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 개수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정하면 skip 무시)"),
+    total_mode: str = Query("estimated", pattern=TOTAL_STRATEGY_PATTERN, description="전체 개수 산출 방식 (exact, estimated, capped, none)"),
     current_user: dict = Depends(get_current_user_from_bearer),
     db: Session = Depends(get_db)
 ):
     """
-    우편번호 목록을 페이지네이션으로 조회합니다.
-    """
-    service = ZipService()
-    zip_codes, total = service.get_multi(db, skip=skip, limit=limit)
+    우편번호 목록을 페이지네이션으로 조회합니다. (우편번호, 일련번호 순)
     
-    pages = (total + limit - 1) // limit
-    page = (skip // limit) + 1
+    - **cursor**: 다음 페이지 커서 (깊은 페이지도 OFFSET 없이 조회)
+    - **total_mode**: 전체 개수 산출 방식 (exact: COUNT, estimated: 통계 추정치, capped: 상한까지만 계산, none: 계산 안 함)
+    """
+    service = offload(ZipService())
+    try:
+        zip_codes, next_cursor = await service.get_page_after(db, cursor=cursor, skip=skip, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    page_total = await service.count_total(db, total_mode)
+    
+    page = None if cursor else (skip // limit) + 1
     
     return ZipPagination(
         items=zip_codes,
-        total=total,
+        total=page_total.total,
+        total_type=page_total.total_type,
         page=page,
         size=limit,
-        pages=pages
+        pages=page_total.pages(limit),
+        cursor=cursor,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
     )
 
 
@@ -79,8 +94,8 @@ async def search_zip_codes_by_address(
     
     - **address**: 검색할 주소 (시도명, 시군구명, 읍면동명, 리건물명에서 검색)
     """
-    service = ZipService()
-    zip_codes, total = service.search_by_address(db, address, skip, limit)
+    service = offload(ZipService())
+    zip_codes, total = await service.search_by_address(db, address, skip, limit)
     
     pages = (total + limit - 1) // limit
     page = (skip // limit) + 1
@@ -105,8 +120,8 @@ async def search_addresses_by_zip_code(
     
     - **zip_code**: 우편번호
     """
-    service = ZipService()
-    return service.search_by_zip_code(db, zip_code)
+    service = offload(ZipService())
+    return await service.search_by_zip_code(db, zip_code)
 
 
 @router.get("/provinces", response_model=List[str], summary="시도 목록 조회")
@@ -117,8 +132,8 @@ async def get_provinces(
     """
     전체 시도 목록을 조회합니다.
     """
-    service = ZipService()
-    return service.get_provinces(db)
+    service = offload(ZipService())
+    return await service.get_provinces(db)
 
 
 @router.get("/provinces/{province}/cities", response_model=List[str], summary="시도별 시군구 목록 조회")
@@ -132,8 +147,8 @@ async def get_cities_by_province(
     
     - **province**: 시도명
     """
-    service = ZipService()
-    return service.get_cities_by_province(db, province)
+    service = offload(ZipService())
+    return await service.get_cities_by_province(db, province)
 
 
 @router.get("/provinces/{province}/cities/{city}/districts", response_model=List[str], summary="시군구별 읍면동 목록 조회")
@@ -149,8 +164,8 @@ async def get_districts_by_city(
     - **province**: 시도명
     - **city**: 시군구명
     """
-    service = ZipService()
-    return service.get_districts_by_city(db, province, city)
+    service = offload(ZipService())
+    return await service.get_districts_by_city(db, province, city)
 
 
 @router.get("/{sn}", response_model=ZipResponse, summary="우편번호 상세 조회")
@@ -164,8 +179,8 @@ async def get_zip_code(
     
     - **sn**: 일련번호
     """
-    service = ZipService()
-    zip_code = service.get(db, sn)
+    service = offload(ZipService())
+    zip_code = await service.get(db, sn)
     if not zip_code:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -188,14 +203,14 @@ async def update_zip_code(
     - **sn**: 일련번호
     - **zip_data**: 수정할 우편번호 정보
     """
-    service = ZipService()
-    zip_code = service.get(db, sn)
+    service = offload(ZipService())
+    zip_code = await service.get(db, sn)
     if not zip_code:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="우편번호를 찾을 수 없습니다."
         )
-    return service.update(db, zip_code, zip_data, current_user_id)
+    return await service.update(db, zip_code, zip_data, current_user_id)
 
 
 @router.delete("/{sn}", summary="우편번호 삭제")
@@ -209,12 +224,12 @@ async def delete_zip_code(
     
     - **sn**: 일련번호
     """
-    service = ZipService()
-    zip_code = service.get(db, sn)
+    service = offload(ZipService())
+    zip_code = await service.get(db, sn)
     if not zip_code:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="우편번호를 찾을 수 없습니다."
         )
-    service.remove(db, sn)
+    await service.remove(db, sn)
     return {"message": "우편번호가 성공적으로 삭제되었습니다."}
\ No newline at end of file
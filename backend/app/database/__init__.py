@@ -5,22 +5,32 @@ PostgreSQL 데이터베이스 연결 및 세션 관리를 위한 모듈들을 
 
 from .database import (
     get_db,
+    get_async_db,
     engine,
+    async_engine,
     SessionLocal,
+    AsyncSessionLocal,
     Base,
     metadata,
     create_database,
     drop_database,
-    check_database_connection
+    check_database_connection,
+    get_pool_metrics,
+    get_async_pool_metrics
 )
 
 __all__ = [
     "get_db",
+    "get_async_db",
     "engine",
+    "async_engine",
     "SessionLocal",
+    "AsyncSessionLocal",
     "Base",
     "metadata",
     "create_database",
     "drop_database",
-    "check_database_connection"
+    "check_database_connection",
+    "get_pool_metrics",
+    "get_async_pool_metrics"
 ]
\ No newline at end of file
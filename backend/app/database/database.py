@@ -1,17 +1,22 @@
 """데이터베이스 연결 및 설정 모듈
 
 PostgreSQL 데이터베이스 연결을 관리하고 SQLAlchemy 세션을 제공합니다.
+동기 세션(get_db)과 함께 async 라우트에서 이벤트 루프를 막지 않도록
+asyncpg 기반 비동기 세션(get_async_db)도 제공합니다.
 """
 
 import os
-from typing import Generator
-from sqlalchemy import create_engine, MetaData, text
+from typing import Any, AsyncGenerator, Dict, Generator
+from sqlalchemy import create_engine, make_url, MetaData, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 import logging
 from dotenv import load_dotenv
 
+from .pool_metrics import InstrumentedQueuePool, PoolMetrics
+
 # .env 파일 로드
 load_dotenv()
 
@@ -24,17 +29,137 @@ DATABASE_URL = os.getenv(
     "postgresql://skyboot_user:skyboot_password@db:5432/skybootcore_prod"
 )
 
+
+def to_async_database_url(database_url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환합니다.
+    
+    PostgreSQL은 asyncpg, SQLite는 aiosqlite를 사용합니다. asyncpg는 항상 UTF-8을
+    사용하고 client_encoding 인자를 받지 않으므로 URL에서 제거합니다.
+    
+    Args:
+        database_url: 동기 데이터베이스 URL
+        
+    Returns:
+        비동기 데이터베이스 URL
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg").difference_update_query(["client_encoding"])
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_database_url(DATABASE_URL)
+
+# 체크아웃 시 연결 확인 방식
+# - always: 매 체크아웃마다 SELECT 1 (pool_pre_ping)
+# - idle: DB_POOL_PING_IDLE_SECONDS 이상 풀에서 쉬던 연결만 확인
+# - off: 확인하지 않음 (끊긴 연결은 첫 쿼리 실패 후 풀 전체가 재연결)
+POOL_PRE_PING_STRATEGIES = ("always", "idle", "off")
+# 이전 설정값(true/false) 호환
+_LEGACY_PRE_PING = {"true": "always", "false": "off"}
+
+
+def _pre_ping_strategy() -> str:
+    """DB_POOL_PRE_PING 값을 연결 확인 방식으로 변환합니다.
+    
+    이전 설정값 true/false는 always/off로 읽고, 알 수 없는 값은 경고 후 기본값(idle)을 사용합니다.
+    
+    Returns:
+        always, idle, off 중 하나
+    """
+    value = os.getenv("DB_POOL_PRE_PING", "idle").strip().lower()
+    value = _LEGACY_PRE_PING.get(value, value)
+    if value not in POOL_PRE_PING_STRATEGIES:
+        logger.warning(
+            f"⚠️ DB_POOL_PRE_PING은 {', '.join(POOL_PRE_PING_STRATEGIES)} 중 하나여야 합니다: {value} (idle 사용)"
+        )
+        return "idle"
+    return value
+
+
+def get_engine_options(database_url: str = DATABASE_URL) -> Dict[str, Any]:
+    """환경 변수에서 엔진/커넥션 풀 설정을 읽습니다.
+    
+    워커 프로세스마다 풀이 따로 생기므로 DB 최대 연결 수는
+    워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW) 이상이어야 합니다.
+    
+    Args:
+        database_url: 데이터베이스 URL
+        
+    Returns:
+        create_engine 키워드 인자
+    """
+    pre_ping = _pre_ping_strategy()
+    
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "300")),
+        "pool_pre_ping": pre_ping == "always",
+        "echo": os.getenv("SQL_DEBUG", "false").lower() == "true"
+    }
+    
+    # 서버 측 문장 타임아웃 (PostgreSQL, 밀리초, 0이면 제한 없음)
+    statement_timeout = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+    url = make_url(database_url)
+    if statement_timeout > 0 and url.get_backend_name() == "postgresql":
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(statement_timeout)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+    
+    return options
+
+
+def get_async_engine_options(database_url: str = ASYNC_DATABASE_URL) -> Dict[str, Any]:
+    """환경 변수에서 비동기 엔진/커넥션 풀 설정을 읽습니다.
+    
+    비동기 엔진은 동기 엔진과 별도의 풀을 가지므로 워커당 연결 수는
+    두 풀의 합입니다. DB_ASYNC_POOL_SIZE/DB_ASYNC_MAX_OVERFLOW가 없으면
+    동기 풀 설정을 따릅니다.
+    
+    Args:
+        database_url: 비동기 데이터베이스 URL
+        
+    Returns:
+        create_async_engine 키워드 인자
+    """
+    options = get_engine_options(database_url)
+    # 비동기 엔진은 기본 AsyncAdaptedQueuePool 사용
+    options.pop("poolclass")
+    options["pool_size"] = int(os.getenv("DB_ASYNC_POOL_SIZE", str(options["pool_size"])))
+    options["max_overflow"] = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", str(options["max_overflow"])))
+    return options
+
+
+def _idle_ping_seconds() -> float:
+    """idle 방식일 때 연결 확인 기준 유휴 시간(초)"""
+    if _pre_ping_strategy() != "idle":
+        return 0.0
+    return float(os.getenv("DB_POOL_PING_IDLE_SECONDS", "30"))
+
+
 # SQLAlchemy 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=os.getenv("SQL_DEBUG", "false").lower() == "true"
-)
+engine = create_engine(DATABASE_URL, **get_engine_options())
+
+# 커넥션 풀 계측 (GET /api/v1/system/db-pool)
+pool_metrics = PoolMetrics(idle_ping_seconds=_idle_ping_seconds())
+pool_metrics.attach(engine)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 및 세션 팩토리 생성 (커밋 후에도 응답 직렬화 시 속성을 다시 읽지 않도록 expire 비활성화)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **get_async_engine_options())
+async_pool_metrics = PoolMetrics(idle_ping_seconds=_idle_ping_seconds())
+async_pool_metrics.attach(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base 클래스 생성
 Base = declarative_base()
 
@@ -63,6 +188,34 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션을 생성하고 반환합니다.
+    
+    async 라우트에서 Depends와 함께 사용하며, 쿼리 대기 중에
+    이벤트 루프가 다른 요청을 처리할 수 있습니다.
+    
+    Yields:
+        AsyncSession: SQLAlchemy 비동기 데이터베이스 세션
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"비동기 데이터베이스 세션 오류: {e}")
+            await db.rollback()
+            raise
+
+
+def get_pool_metrics() -> PoolMetrics:
+    """커넥션 풀 계측 인스턴스를 반환합니다."""
+    return pool_metrics
+
+
+def get_async_pool_metrics() -> PoolMetrics:
+    """비동기 엔진 커넥션 풀 계측 인스턴스를 반환합니다."""
+    return async_pool_metrics
+
+
 def create_database():
     """데이터베이스 테이블을 생성합니다.
     
@@ -0,0 +1,74 @@
+"""대용량 조회 결과 내보내기
+
+조회 결과 전체를 메모리에 올리지 않고 내보냅니다.
+
+- iter_rows(): 서버 측 커서(yield_per)로 batch_size 건씩 가져와 한 행씩 반환
+- copy_csv(): PostgreSQL(psycopg2)에서 COPY (SELECT ...) TO STDOUT으로 CSV를
+  파일 객체에 바로 씁니다. 행을 파이썬 객체로 만들지 않으므로 가장 빠릅니다.
+  supports_copy()가 False인 DB(SQLite 테스트 DB 등)에서는 iter_rows를 사용합니다.
+"""
+
+from typing import Any, BinaryIO, Dict, Iterator
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+# 서버 측 커서에서 한 번에 가져올 행 수
+DEFAULT_BATCH_SIZE = 1000
+
+
+def iter_rows(db: Session, statement: Select, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    조회 결과를 서버 측 커서로 batch_size 건씩 읽어 한 행씩 반환합니다.
+    조회는 반환된 이터레이터를 소비할 때 시작됩니다.
+
+    Args:
+        db: 데이터베이스 세션
+        statement: SELECT 문
+        batch_size: 한 번에 가져올 행 수
+
+    Returns:
+        {컬럼 이름: 값} 이터레이터
+    """
+    result = db.execute(statement.execution_options(yield_per=batch_size))
+    for row in result:
+        yield row._asdict()
+
+
+def supports_copy(db: Session) -> bool:
+    """
+    COPY ... TO STDOUT 사용 가능 여부
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        PostgreSQL + psycopg2 연결이면 True
+    """
+    bind = db.get_bind()
+    return bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2"
+
+
+def copy_csv(db: Session, statement: Select, fp: BinaryIO, header: bool = True) -> int:
+    """
+    COPY (SELECT ...) TO STDOUT으로 조회 결과를 CSV로 씁니다.
+
+    Args:
+        db: 데이터베이스 세션 (supports_copy()가 True여야 함)
+        statement: SELECT 문
+        fp: 바이너리 파일 객체 (write()만 사용)
+        header: 첫 줄에 컬럼 이름을 쓸지 여부
+
+    Returns:
+        쓴 행 수
+    """
+    connection = db.connection()
+    # IN 목록 등 실행 시 펼치는 파라미터도 미리 펼쳐서 컴파일
+    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+    dbapi_connection = connection.connection.dbapi_connection
+    with dbapi_connection.cursor() as cursor:
+        # 바인드 파라미터는 드라이버가 이스케이프한 리터럴로 치환
+        query = cursor.mogrify(str(compiled), compiled.params).decode(dbapi_connection.encoding)
+        options = "FORMAT csv, HEADER true" if header else "FORMAT csv"
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH ({options})", fp)
+        return cursor.rowcount
@@ -8,6 +8,7 @@ import logging
 from datetime import datetime
 from sqlalchemy import text
 from .database import engine, SessionLocal, Base, check_database_connection
+from .partitioning import ensure_partitions
 from ..models import *  # 모든 모델 임포트
 
 # 로깅 설정
@@ -71,6 +72,24 @@ def create_tables():
         raise
 
 
+def create_log_partitions():
+    """로그 테이블 파티션 생성
+    
+    월별 범위 파티션으로 생성된 로그 테이블에 기본 파티션과
+    이번 달부터 3개월 뒤까지의 파티션을 생성합니다.
+    """
+    db = SessionLocal()
+    try:
+        for model in (LoginLog, SysLog, WebLog, APIUsageLog):
+            ensure_partitions(db, model.__table__)
+        logger.info("로그 테이블 파티션이 성공적으로 생성되었습니다.")
+    except Exception as e:
+        logger.error(f"로그 테이블 파티션 생성 실패: {e}")
+        raise
+    finally:
+        db.close()
+
+
 def insert_initial_data():
     """초기 데이터 삽입
     
@@ -242,7 +261,10 @@ def initialize_database():
         # 3. 테이블 생성
         create_tables()
         
-        # 4. 초기 데이터 삽입
+        # 4. 로그 테이블 파티션 생성
+        create_log_partitions()
+        
+        # 5. 초기 데이터 삽입
         insert_initial_data()
         
         logger.info("데이터베이스 초기화가 완료되었습니다.")
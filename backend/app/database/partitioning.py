@@ -0,0 +1,285 @@
+"""로그 테이블 월별 범위 파티션 관리
+
+대용량 로그 테이블(tb_loginlog, tb_syslog, tb_weblog, tb_api_usage_log)은
+PostgreSQL 선언적 범위 파티션(월 단위)으로 저장합니다.
+
+- ensure_partitions(): 이번 달부터 months_ahead개월 뒤까지 파티션을 미리 생성
+  (PartitionMaintainer 백그라운드 작업 또는 manage_db.py partitions 명령)
+- purge_before(): 보관 기간이 지난 파티션은 통째로 DROP(또는 DETACH)하고,
+  기준 시점이 걸친 파티션과 기본 파티션에서만 DELETE 합니다.
+  큰 DELETE로 인한 테이블 팽창과 긴 잠금이 생기지 않습니다.
+
+파티션 이름은 <테이블>_pYYYYMM이며, 범위 파티션이 없는 시점의 행은
+<테이블>_default에 저장됩니다. 파티션되지 않은 테이블(마이그레이션 전,
+SQLite 테스트 DB)에서 purge_before는 기존처럼 DELETE로 동작합니다.
+"""
+
+import logging
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import Table, delete, text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 파티션 테이블 -> 파티션 키 (범위 기준 컬럼)
+PARTITION_KEYS: Dict[str, str] = {
+    "tb_loginlog": "frst_regist_pnttm",
+    "tb_syslog": "occrrnc_de",
+    "tb_weblog": "rqest_de",
+    "tb_api_usage_log": "frst_regist_pnttm",
+}
+
+RETENTION_DROP = "drop"
+RETENTION_DETACH = "detach"
+RETENTION_MODES = (RETENTION_DROP, RETENTION_DETACH)
+
+# 보관 기간이 지난 파티션 처리 방식 (detach는 테이블을 분리만 하여 보관/백업 후 직접 삭제)
+DEFAULT_RETENTION_MODE = os.getenv("LOG_RETENTION_MODE", RETENTION_DROP)
+
+
+def month_start(value: Union[date, datetime]) -> date:
+    """해당 월의 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """month(1일)에서 months개월 뒤의 1일"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table_name: str, month: date) -> str:
+    """월별 파티션 이름 (예: tb_loginlog_p202501)"""
+    return f"{table_name}_p{month:%Y%m}"
+
+
+def default_partition_name(table_name: str) -> str:
+    """기본(default) 파티션 이름"""
+    return f"{table_name}_default"
+
+
+def _qualified(db: Session, table: Table, name: Optional[str] = None) -> str:
+    """스키마를 포함한 테이블 이름 (schema_translate_map 반영)"""
+    schema = table.schema
+    translate = db.connection().get_execution_options().get("schema_translate_map") or {}
+    schema = translate.get(schema, schema)
+    return f"{schema}.{name or table.name}" if schema else (name or table.name)
+
+
+def _exists(db: Session, qualified_name: str) -> bool:
+    return db.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": qualified_name}).scalar()
+
+
+def _lock(db: Session, table: Table) -> None:
+    """여러 워커가 동시에 실행해도 테이블별로 한 번씩만 처리하도록 트랜잭션 잠금"""
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": _qualified(db, table)})
+
+
+def is_partitioned(db: Session, table: Table) -> bool:
+    """테이블이 PostgreSQL 파티션 테이블인지 여부"""
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return db.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:name))"),
+        {"name": _qualified(db, table)}
+    ).scalar()
+
+
+def list_partitions(db: Session, table: Table) -> List[Tuple[str, Optional[date]]]:
+    """
+    파티션 목록
+
+    Returns:
+        [(파티션 이름, 시작 월)] (기본 파티션은 시작 월이 None, 이름 규칙이 다른 파티션은 제외)
+    """
+    names = db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:name) ORDER BY c.relname"
+        ),
+        {"name": _qualified(db, table)}
+    ).scalars().all()
+
+    prefix = f"{table.name}_p"
+    partitions = []
+    for name in names:
+        if name == default_partition_name(table.name):
+            partitions.append((name, None))
+        elif name.startswith(prefix) and len(name) == len(prefix) + 6 and name[len(prefix):].isdigit():
+            suffix = name[len(prefix):]
+            partitions.append((name, date(int(suffix[:4]), int(suffix[4:]), 1)))
+    return partitions
+
+
+def create_partition(db: Session, table: Table, month: date) -> bool:
+    """
+    월별 파티션 생성
+
+    기본 파티션에 이미 해당 월의 행이 있으면 새 파티션으로 옮긴 뒤 붙입니다.
+    (PostgreSQL은 기본 파티션에 겹치는 행이 있으면 파티션 생성을 거부함)
+
+    Returns:
+        새로 생성했으면 True, 이미 있으면 False
+    """
+    name = partition_name(table.name, month)
+    child = _qualified(db, table, name)
+    if _exists(db, child):
+        return False
+
+    parent = _qualified(db, table)
+    default = _qualified(db, table, default_partition_name(table.name))
+    key = PARTITION_KEYS[table.name]
+    start, end = month, add_months(month, 1)
+    bounds = f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    params = {"start": start, "end": end}
+
+    moving = _exists(db, default) and db.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {key} >= :start AND {key} < :end)"), params
+    ).scalar()
+    if not moving:
+        db.execute(text(f"CREATE TABLE {child} PARTITION OF {parent} {bounds}"))
+        return True
+
+    db.execute(text(f"CREATE TABLE {child} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    db.execute(text(
+        f"WITH moved AS (DELETE FROM {default} WHERE {key} >= :start AND {key} < :end RETURNING *) "
+        f"INSERT INTO {child} SELECT * FROM moved"
+    ), params)
+    db.execute(text(f"ALTER TABLE {parent} ATTACH PARTITION {child} {bounds}"))
+    logger.warning(f"⚠️ {table.name} 기본 파티션의 행을 {name}로 옮겼습니다.")
+    return True
+
+
+def ensure_partitions(
+    db: Session,
+    table: Table,
+    months_ahead: int = 3,
+    start: Optional[Union[date, datetime]] = None
+) -> List[str]:
+    """
+    start(기본값: 이번 달)부터 months_ahead개월 뒤까지의 파티션과 기본 파티션을 생성
+
+    Args:
+        db: 데이터베이스 세션
+        table: 파티션 테이블
+        months_ahead: 미리 만들 개월 수
+        start: 시작 월
+
+    Returns:
+        새로 생성한 파티션 이름 목록 (파티션 테이블이 아니면 빈 목록)
+    """
+    if not is_partitioned(db, table):
+        return []
+
+    try:
+        _lock(db, table)
+        default = _qualified(db, table, default_partition_name(table.name))
+        db.execute(text(f"CREATE TABLE IF NOT EXISTS {default} PARTITION OF {_qualified(db, table)} DEFAULT"))
+
+        first = month_start(start or datetime.now())
+        created = [
+            partition_name(table.name, add_months(first, offset))
+            for offset in range(months_ahead + 1)
+            if create_partition(db, table, add_months(first, offset))
+        ]
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ {table.name} 파티션 생성 실패 - 오류: {str(e)}")
+        raise
+
+    if created:
+        logger.info(f"✅ {table.name} 파티션 생성 - {', '.join(created)}")
+    return created
+
+
+def purge_before(
+    db: Session,
+    table: Table,
+    cutoff: datetime,
+    mode: str = DEFAULT_RETENTION_MODE
+) -> Dict[str, Any]:
+    """
+    cutoff 이전 로그 정리
+
+    cutoff 이전에 끝나는 파티션은 DROP(mode=detach면 DETACH)하고, cutoff가 걸친
+    파티션과 기본 파티션에서만 DELETE 합니다. 파티션 테이블이 아니면 DELETE 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        table: 로그 테이블
+        cutoff: 이 시점 이전의 로그를 정리
+        mode: drop 또는 detach
+
+    Returns:
+        {"deleted_count", "dropped_partitions", "detached_partitions"}
+
+    Raises:
+        ValueError: 지원하지 않는 정리 방식
+    """
+    if mode not in RETENTION_MODES:
+        raise ValueError(f"지원하지 않는 로그 정리 방식입니다: {mode}")
+
+    key = PARTITION_KEYS[table.name]
+    result = {"deleted_count": 0, "dropped_partitions": [], "detached_partitions": []}
+
+    try:
+        if not is_partitioned(db, table):
+            result["deleted_count"] = db.execute(delete(table).where(table.c[key] < cutoff)).rowcount
+            db.commit()
+            return result
+
+        _lock(db, table)
+        parent = _qualified(db, table)
+        for name, month in list_partitions(db, table):
+            child = _qualified(db, table, name)
+            if month is not None and datetime.combine(add_months(month, 1), time.min) <= cutoff:
+                if mode == RETENTION_DETACH:
+                    db.execute(text(f"ALTER TABLE {parent} DETACH PARTITION {child}"))
+                    result["detached_partitions"].append(name)
+                else:
+                    db.execute(text(f"DROP TABLE {child}"))
+                    result["dropped_partitions"].append(name)
+            elif month is None or datetime.combine(month, time.min) < cutoff:
+                # cutoff가 걸친 파티션과 기본 파티션만 행 단위로 삭제
+                result["deleted_count"] += db.execute(
+                    text(f"DELETE FROM {child} WHERE {key} < :cutoff"), {"cutoff": cutoff}
+                ).rowcount
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ {table.name} 로그 정리 실패 - 오류: {str(e)}")
+        raise
+
+    return result
+
+
+def cleanup_log_table(
+    db: Session,
+    table: Table,
+    days_to_keep: int,
+    mode: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    보관 기간(일)이 지난 로그 정리 (서비스의 cleanup_old_logs 공통 구현)
+
+    Args:
+        db: 데이터베이스 세션
+        table: 로그 테이블
+        days_to_keep: 보관할 일수
+        mode: drop 또는 detach (기본값: LOG_RETENTION_MODE)
+
+    Returns:
+        purge_before 결과
+    """
+    cutoff = datetime.now() - timedelta(days=days_to_keep)
+    result = purge_before(db, table, cutoff, mode or DEFAULT_RETENTION_MODE)
+    partitions = result["dropped_partitions"] + result["detached_partitions"]
+    logger.info(
+        f"✅ {table.name} 오래된 로그 정리 완료 - 삭제된 로그 수: {result['deleted_count']}"
+        + (f", 정리된 파티션: {', '.join(partitions)}" if partitions else "")
+    )
+    return result
@@ -0,0 +1,256 @@
+"""커넥션 풀 계측
+
+SQLAlchemy 풀 이벤트(connect/checkout/checkin/invalidate)를 구독해 사용 중 연결 수,
+오버플로, 연결 획득 대기 시간과 연결 점유 시간 히스토그램을 집계합니다.
+워커 프로세스마다 풀이 따로 있으므로 값도 프로세스 단위입니다.
+
+유휴 시간 기준 사전 핑(pre-ping)도 여기서 처리합니다. 모든 체크아웃마다
+SELECT 1을 보내는 pool_pre_ping 대신, 일정 시간 이상 풀에서 쉬던 연결만 확인합니다.
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 구간 상한(초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram과 같은 le 구간)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """관측값을 기록합니다."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 값을 반환합니다.
+
+        Returns:
+            count, sum, max와 le별 누적 건수
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_max = self._max
+
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative[f"{bound:g}"] = running
+        cumulative["+Inf"] = running + counts[-1]
+
+        return {
+            "count": cumulative["+Inf"],
+            "sum": round(total_sum, 6),
+            "max": round(total_max, 6),
+            "buckets": cumulative
+        }
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 지표 수집기
+
+    - attach(engine): 풀 이벤트 구독 (엔진 단위로 등록하므로 dispose 후에도 유지)
+    - 획득 대기 시간은 InstrumentedQueuePool이 connect() 호출 전후로 측정
+    - idle_ping_seconds > 0이면 그 시간 이상 쉬던 연결만 체크아웃 시 핑
+    """
+
+    def __init__(self, idle_ping_seconds: float = 0.0, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        수집기 초기화
+
+        Args:
+            idle_ping_seconds: 체크아웃 시 핑을 보낼 최소 유휴 시간(초), 0이면 핑하지 않음
+            buckets: 히스토그램 구간 상한(초)
+        """
+        self.idle_ping_seconds = idle_ping_seconds
+        self.wait_time = Histogram(buckets)
+        self.checkout_duration = Histogram(buckets)
+
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+
+        # 통계
+        self.connect_count = 0
+        self.checkout_count = 0
+        self.checkin_count = 0
+        self.invalidated_count = 0
+        self.timeout_count = 0
+        self.ping_count = 0
+        self.ping_failed_count = 0
+        self.in_use = 0
+        self.max_in_use = 0
+
+    def attach(self, engine: Engine) -> None:
+        """
+        엔진의 풀 이벤트를 구독합니다.
+
+        Args:
+            engine: 계측할 엔진
+        """
+        self._engine = engine
+        if isinstance(engine.pool, InstrumentedQueuePool):
+            engine.pool.metrics = self
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float) -> None:
+        """연결 획득 대기 시간을 기록합니다."""
+        self.wait_time.observe(seconds)
+
+    def record_timeout(self) -> None:
+        """pool_timeout 초과로 연결을 얻지 못한 횟수를 기록합니다."""
+        with self._lock:
+            self.timeout_count += 1
+        logger.warning("⚠️ 커넥션 풀 대기 시간 초과 - 풀 크기/오버플로 설정을 확인하세요")
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+        with self._lock:
+            self.connect_count += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        now = time.monotonic()
+        idle_since = connection_record.info.get("checked_in_at", now)
+        if self.idle_ping_seconds > 0 and now - idle_since >= self.idle_ping_seconds:
+            self._ping(dbapi_connection)
+
+        # record_info는 연결이 무효화되어도 유지되므로 점유 시작 시각은 여기에 저장
+        connection_record.record_info["checked_out_at"] = now
+        with self._lock:
+            self.checkout_count += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        now = time.monotonic()
+        checked_out_at = connection_record.record_info.pop("checked_out_at", None)
+        connection_record.info["checked_in_at"] = now
+        if checked_out_at is None:
+            return
+        self.checkout_duration.observe(now - checked_out_at)
+        with self._lock:
+            self.checkin_count += 1
+            self.in_use -= 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidated_count += 1
+
+    def _ping(self, dbapi_connection) -> None:
+        """
+        오래 쉬던 연결을 확인합니다.
+
+        실패하면 DisconnectionError를 발생시켜 풀이 연결을 버리고 새로 얻도록 합니다.
+        """
+        with self._lock:
+            self.ping_count += 1
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception as e:
+            with self._lock:
+                self.ping_failed_count += 1
+            logger.warning(f"⚠️ 유휴 연결 확인 실패, 재연결합니다: {e}")
+            raise exc.DisconnectionError() from e
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        풀 상태와 누적 지표를 반환합니다.
+
+        Returns:
+            풀 크기/사용량, 누적 건수, 대기/점유 시간 히스토그램
+        """
+        pool_stats: Dict[str, Any] = {}
+        pool = self._engine.pool if self._engine is not None else None
+        if isinstance(pool, QueuePool):
+            pool_stats = {
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                # 풀 크기를 넘어 추가로 연 연결 수 (음수면 아직 열지 않은 기본 연결 수)
+                "overflow": pool.overflow()
+            }
+        elif pool is not None:
+            pool_stats = {"status": pool.status()}
+
+        with self._lock:
+            counters = {
+                "connects": self.connect_count,
+                "checkouts": self.checkout_count,
+                "checkins": self.checkin_count,
+                "invalidated": self.invalidated_count,
+                "timeouts": self.timeout_count,
+                "pings": self.ping_count,
+                "ping_failures": self.ping_failed_count,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use
+            }
+
+        return {
+            "pid": os.getpid(),
+            "pool": pool_stats,
+            **counters,
+            "idle_ping_seconds": self.idle_ping_seconds,
+            "wait_seconds": self.wait_time.snapshot(),
+            "checkout_seconds": self.checkout_duration.snapshot()
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """연결 획득 대기 시간과 대기 시간 초과를 기록하는 QueuePool"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super().connect()
+
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            metrics.record_timeout()
+            raise
+        finally:
+            metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # engine.dispose() 등으로 풀을 다시 만들 때 수집기 유지
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
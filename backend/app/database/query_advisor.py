@@ -0,0 +1,192 @@
+"""쿼리 실행 계획 점검 (인덱스 어드바이저)
+
+서비스의 주요 조회 메서드를 실제로 호출해 실행되는 SQL을 수집하고, 각 SQL을
+EXPLAIN (ANALYZE, BUFFERS)로 다시 실행해 순차 스캔(Seq Scan)을 찾아냅니다.
+인덱스를 추가하거나 쿼리를 바꾼 뒤 계획이 기대대로 바뀌었는지
+manage_db.py explain 명령으로 확인합니다.
+
+EXPLAIN ANALYZE는 쿼리를 실제로 실행하므로 SELECT 문만 점검하며,
+점검이 끝나면 트랜잭션을 롤백합니다. PostgreSQL 전용입니다.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# (이름, 서비스 호출 함수(db, params))
+CatalogEntry = Tuple[str, Callable[[Session, Dict[str, Any]], Any]]
+
+
+def get_query_catalog() -> List[CatalogEntry]:
+    """
+    점검할 서비스 조회 목록
+
+    params로 user_id(사용자별 조회), bbs_id(게시판 목록)를 받습니다.
+    서비스 모듈이 app.database를 참조하므로 호출 시점에 임포트합니다.
+    """
+    from app.schemas.log_schemas import LoginLogSearchParams
+    from app.services.board_service import BbsService
+    from app.services.log_service import LoginLogService
+    from app.services.system_service import SysLogService, SystemMonitoringService, WebLogService
+
+    return [
+        ("loginlog.list", lambda db, p: LoginLogService().search_logs_page(
+            db, LoginLogSearchParams(), limit=100
+        )),
+        ("loginlog.user", lambda db, p: LoginLogService().search_logs_page(
+            db, LoginLogSearchParams(login_id=p.get("user_id")), limit=100
+        )),
+        ("loginlog.failed", lambda db, p: LoginLogService().get_failed_login_attempts(db, hours=24)),
+        ("loginlog.statistics", lambda db, p: LoginLogService().get_login_statistics(db, days=30)),
+        ("syslog.list", lambda db, p: SysLogService().get_page_after(
+            db, limit=100, order_by="occrrnc_de", order_desc=True
+        )),
+        ("syslog.errors", lambda db, p: SysLogService().get_error_logs(db, days=7)),
+        ("syslog.statistics", lambda db, p: SysLogService().get_log_statistics(db)),
+        ("weblog.popular_pages", lambda db, p: WebLogService().get_popular_pages(db)),
+        ("weblog.hourly_traffic", lambda db, p: WebLogService().get_hourly_traffic(db)),
+        ("weblog.user", lambda db, p: WebLogService().get_user_logs(db, p.get("user_id"))),
+        ("bbs.list", lambda db, p: BbsService().search_posts(db, bbs_id=p.get("bbs_id"), limit=20)),
+        ("dashboard.summary", lambda db, p: SystemMonitoringService().get_dashboard_summary(db)),
+    ]
+
+
+def capture_statements(db: Session, run: Callable[[Session], Any]) -> List[Tuple[str, Any]]:
+    """
+    run(db) 실행 중 데이터베이스로 전송된 SELECT 문과 파라미터를 수집합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        run: 세션을 받아 조회를 수행하는 함수
+
+    Returns:
+        (드라이버 SQL, 드라이버 파라미터) 목록 (중복 제거, 실행 순서 유지)
+    """
+    connection = db.connection()
+    captured: List[Tuple[str, Any]] = []
+    seen = set()
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        # 이벤트는 엔진 단위로 등록되므로 다른 연결(다른 요청)의 쿼리는 제외
+        if conn is not connection or executemany or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return
+        if statement not in seen:
+            seen.add(statement)
+            captured.append((statement, parameters))
+
+    event.listen(connection.engine, "before_cursor_execute", collect)
+    try:
+        run(db)
+    finally:
+        event.remove(connection.engine, "before_cursor_execute", collect)
+    return captured
+
+
+def explain_statement(db: Session, statement: str, parameters: Any) -> Dict[str, Any]:
+    """EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) 결과의 최상위 항목"""
+    plan = db.connection().exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def find_seq_scans(plan: Dict[str, Any], min_rows: int = 0) -> List[Dict[str, Any]]:
+    """
+    실행 계획에서 순차 스캔 노드를 찾습니다.
+
+    Args:
+        plan: EXPLAIN (FORMAT JSON) 결과 항목 ({"Plan": {...}})
+        min_rows: 이보다 적은 행을 읽은 순차 스캔은 제외 (작은 코드 테이블 등)
+
+    Returns:
+        [{"relation", "rows_scanned", "rows_returned", "filter"}] (읽은 행 수 내림차순)
+    """
+    scans = []
+    nodes = [plan.get("Plan", plan)]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.get("Plans", []))
+        if node.get("Node Type") != "Seq Scan":
+            continue
+
+        loops = node.get("Actual Loops", 1) or 1
+        returned = node.get("Actual Rows", node.get("Plan Rows", 0))
+        scanned = (returned + node.get("Rows Removed by Filter", 0)) * loops
+        if scanned < min_rows:
+            continue
+
+        relation = node.get("Relation Name")
+        if node.get("Schema"):
+            relation = f"{node['Schema']}.{relation}"
+        scans.append({
+            "relation": relation,
+            "rows_scanned": scanned,
+            "rows_returned": returned * loops,
+            "filter": node.get("Filter"),
+        })
+    return sorted(scans, key=lambda scan: scan["rows_scanned"], reverse=True)
+
+
+def analyze_catalog(
+    db: Session,
+    params: Optional[Dict[str, Any]] = None,
+    catalog: Optional[List[CatalogEntry]] = None,
+    min_rows: int = 0,
+    only: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    조회 목록의 SQL 실행 계획을 점검합니다.
+
+    Args:
+        db: 데이터베이스 세션 (PostgreSQL)
+        params: 조회 파라미터 (user_id, bbs_id)
+        catalog: 점검할 조회 목록 (기본값: get_query_catalog())
+        min_rows: 보고할 순차 스캔의 최소 읽은 행 수
+        only: 이름이 이 값으로 시작하는 항목만 점검
+
+    Returns:
+        SQL별 결과 목록 (name, statement, planning_ms, execution_ms,
+        shared_hit, shared_read, seq_scans 또는 error)
+
+    Raises:
+        RuntimeError: PostgreSQL이 아닌 데이터베이스
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        raise RuntimeError("실행 계획 점검은 PostgreSQL에서만 지원합니다.")
+
+    params = params or {}
+    results = []
+    try:
+        for name, run in catalog if catalog is not None else get_query_catalog():
+            if only and not name.startswith(only):
+                continue
+
+            try:
+                statements = capture_statements(db, lambda session: run(session, params))
+                for index, (statement, parameters) in enumerate(statements, start=1):
+                    plan = explain_statement(db, statement, parameters)
+                    root = plan["Plan"]
+                    results.append({
+                        "name": name if len(statements) == 1 else f"{name}#{index}",
+                        "statement": statement,
+                        "planning_ms": plan.get("Planning Time"),
+                        "execution_ms": plan.get("Execution Time"),
+                        "shared_hit": root.get("Shared Hit Blocks", 0),
+                        "shared_read": root.get("Shared Read Blocks", 0),
+                        "seq_scans": find_seq_scans(plan, min_rows),
+                    })
+            except Exception as e:
+                logger.warning(f"⚠️ 실행 계획 점검 실패 - {name}: {str(e)}")
+                results.append({"name": name, "error": str(e), "seq_scans": []})
+                db.rollback()
+    finally:
+        db.rollback()
+
+    return results
@@ -0,0 +1,340 @@
+"""로그 통계 집계(rollup)
+
+접속로그/시스템로그/웹로그를 (시간, 사용자, IP, 메뉴, 처리구분, 성공여부) 단위로
+미리 집계해 두고, 통계 조회는 원본 로그 대신 집계 테이블을 읽습니다.
+조회 비용은 원본 로그 건수가 아니라 집계 버킷 수에 비례합니다.
+
+- compact_rollup(): 집계 진행 시점(watermark) 이후의 끝난 시간대를 원본 로그에서
+  시간별 집계로 옮기고, 해당 일자의 일별 집계를 시간별 집계에서 다시 만듭니다.
+  (RollupCompactor 백그라운드 작업 또는 manage_db.py rollups 명령)
+- rollup_source(): 조회 구간을 나누어 집계가 끝난 구간은 일별/시간별 집계에서,
+  구간 앞뒤의 시간 단위 자투리와 watermark 이후는 원본 로그에서 읽어
+  같은 형태의 행으로 합친 서브쿼리를 반환합니다. 결과는 원본만 읽은 것과 같습니다.
+
+watermark보다 이전 시점으로 늦게 기록된 로그는 집계에 반영되지 않으므로,
+집계 작업은 현재 시각에서 LOG_ROLLUP_DELAY만큼 지난 시간대까지만 처리합니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import Date, Numeric, Table, case, cast, delete, func, insert, literal_column, select, text, union_all
+from sqlalchemy.orm import Session
+
+from app.models.log_models import LoginLog
+from app.models.stats_models import (
+    LoginLogDayStats, LoginLogHourStats, StatsWatermark,
+    SysLogDayStats, SysLogHourStats, WebLogDayStats, WebLogHourStats
+)
+from app.models.system_models import SysLog, WebLog
+
+logger = logging.getLogger(__name__)
+
+GRAIN_HOUR = "hour"
+GRAIN_DAY = "day"
+
+
+@dataclass(frozen=True, eq=False)
+class RollupSpec:
+    """원본 로그 테이블과 시간별/일별 집계 테이블의 대응"""
+    name: str
+    source: Table
+    time_column: str
+    # 집계 테이블에서도 같은 이름을 쓰는 차원 컬럼
+    dimensions: Tuple[str, ...]
+    # 측정값 컬럼 -> 원본 테이블 집계식 (집계 테이블에서는 SUM으로 합산)
+    measures: Dict[str, Callable[[Table], Any]]
+    hourly: Table
+    daily: Table
+
+    @property
+    def time(self):
+        return self.source.c[self.time_column]
+
+
+def _count(table: Table):
+    return func.count()
+
+
+# process_time은 자유 형식 문자열(String(14))이므로 숫자 형식인 값만 집계
+NUMERIC_PATTERN = r"^[0-9]+(\.[0-9]+)?$"
+
+
+def _numeric_process_time(table: Table):
+    """숫자 형식인 process_time만 Numeric으로 변환 (그 외 값은 NULL로 집계에서 제외)
+
+    "12ms"처럼 숫자가 아닌 값이 하나라도 있으면 PostgreSQL CAST가 실패하여
+    집계 전체가 실패하므로 CAST 전에 형식을 확인합니다.
+    """
+    process_time = table.c.process_time
+    return case((process_time.regexp_match(NUMERIC_PATTERN), cast(process_time, Numeric)), else_=None)
+
+
+LOGIN_ROLLUP = RollupSpec(
+    name="loginlog",
+    source=LoginLog.__table__,
+    time_column="frst_regist_pnttm",
+    dimensions=("conect_id", "conect_ip", "error_occrrnc_at"),
+    measures={"log_co": _count},
+    hourly=LoginLogHourStats.__table__,
+    daily=LoginLogDayStats.__table__,
+)
+
+SYSLOG_ROLLUP = RollupSpec(
+    name="syslog",
+    source=SysLog.__table__,
+    time_column="occrrnc_de",
+    dimensions=("rqester_id", "trget_menu_nm", "process_se_code"),
+    measures={
+        "log_co": _count,
+        "process_time_sum": lambda table: func.sum(_numeric_process_time(table)),
+        "process_time_co": lambda table: func.count(_numeric_process_time(table)),
+    },
+    hourly=SysLogHourStats.__table__,
+    daily=SysLogDayStats.__table__,
+)
+
+WEBLOG_ROLLUP = RollupSpec(
+    name="weblog",
+    source=WebLog.__table__,
+    time_column="rqest_de",
+    dimensions=("rqester_id", "trget_menu_nm"),
+    measures={"log_co": _count},
+    hourly=WebLogHourStats.__table__,
+    daily=WebLogDayStats.__table__,
+)
+
+ROLLUPS = [LOGIN_ROLLUP, SYSLOG_ROLLUP, WEBLOG_ROLLUP]
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def ceil_hour(value: datetime) -> datetime:
+    floor = floor_hour(value)
+    return floor if floor == value else floor + timedelta(hours=1)
+
+
+def floor_day(value: datetime) -> datetime:
+    return datetime.combine(value.date(), time.min)
+
+
+def ceil_day(value: datetime) -> datetime:
+    floor = floor_day(value)
+    return floor if floor == value else floor + timedelta(days=1)
+
+
+def rollup_dimension(column):
+    """집계 행의 차원 값 (NULL을 뜻하는 빈 문자열은 NULL로 되돌림, 고유 개수 집계용)"""
+    return func.nullif(column, "")
+
+
+def _is_postgresql(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _hour_bucket(db: Session, column):
+    """시간 단위 버킷 (해당 시간의 시작 시점)"""
+    if _is_postgresql(db):
+        return func.date_trunc(literal_column("'hour'"), column)
+    # SQLite는 SQLAlchemy의 DateTime 저장 형식과 같은 문자열로 맞춤
+    return func.strftime("%Y-%m-%d %H:00:00.000000", column)
+
+
+def _day_bucket(db: Session, column):
+    """일 단위 버킷 (날짜)"""
+    if _is_postgresql(db):
+        return cast(column, Date)
+    return func.date(column)
+
+
+def _bucket_name(grain: str) -> str:
+    return "stats_pnttm" if grain == GRAIN_HOUR else "stats_de"
+
+
+def get_watermark(db: Session, spec: RollupSpec) -> Optional[datetime]:
+    """시간별 집계가 끝난 시점 (이 시점 이전의 시간대는 모두 집계됨)"""
+    return db.execute(
+        select(StatsWatermark.watermark_pnttm).where(StatsWatermark.stats_nm == spec.name)
+    ).scalar()
+
+
+def _raw_select(db: Session, spec: RollupSpec, start: datetime, end: datetime, grain: str, include_end: bool = False):
+    """원본 로그를 집계 행 형태로 집계하는 SELECT"""
+    bucket = (_hour_bucket if grain == GRAIN_HOUR else _day_bucket)(db, spec.time).label(_bucket_name(grain))
+    # GROUP BY와 같은 식이 되도록 바인드 파라미터 대신 리터럴 사용
+    dimensions = [func.coalesce(spec.source.c[name], literal_column("''")).label(name) for name in spec.dimensions]
+    measures = [measure(spec.source).label(name) for name, measure in spec.measures.items()]
+    upper = spec.time <= end if include_end else spec.time < end
+    return select(bucket, *dimensions, *measures).where(spec.time >= start, upper).group_by(bucket, *dimensions)
+
+
+def _hourly_select(db: Session, spec: RollupSpec, start: datetime, end: datetime, grain: str):
+    """시간별 집계 행을 읽는 SELECT"""
+    hourly = spec.hourly
+    bucket = hourly.c.stats_pnttm if grain == GRAIN_HOUR else _day_bucket(db, hourly.c.stats_pnttm)
+    return select(
+        bucket.label(_bucket_name(grain)),
+        *[hourly.c[name] for name in spec.dimensions],
+        *[hourly.c[name] for name in spec.measures]
+    ).where(hourly.c.stats_pnttm >= start, hourly.c.stats_pnttm < end)
+
+
+def _daily_select(spec: RollupSpec, start: datetime, end: datetime):
+    """일별 집계 행을 읽는 SELECT"""
+    daily = spec.daily
+    return select(
+        daily.c.stats_de,
+        *[daily.c[name] for name in spec.dimensions],
+        *[daily.c[name] for name in spec.measures]
+    ).where(daily.c.stats_de >= start.date(), daily.c.stats_de < end.date())
+
+
+def rollup_source(
+    db: Session,
+    spec: RollupSpec,
+    start: datetime,
+    end: datetime,
+    grain: str = GRAIN_HOUR,
+    include_end: bool = True
+):
+    """
+    조회 구간의 집계 행 서브쿼리
+
+    Args:
+        db: 데이터베이스 세션
+        spec: 집계 정의
+        start: 시작 시점
+        end: 종료 시점
+        grain: 버킷 단위 (hour: stats_pnttm, day: stats_de 컬럼)
+        include_end: 종료 시점과 같은 시각의 로그 포함 여부
+
+    Returns:
+        (버킷, 차원 컬럼..., 측정값 컬럼...) 서브쿼리. 차원의 NULL은 빈 문자열이며,
+        같은 버킷/차원이 여러 행일 수 있으므로 측정값은 SUM으로 합산해야 합니다.
+    """
+    watermark = get_watermark(db, spec)
+    first = ceil_hour(start)
+    last = min(watermark, floor_hour(end)) if watermark else first
+
+    if last <= first:
+        # 집계된 시간대가 구간 안에 없으면 원본만 조회
+        segments = [_raw_select(db, spec, start, end, grain, include_end)]
+    else:
+        segments = []
+        if start < first:
+            segments.append(_raw_select(db, spec, start, first, grain))
+
+        first_day, last_day = ceil_day(first), floor_day(last)
+        if grain == GRAIN_DAY and first_day < last_day:
+            if first < first_day:
+                segments.append(_hourly_select(db, spec, first, first_day, grain))
+            segments.append(_daily_select(spec, first_day, last_day))
+            if last_day < last:
+                segments.append(_hourly_select(db, spec, last_day, last, grain))
+        else:
+            segments.append(_hourly_select(db, spec, first, last, grain))
+
+        segments.append(_raw_select(db, spec, last, end, grain, include_end))
+
+    statement = segments[0] if len(segments) == 1 else union_all(*segments)
+    return statement.subquery(f"{spec.name}_stats")
+
+
+def _lock(db: Session, spec: RollupSpec) -> None:
+    """여러 워커가 동시에 같은 구간을 집계하지 않도록 트랜잭션 잠금"""
+    if _is_postgresql(db):
+        db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": f"stats:{spec.name}"})
+
+
+def _rebuild_daily(db: Session, spec: RollupSpec, start: datetime, end: datetime) -> None:
+    """[start, end) 일자의 일별 집계를 시간별 집계에서 다시 만듭니다."""
+    daily, hourly = spec.daily, spec.hourly
+    db.execute(delete(daily).where(daily.c.stats_de >= start.date(), daily.c.stats_de < end.date()))
+
+    day = _day_bucket(db, hourly.c.stats_pnttm).label("stats_de")
+    dimensions = [hourly.c[name] for name in spec.dimensions]
+    sums = [func.sum(hourly.c[name]).label(name) for name in spec.measures]
+    db.execute(insert(daily).from_select(
+        ["stats_de", *spec.dimensions, *spec.measures],
+        select(day, *dimensions, *sums).where(
+            hourly.c.stats_pnttm >= start, hourly.c.stats_pnttm < end
+        ).group_by(day, *dimensions)
+    ))
+
+
+def compact_rollup(
+    db: Session,
+    spec: RollupSpec,
+    until: Optional[datetime] = None,
+    chunk_hours: int = 24
+) -> int:
+    """
+    watermark부터 until 이전의 끝난 시간대까지 원본 로그를 집계합니다.
+
+    처음 실행하면 가장 오래된 로그의 시간대부터 집계합니다.
+    chunk_hours 단위로 나누어 집계하고 구간마다 커밋합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        spec: 집계 정의
+        until: 이 시점이 속한 시간대 이전까지 집계 (기본값: 현재 시각)
+        chunk_hours: 한 번에 집계할 시간 수
+
+    Returns:
+        새로 만든 시간별 집계 행 수
+    """
+    until = floor_hour(until or datetime.now())
+    created = 0
+
+    try:
+        while True:
+            _lock(db, spec)
+            watermark = get_watermark(db, spec)
+            if watermark is None:
+                oldest = db.execute(select(func.min(spec.time))).scalar()
+                watermark = floor_hour(oldest) if oldest is not None else until
+                db.merge(StatsWatermark(stats_nm=spec.name, watermark_pnttm=watermark))
+
+            if watermark >= until:
+                db.commit()
+                break
+
+            chunk_end = min(watermark + timedelta(hours=chunk_hours), until)
+            created += db.execute(insert(spec.hourly).from_select(
+                ["stats_pnttm", *spec.dimensions, *spec.measures],
+                _raw_select(db, spec, watermark, chunk_end, GRAIN_HOUR)
+            )).rowcount
+            _rebuild_daily(db, spec, floor_day(watermark), ceil_day(chunk_end))
+            db.merge(StatsWatermark(stats_nm=spec.name, watermark_pnttm=chunk_end))
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ {spec.name} 로그 집계 실패 - 오류: {str(e)}")
+        raise
+
+    if created:
+        logger.info(f"✅ {spec.name} 로그 집계 완료 - 시간별 집계 {created}건, 집계 시점: {until}")
+    return created
+
+
+def reset_rollup(db: Session, spec: RollupSpec) -> None:
+    """
+    집계 테이블과 watermark를 비웁니다. (다음 compact_rollup에서 처음부터 다시 집계)
+
+    Args:
+        db: 데이터베이스 세션
+        spec: 집계 정의
+    """
+    try:
+        db.execute(delete(spec.hourly))
+        db.execute(delete(spec.daily))
+        db.execute(delete(StatsWatermark.__table__).where(StatsWatermark.stats_nm == spec.name))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ {spec.name} 로그 집계 초기화 실패 - 오류: {str(e)}")
+        raise
@@ -1,41 +1,46 @@
 import time
 import json
 import uuid
-from typing import Callable, Optional
-from fastapi import Request, Response
+from typing import Optional, Tuple
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.database.database import get_db
-from app.models.log_models import APIUsageLog
+from app.utils.api_log_writer import get_api_log_writer
 from app.utils.logger import get_api_logger
 
 
-class APIUsageMiddleware(BaseHTTPMiddleware):
+class APIUsageMiddleware:
     """
     API 사용 로그 데이터베이스 저장 미들웨어
     모든 API 요청/응답을 데이터베이스에 기록합니다.
     """
     
+    # 본문을 버퍼링하지 않는 Content-Type (파일 업로드 등)
+    BINARY_CONTENT_TYPES = ("multipart/", "application/octet-stream")
+    
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
         self.logger = get_api_logger()
+        self.log_writer = get_api_log_writer()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         API 요청/응답 처리 및 데이터베이스 로깅
         
         Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어 또는 엔드포인트 호출 함수
-        
-        Returns:
-            Response 객체
+            scope: ASGI scope
+            receive: ASGI receive 채널
+            send: ASGI send 채널
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # 요청 시작 시간 기록
         start_time = time.time()
+        request = Request(scope)
         
         # 클라이언트 정보 추출
         client_ip = self._get_client_ip(request)
@@ -54,37 +59,60 @@ class APIUsageMiddleware(BaseHTTPMiddleware):
         # 요청 본문 추출 (POST, PUT, PATCH의 경우)
         request_body = None
         if method in ["POST", "PUT", "PATCH"]:
-            try:
-                # 요청 본문을 읽되, 스트림을 다시 사용할 수 있도록 처리
-                body = await request.body()
-                if body:
-                    # JSON 형태로 파싱 시도
-                    try:
-                        request_body = json.loads(body.decode('utf-8'))
-                        # 민감한 정보 마스킹
-                        request_body = self._mask_sensitive_data(request_body)
-                        request_body = json.dumps(request_body, ensure_ascii=False)
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        request_body = "[Binary or Invalid JSON Data]"
-            except Exception as e:
-                self.logger.logger.error(f"요청 본문 읽기 실패: {str(e)}")
-                request_body = "[Error reading request body]"
+            content_type = request.headers.get("content-type", "")
+            if content_type.startswith(self.BINARY_CONTENT_TYPES):
+                # 업로드 본문은 메모리에 버퍼링하지 않고 그대로 전달
+                request_body = "[Binary or Invalid JSON Data]"
+            else:
+                try:
+                    # 요청 본문을 읽고, 다음 앱이 다시 읽을 수 있도록 receive를 교체
+                    body, receive = await self._read_body(receive)
+                    if body:
+                        # JSON 형태로 파싱 시도
+                        try:
+                            request_body = json.loads(body.decode('utf-8'))
+                            # 민감한 정보 마스킹
+                            request_body = self._mask_sensitive_data(request_body)
+                            request_body = json.dumps(request_body, ensure_ascii=False)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            request_body = "[Binary or Invalid JSON Data]"
+                except Exception as e:
+                    self.logger.logger.error(f"요청 본문 읽기 실패: {str(e)}")
+                    request_body = "[Error reading request body]"
         
         # 로그 ID 생성
         log_id = self._generate_log_id()
         
-        response = None
+        response_status = 500
+        response_started = False
         error_message = None
         
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_status, response_started
+            
+            if message["type"] == "http.response.start":
+                response_started = True
+                response_status = message["status"]
+                
+                # 응답 헤더에 처리 시간 추가
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(int((time.time() - start_time) * 1000))
+            
+            await send(message)
+        
         try:
             # 다음 미들웨어 또는 엔드포인트 호출
-            response = await call_next(request)
-            
+            await self.app(scope, receive, send_wrapper)
+        
         except Exception as e:
             # 에러 발생 시 기록
             error_message = str(e)
             self.logger.logger.error(f"API 호출 중 오류 발생: {error_message}")
             
+            # 응답 전송이 이미 시작된 경우 에러 응답으로 대체할 수 없음
+            if response_started:
+                raise
+            
             # 에러 응답 생성
             response = JSONResponse(
                 status_code=500,
@@ -94,29 +122,62 @@ class APIUsageMiddleware(BaseHTTPMiddleware):
                     "timestamp": time.time()
                 }
             )
+            await response(scope, receive, send_wrapper)
         
-        # 응답 시간 계산
-        process_time_ms = int((time.time() - start_time) * 1000)
-        
-        # 데이터베이스에 로그 저장
-        await self._save_api_log(
-            log_id=log_id,
-            user_id=user_id,
-            endpoint=endpoint,
-            method=method,
-            ip_address=client_ip,
-            user_agent=user_agent,
-            request_body=request_body,
-            response_status=response.status_code if response else 500,
-            response_time_ms=process_time_ms,
-            error_message=error_message
-        )
-        
-        # 응답 헤더에 처리 시간 추가
-        if response:
-            response.headers["X-Process-Time"] = str(process_time_ms)
-        
-        return response
+        finally:
+            # 응답 시간 계산
+            process_time_ms = int((time.time() - start_time) * 1000)
+            
+            # 데이터베이스에 로그 저장 (응답 전송 이후 큐에 적재)
+            await self._save_api_log(
+                log_id=log_id,
+                user_id=user_id,
+                endpoint=endpoint,
+                method=method,
+                ip_address=client_ip,
+                user_agent=user_agent,
+                request_body=request_body,
+                response_status=response_status,
+                response_time_ms=process_time_ms,
+                error_message=error_message
+            )
+    
+    async def _read_body(self, receive: Receive) -> Tuple[bytes, Receive]:
+        """
+        요청 본문을 모두 읽고, 읽은 본문을 다시 전달하는 receive를 반환
+        
+        Args:
+            receive: 원본 ASGI receive 채널
+        
+        Returns:
+            (요청 본문, 본문을 재생하는 receive) 튜플
+        """
+        chunks = []
+        disconnect_message: Optional[Message] = None
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                # 본문 수신 중 연결 종료 - 재생 후 그대로 전달
+                disconnect_message = message
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        
+        body = b"".join(chunks)
+        replayed = False
+        
+        async def replay_receive() -> Message:
+            nonlocal replayed, disconnect_message
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            if disconnect_message is not None:
+                message, disconnect_message = disconnect_message, None
+                return message
+            return await receive()
+        
+        return body, replay_receive
     
     def _get_client_ip(self, request: Request) -> str:
         """
@@ -201,7 +262,10 @@ class APIUsageMiddleware(BaseHTTPMiddleware):
         error_message: Optional[str]
     ):
         """
-        API 사용 로그를 데이터베이스에 저장
+        API 사용 로그를 저장 큐에 적재
+        
+        실제 INSERT는 백그라운드 저장기가 일괄로 수행하므로
+        요청 처리 시간에 DB 왕복이 포함되지 않습니다.
         
         Args:
             log_id: 로그 ID
@@ -216,38 +280,18 @@ class APIUsageMiddleware(BaseHTTPMiddleware):
             error_message: 오류 메시지
         """
         try:
-            # 데이터베이스 세션 생성
-            db_gen = get_db()
-            db: Session = next(db_gen)
-            
-            try:
-                # API 사용 로그 생성
-                api_log = APIUsageLog(
-                    log_id=log_id,
-                    user_id=user_id,
-                    endpoint=endpoint,
-                    method=method,
-                    ip_address=ip_address,
-                    user_agent=user_agent[:1000] if user_agent else None,  # 길이 제한
-                    request_body=request_body[:5000] if request_body else None,  # 길이 제한
-                    response_status=response_status,
-                    response_time_ms=response_time_ms,
-                    error_message=error_message[:1000] if error_message else None,  # 길이 제한
-                    frst_register_id=user_id or 'system'
-                )
-                
-                # 데이터베이스에 저장
-                db.add(api_log)
-                db.commit()
-                
-                self.logger.logger.info(f"[SUCCESS] API 로그 저장 완료 - ID: {log_id}, 엔드포인트: {endpoint}")
-                
-            except Exception as e:
-                db.rollback()
-                self.logger.logger.error(f"[ERROR] API 로그 저장 실패: {str(e)}")
-                raise
-            finally:
-                db.close()
-                
+            await self.log_writer.enqueue({
+                "log_id": log_id,
+                "user_id": user_id,
+                "endpoint": endpoint,
+                "method": method,
+                "ip_address": ip_address,
+                "user_agent": user_agent[:1000] if user_agent else None,  # 길이 제한
+                "request_body": request_body[:5000] if request_body else None,  # 길이 제한
+                "response_status": response_status,
+                "response_time_ms": response_time_ms,
+                "error_message": error_message[:1000] if error_message else None,  # 길이 제한
+                "frst_register_id": user_id or 'system'
+            })
         except Exception as e:
-            self.logger.logger.error(f"[ERROR] 데이터베이스 연결 실패: {str(e)}")
\ No newline at end of file
+            self.logger.logger.error(f"[ERROR] API 로그 적재 실패: {str(e)}")
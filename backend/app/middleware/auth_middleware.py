@@ -1,16 +1,13 @@
-from typing import Callable, Optional
-from fastapi import Request, Response, HTTPException
+from typing import Optional
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.database.database import get_db
 from app.services.auth_service import AuthorInfoService
 from app.utils.logger import get_api_logger
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     JWT 토큰 인증 미들웨어
     보호된 엔드포인트에 대한 access token 검증을 수행합니다.
@@ -41,21 +38,24 @@ class AuthMiddleware(BaseHTTPMiddleware):
     }
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
         self.logger = get_api_logger()
         self.auth_service = AuthorInfoService()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         요청 인증 검증 및 처리
         
         Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어 또는 엔드포인트 호출 함수
-        
-        Returns:
-            Response 객체
+            scope: ASGI scope
+            receive: ASGI receive 채널
+            send: ASGI send 채널
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
         path = request.url.path
         method = request.method
         
@@ -67,63 +67,43 @@ class AuthMiddleware(BaseHTTPMiddleware):
         if self._is_excluded_path(path):
             print(f"✅ AuthMiddleware - Excluded path: {path}")
             self.logger.info(f"✅ AuthMiddleware - Excluded path: {path}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         print(f"🔒 AuthMiddleware - Protected path: {path}")
         self.logger.info(f"🔒 AuthMiddleware - Protected path: {path}")
         
         # OPTIONS 요청은 인증 제외 (CORS preflight)
         if method == "OPTIONS":
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # Authorization 헤더에서 토큰 추출
         authorization = request.headers.get("Authorization")
         if not authorization:
-            return self._create_auth_error_response(
+            response = self._create_auth_error_response(
                 "Authorization header missing",
                 "인증 헤더가 누락되었습니다."
             )
+            await response(scope, receive, send)
+            return
         
         # Bearer 토큰 형식 확인
         if not authorization.startswith("Bearer "):
-            return self._create_auth_error_response(
+            response = self._create_auth_error_response(
                 "Invalid authorization format",
                 "잘못된 인증 형식입니다. Bearer 토큰을 사용해주세요."
             )
+            await response(scope, receive, send)
+            return
         
         # 토큰 추출
         token = authorization.split(" ")[1]
         
         try:
-            # 데이터베이스 세션 생성
-            db = next(get_db())
-            
-            # 토큰 검증 및 사용자 정보 조회
+            # 토큰 검증 (DB 조회 없이 서명/만료만 확인, 검증된 토큰은 캐시 사용)
             user_info = self.auth_service.verify_access_token(token)
-            
-            if not user_info:
-                return self._create_auth_error_response(
-                    "Invalid or expired token",
-                    "유효하지 않거나 만료된 토큰입니다."
-                )
-            
-            # 사용자 정보를 request.state에 저장
-            request.state.user = user_info
-            request.state.user_id = user_info.get('user_id')
-            
-            # 인증 성공 로깅
-            client_ip = self._get_client_ip(request)
-            self.logger.log_custom(
-                level="info",
-                message=f"🔐 Authentication successful - User: {user_info.get('user_id')}",
-                client_ip=client_ip,
-                url=path,
-                method=method,
-                user_id=user_info.get('user_id')
-            )
-            
-            return await call_next(request)
-            
+        
         except Exception as e:
             # 토큰 검증 실패 로깅
             client_ip = self._get_client_ip(request)
@@ -136,15 +116,37 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 error=str(e)
             )
             
-            return self._create_auth_error_response(
+            response = self._create_auth_error_response(
                 "Authentication failed",
                 "인증에 실패했습니다."
             )
+            await response(scope, receive, send)
+            return
         
-        finally:
-            # 데이터베이스 세션 정리
-            if 'db' in locals():
-                db.close()
+        if not user_info:
+            response = self._create_auth_error_response(
+                "Invalid or expired token",
+                "유효하지 않거나 만료된 토큰입니다."
+            )
+            await response(scope, receive, send)
+            return
+        
+        # 사용자 정보를 request.state에 저장 (scope["state"]를 통해 하위 앱과 공유)
+        request.state.user = user_info
+        request.state.user_id = user_info.get('user_id')
+        
+        # 인증 성공 로깅
+        client_ip = self._get_client_ip(request)
+        self.logger.log_custom(
+            level="info",
+            message=f"🔐 Authentication successful - User: {user_info.get('user_id')}",
+            client_ip=client_ip,
+            url=path,
+            method=method,
+            user_id=user_info.get('user_id')
+        )
+        
+        await self.app(scope, receive, send)
     
     def _is_excluded_path(self, path: str) -> bool:
         """
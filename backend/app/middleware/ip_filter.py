@@ -0,0 +1,339 @@
+# SkyBoot Core API - IP 접근 제어 규칙
+# SecurityMiddleware에서 사용하는 사전 컴파일된 화이트리스트/블랙리스트 매처
+#
+# 규칙은 ALLOWED_IPS/BLOCKED_IPS 환경 변수와 IP_RULES_FILE 규칙 파일을 합친 것입니다.
+# 규칙 파일은 한 줄에 "allow <IP/CIDR>" 또는 "block <IP/CIDR>"를 쓰며(# 이후는 주석),
+# 다음 경우에 재시작 없이 다시 읽습니다.
+# - 파일 수정 시각 변경 (IP_RULES_RELOAD_INTERVAL초마다 확인, 모든 워커)
+# - SIGHUP 수신
+# - POST /api/v1/system/ip-rules/reload (요청을 받은 워커)
+
+import asyncio
+import bisect
+import ipaddress
+import logging
+import os
+import signal
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class IPRangeSet:
+    """
+    CIDR 목록을 정렬된 정수 구간 테이블로 컴파일한 집합
+
+    IPv4/IPv6 각각에 대해 네트워크를 [시작, 끝] 정수 구간으로 변환하고,
+    겹치거나 인접한 구간을 병합하여 시작값 기준으로 정렬해 둡니다.
+    포함 여부는 이진 탐색 한 번(O(log n))으로 확인합니다.
+    잘못된 형식의 항목은 건너뛰고 invalid에 기록합니다.
+    """
+
+    def __init__(self, networks: Iterable[str] = ()):
+        """
+        Args:
+            networks: CIDR 또는 단일 IP 문자열 목록
+        """
+        ranges: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+        self.invalid: List[str] = []
+        for entry in networks:
+            entry = entry.strip()
+            if not entry:
+                continue
+            try:
+                network = ipaddress.ip_network(entry, strict=False)
+            except ValueError:
+                self.invalid.append(entry)
+                continue
+            ranges[network.version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+
+        self._starts: Dict[int, List[int]] = {}
+        self._ends: Dict[int, List[int]] = {}
+        self.size = 0
+        for version, version_ranges in ranges.items():
+            merged = self._merge(version_ranges)
+            self._starts[version] = [start for start, _ in merged]
+            self._ends[version] = [end for _, end in merged]
+            self.size += len(merged)
+
+    @staticmethod
+    def _merge(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """겹치거나 인접한 구간을 병합합니다."""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def contains(self, ip_obj) -> bool:
+        """
+        IP 주소가 집합에 포함되는지 확인합니다.
+
+        Args:
+            ip_obj: ipaddress.IPv4Address 또는 IPv6Address
+
+        Returns:
+            포함 여부
+        """
+        starts = self._starts[ip_obj.version]
+        value = int(ip_obj)
+        index = bisect.bisect_right(starts, value) - 1
+        return index >= 0 and value <= self._ends[ip_obj.version][index]
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def parse_rules_file(path: str) -> Tuple[List[str], List[str]]:
+    """
+    규칙 파일을 읽습니다.
+
+    Args:
+        path: 규칙 파일 경로 (한 줄에 "allow <IP/CIDR>" 또는 "block <IP/CIDR>")
+
+    Returns:
+        (허용 목록, 차단 목록). 형식이 잘못된 줄은 경고 후 건너뜁니다.
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    allowed: List[str] = []
+    blocked: List[str] = []
+    with open(path, encoding="utf-8") as fp:
+        for line_no, line in enumerate(fp, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            action = parts[0].lower()
+            if len(parts) != 2 or action not in ("allow", "block"):
+                logger.warning(f"⚠️ IP 규칙 파일 {path}:{line_no} 형식 오류 - 건너뜀: {line}")
+                continue
+            (allowed if action == "allow" else blocked).append(parts[1])
+    return allowed, blocked
+
+
+class IPAccessRules:
+    """
+    IP 화이트리스트/블랙리스트 규칙
+
+    규칙은 생성 시 한 번 컴파일되며, reload()/reload_file()로 재시작 없이 교체할 수 있습니다.
+    교체는 컴파일이 끝난 (허용, 차단) 쌍을 한 번에 바꾸므로 요청 처리 중인
+    스레드는 항상 이전 규칙 또는 새 규칙 중 하나만 보게 됩니다.
+
+    - reload(): 고정 목록(환경 변수 값)을 바꾸고 규칙 파일과 합쳐 다시 컴파일
+    - reload_file(): 규칙 파일만 다시 읽어 다시 컴파일
+    - start()/stop(): 규칙 파일 변경 감시 태스크와 SIGHUP 처리 시작/종료
+    """
+
+    def __init__(
+        self,
+        allowed_ips: Optional[Iterable[str]] = None,
+        blocked_ips: Optional[Iterable[str]] = None,
+        rules_file: Optional[str] = None,
+        reload_interval: float = 10
+    ):
+        """
+        Args:
+            allowed_ips: 허용할 IP/CIDR 목록 (비어 있으면 모두 허용)
+            blocked_ips: 차단할 IP/CIDR 목록
+            rules_file: 추가 규칙 파일 경로 (None이면 사용하지 않음)
+            reload_interval: 규칙 파일 수정 시각 확인 주기(초, 0이면 감시하지 않음)
+        """
+        self.rules_file = rules_file
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._rules: Tuple[IPRangeSet, IPRangeSet] = (IPRangeSet(), IPRangeSet())
+        self._static: Tuple[List[str], List[str]] = ([], [])
+        self._file_rules: Tuple[List[str], List[str]] = ([], [])
+        self._file_mtime: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._sighup_installed = False
+
+        # 통계
+        self.reload_count = 0
+        self.invalid_entries: List[str] = []
+        self.last_error: Optional[str] = None
+
+        self.reload(allowed_ips, blocked_ips)
+
+    def reload(
+        self,
+        allowed_ips: Optional[Iterable[str]] = None,
+        blocked_ips: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        고정 목록을 바꾸고 규칙 파일을 다시 읽어 규칙을 교체합니다.
+
+        Args:
+            allowed_ips: 허용할 IP/CIDR 목록
+            blocked_ips: 차단할 IP/CIDR 목록
+        """
+        self._static = (list(allowed_ips or []), list(blocked_ips or []))
+        self.reload_file()
+
+    def reload_file(self) -> bool:
+        """
+        규칙 파일을 다시 읽어 규칙을 교체합니다.
+        파일을 읽지 못하면 마지막으로 읽은 파일 규칙을 유지합니다.
+
+        Returns:
+            파일을 읽었으면 True (규칙 파일이 없거나 읽기 실패 시 False, 고정 목록은 항상 적용)
+        """
+        loaded = False
+        if self.rules_file:
+            try:
+                mtime = os.path.getmtime(self.rules_file)
+                self._file_rules = parse_rules_file(self.rules_file)
+                self._file_mtime = mtime
+                self.last_error = None
+                loaded = True
+            except OSError as e:
+                self.last_error = str(e)
+                logger.error(f"❌ IP 규칙 파일 읽기 실패 - 기존 규칙 유지: {e}")
+
+        allowed = IPRangeSet(self._static[0] + self._file_rules[0])
+        blocked = IPRangeSet(self._static[1] + self._file_rules[1])
+        self.invalid_entries = allowed.invalid + blocked.invalid
+        if self.invalid_entries:
+            logger.warning(f"⚠️ 잘못된 IP 규칙 건너뜀: {', '.join(self.invalid_entries)}")
+
+        with self._lock:
+            self._rules = (allowed, blocked)
+            self.reload_count += 1
+        logger.info(f"🔒 IP 접근 규칙 적용 - 허용: {len(allowed)}개 구간, 차단: {len(blocked)}개 구간")
+        return loaded
+
+    def check_file(self) -> bool:
+        """
+        규칙 파일 수정 시각이 바뀌었으면 다시 읽습니다.
+
+        Returns:
+            다시 읽었으면 True
+        """
+        if not self.rules_file:
+            return False
+        try:
+            mtime = os.path.getmtime(self.rules_file)
+        except OSError:
+            return False
+        if mtime == self._file_mtime:
+            return False
+        return self.reload_file()
+
+    async def start(self) -> None:
+        """규칙 파일 감시 태스크와 SIGHUP 처리를 시작합니다. (규칙 파일이 없으면 아무것도 하지 않음)"""
+        if not self.rules_file:
+            return
+        loop = asyncio.get_running_loop()
+        if hasattr(signal, "SIGHUP") and not self._sighup_installed:
+            try:
+                loop.add_signal_handler(signal.SIGHUP, self.reload_file)
+                self._sighup_installed = True
+            except (NotImplementedError, RuntimeError, ValueError):
+                # 메인 스레드가 아니거나 지원하지 않는 이벤트 루프
+                pass
+        if self.reload_interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._watch(), name="ip-rules-watcher")
+            logger.info(f"✅ IP 규칙 파일 감시 시작 - {self.rules_file}, 주기: {self.reload_interval}s")
+
+    async def stop(self) -> None:
+        """규칙 파일 감시 태스크를 종료합니다."""
+        if self._sighup_installed:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+            self._sighup_installed = False
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                self.check_file()
+            except Exception as e:
+                logger.error(f"❌ IP 규칙 파일 확인 실패: {e}")
+
+    def is_allowed(self, client_ip: str) -> bool:
+        """
+        클라이언트 IP의 접근 허용 여부를 확인합니다.
+
+        Args:
+            client_ip: 클라이언트 IP 문자열
+
+        Returns:
+            허용 여부
+
+        Raises:
+            ValueError: 잘못된 IP 형식인 경우
+        """
+        ip_obj = ipaddress.ip_address(client_ip)
+        allowed, blocked = self._rules
+
+        # 블랙리스트 확인
+        if blocked and blocked.contains(ip_obj):
+            return False
+
+        # 화이트리스트 확인 (설정된 경우)
+        if allowed:
+            return allowed.contains(ip_obj)
+
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """컴파일된 규칙 구간 수와 규칙 파일 상태를 반환합니다."""
+        allowed, blocked = self._rules
+        return {
+            "allowed_ranges": len(allowed),
+            "blocked_ranges": len(blocked),
+            "rules_file": self.rules_file,
+            "watching": self._task is not None and not self._task.done(),
+            "reloads": self.reload_count,
+            "invalid_entries": list(self.invalid_entries),
+            "last_error": self.last_error
+        }
+
+
+def _split_env(name: str) -> Optional[List[str]]:
+    value = os.getenv(name)
+    return value.split(",") if value else None
+
+
+def _create_ip_access_rules_from_env() -> IPAccessRules:
+    """
+    환경 변수에서 IP 접근 규칙 설정을 읽어 인스턴스를 생성합니다.
+    """
+    return IPAccessRules(
+        _split_env("ALLOWED_IPS"),
+        _split_env("BLOCKED_IPS"),
+        rules_file=os.getenv("IP_RULES_FILE") or None,
+        reload_interval=float(os.getenv("IP_RULES_RELOAD_INTERVAL", "10"))
+    )
+
+
+# 전역 IP 접근 규칙 인스턴스 (처음 사용할 때 생성)
+ip_access_rules: Optional[IPAccessRules] = None
+_ip_access_rules_lock = threading.Lock()
+
+
+def get_ip_access_rules() -> IPAccessRules:
+    """IP 접근 규칙 인스턴스를 반환합니다."""
+    global ip_access_rules
+    with _ip_access_rules_lock:
+        if ip_access_rules is None:
+            ip_access_rules = _create_ip_access_rules_from_env()
+        return ip_access_rules
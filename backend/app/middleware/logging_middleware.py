@@ -1,37 +1,39 @@
 import time
-from typing import Callable
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.utils.logger import get_api_logger
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     API 요청/응답 로깅 미들웨어
     모든 HTTP 요청과 응답을 자동으로 로깅합니다.
     """
     
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
         print("🔧 LoggingMiddleware 초기화됨")  # 디버그용
         self.logger = get_api_logger()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         요청/응답 처리 및 로깅
         
         Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어 또는 엔드포인트 호출 함수
-        
-        Returns:
-            Response 객체
+            scope: ASGI scope
+            receive: ASGI receive 채널
+            send: ASGI send 채널
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # 요청 시작 시간 기록
         start_time = time.time()
+        request = Request(scope)
         
         # 클라이언트 정보 추출
         client_ip = self._get_client_ip(request)
@@ -54,32 +56,40 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             user_id=user_id
         )
         
-        try:
-            # 다음 미들웨어 또는 엔드포인트 호출
-            response = await call_next(request)
-            
-            # 응답 시간 계산
-            process_time = time.time() - start_time
-            
-            # 응답 크기 계산 (가능한 경우)
-            response_size = None
-            if hasattr(response, 'body'):
-                response_size = len(response.body) if response.body else 0
-            
-            # 응답 로깅
-            self.logger.log_response(
-                method=method,
-                url=url,
-                status_code=response.status_code,
-                response_time=process_time,
-                response_size=response_size
-            )
+        response_started = False
+        status_code = 500
+        response_size = 0
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started, status_code, response_size
             
-            # 응답 헤더에 처리 시간 추가
-            response.headers["X-Process-Time"] = str(process_time)
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                
+                # 응답 헤더에 처리 시간 추가
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(time.time() - start_time)
             
-            return response
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+                
+                # 응답 본문 전송 완료 시 로깅
+                if not message.get("more_body", False):
+                    self.logger.log_response(
+                        method=method,
+                        url=url,
+                        status_code=status_code,
+                        response_time=time.time() - start_time,
+                        response_size=response_size
+                    )
             
+            await send(message)
+        
+        try:
+            # 다음 미들웨어 또는 엔드포인트 호출
+            await self.app(scope, receive, send_wrapper)
+        
         except Exception as e:
             # 에러 발생 시 로깅
             process_time = time.time() - start_time
@@ -92,6 +102,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 user_id=user_id
             )
             
+            # 응답 전송이 이미 시작된 경우 에러 응답으로 대체할 수 없음
+            if response_started:
+                raise
+            
             # 에러 응답 생성
             error_response = JSONResponse(
                 status_code=500,
@@ -103,7 +117,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             )
             error_response.headers["X-Process-Time"] = str(process_time)
             
-            return error_response
+            await error_response(scope, receive, send)
     
     def _get_client_ip(self, request: Request) -> str:
         """
@@ -133,28 +147,32 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         return "Unknown"
 
 
-class RequestSizeMiddleware(BaseHTTPMiddleware):
+class RequestSizeMiddleware:
     """
     요청 크기 제한 미들웨어
     대용량 파일 업로드 등을 제한합니다.
     """
     
     def __init__(self, app: ASGIApp, max_size: int = 50 * 1024 * 1024):  # 50MB
-        super().__init__(app)
+        self.app = app
         self.max_size = max_size
         self.logger = get_api_logger()
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         요청 크기 검증 및 처리
         
         Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어 또는 엔드포인트 호출 함수
-        
-        Returns:
-            Response 객체
+            scope: ASGI scope
+            receive: ASGI receive 채널
+            send: ASGI send 채널
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
+        
         # Content-Length 헤더 확인
         content_length = request.headers.get("content-length")
         
@@ -171,7 +189,7 @@ class RequestSizeMiddleware(BaseHTTPMiddleware):
                     max_size=self.max_size
                 )
                 
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=413,
                     content={
                         "error": "Request Entity Too Large",
@@ -179,5 +197,7 @@ class RequestSizeMiddleware(BaseHTTPMiddleware):
                         "max_size_mb": self.max_size // (1024*1024)
                     }
                 )
+                await response(scope, receive, send)
+                return
         
-        return await call_next(request)
\ No newline at end of file
+        await self.app(scope, receive, send)
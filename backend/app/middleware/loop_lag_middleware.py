@@ -0,0 +1,35 @@
+"""이벤트 루프 지연 추적 미들웨어
+
+처리 중인 요청을 LoopLagMonitor에 등록하여, 루프 지연이 발생했을 때 그 구간에
+처리 중이던 엔드포인트에 지연을 기록할 수 있게 합니다.
+"""
+
+import asyncio
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.utils.loop_monitor import LoopLagMonitor, get_loop_lag_monitor
+
+
+class LoopLagMiddleware:
+    """
+    요청 처리 구간을 루프 지연 모니터에 등록하는 ASGI 미들웨어
+
+    스트리밍 응답처럼 본문 전송 중에 루프를 막는 경우도 기록되도록
+    응답 전송이 끝날 때까지를 처리 구간으로 봅니다.
+    """
+
+    def __init__(self, app: ASGIApp, monitor: LoopLagMonitor = None):
+        self.app = app
+        self.monitor = monitor or get_loop_lag_monitor()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self.monitor.request_started(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.request_finished(request_id, asyncio.get_running_loop().time())
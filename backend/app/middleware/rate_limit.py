@@ -0,0 +1,223 @@
+# SkyBoot Core API - Rate Limit 백엔드
+# SecurityMiddleware에서 사용하는 교체 가능한 요청 수 제한 저장소
+
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(ABC):
+    """
+    Rate limit 백엔드 기본 클래스
+
+    hit()은 키(클라이언트 IP)의 요청을 한 건 기록하고 허용 여부를 반환합니다.
+    """
+
+    def __init__(self, limit: int, window: int):
+        """
+        Args:
+            limit: 윈도우당 허용 요청 수
+            window: 윈도우 크기(초)
+        """
+        self.limit = limit
+        self.window = window
+
+    @abstractmethod
+    async def hit(self, key: str) -> bool:
+        """
+        요청을 한 건 기록합니다.
+
+        Args:
+            key: 클라이언트 키
+
+        Returns:
+            허용 여부
+        """
+
+    async def close(self) -> None:
+        """백엔드 리소스를 정리합니다."""
+        return None
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    프로세스 내부 GCRA(Generic Cell Rate Algorithm) rate limiter
+
+    키마다 이론적 도착 시각(TAT) float 하나만 저장합니다.
+    window 동안 limit건까지 연속 허용하며, 이후에는 window/limit 간격으로
+    한 건씩 회복됩니다. TAT가 현재 시각보다 과거인 키는 한도가 완전히
+    회복된 유휴 키이므로 주기적으로 제거합니다.
+
+    많은 IP에서 동시에 요청이 들어와 유휴 키가 없어도 키 수는 max_keys를
+    넘지 않습니다. 가득 찬 상태에서 새 키가 들어오면 가장 오래 요청이 없던
+    키부터 제거합니다(LRU). 제거된 키는 다음 요청에서 한도가 새로 시작됩니다.
+    """
+
+    def __init__(self, limit: int, window: int, max_keys: int = 100000):
+        """
+        Args:
+            limit: 윈도우당 허용 요청 수
+            window: 윈도우 크기(초)
+            max_keys: 보관할 최대 키 수 (가득 차면 LRU 제거)
+        """
+        super().__init__(limit, window)
+        self.max_keys = max_keys
+        self.emission_interval = window / limit if limit > 0 else float("inf")
+        self.burst_tolerance = window - self.emission_interval
+        # 최근에 요청한 키가 뒤쪽에 오도록 유지 (LRU 순서)
+        self._tat: "OrderedDict[str, float]" = OrderedDict()
+        self._next_sweep = time.monotonic() + window
+        self.evicted_count = 0
+
+    async def hit(self, key: str) -> bool:
+        return self.hit_at(key, time.monotonic())
+
+    def hit_at(self, key: str, now: float) -> bool:
+        """
+        지정된 시각 기준으로 요청을 기록합니다.
+
+        Args:
+            key: 클라이언트 키
+            now: 기준 시각 (monotonic 초)
+
+        Returns:
+            허용 여부
+        """
+        if self.limit <= 0:
+            return False
+
+        if now >= self._next_sweep:
+            self._evict_idle(now)
+        if key not in self._tat and len(self._tat) >= self.max_keys:
+            # 전체 순회 없이 O(1)로 자리 확보 (유휴 키는 대부분 LRU 앞쪽에 있음)
+            self._evict_lru()
+
+        tat = max(self._tat.get(key, now), now)
+        if key in self._tat:
+            self._tat.move_to_end(key)
+        if tat - now > self.burst_tolerance:
+            return False
+
+        self._tat[key] = tat + self.emission_interval
+        return True
+
+    def _evict_idle(self, now: float) -> None:
+        """한도가 완전히 회복된 유휴 키를 제거합니다."""
+        idle_keys = [key for key, tat in self._tat.items() if tat <= now]
+        for key in idle_keys:
+            del self._tat[key]
+        self._next_sweep = now + self.window
+
+    def _evict_lru(self) -> None:
+        """새 키를 넣을 자리가 생길 때까지 가장 오래 요청이 없던 키를 제거합니다."""
+        while len(self._tat) >= self.max_keys:
+            self._tat.popitem(last=False)
+            self.evicted_count += 1
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Redis 기반 sliding window rate limiter
+
+    키마다 sorted set에 요청 시각을 기록하고, 윈도우 밖의 항목 제거,
+    개수 확인, 기록, 만료 설정을 Lua 스크립트 한 번으로 원자적으로
+    수행하므로 여러 워커와 노드가 같은 한도를 공유합니다.
+    시각은 Redis 서버의 TIME을 사용하여 노드 간 시계 차이를 배제합니다.
+    """
+
+    SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window_us = tonumber(ARGV[2])
+local member = ARGV[3]
+
+local now = redis.call('TIME')
+local now_us = tonumber(now[1]) * 1000000 + tonumber(now[2])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now_us - window_us)
+local count = redis.call('ZCARD', key)
+if count >= limit then
+    return 0
+end
+
+redis.call('ZADD', key, now_us, member)
+redis.call('PEXPIRE', key, math.ceil(window_us / 1000))
+return 1
+"""
+
+    def __init__(
+        self,
+        redis_client,
+        limit: int,
+        window: int,
+        key_prefix: str = "skyboot:ratelimit:",
+        fallback: Optional[RateLimitBackend] = None
+    ):
+        """
+        Args:
+            redis_client: redis.asyncio 클라이언트
+            limit: 윈도우당 허용 요청 수
+            window: 윈도우 크기(초)
+            key_prefix: Redis 키 접두사
+            fallback: Redis 오류 시 사용할 백엔드 (기본: 프로세스 내부 GCRA)
+        """
+        super().__init__(limit, window)
+        self.redis = redis_client
+        self.key_prefix = key_prefix
+        self.fallback = fallback or InMemoryRateLimitBackend(limit, window)
+        self._script = redis_client.register_script(self.SLIDING_WINDOW_SCRIPT)
+
+    async def hit(self, key: str) -> bool:
+        try:
+            allowed = await self._script(
+                keys=[f"{self.key_prefix}{key}"],
+                args=[self.limit, self.window * 1000000, uuid.uuid4().hex]
+            )
+            return bool(int(allowed))
+        except Exception as e:
+            # Redis 장애 시 요청을 막지 않고 워커 단위 제한으로 대체
+            logger.error(f"❌ Redis rate limit 확인 실패, 로컬 백엔드로 대체: {str(e)}")
+            return await self.fallback.hit(key)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_rate_limit_backend(
+    limit: int,
+    window: int,
+    backend: str = "memory",
+    redis_url: Optional[str] = None
+) -> RateLimitBackend:
+    """
+    설정에 맞는 rate limit 백엔드를 생성합니다.
+
+    Args:
+        limit: 윈도우당 허용 요청 수
+        window: 윈도우 크기(초)
+        backend: "memory" 또는 "redis"
+        redis_url: Redis 접속 URL (redis 백엔드에서 필수)
+
+    Returns:
+        RateLimitBackend 인스턴스
+    """
+    if backend == "redis":
+        if not redis_url:
+            logger.warning("⚠️ REDIS_URL이 설정되지 않아 메모리 rate limit 백엔드를 사용합니다.")
+        else:
+            import redis.asyncio as redis_asyncio
+
+            client = redis_asyncio.from_url(redis_url)
+            logger.info("🔒 Redis rate limit 백엔드 사용")
+            return RedisRateLimitBackend(client, limit, window)
+
+    logger.info("🔒 메모리 rate limit 백엔드 사용")
+    return InMemoryRateLimitBackend(limit, window)
@@ -5,16 +5,18 @@ import os
 import time
 import logging
 from typing import Dict, List, Optional
-from fastapi import Request, Response, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.middleware.base import RequestResponseEndpoint
-from collections import defaultdict, deque
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from datetime import datetime, timedelta
-import ipaddress
+
+from app.middleware.ip_filter import IPAccessRules
+from app.middleware.rate_limit import RateLimitBackend, InMemoryRateLimitBackend
 
 logger = logging.getLogger(__name__)
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+class SecurityMiddleware:
     """
     보안 강화를 위한 미들웨어
     - Rate Limiting
@@ -31,62 +33,92 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         max_request_size: int = 10 * 1024 * 1024,  # 10MB
         allowed_ips: Optional[List[str]] = None,
         blocked_ips: Optional[List[str]] = None,
-        enable_security_headers: bool = True
+        enable_security_headers: bool = True,
+        rate_limit_backend: Optional[RateLimitBackend] = None,
+        ip_rules: Optional[IPAccessRules] = None
     ):
-        super().__init__(app)
+        self.app = app
         self.rate_limit_requests = rate_limit_requests
         self.rate_limit_window = rate_limit_window
         self.max_request_size = max_request_size
-        self.allowed_ips = set(allowed_ips or [])
-        self.blocked_ips = set(blocked_ips or [])
         self.enable_security_headers = enable_security_headers
         
-        # Rate limiting 저장소
-        self.request_counts: Dict[str, deque] = defaultdict(deque)
+        # IP 접근 규칙 (시작 시 한 번 컴파일, ip_rules.reload()로 재시작 없이 교체)
+        self.ip_rules = ip_rules or IPAccessRules(allowed_ips, blocked_ips)
+        
+        # Rate limiting 저장소 (기본: 프로세스 내부 GCRA, 다중 워커 환경은 Redis 백엔드 사용)
+        self.rate_limiter = rate_limit_backend or InMemoryRateLimitBackend(
+            rate_limit_requests, rate_limit_window
+        )
         
         logger.info("🔒 보안 미들웨어 초기화 완료")
     
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         보안 검사를 수행하고 요청을 처리합니다.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         start_time = time.time()
+        request = Request(scope)
         client_ip = self._get_client_ip(request)
         
-        try:
-            # 1. IP 기반 접근 제어
-            if not self._check_ip_access(client_ip):
-                logger.warning(f"🚫 IP 접근 차단: {client_ip}")
-                raise HTTPException(status_code=403, detail="Access denied")
-            
-            # 2. Rate Limiting 검사
-            if not self._check_rate_limit(client_ip):
-                logger.warning(f"⚠️ Rate limit 초과: {client_ip}")
-                raise HTTPException(status_code=429, detail="Too many requests")
+        # 1. IP 기반 접근 제어
+        if not self._check_ip_access(client_ip):
+            logger.warning(f"🚫 IP 접근 차단: {client_ip}")
+            await self._reject(scope, receive, send, 403, "Access denied")
+            return
+        
+        # 2. Rate Limiting 검사
+        if not await self._check_rate_limit(client_ip):
+            logger.warning(f"⚠️ Rate limit 초과: {client_ip}")
+            await self._reject(scope, receive, send, 429, "Too many requests")
+            return
+        
+        # 3. 요청 크기 검사
+        if not await self._check_request_size(request):
+            logger.warning(f"📦 요청 크기 초과: {client_ip}")
+            await self._reject(scope, receive, send, 413, "Request entity too large")
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
             
-            # 3. 요청 크기 검사
-            if not await self._check_request_size(request):
-                logger.warning(f"📦 요청 크기 초과: {client_ip}")
-                raise HTTPException(status_code=413, detail="Request entity too large")
+            if message["type"] == "http.response.start":
+                response_started = True
+                
+                # 5. 보안 헤더 추가
+                if self.enable_security_headers:
+                    self._add_security_headers(MutableHeaders(scope=message))
+                
+                # 6. 처리 시간 로깅
+                process_time = time.time() - start_time
+                logger.info(f"🔒 보안 검사 완료 - IP: {client_ip}, 처리시간: {process_time:.3f}s")
             
+            await send(message)
+        
+        try:
             # 4. 요청 처리
-            response = await call_next(request)
-            
-            # 5. 보안 헤더 추가
-            if self.enable_security_headers:
-                self._add_security_headers(response)
-            
-            # 6. 처리 시간 로깅
-            process_time = time.time() - start_time
-            logger.info(f"🔒 보안 검사 완료 - IP: {client_ip}, 처리시간: {process_time:.3f}s")
-            
-            return response
-            
-        except HTTPException:
-            raise
+            await self.app(scope, receive, send_wrapper)
+        
         except Exception as e:
             logger.error(f"❌ 보안 미들웨어 오류: {str(e)}")
-            raise HTTPException(status_code=500, detail="Internal server error")
+            if response_started:
+                raise
+            await self._reject(scope, receive, send, 500, "Internal server error")
+    
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, status_code: int, detail: str) -> None:
+        """
+        요청을 거부하는 오류 응답을 전송합니다.
+        """
+        response = JSONResponse(status_code=status_code, content={"detail": detail})
+        if self.enable_security_headers:
+            self._add_security_headers(response.headers)
+        await response(scope, receive, send)
     
     def _get_client_ip(self, request: Request) -> str:
         """
@@ -110,48 +142,17 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         IP 기반 접근 제어를 확인합니다.
         """
         try:
-            ip_obj = ipaddress.ip_address(client_ip)
-            
-            # 블랙리스트 확인
-            if self.blocked_ips:
-                for blocked_ip in self.blocked_ips:
-                    if ip_obj in ipaddress.ip_network(blocked_ip, strict=False):
-                        return False
-            
-            # 화이트리스트 확인 (설정된 경우)
-            if self.allowed_ips:
-                for allowed_ip in self.allowed_ips:
-                    if ip_obj in ipaddress.ip_network(allowed_ip, strict=False):
-                        return True
-                return False  # 화이트리스트가 설정되었지만 매치되지 않음
-            
-            return True  # 화이트리스트가 설정되지 않은 경우 허용
-            
+            return self.ip_rules.is_allowed(client_ip)
+        
         except ValueError:
             logger.warning(f"⚠️ 잘못된 IP 형식: {client_ip}")
             return False
     
-    def _check_rate_limit(self, client_ip: str) -> bool:
+    async def _check_rate_limit(self, client_ip: str) -> bool:
         """
         Rate limiting을 확인합니다.
         """
-        now = time.time()
-        window_start = now - self.rate_limit_window
-        
-        # 현재 IP의 요청 기록 가져오기
-        requests = self.request_counts[client_ip]
-        
-        # 윈도우 밖의 오래된 요청 제거
-        while requests and requests[0] < window_start:
-            requests.popleft()
-        
-        # 현재 요청 수 확인
-        if len(requests) >= self.rate_limit_requests:
-            return False
-        
-        # 현재 요청 기록
-        requests.append(now)
-        return True
+        return await self.rate_limiter.hit(client_ip)
     
     async def _check_request_size(self, request: Request) -> bool:
         """
@@ -166,7 +167,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                 return False
         return True
     
-    def _add_security_headers(self, response: Response) -> None:
+    def _add_security_headers(self, headers: MutableHeaders) -> None:
         """
         보안 헤더를 추가합니다.
         """
@@ -181,43 +182,52 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         }
         
         for header, value in security_headers.items():
-            response.headers[header] = value
+            headers[header] = value
 
-class APIKeyMiddleware(BaseHTTPMiddleware):
+class APIKeyMiddleware:
     """
     API 키 기반 인증 미들웨어
     """
     
-    def __init__(self, app, api_keys: Optional[List[str]] = None, exempt_paths: Optional[List[str]] = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, api_keys: Optional[List[str]] = None, exempt_paths: Optional[List[str]] = None):
+        self.app = app
         self.api_keys = set(api_keys or [])
         self.exempt_paths = set(exempt_paths or ["/health", "/docs", "/redoc", "/openapi.json"])
         
         logger.info(f"🔑 API 키 미들웨어 초기화 - 등록된 키: {len(self.api_keys)}개")
     
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         API 키 인증을 확인합니다.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
         path = request.url.path
         
         # 예외 경로 확인
         if any(path.startswith(exempt_path) for exempt_path in self.exempt_paths):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # API 키가 설정되지 않은 경우 통과
         if not self.api_keys:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # API 키 확인
         api_key = request.headers.get("X-API-Key") or request.query_params.get("api_key")
         
         if not api_key or api_key not in self.api_keys:
             logger.warning(f"🚫 유효하지 않은 API 키: {request.client.host if request.client else 'unknown'}")
-            raise HTTPException(status_code=401, detail="Invalid API key")
+            response = JSONResponse(status_code=401, content={"detail": "Invalid API key"})
+            await response(scope, receive, send)
+            return
         
         logger.info(f"✅ API 키 인증 성공: {path}")
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 def get_security_config() -> Dict:
     """
@@ -230,5 +240,7 @@ def get_security_config() -> Dict:
         "allowed_ips": os.getenv("ALLOWED_IPS", "").split(",") if os.getenv("ALLOWED_IPS") else None,
         "blocked_ips": os.getenv("BLOCKED_IPS", "").split(",") if os.getenv("BLOCKED_IPS") else None,
         "api_keys": os.getenv("API_KEYS", "").split(",") if os.getenv("API_KEYS") else None,
-        "enable_security_headers": os.getenv("ENABLE_SECURITY_HEADERS", "true").lower() == "true"
+        "enable_security_headers": os.getenv("ENABLE_SECURITY_HEADERS", "true").lower() == "true",
+        "rate_limit_backend": os.getenv("RATE_LIMIT_BACKEND", "memory").lower(),
+        "redis_url": os.getenv("REDIS_URL")
     }
\ No newline at end of file
@@ -13,6 +13,12 @@ from .user_models import UserInfo
 from .org_models import Org
 from .zip_models import Zip
 from .system_models import SysLog, WebLog, ProgrmList
+from .stats_models import (
+    LoginLogHourStats, LoginLogDayStats,
+    SysLogHourStats, SysLogDayStats,
+    WebLogHourStats, WebLogDayStats,
+    StatsWatermark
+)
 
 __all__ = [
     "AuthorInfo",
@@ -32,5 +38,12 @@ __all__ = [
     "Zip",
     "SysLog",
     "WebLog",
-    "ProgrmList"
+    "ProgrmList",
+    "LoginLogHourStats",
+    "LoginLogDayStats",
+    "SysLogHourStats",
+    "SysLogDayStats",
+    "WebLogHourStats",
+    "WebLogDayStats",
+    "StatsWatermark"
 ]
\ No newline at end of file
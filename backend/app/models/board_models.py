@@ -4,7 +4,7 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Numeric, ForeignKey, Index, and_, ForeignKeyConstraint
+from sqlalchemy import Column, String, DateTime, Text, Numeric, ForeignKey, Index, and_, ForeignKeyConstraint, text
 from sqlalchemy.orm import relationship
 from ..database.database import Base
 
@@ -52,6 +52,8 @@ class Bbs(Base):
     __tablename__ = "tb_bbs"
     __table_args__ = (
         Index('ix_bbs_01', 'bbs_id'),
+        # 게시판별 최신순 목록 (삭제되지 않은 글)
+        Index('ix_bbs_02', 'bbs_id', 'delete_at', text('frst_regist_pnttm DESC')),
         {
             'schema': 'skybootcore',
             'comment': '게시판'
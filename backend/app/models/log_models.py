@@ -4,7 +4,7 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, Integer
+from sqlalchemy import Column, String, DateTime, Text, Integer, Index
 from ..database.database import Base
 
 
@@ -14,10 +14,19 @@ class LoginLog(Base):
     사용자의 시스템 접속 로그를 관리하는 테이블입니다.
     """
     __tablename__ = "tb_loginlog"
-    __table_args__ = {
-        'schema': 'skybootcore',
-        'comment': '접속로그'
-    }
+    __table_args__ = (
+        # 통계/목록: 등록시점 범위, 사용자·IP별 집계, 성공/실패별 조회
+        Index('ix_loginlog_01', 'frst_regist_pnttm'),
+        Index('ix_loginlog_02', 'conect_id', 'frst_regist_pnttm'),
+        Index('ix_loginlog_03', 'conect_ip', 'frst_regist_pnttm'),
+        Index('ix_loginlog_04', 'error_occrrnc_at', 'frst_regist_pnttm'),
+        {
+            'schema': 'skybootcore',
+            'comment': '접속로그',
+            # 등록시점 기준 월별 범위 파티션 (app.database.partitioning)
+            'postgresql_partition_by': 'RANGE (frst_regist_pnttm)'
+        }
+    )
     
     # 기본 필드
     log_id = Column(String(20), primary_key=True, comment="로그ID")
@@ -27,12 +36,15 @@ class LoginLog(Base):
     error_occrrnc_at = Column(String(1), nullable=True, comment="오류발생여부")
     error_code = Column(String(3), nullable=True, comment="오류코드")
 
-    # 공통 필드
-    frst_regist_pnttm = Column(DateTime, nullable=True, default=datetime.now, comment="최초등록시점")
+    # 공통 필드 (frst_regist_pnttm은 파티션 키이므로 테이블 기본 키에 포함)
+    frst_regist_pnttm = Column(DateTime, primary_key=True, default=datetime.now, comment="최초등록시점")
     frst_register_id = Column(String(20), nullable=True, comment="최초등록자ID")
     last_updt_pnttm = Column(DateTime, nullable=True, comment="최종수정시점")
     last_updusr_id = Column(String(20), nullable=True, comment="최종수정자ID")
     
+    # ORM 식별자는 로그ID만 사용
+    __mapper_args__ = {'primary_key': [log_id]}
+    
     def __repr__(self):
         return f"<LoginLog(log_id='{self.log_id}', conect_id='{self.conect_id}', conect_ip='{self.conect_ip}')>"
 
@@ -43,10 +55,18 @@ class APIUsageLog(Base):
     모든 API 엔드포인트 호출 내역을 기록하는 테이블입니다.
     """
     __tablename__ = "tb_api_usage_log"
-    __table_args__ = {
-        'schema': 'skybootcore',
-        'comment': 'API 사용 로그'
-    }
+    __table_args__ = (
+        # 등록시점 범위, 사용자·IP별 조회
+        Index('ix_api_usage_log_01', 'frst_regist_pnttm'),
+        Index('ix_api_usage_log_02', 'user_id', 'frst_regist_pnttm'),
+        Index('ix_api_usage_log_03', 'ip_address', 'frst_regist_pnttm'),
+        {
+            'schema': 'skybootcore',
+            'comment': 'API 사용 로그',
+            # 등록시점 기준 월별 범위 파티션 (app.database.partitioning)
+            'postgresql_partition_by': 'RANGE (frst_regist_pnttm)'
+        }
+    )
     
     # 기본 필드
     log_id = Column(String(20), primary_key=True, comment="로그ID")
@@ -60,11 +80,14 @@ class APIUsageLog(Base):
     response_time_ms = Column(Integer, nullable=True, comment="응답 시간(밀리초)")
     error_message = Column(Text, nullable=True, comment="오류 메시지")
     
-    # 공통 필드
-    frst_regist_pnttm = Column(DateTime, nullable=True, default=datetime.now, comment="최초등록시점")
+    # 공통 필드 (frst_regist_pnttm은 파티션 키이므로 테이블 기본 키에 포함)
+    frst_regist_pnttm = Column(DateTime, primary_key=True, default=datetime.now, comment="최초등록시점")
     frst_register_id = Column(String(20), nullable=True, comment="최초등록자ID")
     last_updt_pnttm = Column(DateTime, nullable=True, comment="최종수정시점")
     last_updusr_id = Column(String(20), nullable=True, comment="최종수정자ID")
     
+    # ORM 식별자는 로그ID만 사용
+    __mapper_args__ = {'primary_key': [log_id]}
+    
     def __repr__(self):
         return f"<APIUsageLog(log_id='{self.log_id}', endpoint='{self.endpoint}', method='{self.method}', user_id='{self.user_id}')>"
\ No newline at end of file
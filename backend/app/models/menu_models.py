@@ -17,6 +17,7 @@ class MenuInfo(Base):
     __tablename__ = "tb_menuinfo"
     __table_args__ = (
         Index('ix_menuinfo_01', 'upper_menu_no'),
+        Index('ix_menuinfo_02', 'menu_path', postgresql_ops={'menu_path': 'varchar_pattern_ops'}),
         {
             'schema': 'skybootcore',
             'comment': '메뉴정보'
@@ -37,6 +38,10 @@ class MenuInfo(Base):
     use_tag_yn = Column(String(1), nullable=False, default='N', comment="메뉴 표시할때 이미지 URL 대신 태그내용를 사용하는지 여부표시")
     menu_tag = Column(String, nullable=True, comment="메뉴 표시 태그 use_tag_yn 이 Y 일때 사용")
     
+    # 계층 경로 필드 (NULL이면 경로를 알 수 없으므로 재귀 조회로 대체)
+    menu_path = Column(String, nullable=True, comment="메뉴경로 (/최상위메뉴번호/.../메뉴번호/)")
+    menu_depth = Column(Numeric(3), nullable=True, comment="메뉴깊이 (최상위 메뉴가 1)")
+    
     # 공통 필드
     frst_regist_pnttm = Column(DateTime, nullable=False, default=datetime.now, comment="최초등록시점")
     frst_register_id = Column(String(20), nullable=True, comment="최초등록자ID")
@@ -0,0 +1,100 @@
+"""로그 통계 집계(rollup) SQLAlchemy 모델
+
+접속로그/시스템로그/웹로그를 시간 단위와 일 단위로 미리 집계한 테이블과
+집계 진행 시점(watermark)을 관리하는 테이블을 정의합니다.
+집계 테이블은 app.database.rollups의 집계 작업이 채우며, 통계 조회는
+원본 로그 대신 집계 테이블을 읽습니다.
+
+차원 컬럼의 NULL은 기본 키에 포함하기 위해 빈 문자열('')로 저장합니다.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Date, Integer, Numeric
+from ..database.database import Base
+
+
+class LoginLogHourStats(Base):
+    """접속로그 시간별 집계 테이블 모델"""
+    __tablename__ = "tb_loginlog_hour_stats"
+    __table_args__ = {'schema': 'skybootcore', 'comment': '접속로그 시간별 집계'}
+
+    stats_pnttm = Column(DateTime, primary_key=True, comment="집계시점(시간 시작)")
+    conect_id = Column(String(20), primary_key=True, default='', comment="접속ID")
+    conect_ip = Column(String(23), primary_key=True, default='', comment="접속IP")
+    error_occrrnc_at = Column(String(1), primary_key=True, default='', comment="오류발생여부")
+    log_co = Column(Integer, nullable=False, default=0, comment="로그수")
+
+
+class LoginLogDayStats(Base):
+    """접속로그 일별 집계 테이블 모델"""
+    __tablename__ = "tb_loginlog_day_stats"
+    __table_args__ = {'schema': 'skybootcore', 'comment': '접속로그 일별 집계'}
+
+    stats_de = Column(Date, primary_key=True, comment="집계일자")
+    conect_id = Column(String(20), primary_key=True, default='', comment="접속ID")
+    conect_ip = Column(String(23), primary_key=True, default='', comment="접속IP")
+    error_occrrnc_at = Column(String(1), primary_key=True, default='', comment="오류발생여부")
+    log_co = Column(Integer, nullable=False, default=0, comment="로그수")
+
+
+class SysLogHourStats(Base):
+    """시스템로그 시간별 집계 테이블 모델"""
+    __tablename__ = "tb_syslog_hour_stats"
+    __table_args__ = {'schema': 'skybootcore', 'comment': '시스템로그 시간별 집계'}
+
+    stats_pnttm = Column(DateTime, primary_key=True, comment="집계시점(시간 시작)")
+    rqester_id = Column(String(20), primary_key=True, default='', comment="요청자ID")
+    trget_menu_nm = Column(String(255), primary_key=True, default='', comment="대상메뉴명")
+    process_se_code = Column(String(3), primary_key=True, default='', comment="처리구분코드")
+    log_co = Column(Integer, nullable=False, default=0, comment="로그수")
+    process_time_sum = Column(Numeric, nullable=True, comment="처리시간합계")
+    process_time_co = Column(Integer, nullable=False, default=0, comment="처리시간기록수")
+
+
+class SysLogDayStats(Base):
+    """시스템로그 일별 집계 테이블 모델"""
+    __tablename__ = "tb_syslog_day_stats"
+    __table_args__ = {'schema': 'skybootcore', 'comment': '시스템로그 일별 집계'}
+
+    stats_de = Column(Date, primary_key=True, comment="집계일자")
+    rqester_id = Column(String(20), primary_key=True, default='', comment="요청자ID")
+    trget_menu_nm = Column(String(255), primary_key=True, default='', comment="대상메뉴명")
+    process_se_code = Column(String(3), primary_key=True, default='', comment="처리구분코드")
+    log_co = Column(Integer, nullable=False, default=0, comment="로그수")
+    process_time_sum = Column(Numeric, nullable=True, comment="처리시간합계")
+    process_time_co = Column(Integer, nullable=False, default=0, comment="처리시간기록수")
+
+
+class WebLogHourStats(Base):
+    """웹로그 시간별 집계 테이블 모델"""
+    __tablename__ = "tb_weblog_hour_stats"
+    __table_args__ = {'schema': 'skybootcore', 'comment': '웹로그 시간별 집계'}
+
+    stats_pnttm = Column(DateTime, primary_key=True, comment="집계시점(시간 시작)")
+    rqester_id = Column(String(20), primary_key=True, default='', comment="요청자ID")
+    trget_menu_nm = Column(String(60), primary_key=True, default='', comment="대상메뉴명")
+    log_co = Column(Integer, nullable=False, default=0, comment="로그수")
+
+
+class WebLogDayStats(Base):
+    """웹로그 일별 집계 테이블 모델"""
+    __tablename__ = "tb_weblog_day_stats"
+    __table_args__ = {'schema': 'skybootcore', 'comment': '웹로그 일별 집계'}
+
+    stats_de = Column(Date, primary_key=True, comment="집계일자")
+    rqester_id = Column(String(20), primary_key=True, default='', comment="요청자ID")
+    trget_menu_nm = Column(String(60), primary_key=True, default='', comment="대상메뉴명")
+    log_co = Column(Integer, nullable=False, default=0, comment="로그수")
+
+
+class StatsWatermark(Base):
+    """로그 집계 진행 시점 테이블 모델
+
+    원본 로그 중 watermark_pnttm 이전 시간대는 모두 시간별 집계에 반영되어 있습니다.
+    """
+    __tablename__ = "tb_stats_watermark"
+    __table_args__ = {'schema': 'skybootcore', 'comment': '로그 집계 진행 시점'}
+
+    stats_nm = Column(String(30), primary_key=True, comment="집계명")
+    watermark_pnttm = Column(DateTime, nullable=False, comment="집계완료시점")
+    last_updt_pnttm = Column(DateTime, nullable=True, default=datetime.now, onupdate=datetime.now, comment="최종수정시점")
@@ -3,7 +3,8 @@
 시스템로그, 웹로그, 프로그램목록 등 시스템 관련 테이블의 SQLAlchemy 모델을 정의합니다.
 """
 
-from sqlalchemy import Column, String, Numeric, DateTime, Text, Index
+from datetime import datetime
+from sqlalchemy import Column, String, Numeric, DateTime, Text, Index, text
 from sqlalchemy.sql import func
 from ..database.database import Base
 
@@ -14,16 +15,27 @@ class SysLog(Base):
     시스템의 처리 로그와 오류 정보를 관리하는 테이블입니다.
     """
     __tablename__ = "tb_syslog"
-    __table_args__ = {
-        'schema': 'skybootcore',
-        'comment': '시스템로그'
-    }
+    __table_args__ = (
+        # 통계/목록: 발생일 범위, 요청자별 집계, 처리구분(오류)별 조회
+        Index('ix_syslog_01', 'occrrnc_de'),
+        Index('ix_syslog_02', 'rqester_id', 'occrrnc_de'),
+        Index('ix_syslog_03', 'process_se_code', 'occrrnc_de'),
+        # 오류 로그 조회 (error_se = 'Y'인 행만 색인)
+        Index('ix_syslog_04', 'occrrnc_de', postgresql_where=text("error_se = 'Y'")),
+        {
+            'schema': 'skybootcore',
+            'comment': '시스템로그',
+            # 발생일 기준 월별 범위 파티션 (app.database.partitioning)
+            'postgresql_partition_by': 'RANGE (occrrnc_de)'
+        }
+    )
     
     # 기본 필드
     requst_id = Column(String(20), primary_key=True, comment="요청ID")
     job_se_code = Column(String(3), nullable=True, comment="업무구분코드")
     instt_code = Column(String(7), nullable=True, comment="기관코드")
-    occrrnc_de = Column(DateTime, nullable=False, default=func.current_timestamp(), comment="발생일")
+    # 파티션 키이므로 테이블 기본 키에 포함
+    occrrnc_de = Column(DateTime, primary_key=True, default=func.current_timestamp(), comment="발생일")
     rqester_ip = Column(String(23), nullable=True, comment="요청자IP")
     rqester_id = Column(String(20), nullable=True, comment="요청자ID")
     trget_menu_nm = Column(String(255), nullable=True, comment="대상메뉴명")
@@ -42,6 +54,9 @@ class SysLog(Base):
     frst_register_id = Column(String(20), nullable=True, comment="최초등록자ID")
     last_updt_pnttm = Column(DateTime, nullable=True, comment="최종수정시점")
     last_updusr_id = Column(String(20), nullable=True, comment="최종수정자ID")
+    
+    # ORM 식별자는 요청ID만 사용
+    __mapper_args__ = {'primary_key': [requst_id]}
 
 
 class WebLog(Base):
@@ -50,10 +65,18 @@ class WebLog(Base):
     웹 접속 로그와 URL 정보를 관리하는 테이블입니다.
     """
     __tablename__ = "tb_weblog"
-    __table_args__ = {
-        'schema': 'skybootcore',
-        'comment': '웹로그'
-    }
+    __table_args__ = (
+        # 통계/목록: 요청일자·발생일 범위, 요청자별 조회
+        Index('ix_weblog_01', 'rqest_de'),
+        Index('ix_weblog_02', 'occrrnc_de'),
+        Index('ix_weblog_03', 'rqester_id', 'rqest_de'),
+        {
+            'schema': 'skybootcore',
+            'comment': '웹로그',
+            # 요청일자 기준 월별 범위 파티션 (app.database.partitioning)
+            'postgresql_partition_by': 'RANGE (rqest_de)'
+        }
+    )
     
     # 기본 필드
     requst_id = Column(String(20), primary_key=True, comment="요청ID")
@@ -66,13 +89,17 @@ class WebLog(Base):
     process_se_code = Column(String(20), nullable=True, comment="처리구분코드")
     process_cn = Column(String(2000), nullable=True, comment="처리내용")
     process_time = Column(Numeric(10, 3), nullable=True, comment="처리시간")
-    rqest_de = Column(DateTime, nullable=True, comment="요청일자")
+    # 파티션 키이므로 테이블 기본 키에 포함
+    rqest_de = Column(DateTime, primary_key=True, default=datetime.now, comment="요청일자")
     
     # 공통 필드
     frst_regist_pnttm = Column(DateTime, nullable=False, default=func.current_date(), comment="최초등록시점")
     frst_register_id = Column(String(20), nullable=True, comment="최초등록자ID")
     last_updt_pnttm = Column(DateTime, nullable=True, comment="최종수정시점")
     last_updusr_id = Column(String(20), nullable=True, comment="최종수정자ID")
+    
+    # ORM 식별자는 요청ID만 사용
+    __mapper_args__ = {'primary_key': [requst_id]}
 
 
 class ProgrmList(Base):
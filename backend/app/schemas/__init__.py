@@ -27,7 +27,7 @@ from .common_schemas import (
     CmmnGrpCodeListResponse, CmmnCodeListResponse,
     CmmnGrpCodeWithCodes, CmmnCodeWithGroup,
     CodeSearchParams, GroupCodeSearchParams,
-    CodeOption, CodeOptionsResponse
+    CodeOption, CodeOptionsResponse, CursorPagination
 )
 
 # 파일 관련 스키마
@@ -95,7 +95,7 @@ __all__ = [
     "CmmnGrpCodeBase", "CmmnGrpCodeCreate", "CmmnGrpCodeUpdate", "CmmnGrpCodeResponse",
     "CmmnCodeBase", "CmmnCodeCreate", "CmmnCodeUpdate", "CmmnCodeResponse",
     "CmmnGrpCodeListResponse", "CmmnCodeListResponse",
-    "CmmnGrpCodeWithCodes", "CmmnCodeWithGroup",
+    "CmmnGrpCodeWithCodes", "CmmnCodeWithGroup", "CursorPagination",
     "CodeSearchParams", "GroupCodeSearchParams",
     "CodeOption", "CodeOptionsResponse",
     
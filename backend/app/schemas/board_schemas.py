@@ -9,6 +9,8 @@ from decimal import Decimal
 from pydantic import BaseModel, Field
 from fastapi import UploadFile
 
+from app.schemas.common_schemas import CursorPagination
+
 
 # BbsMaster 스키마
 class BbsMasterBase(BaseModel):
@@ -247,10 +249,10 @@ class BbsMasterPagination(BaseModel):
     limit: int = Field(..., description="조회 개수")
 
 
-class BbsPagination(BaseModel):
+class BbsPagination(CursorPagination):
     """게시판 페이지네이션 응답 스키마"""
     items: List[BbsResponse] = Field(..., description="게시판 목록")
-    total: int = Field(..., description="전체 개수")
+    total: Optional[int] = Field(None, description="전체 개수 (total_type 참고)")
     skip: int = Field(..., description="건너뛴 개수")
     limit: int = Field(..., description="조회 개수")
 
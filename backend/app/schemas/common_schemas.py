@@ -157,6 +157,19 @@ class CodeOptionsResponse(BaseModel):
 
 
 # 페이지네이션 스키마 (라우터에서 사용)
+class CursorPagination(BaseModel):
+    """키셋(커서) 페이지네이션 응답 필드
+
+    목록 응답 스키마가 상속합니다. 요청에 cursor를 주면 OFFSET 대신
+    커서가 가리키는 행 다음부터 조회하며, next_cursor로 다음 페이지를 요청합니다.
+    total은 total_type에 따라 정확한 값, 추정치, 상한(capped: total 이상) 또는 None(none)입니다.
+    """
+    cursor: Optional[str] = Field(None, description="요청한 커서 (오프셋 조회면 None)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+    total_type: str = Field("exact", description="전체 개수 산출 방식 (exact, estimated, capped, none)")
+
+
 class CmmnGrpCodePagination(BaseModel):
     """공통그룹코드 페이지네이션 응답 스키마"""
     items: List[CmmnGrpCodeResponse] = Field(..., description="공통그룹코드 목록")
@@ -8,6 +8,8 @@ from typing import Optional, List
 from decimal import Decimal
 from pydantic import BaseModel, Field
 
+from app.schemas.common_schemas import CursorPagination
+
 
 # LoginLog 스키마
 class LoginLogBase(BaseModel):
@@ -154,17 +156,25 @@ class LogExportRequest(BaseModel):
     login_ids: Optional[List[str]] = Field(None, description="특정 로그인ID 목록")
     include_successful: bool = Field(default=True, description="성공 로그인 포함")
     include_failed: bool = Field(default=True, description="실패 로그인 포함")
-    export_format: str = Field(default="csv", description="내보내기 형식 (csv, json, xlsx)")
+    export_format: str = Field(default="csv", description="내보내기 형식 (csv, ndjson, json)")
+    compress: bool = Field(default=False, description="gzip 압축 여부")
 
 
 class LogExportResponse(BaseModel):
-    """로그 내보내기 응답 스키마"""
+    """로그 내보내기 작업 응답 스키마"""
     export_id: str = Field(..., description="내보내기ID")
+    status: str = Field(..., description="작업 상태 (pending, running, completed, failed)")
     file_name: str = Field(..., description="파일명")
-    file_size: int = Field(..., description="파일크기")
-    record_count: int = Field(..., description="레코드 수")
-    download_url: str = Field(..., description="다운로드 URL")
-    expires_at: datetime = Field(..., description="만료시간")
+    format: str = Field(..., description="내보내기 형식 (csv, ndjson, json)")
+    record_count: int = Field(0, description="기록한 레코드 수")
+    total_count: Optional[int] = Field(None, description="전체 레코드 수")
+    progress: Optional[float] = Field(None, description="진행률(%)")
+    file_size: Optional[int] = Field(None, description="파일크기 (완료 시)")
+    status_url: str = Field(..., description="상태 조회 URL")
+    download_url: Optional[str] = Field(None, description="다운로드 URL (완료 시)")
+    created_at: datetime = Field(..., description="요청시간")
+    expires_at: Optional[datetime] = Field(None, description="만료시간 (완료 또는 실패 시)")
+    error: Optional[str] = Field(None, description="오류 내용 (실패 시)")
 
 
 # 로그 분석 스키마
@@ -189,13 +199,13 @@ class LoginTrend(BaseModel):
 
 
 # 페이지네이션 스키마
-class LoginLogPagination(BaseModel):
+class LoginLogPagination(CursorPagination):
     """로그인로그 페이지네이션 스키마"""
     items: List[LoginLogResponse] = Field(..., description="로그인로그 목록")
-    total: int = Field(..., description="전체 항목 수")
-    page: int = Field(..., description="현재 페이지")
+    total: Optional[int] = Field(None, description="전체 항목 수 (total_type 참고)")
+    page: Optional[int] = Field(None, description="현재 페이지 (커서 조회면 None)")
     size: int = Field(..., description="페이지 크기")
-    pages: int = Field(..., description="전체 페이지 수")
+    pages: Optional[int] = Field(None, description="전체 페이지 수 (개수를 세지 않으면 None)")
 
 
 # 로그인로그 검색 파라미터 스키마
@@ -280,14 +290,6 @@ class LogAnalysisResponse(BaseModel):
     generated_at: datetime = Field(..., description="생성 시간")
 
 
-# 로그 내보내기 응답 스키마
-class LogExportResponse(BaseModel):
-    """로그 내보내기 응답 스키마"""
-    status: str = Field(..., description="상태")
-    data: dict = Field(..., description="내보내기 데이터")
-    format: str = Field(..., description="내보내기 형식")
-
-
 # 로그 분석 간단 응답 스키마
 class LogAnalysisSimpleResponse(BaseModel):
     """로그 분석 간단 응답 스키마"""
@@ -291,13 +291,3 @@ class MenuValidationResponse(BaseModel):
     is_valid: bool = Field(..., description="검증 성공 여부")
     validation_results: List[MenuValidationResult] = Field(..., description="검증 결과 목록")
     summary: dict = Field(..., description="검증 요약 정보")
-
-
-# 메뉴 내보내기 응답 스키마
-class MenuExportResponse(BaseModel):
-    """메뉴 내보내기 응답 스키마"""
-    export_id: str = Field(..., description="내보내기 ID")
-    file_name: str = Field(..., description="파일명")
-    file_size: int = Field(..., description="파일 크기")
-    download_url: str = Field(..., description="다운로드 URL")
-    expires_at: datetime = Field(..., description="만료 시간")
\ No newline at end of file
@@ -3,11 +3,13 @@
 시스템 로그, 웹 로그, 프로그램 목록 관련 요청/응답 모델을 정의합니다.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
 from decimal import Decimal
 
+from app.schemas.common_schemas import CursorPagination
+
 
 # ==================== SysLog 스키마 ====================
 
@@ -53,13 +55,13 @@ class SysLogResponse(SysLogBase):
         from_attributes = True
 
 
-class SysLogPagination(BaseModel):
+class SysLogPagination(CursorPagination):
     """시스템 로그 페이지네이션 응답 스키마"""
     items: List[SysLogResponse] = Field(..., description="시스템 로그 목록")
-    total: int = Field(..., description="전체 개수")
-    page: int = Field(..., description="현재 페이지")
+    total: Optional[int] = Field(None, description="전체 개수 (total_type 참고)")
+    page: Optional[int] = Field(None, description="현재 페이지 (커서 조회면 None)")
     size: int = Field(..., description="페이지 크기")
-    pages: int = Field(..., description="전체 페이지 수")
+    pages: Optional[int] = Field(None, description="전체 페이지 수 (개수를 세지 않으면 None)")
 
 
 # ==================== WebLog 스키마 ====================
@@ -193,6 +195,10 @@ class SystemHealthCheck(BaseModel):
     system_uptime: str = Field(..., description="시스템 가동시간")
     memory_usage: float = Field(..., description="메모리 사용률")
     cpu_usage: float = Field(..., description="CPU 사용률")
+    event_loop: Optional[Dict[str, Any]] = Field(None, description="이벤트 루프 지연 지표 (워커 단위)")
+    db_offload: Optional[Dict[str, Any]] = Field(None, description="동기 DB 작업 스레드 풀 지표 (워커 단위)")
+    snapshot_at: Optional[datetime] = Field(None, description="스냅샷 계산 시각")
+    snapshot_age: Optional[float] = Field(None, description="스냅샷 나이(초)")
 
 
 class DashboardSummary(BaseModel):
@@ -203,4 +209,6 @@ class DashboardSummary(BaseModel):
     error_requests_today: int = Field(..., description="오늘 오류 요청 수")
     popular_menus: List[dict] = Field(..., description="인기 메뉴 목록")
     recent_activities: List[dict] = Field(..., description="최근 활동 목록")
-    system_alerts: List[dict] = Field(..., description="시스템 알림 목록")
\ No newline at end of file
+    system_alerts: List[dict] = Field(..., description="시스템 알림 목록")
+    snapshot_at: Optional[datetime] = Field(None, description="스냅샷 계산 시각")
+    snapshot_age: Optional[float] = Field(None, description="스냅샷 나이(초)")
@@ -8,6 +8,8 @@ from datetime import datetime
 from pydantic import BaseModel, Field, EmailStr
 from decimal import Decimal
 
+from app.schemas.common_schemas import CursorPagination
+
 
 # ==================== UserInfo 스키마 ====================
 
@@ -166,13 +168,13 @@ class ZipResponse(ZipBase):
         from_attributes = True
 
 
-class ZipPagination(BaseModel):
+class ZipPagination(CursorPagination):
     """우편번호 페이지네이션 응답 스키마"""
     items: List[ZipResponse] = Field(..., description="우편번호 목록")
-    total: int = Field(..., description="전체 개수")
-    page: int = Field(..., description="현재 페이지")
+    total: Optional[int] = Field(None, description="전체 개수 (total_type 참고)")
+    page: Optional[int] = Field(None, description="현재 페이지 (커서 조회면 None)")
     size: int = Field(..., description="페이지 크기")
-    pages: int = Field(..., description="전체 페이지 수")
+    pages: Optional[int] = Field(None, description="전체 페이지 수 (개수를 세지 않으면 None)")
 
 
 # ==================== 검색 및 통계 스키마 ====================
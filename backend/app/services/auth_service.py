@@ -4,10 +4,12 @@
 """
 
 from typing import List, Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, select
 from datetime import datetime
 import logging
+import os
 import bcrypt
 
 from app.models.user_models import UserInfo
@@ -18,11 +20,41 @@ from app.schemas.user_schemas import (
 from app.schemas.auth_schemas import (
     AuthorMenuCreate, AuthorMenuUpdate
 )
-from app.utils.jwt_utils import create_token_pair, verify_token
+from app.utils.jwt_utils import create_token_pair, verify_token, verify_token_cached
+from app.utils.cache import TTLCache
 from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
 
+# 인증된 사용자 정보 캐시 (user_id -> 사용자 정보 딕셔너리)
+user_principal_cache = TTLCache(
+    max_size=int(os.getenv("USER_PRINCIPAL_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("USER_PRINCIPAL_CACHE_TTL", "30"))
+)
+
+# 인증 사용자 정보로 조회하는 컬럼
+PRINCIPAL_COLUMNS = (
+    UserInfo.user_id,
+    UserInfo.email_adres,
+    UserInfo.group_id,
+    UserInfo.user_nm,
+    UserInfo.orgnzt_id,
+    UserInfo.emplyr_sttus_code
+)
+
+
+def invalidate_user_principal(user_id: Optional[str]) -> None:
+    """
+    사용자 정보 캐시에서 해당 사용자를 제거합니다.
+    
+    사용자 정보, 상태, 잠금 여부가 변경되거나 삭제될 때 호출합니다.
+    
+    Args:
+        user_id: 사용자 ID
+    """
+    if user_id:
+        user_principal_cache.invalidate(user_id)
+
 
 class AuthorInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
     """사용자 정보 서비스
@@ -439,6 +471,9 @@ class AuthorInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
         """
         JWT 토큰에서 현재 사용자 정보를 추출합니다.
         
+        활성 사용자 정보는 user_principal_cache에 짧은 TTL로 보관되어
+        반복 요청 시 사용자 테이블 조회를 생략합니다.
+        
         Args:
             db: 데이터베이스 세션
             token: JWT 액세스 토큰
@@ -447,45 +482,84 @@ class AuthorInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
             사용자 정보 또는 None
         """
         try:
-            # 토큰 검증 및 페이로드 추출
-            payload = verify_token(token)
-            if not payload:
-                logger.warning("⚠️ 토큰 검증 실패")
-                return None
-            
-            user_id = payload.get("user_id")
+            user_id = self._user_id_from_token(token)
             if not user_id:
-                logger.warning("⚠️ 토큰에서 user_id를 찾을 수 없음")
                 return None
             
-            # 데이터베이스에서 사용자 정보 조회
-            user = self.get_by_user_id(db, user_id)
-            if not user:
-                logger.warning(f"⚠️ 사용자를 찾을 수 없음 - user_id: {user_id}")
-                return None
+            # 캐시된 사용자 정보 확인
+            cached_user_info = user_principal_cache.get(user_id)
+            if cached_user_info is not None:
+                return dict(cached_user_info)
             
-            # 계정 상태 확인 (활성 상태: '1')
-            if user.emplyr_sttus_code != '1':
-                logger.warning(f"🚫 비활성 계정 - user_id: {user_id}")
+            # 데이터베이스에서 필요한 컬럼만 단일 쿼리로 조회
+            user = db.query(*PRINCIPAL_COLUMNS).filter(
+                UserInfo.user_id == user_id
+            ).first()
+            return self._accept_principal(user_id, user)
+            
+        except Exception as e:
+            logger.error(f"❌ 토큰에서 사용자 정보 추출 실패 - 오류: {str(e)}")
+            return None
+    
+    async def get_current_user_from_token_async(self, db: AsyncSession, token: str) -> Optional[Dict[str, Any]]:
+        """
+        JWT 토큰에서 현재 사용자 정보를 추출합니다 (비동기).
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            token: JWT 액세스 토큰
+            
+        Returns:
+            사용자 정보 또는 None
+        """
+        try:
+            user_id = self._user_id_from_token(token)
+            if not user_id:
                 return None
             
-            # 사용자 정보 반환
-            user_info = {
-                "user_id": user.user_id,
-                "email_adres": user.email_adres,
-                "group_id": user.group_id,
-                "user_nm": user.user_nm,
-                "orgnzt_id": user.orgnzt_id,
-                "emplyr_sttus_code": user.emplyr_sttus_code
-            }
+            cached_user_info = user_principal_cache.get(user_id)
+            if cached_user_info is not None:
+                return dict(cached_user_info)
             
-            logger.info(f"✅ 토큰에서 사용자 정보 추출 완료 - user_id: {user_id}")
-            return user_info
+            result = await db.execute(select(*PRINCIPAL_COLUMNS).where(UserInfo.user_id == user_id))
+            return self._accept_principal(user_id, result.first())
             
         except Exception as e:
             logger.error(f"❌ 토큰에서 사용자 정보 추출 실패 - 오류: {str(e)}")
             return None
     
+    def _user_id_from_token(self, token: str) -> Optional[str]:
+        """토큰을 검증하고 user_id를 반환합니다."""
+        # 토큰 검증 및 페이로드 추출
+        payload = verify_token_cached(token)
+        if not payload:
+            logger.warning("⚠️ 토큰 검증 실패")
+            return None
+        
+        user_id = payload.get("user_id")
+        if not user_id:
+            logger.warning("⚠️ 토큰에서 user_id를 찾을 수 없음")
+            return None
+        return user_id
+    
+    def _accept_principal(self, user_id: str, user) -> Optional[Dict[str, Any]]:
+        """조회한 사용자 행이 활성 상태이면 캐시하고 사용자 정보를 반환합니다."""
+        if not user:
+            logger.warning(f"⚠️ 사용자를 찾을 수 없음 - user_id: {user_id}")
+            return None
+        
+        # 계정 상태 확인 (활성 상태: '1')
+        if user.emplyr_sttus_code != '1':
+            logger.warning(f"🚫 비활성 계정 - user_id: {user_id}")
+            return None
+        
+        # 사용자 정보 반환
+        user_info = dict(user._mapping)
+        user_principal_cache.set(user_id, user_info)
+        
+        logger.info(f"✅ 토큰에서 사용자 정보 추출 완료 - user_id: {user_id}")
+        return dict(user_info)
+    
     def refresh_access_token(self, db: Session, refresh_token: str) -> Optional[Dict[str, Any]]:
         """
         리프레시 토큰을 사용하여 새로운 액세스 토큰을 생성합니다.
@@ -543,6 +617,9 @@ class AuthorInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
         """
         액세스 토큰을 검증합니다.
         
+        DB 조회 없이 서명과 만료만 확인하며, 이미 검증된 토큰은
+        exp 시각까지 캐시된 페이로드를 사용합니다.
+        
         Args:
             access_token: 액세스 토큰
             
@@ -550,7 +627,7 @@ class AuthorInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
             토큰 페이로드 또는 None
         """
         try:
-            payload = verify_token(access_token, "access")
+            payload = verify_token_cached(access_token, "access")
             if payload:
                 logger.info(f"✅ 액세스 토큰 검증 성공 - user_id: {payload.get('user_id')}")
             return payload
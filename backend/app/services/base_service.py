@@ -1,15 +1,21 @@
 """기본 CRUD 서비스 클래스
 
 모든 서비스 클래스의 기본이 되는 CRUD 기능을 제공합니다.
+*_async 메서드는 같은 동작을 AsyncSession으로 수행합니다.
 """
 
-from typing import Generic, TypeVar, Type, List, Optional, Dict, Any
+from typing import Generic, TypeVar, Type, List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy import and_, or_, desc, asc, func, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import BaseModel
 from datetime import datetime
 import logging
+import operator
+
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.page_total import DEFAULT_TOTAL_CAP, TOTAL_EXACT, PageTotal, resolve_total
 
 # 타입 변수 정의
 ModelType = TypeVar("ModelType")
@@ -75,26 +81,12 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             조회된 모델 인스턴스 리스트
         """
         try:
-            query = db.query(self.model)
-            
-            # 필터 적용
-            if filters:
-                for key, value in filters.items():
-                    if hasattr(self.model, key) and value is not None:
-                        if isinstance(value, str) and '%' in value:
-                            # LIKE 검색
-                            query = query.filter(getattr(self.model, key).like(value))
-                        else:
-                            # 정확한 매치
-                            query = query.filter(getattr(self.model, key) == value)
+            query = db.query(self.model).filter(*self._filter_conditions(filters))
             
             # 정렬 적용
-            if order_by and hasattr(self.model, order_by):
-                order_column = getattr(self.model, order_by)
-                if order_desc:
-                    query = query.order_by(desc(order_column))
-                else:
-                    query = query.order_by(asc(order_column))
+            order_clause = self._order_clause(order_by, order_desc)
+            if order_clause is not None:
+                query = query.order_by(order_clause)
             
             return query.offset(skip).limit(limit).all()
             
@@ -118,16 +110,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             조건에 맞는 레코드 총 개수
         """
         try:
-            query = db.query(self.model)
-            
-            # 필터 적용
-            if filters:
-                for key, value in filters.items():
-                    if hasattr(self.model, key) and value is not None:
-                        if isinstance(value, str) and '%' in value:
-                            query = query.filter(getattr(self.model, key).like(value))
-                        else:
-                            query = query.filter(getattr(self.model, key) == value)
+            query = db.query(self.model).filter(*self._filter_conditions(filters))
             
             return query.count()
             
@@ -135,6 +118,76 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             logger.error(f"❌ {self.model.__name__} 개수 조회 실패 - 오류: {str(e)}")
             raise
     
+    def get_page_after(
+        self, 
+        db: Session, 
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        order_desc: bool = False,
+        conditions: Optional[Sequence[Any]] = None,
+        skip: int = 0
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        키셋(커서) 페이지네이션 조회
+        
+        (정렬 컬럼, 기본 키) 순으로 정렬하고 cursor가 가리키는 행 다음부터 limit개를
+        조회합니다. OFFSET을 쓰지 않으므로 페이지가 깊어져도 비용이 일정합니다.
+        cursor 없이 호출하면 skip부터 조회하며, 이때도 next_cursor를 반환하므로
+        오프셋 페이지에서 커서 페이지로 이어서 조회할 수 있습니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            limit: 조회할 최대 레코드 수
+            filters: 필터 조건 딕셔너리
+            order_by: 정렬 기준 컬럼명 (None이면 기본 키 순)
+            order_desc: 내림차순 정렬 여부
+            conditions: 추가 WHERE 조건 목록 (범위/검색 조건 등)
+            skip: cursor가 없을 때 건너뛸 레코드 수
+            
+        Returns:
+            (조회된 모델 인스턴스 리스트, 다음 페이지 커서 또는 None) 튜플
+            
+        Raises:
+            InvalidCursorError: 커서 형식이 잘못되었거나 정렬 조건이 다른 경우
+        """
+        stmt = self._page_statement(cursor, limit, filters, order_by, order_desc, conditions, skip)
+        try:
+            rows = list(db.scalars(stmt).all())
+        except SQLAlchemyError as e:
+            logger.error(f"❌ {self.model.__name__} 커서 페이지 조회 실패 - 오류: {str(e)}")
+            raise
+        return self._page_result(rows, limit, order_by, order_desc)
+    
+    def count_total(
+        self, 
+        db: Session, 
+        strategy: str = TOTAL_EXACT,
+        filters: Optional[Dict[str, Any]] = None,
+        conditions: Optional[Sequence[Any]] = None,
+        cap: int = DEFAULT_TOTAL_CAP
+    ) -> PageTotal:
+        """
+        목록 응답의 전체 개수를 전략에 따라 산출
+        
+        Args:
+            db: 데이터베이스 세션
+            strategy: exact(COUNT), estimated(통계 추정), capped(cap까지만), none(세지 않음)
+            filters: 필터 조건 딕셔너리
+            conditions: 추가 WHERE 조건 목록 (get_page_after와 같은 조건)
+            cap: capped 전략의 상한
+            
+        Returns:
+            PageTotal (total, total_type)
+        """
+        try:
+            return resolve_total(db, self._list_statement(filters, conditions), strategy, cap)
+        except SQLAlchemyError as e:
+            logger.error(f"❌ {self.model.__name__} 전체 개수 산출 실패 - 오류: {str(e)}")
+            raise
+    
     def create(self, db: Session, obj_in: CreateSchemaType, **kwargs) -> ModelType:
         """
         새 레코드 생성
@@ -148,22 +201,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             생성된 모델 인스턴스
         """
         try:
-            # Pydantic 모델을 딕셔너리로 변환
-            obj_data = obj_in.dict() if hasattr(obj_in, 'dict') else obj_in
-            
-            # 추가 필드 병합
-            obj_data.update(kwargs)
-            
-            # 공통 필드 설정
-            current_time = datetime.now()
-            if hasattr(self.model, 'frst_regist_pnttm'):
-                obj_data['frst_regist_pnttm'] = current_time
-            if hasattr(self.model, 'last_updt_pnttm'):
-                obj_data['last_updt_pnttm'] = current_time
-            
-            # 모델에 존재하는 필드만 필터링
-            model_columns = {column.name for column in self.model.__table__.columns}
-            filtered_data = {key: value for key, value in obj_data.items() if key in model_columns}
+            filtered_data = self._prepare_create_data(obj_in, kwargs)
             
             # 모델 인스턴스 생성
             db_obj = self.model(**filtered_data)
@@ -171,13 +209,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db.commit()
             db.refresh(db_obj)
             
-            # Primary key 필드 찾기
-            pk_field = None
-            for column in self.model.__table__.primary_key.columns:
-                pk_field = column.name
-                break
-            pk_value = getattr(db_obj, pk_field, 'N/A') if pk_field else 'N/A'
-            logger.info(f"✅ {self.model.__name__} 생성 완료 - {pk_field}: {pk_value}")
+            self._log_created(db_obj)
             return db_obj
             
         except SQLAlchemyError as e:
@@ -205,23 +237,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             수정된 모델 인스턴스
         """
         try:
-            # Pydantic 모델을 딕셔너리로 변환 (None 값 제외)
-            if hasattr(obj_in, 'dict'):
-                obj_data = obj_in.dict(exclude_unset=True)
-            else:
-                obj_data = {k: v for k, v in obj_in.items() if v is not None}
-            
-            # 추가 필드 병합
-            obj_data.update(kwargs)
-            
-            # 공통 필드 설정
-            if hasattr(self.model, 'last_updt_pnttm'):
-                obj_data['last_updt_pnttm'] = datetime.now()
-            
-            # 필드 업데이트
-            for field, value in obj_data.items():
-                if hasattr(db_obj, field):
-                    setattr(db_obj, field, value)
+            self._apply_update(db_obj, obj_in, kwargs)
             
             db.add(db_obj)
             db.commit()
@@ -275,11 +291,7 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         try:
             obj = db.query(self.model).filter(self.model.id == id).first()
             if obj and hasattr(obj, 'delete_at'):
-                obj.delete_at = 'Y'
-                if hasattr(obj, 'last_updusr_id'):
-                    obj.last_updusr_id = user_id
-                if hasattr(obj, 'last_updt_pnttm'):
-                    obj.last_updt_pnttm = datetime.now()
+                self._mark_deleted(obj, user_id)
                 
                 db.add(obj)
                 db.commit()
@@ -347,4 +359,386 @@ class BaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             
         except SQLAlchemyError as e:
             logger.error(f"❌ {self.model.__name__} 활성 레코드 조회 실패 - 오류: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+    
+    # ==================== 비동기 CRUD ====================
+    
+    async def get_async(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """
+        기본 키로 단일 레코드 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            id: 조회할 레코드의 기본 키 (복합 키는 튜플)
+            
+        Returns:
+            조회된 모델 인스턴스 또는 None
+        """
+        try:
+            return await db.get(self.model, id)
+        except SQLAlchemyError as e:
+            logger.error(f"❌ {self.model.__name__} 조회 실패 - ID: {id}, 오류: {str(e)}")
+            raise
+    
+    async def get_multi_async(
+        self, 
+        db: AsyncSession, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        order_desc: bool = False
+    ) -> List[ModelType]:
+        """
+        여러 레코드 조회 (비동기, 페이지네이션 지원)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            skip: 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            filters: 필터 조건 딕셔너리
+            order_by: 정렬 기준 컬럼명
+            order_desc: 내림차순 정렬 여부
+            
+        Returns:
+            조회된 모델 인스턴스 리스트
+        """
+        try:
+            stmt = select(self.model).where(*self._filter_conditions(filters))
+            
+            order_clause = self._order_clause(order_by, order_desc)
+            if order_clause is not None:
+                stmt = stmt.order_by(order_clause)
+            
+            result = await db.scalars(stmt.offset(skip).limit(limit))
+            return list(result.all())
+            
+        except SQLAlchemyError as e:
+            logger.error(f"❌ {self.model.__name__} 목록 조회 실패 - 오류: {str(e)}")
+            raise
+    
+    async def count_async(
+        self, 
+        db: AsyncSession, 
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        레코드 총 개수 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            filters: 필터 조건 딕셔너리
+            
+        Returns:
+            조건에 맞는 레코드 총 개수
+        """
+        try:
+            stmt = select(func.count()).select_from(self.model).where(*self._filter_conditions(filters))
+            return await db.scalar(stmt)
+            
+        except SQLAlchemyError as e:
+            logger.error(f"❌ {self.model.__name__} 개수 조회 실패 - 오류: {str(e)}")
+            raise
+    
+    async def get_page_after_async(
+        self, 
+        db: AsyncSession, 
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        order_desc: bool = False,
+        conditions: Optional[Sequence[Any]] = None,
+        skip: int = 0
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        키셋(커서) 페이지네이션 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            limit: 조회할 최대 레코드 수
+            filters: 필터 조건 딕셔너리
+            order_by: 정렬 기준 컬럼명 (None이면 기본 키 순)
+            order_desc: 내림차순 정렬 여부
+            conditions: 추가 WHERE 조건 목록 (범위/검색 조건 등)
+            skip: cursor가 없을 때 건너뛸 레코드 수
+            
+        Returns:
+            (조회된 모델 인스턴스 리스트, 다음 페이지 커서 또는 None) 튜플
+            
+        Raises:
+            InvalidCursorError: 커서 형식이 잘못되었거나 정렬 조건이 다른 경우
+        """
+        stmt = self._page_statement(cursor, limit, filters, order_by, order_desc, conditions, skip)
+        try:
+            rows = list((await db.scalars(stmt)).all())
+        except SQLAlchemyError as e:
+            logger.error(f"❌ {self.model.__name__} 커서 페이지 조회 실패 - 오류: {str(e)}")
+            raise
+        return self._page_result(rows, limit, order_by, order_desc)
+    
+    async def count_total_async(
+        self, 
+        db: AsyncSession, 
+        strategy: str = TOTAL_EXACT,
+        filters: Optional[Dict[str, Any]] = None,
+        conditions: Optional[Sequence[Any]] = None,
+        cap: int = DEFAULT_TOTAL_CAP
+    ) -> PageTotal:
+        """
+        목록 응답의 전체 개수를 전략에 따라 산출 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            strategy: exact(COUNT), estimated(통계 추정), capped(cap까지만), none(세지 않음)
+            filters: 필터 조건 딕셔너리
+            conditions: 추가 WHERE 조건 목록 (get_page_after_async와 같은 조건)
+            cap: capped 전략의 상한
+            
+        Returns:
+            PageTotal (total, total_type)
+        """
+        return await db.run_sync(
+            lambda session: self.count_total(session, strategy, filters, conditions, cap)
+        )
+    
+    async def create_async(self, db: AsyncSession, obj_in: CreateSchemaType, **kwargs) -> ModelType:
+        """
+        새 레코드 생성 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            obj_in: 생성할 데이터 스키마
+            **kwargs: 추가 필드 값
+            
+        Returns:
+            생성된 모델 인스턴스
+        """
+        try:
+            db_obj = self.model(**self._prepare_create_data(obj_in, kwargs))
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            
+            self._log_created(db_obj)
+            return db_obj
+            
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"❌ {self.model.__name__} 생성 실패 - 오류: {str(e)}")
+            raise
+    
+    async def update_async(
+        self, 
+        db: AsyncSession, 
+        db_obj: ModelType, 
+        obj_in: UpdateSchemaType,
+        **kwargs
+    ) -> ModelType:
+        """
+        기존 레코드 수정 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            db_obj: 수정할 모델 인스턴스
+            obj_in: 수정할 데이터 스키마
+            **kwargs: 추가 필드 값
+            
+        Returns:
+            수정된 모델 인스턴스
+        """
+        try:
+            self._apply_update(db_obj, obj_in, kwargs)
+            
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            
+            logger.info(f"✅ {self.model.__name__} 수정 완료 - ID: {getattr(db_obj, 'id', 'N/A')}")
+            return db_obj
+            
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"❌ {self.model.__name__} 수정 실패 - 오류: {str(e)}")
+            raise
+    
+    async def soft_delete_async(self, db: AsyncSession, id: Any, user_id: str) -> Optional[ModelType]:
+        """
+        레코드 논리적 삭제 (비동기, delete_at 플래그 사용)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            id: 삭제할 레코드의 기본 키
+            user_id: 삭제 수행자 ID
+            
+        Returns:
+            삭제된 모델 인스턴스 또는 None
+        """
+        try:
+            obj = await db.get(self.model, id)
+            if obj and hasattr(obj, 'delete_at'):
+                self._mark_deleted(obj, user_id)
+                
+                db.add(obj)
+                await db.commit()
+                await db.refresh(obj)
+                
+                logger.info(f"✅ {self.model.__name__} 논리적 삭제 완료 - ID: {id}")
+                return obj
+            return None
+            
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error(f"❌ {self.model.__name__} 논리적 삭제 실패 - ID: {id}, 오류: {str(e)}")
+            raise
+    
+    # ==================== 동기/비동기 공통 처리 ====================
+    
+    def _filter_conditions(self, filters: Optional[Dict[str, Any]]) -> List[Any]:
+        """필터 딕셔너리를 WHERE 조건 목록으로 변환합니다. ('%'가 포함된 문자열은 LIKE 검색)"""
+        conditions = []
+        for key, value in (filters or {}).items():
+            if hasattr(self.model, key) and value is not None:
+                column = getattr(self.model, key)
+                if isinstance(value, str) and '%' in value:
+                    conditions.append(column.like(value))
+                else:
+                    conditions.append(column == value)
+        return conditions
+    
+    def _order_clause(self, order_by: Optional[str], order_desc: bool) -> Optional[Any]:
+        """정렬 기준 컬럼명을 ORDER BY 절로 변환합니다."""
+        if not order_by or not hasattr(self.model, order_by):
+            return None
+        order_column = getattr(self.model, order_by)
+        return desc(order_column) if order_desc else asc(order_column)
+    
+    def _list_statement(self, filters: Optional[Dict[str, Any]], conditions: Optional[Sequence[Any]]) -> Any:
+        """필터 딕셔너리와 추가 조건을 적용한 목록 조회문"""
+        return select(self.model).where(*self._filter_conditions(filters), *(conditions or ()))
+    
+    def _keyset_keys(self, order_by: Optional[str]) -> List[str]:
+        """키셋 정렬에 사용할 속성명 목록 (정렬 컬럼 + 기본 키)을 반환합니다."""
+        mapper = self.model.__mapper__
+        keys = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+        if order_by and order_by not in keys:
+            if order_by not in mapper.column_attrs:
+                raise ValueError(f"정렬할 수 없는 컬럼입니다: {order_by}")
+            keys.insert(0, order_by)
+        return keys
+    
+    def _cursor_order(self, order_by: Optional[str], order_desc: bool) -> str:
+        """커서에 기록할 정렬 조건 식별자"""
+        return f"{self.model.__tablename__}:{order_by or ''}:{'desc' if order_desc else 'asc'}"
+    
+    def _page_statement(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        order_by: Optional[str],
+        order_desc: bool,
+        conditions: Optional[Sequence[Any]],
+        skip: int
+    ) -> Any:
+        """
+        키셋 페이지 조회문을 만듭니다.
+        
+        정렬 컬럼이 NULL을 허용하면 NULL 행을 마지막에 두고(NULLS LAST),
+        커서 조건도 그에 맞춰 "(키) 다음 또는 NULL" / "NULL 중 기본 키 다음"으로 나눕니다.
+        다음 페이지 존재 여부를 COUNT 없이 알 수 있도록 limit + 1개를 조회합니다.
+        """
+        keys = self._keyset_keys(order_by)
+        columns = [getattr(self.model, key) for key in keys]
+        # 기본 키 컬럼은 NULL이 없으므로 첫 컬럼(정렬 컬럼)만 확인
+        nullable = columns[0].expression.nullable
+        
+        stmt = self._list_statement(filters, conditions)
+        
+        if cursor:
+            values = decode_cursor(cursor, self._cursor_order(order_by, order_desc), len(keys))
+            after = operator.lt if order_desc else operator.gt
+            if not nullable:
+                stmt = stmt.where(after(tuple_(*columns), tuple(values)))
+            elif values[0] is None:
+                stmt = stmt.where(columns[0].is_(None), after(tuple_(*columns[1:]), tuple(values[1:])))
+            else:
+                stmt = stmt.where(or_(after(tuple_(*columns), tuple(values)), columns[0].is_(None)))
+        elif skip:
+            stmt = stmt.offset(skip)
+        
+        direction = desc if order_desc else asc
+        order = [direction(column) for column in columns]
+        if nullable:
+            order[0] = order[0].nulls_last()
+        return stmt.order_by(*order).limit(limit + 1)
+    
+    def _page_result(
+        self, rows: List[ModelType], limit: int, order_by: Optional[str], order_desc: bool
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """limit + 1개 조회 결과를 (페이지 항목, 다음 커서)로 나눕니다."""
+        if len(rows) <= limit:
+            return rows, None
+        items = rows[:limit]
+        keys = self._keyset_keys(order_by)
+        next_cursor = encode_cursor(
+            [getattr(items[-1], key) for key in keys], self._cursor_order(order_by, order_desc)
+        )
+        return items, next_cursor
+    
+    def _prepare_create_data(self, obj_in: Any, extra: Dict[str, Any]) -> Dict[str, Any]:
+        """생성 데이터에 공통 필드를 채우고 모델에 존재하는 필드만 남깁니다."""
+        # Pydantic 모델을 딕셔너리로 변환
+        obj_data = obj_in.dict() if hasattr(obj_in, 'dict') else obj_in
+        
+        # 추가 필드 병합
+        obj_data.update(extra)
+        
+        # 공통 필드 설정
+        current_time = datetime.now()
+        if hasattr(self.model, 'frst_regist_pnttm'):
+            obj_data['frst_regist_pnttm'] = current_time
+        if hasattr(self.model, 'last_updt_pnttm'):
+            obj_data['last_updt_pnttm'] = current_time
+        
+        # 모델에 존재하는 필드만 필터링
+        model_columns = {column.name for column in self.model.__table__.columns}
+        return {key: value for key, value in obj_data.items() if key in model_columns}
+    
+    def _apply_update(self, db_obj: ModelType, obj_in: Any, extra: Dict[str, Any]) -> None:
+        """수정 데이터(설정된 값만)와 공통 필드를 모델 인스턴스에 반영합니다."""
+        # Pydantic 모델을 딕셔너리로 변환 (None 값 제외)
+        if hasattr(obj_in, 'dict'):
+            obj_data = obj_in.dict(exclude_unset=True)
+        else:
+            obj_data = {k: v for k, v in obj_in.items() if v is not None}
+        
+        # 추가 필드 병합
+        obj_data.update(extra)
+        
+        # 공통 필드 설정
+        if hasattr(self.model, 'last_updt_pnttm'):
+            obj_data['last_updt_pnttm'] = datetime.now()
+        
+        # 필드 업데이트
+        for field, value in obj_data.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+    
+    def _mark_deleted(self, obj: ModelType, user_id: str) -> None:
+        """논리적 삭제 플래그와 수정자 정보를 설정합니다."""
+        obj.delete_at = 'Y'
+        if hasattr(obj, 'last_updusr_id'):
+            obj.last_updusr_id = user_id
+        if hasattr(obj, 'last_updt_pnttm'):
+            obj.last_updt_pnttm = datetime.now()
+    
+    def _log_created(self, db_obj: ModelType) -> None:
+        """생성된 레코드의 첫 번째 기본 키 값을 로그로 남깁니다."""
+        pk_field = None
+        for column in self.model.__table__.primary_key.columns:
+            pk_field = column.name
+            break
+        pk_value = getattr(db_obj, pk_field, 'N/A') if pk_field else 'N/A'
+        logger.info(f"✅ {self.model.__name__} 생성 완료 - {pk_field}: {pk_value}")
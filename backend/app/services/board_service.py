@@ -4,8 +4,9 @@
 """
 
 from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy import and_, or_, desc, asc, func, select, update
 from datetime import datetime
 import logging
 
@@ -15,6 +16,7 @@ from app.schemas.board_schemas import (
     BbsCreate, BbsUpdate,
     CommentCreate, CommentUpdate
 )
+from app.utils.page_total import TOTAL_EXACT, PageTotal
 from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
@@ -73,6 +75,47 @@ class BbsMasterService(BaseService[BbsMaster, BbsMasterCreate, BbsMasterUpdate])
             logger.error(f"❌ 활성 게시판 목록 조회 실패 - 오류: {str(e)}")
             raise
     
+    async def get_by_bbs_id_async(self, db: AsyncSession, bbs_id: str) -> Optional[BbsMaster]:
+        """
+        게시판 ID로 게시판 마스터 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            bbs_id: 게시판 ID
+            
+        Returns:
+            게시판 마스터 정보 또는 None
+        """
+        try:
+            return await db.scalar(select(BbsMaster).where(
+                BbsMaster.bbs_id == bbs_id,
+                BbsMaster.use_at == 'Y',
+                BbsMaster.delete_at == 'N'
+            ))
+        except Exception as e:
+            logger.error(f"❌ 게시판 마스터 조회 실패 - bbs_id: {bbs_id}, 오류: {str(e)}")
+            raise
+    
+    async def get_active_boards_async(self, db: AsyncSession) -> List[BbsMaster]:
+        """
+        활성화된 게시판 목록 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            
+        Returns:
+            활성화된 게시판 목록
+        """
+        try:
+            result = await db.scalars(select(BbsMaster).where(
+                BbsMaster.use_at == 'Y',
+                BbsMaster.delete_at == 'N'
+            ).order_by(BbsMaster.frst_regist_pnttm))
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"❌ 활성 게시판 목록 조회 실패 - 오류: {str(e)}")
+            raise
+    
     def search_boards(
         self, 
         db: Session, 
@@ -155,6 +198,26 @@ class BbsService(BaseService[Bbs, BbsCreate, BbsUpdate]):
             logger.error(f"❌ 게시글 조회 실패 - ntt_id: {ntt_id}, 오류: {str(e)}")
             raise
     
+    async def get_by_ntt_id_async(self, db: AsyncSession, ntt_id: int) -> Optional[Bbs]:
+        """
+        게시글 ID로 게시글 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            ntt_id: 게시글 ID
+            
+        Returns:
+            게시글 정보 또는 None
+        """
+        try:
+            return await db.scalar(select(Bbs).where(
+                Bbs.ntt_id == ntt_id,
+                Bbs.delete_at == 'N'
+            ))
+        except Exception as e:
+            logger.error(f"❌ 게시글 조회 실패 - ntt_id: {ntt_id}, 오류: {str(e)}")
+            raise
+    
     def get_board_posts(
         self, 
         db: Session, 
@@ -228,38 +291,185 @@ class BbsService(BaseService[Bbs, BbsCreate, BbsUpdate]):
             검색된 게시글 목록
         """
         try:
-            query = db.query(Bbs).filter(Bbs.delete_at == 'N')
+            query = db.query(Bbs).filter(*self._search_conditions(bbs_id, search_term, search_type, author))
+            return query.order_by(desc(Bbs.frst_regist_pnttm)).offset(skip).limit(limit).all()
             
-            # 게시판 조건
-            if bbs_id:
-                query = query.filter(Bbs.bbs_id == bbs_id)
+        except Exception as e:
+            logger.error(f"❌ 게시글 검색 실패 - 오류: {str(e)}")
+            return []
+    
+    async def get_board_posts_async(
+        self, 
+        db: AsyncSession, 
+        bbs_id: str,
+        skip: int = 0,
+        limit: int = 20,
+        order_by: str = 'latest'
+    ) -> List[Bbs]:
+        """
+        게시판별 게시글 목록 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            bbs_id: 게시판 ID
+            skip: 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            order_by: 정렬 방식 (latest, oldest, views, likes)
             
-            # 작성자 조건
-            if author:
-                query = query.filter(Bbs.frst_register_id == author)
-                
-                # 검색어 조건
-                if search_term:
-                    if search_type == 'title':
-                        query = query.filter(Bbs.ntt_sj.like(f"%{search_term}%"))
-                    elif search_type == 'content':
-                        query = query.filter(Bbs.ntt_cn.like(f"%{search_term}%"))
-                    elif search_type == 'author':
-                        query = query.filter(Bbs.ntcrNm.like(f"%{search_term}%"))
-                    else:  # all
-                        search_filter = or_(
-                            Bbs.ntt_sj.like(f"%{search_term}%"),
-                            Bbs.ntt_cn.like(f"%{search_term}%"),
-                            Bbs.ntcrNm.like(f"%{search_term}%")
-                        )
-                        query = query.filter(search_filter)
-                
-                return query.order_by(desc(Bbs.frst_regist_pnttm)).offset(skip).limit(limit).all()
+        Returns:
+            게시글 목록
+        """
+        try:
+            stmt = select(Bbs).where(
+                Bbs.bbs_id == bbs_id,
+                Bbs.delete_at == 'N'
+            ).order_by(self._post_order(order_by)).offset(skip).limit(limit)
+            return list((await db.scalars(stmt)).all())
+        except Exception as e:
+            logger.error(f"❌ 게시판 게시글 목록 조회 실패 - bbs_id: {bbs_id}, 오류: {str(e)}")
+            raise
+    
+    async def search_posts_async(
+        self, 
+        db: AsyncSession, 
+        bbs_id: Optional[str] = None,
+        search_term: Optional[str] = None,
+        search_type: str = 'all',
+        author: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> List[Bbs]:
+        """
+        게시글 검색 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            bbs_id: 게시판 ID
+            search_term: 검색어
+            search_type: 검색 유형 (all, title, content, author)
+            author: 작성자 ID
+            skip: 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            
+        Returns:
+            검색된 게시글 목록
+        """
+        try:
+            stmt = select(Bbs).where(
+                *self._search_conditions(bbs_id, search_term, search_type, author)
+            ).order_by(desc(Bbs.frst_regist_pnttm)).offset(skip).limit(limit)
+            return list((await db.scalars(stmt)).all())
             
         except Exception as e:
             logger.error(f"❌ 게시글 검색 실패 - 오류: {str(e)}")
             return []
     
+    async def search_posts_page_async(
+        self, 
+        db: AsyncSession, 
+        bbs_id: Optional[str] = None,
+        search_term: Optional[str] = None,
+        author: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Bbs], Optional[str]]:
+        """
+        게시글 검색 (비동기, 최신순 키셋 페이지네이션)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            bbs_id: 게시판 ID
+            search_term: 검색어 (제목, 내용, 작성자명)
+            author: 작성자 ID
+            cursor: 이전 페이지의 next_cursor (None이면 skip부터 조회)
+            skip: cursor가 없을 때 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            
+        Returns:
+            (게시글 목록, 다음 페이지 커서) 튜플
+        """
+        return await self.get_page_after_async(
+            db,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            order_by='frst_regist_pnttm',
+            order_desc=True,
+            conditions=self._search_conditions(bbs_id, search_term, 'all', author)
+        )
+    
+    async def count_posts_async(
+        self, 
+        db: AsyncSession, 
+        bbs_id: Optional[str] = None,
+        search_term: Optional[str] = None,
+        author: Optional[str] = None,
+        strategy: str = TOTAL_EXACT
+    ) -> PageTotal:
+        """
+        검색 조건에 맞는 게시글 수 (비동기, search_posts_page_async와 같은 조건)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            bbs_id: 게시판 ID
+            search_term: 검색어 (제목, 내용, 작성자명)
+            author: 작성자 ID
+            strategy: 개수 산출 방식 (exact, estimated, capped, none)
+            
+        Returns:
+            PageTotal (total, total_type)
+        """
+        return await self.count_total_async(
+            db, strategy, conditions=self._search_conditions(bbs_id, search_term, 'all', author)
+        )
+    
+    @staticmethod
+    def _search_conditions(
+        bbs_id: Optional[str],
+        search_term: Optional[str],
+        search_type: str,
+        author: Optional[str]
+    ) -> List[Any]:
+        """게시글 검색 조건 (삭제 제외, 게시판, 작성자, 검색어)"""
+        conditions = [Bbs.delete_at == 'N']
+        
+        # 게시판 조건
+        if bbs_id:
+            conditions.append(Bbs.bbs_id == bbs_id)
+        
+        # 작성자 조건
+        if author:
+            conditions.append(Bbs.frst_register_id == author)
+        
+        # 검색어 조건
+        if search_term:
+            pattern = f"%{search_term}%"
+            if search_type == 'title':
+                conditions.append(Bbs.ntt_sj.like(pattern))
+            elif search_type == 'content':
+                conditions.append(Bbs.ntt_cn.like(pattern))
+            elif search_type == 'author':
+                conditions.append(Bbs.ntcr_nm.like(pattern))
+            else:  # all
+                conditions.append(or_(
+                    Bbs.ntt_sj.like(pattern),
+                    Bbs.ntt_cn.like(pattern),
+                    Bbs.ntcr_nm.like(pattern)
+                ))
+        return conditions
+    
+    @staticmethod
+    def _post_order(order_by: str):
+        """게시글 정렬 기준 (latest, oldest, views, likes)"""
+        if order_by == 'oldest':
+            return asc(Bbs.frst_regist_pnttm)
+        if order_by == 'views':
+            return desc(Bbs.rdcnt)
+        if order_by == 'likes':
+            return desc(Bbs.recomend_cnt)
+        return desc(Bbs.frst_regist_pnttm)
+    
     def increase_view_count(self, db: Session, ntt_id: int) -> bool:
         """
         게시글 조회수 증가
@@ -290,6 +500,34 @@ class BbsService(BaseService[Bbs, BbsCreate, BbsUpdate]):
             logger.error(f"❌ 조회수 증가 실패 - ntt_id: {ntt_id}, 오류: {str(e)}")
             raise
     
+    async def increase_view_count_async(self, db: AsyncSession, ntt_id: int) -> bool:
+        """
+        게시글 조회수 증가 (비동기)
+        
+        조회 후 갱신하지 않고 UPDATE 한 번으로 증가시켜 동시 조회 시 누락을 막습니다.
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            ntt_id: 게시글 ID
+            
+        Returns:
+            조회수 증가 성공 여부
+        """
+        try:
+            result = await db.execute(
+                update(Bbs)
+                .where(Bbs.ntt_id == ntt_id, Bbs.delete_at == 'N')
+                .values(rdcnt=func.coalesce(Bbs.rdcnt, 0) + 1, last_updt_pnttm=datetime.now())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return result.rowcount > 0
+            
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"❌ 조회수 증가 실패 - ntt_id: {ntt_id}, 오류: {str(e)}")
+            raise
+    
     def increase_recommend_count(self, db: Session, ntt_id: int) -> bool:
         """
         게시글 추천수 증가
@@ -4,11 +4,13 @@
 """
 
 from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_, desc, asc
+from sqlalchemy import and_, func, or_, desc, asc, select
 from datetime import datetime
 import logging
 
+from app.database.aggregates import AggregateQuery
 from app.models.common_models import CmmnGrpCode, CmmnCode
 from app.schemas.common_schemas import (
     CmmnGrpCodeCreate, CmmnGrpCodeUpdate,
@@ -69,6 +71,25 @@ class CmmnGrpCodeService(BaseService[CmmnGrpCode, CmmnGrpCodeCreate, CmmnGrpCode
             logger.error(f"❌ 활성 공통 그룹 코드 목록 조회 실패 - 오류: {str(e)}")
             raise
     
+    async def get_active_group_codes_async(self, db: AsyncSession) -> List[CmmnGrpCode]:
+        """
+        활성화된 공통 그룹 코드 목록 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            
+        Returns:
+            활성화된 공통 그룹 코드 목록
+        """
+        try:
+            result = await db.scalars(select(CmmnGrpCode).where(
+                CmmnGrpCode.use_yn == 'Y'
+            ).order_by(CmmnGrpCode.code_id))
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"❌ 활성 공통 그룹 코드 목록 조회 실패 - 오류: {str(e)}")
+            raise
+    
     def search_group_codes(
         self, 
         db: Session, 
@@ -133,6 +154,25 @@ class CmmnGrpCodeService(BaseService[CmmnGrpCode, CmmnGrpCodeCreate, CmmnGrpCode
             logger.error(f"❌ 공통 그룹 코드 조회 실패 - group_code_id: {group_code_id}, 오류: {str(e)}")
             raise
     
+    async def get_by_group_code_id_async(self, db: AsyncSession, group_code_id: str) -> Optional[CmmnGrpCode]:
+        """
+        그룹 코드 ID로 공통 그룹 코드 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            group_code_id: 그룹 코드 ID
+            
+        Returns:
+            공통 그룹 코드 정보 또는 None
+        """
+        try:
+            return await db.scalar(select(CmmnGrpCode).where(
+                CmmnGrpCode.code_id == group_code_id
+            ))
+        except Exception as e:
+            logger.error(f"❌ 공통 그룹 코드 조회 실패 - group_code_id: {group_code_id}, 오류: {str(e)}")
+            raise
+    
     def get_group_code_statistics(self, db: Session) -> Dict[str, Any]:
         """
         공통 그룹 코드 통계 조회
@@ -144,14 +184,18 @@ class CmmnGrpCodeService(BaseService[CmmnGrpCode, CmmnGrpCodeCreate, CmmnGrpCode
             그룹 코드 통계 정보
         """
         try:
-            total_groups = db.query(CmmnGrpCode).count()
-            active_groups = db.query(CmmnGrpCode).filter(
-                CmmnGrpCode.use_yn == 'Y'
-            ).count()
+            # 전체/활성 그룹 수와 전체 코드 수를 한 번에 집계
+            counts = (
+                AggregateQuery(CmmnGrpCode)
+                .count('total_groups')
+                .count('active_groups', CmmnGrpCode.use_yn == 'Y')
+                .add('total_codes', select(func.count()).select_from(CmmnCode).scalar_subquery())
+                .one(db)
+            )
+            total_groups = counts.total_groups
+            active_groups = counts.active_groups
             inactive_groups = total_groups - active_groups
-            
-            # 전체 코드 수 계산
-            total_codes = db.query(CmmnCode).count()
+            total_codes = counts.total_codes
             avg_codes_per_group = total_codes / total_groups if total_groups > 0 else 0
             
             return {
@@ -325,33 +369,24 @@ class CmmnGrpCodeService(BaseService[CmmnGrpCode, CmmnGrpCodeCreate, CmmnGrpCode
             통계 정보 딕셔너리
         """
         try:
-            from sqlalchemy import func
-            
-            # 전체 그룹 수
-            total_groups = db.query(CmmnGrpCode).filter(
-                CmmnGrpCode.delete_at == 'N'
-            ).count()
-            
-            # 활성 그룹 수
-            active_groups = db.query(CmmnGrpCode).filter(
-                CmmnGrpCode.use_at == 'Y'
-            ).count()
-            
-            # 그룹별 코드 수
-            group_code_counts = db.query(
-                CmmnGrpCode.group_id,
-                CmmnGrpCode.group_nm,
-                func.count(CmmnCode.code_id).label('code_count')
-            ).outerjoin(
-                CmmnCode, 
-                and_(
-                    CmmnGrpCode.group_id == CmmnCode.group_id,
-                    CmmnCode.use_at == 'Y'
+            # 그룹별 사용 코드 수 (그룹별 행을 합산해 전체/활성 그룹 수도 계산)
+            group_code_counts = (
+                AggregateQuery(
+                    CmmnGrpCode.__table__.outerjoin(
+                        CmmnCode.__table__,
+                        and_(
+                            CmmnGrpCode.code_id == CmmnCode.code_id,
+                            CmmnCode.use_yn == 'Y'
+                        )
+                    )
                 )
-            ).group_by(
-                CmmnGrpCode.group_id, 
-                CmmnGrpCode.group_nm
-            ).all()
+                .count_distinct('code_count', CmmnCode.code)
+                .group_by(CmmnGrpCode.code_id, CmmnGrpCode.code_id_nm, CmmnGrpCode.use_yn)
+                .all(db)
+            )
+            
+            total_groups = len(group_code_counts)
+            active_groups = sum(1 for item in group_code_counts if item.use_yn == 'Y')
             
             return {
                 'total_groups': total_groups,
@@ -359,8 +394,8 @@ class CmmnGrpCodeService(BaseService[CmmnGrpCode, CmmnGrpCodeCreate, CmmnGrpCode
                 'inactive_groups': total_groups - active_groups,
                 'group_code_counts': [
                     {
-                        'group_id': item.group_id,
-                        'group_nm': item.group_nm,
+                        'group_id': item.code_id,
+                        'group_nm': item.code_id_nm,
                         'code_count': item.code_count
                     }
                     for item in group_code_counts
@@ -427,6 +462,27 @@ class CmmnCodeService(BaseService[CmmnCode, CmmnCodeCreate, CmmnCodeUpdate]):
             logger.error(f"❌ 그룹별 공통 코드 조회 실패 - group_code_id: {group_code_id}, 오류: {str(e)}")
             raise
     
+    async def get_codes_by_group_async(self, db: AsyncSession, group_code_id: str) -> List[CmmnCode]:
+        """
+        그룹 ID로 공통 코드 목록 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            group_code_id: 그룹 코드 ID
+            
+        Returns:
+            해당 그룹의 공통 코드 목록
+        """
+        try:
+            result = await db.scalars(select(CmmnCode).where(
+                CmmnCode.code_id == group_code_id,
+                CmmnCode.use_yn == 'Y'
+            ).order_by(CmmnCode.code_ordr, CmmnCode.code))
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"❌ 그룹별 공통 코드 조회 실패 - group_code_id: {group_code_id}, 오류: {str(e)}")
+            raise
+    
     def get_active_codes(self, db: Session) -> List[CmmnCode]:
         """
         활성화된 공통 코드 목록 조회
@@ -589,21 +645,20 @@ class CmmnCodeService(BaseService[CmmnCode, CmmnCodeCreate, CmmnCodeUpdate]):
             코드 통계 정보
         """
         try:
-            query = db.query(CmmnCode)
-            
-            if group_id:
-                query = query.filter(CmmnCode.code_id == group_id)
+            # 그룹별 전체/사용 코드 수 (group_id가 있으면 해당 그룹 행만 합산)
+            group_stats = (
+                AggregateQuery(CmmnCode)
+                .count('code_count')
+                .count('active_count', CmmnCode.use_yn == 'Y')
+                .group_by(CmmnCode.code_id)
+                .all(db)
+            )
+            selected = [stat for stat in group_stats if not group_id or stat.code_id == group_id]
             
-            total_codes = query.count()
-            active_codes = query.filter(CmmnCode.use_yn == 'Y').count()
+            total_codes = sum(stat.code_count for stat in selected)
+            active_codes = sum(stat.active_count for stat in selected)
             inactive_codes = total_codes - active_codes
             
-            # 그룹별 코드 수
-            group_stats = db.query(
-                CmmnCode.code_id,
-                func.count(CmmnCode.code).label('code_count')
-            ).group_by(CmmnCode.code_id).all()
-            
             # 그룹별 코드 수를 딕셔너리로 변환
             codes_by_group = {
                 stat.code_id: stat.code_count for stat in group_stats
@@ -621,9 +676,6 @@ class CmmnCodeService(BaseService[CmmnCode, CmmnCodeCreate, CmmnCodeUpdate]):
                 "codes_by_group": codes_by_group,
                 "most_used_group": most_used_group
             }
-            print(f"📊 DEBUG - 통계 조회 결과: {result}")
-            print(f"📊 DEBUG - codes_by_group 타입: {type(codes_by_group)}")
-            print(f"📊 DEBUG - codes_by_group 값: {codes_by_group}")
             logger.info(f"📊 통계 조회 결과: {result}")
             return result
         except Exception as e:
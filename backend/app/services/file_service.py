@@ -4,8 +4,9 @@
 """
 
 from typing import List, Optional, Dict, Any, BinaryIO
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy import and_, or_, desc, asc, func, select
 from datetime import datetime
 from decimal import Decimal
 import logging
@@ -20,6 +21,7 @@ from app.schemas.file_schemas import (
     FileDetailCreate, FileDetailUpdate,
     FileValidationResponse, FileValidationResult
 )
+from app.utils.file_analytics import get_file_analytics
 from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
@@ -93,78 +95,19 @@ class FileService(BaseService[File, FileCreate, FileUpdate]):
             logger.error(f"❌ 파일 그룹 생성 실패 - 오류: {str(e)}")
             raise
     
-    def get_file_statistics(self, db: Session) -> Dict[str, Any]:
+    def get_file_statistics(self, db: Session, days: Optional[int] = None) -> Dict[str, Any]:
         """
-        파일 통계 조회
+        파일 통계 조회 (업로드/삭제 시 무효화되는 캐시 사용)
         
         Args:
             db: 데이터베이스 세션
+            days: 업로드 추세 조회 일수 (기본값: FILE_STATS_TREND_DAYS)
             
         Returns:
             파일 통계 정보
         """
         try:
-            from decimal import Decimal
-            from datetime import datetime, timedelta
-            
-            # 전체 파일 수 (FileDetail 기준)
-            total_files = db.query(FileDetail).filter(
-                FileDetail.file_delete_yn == 'N'
-            ).count()
-            
-            # 전체 파일 크기
-            total_size = db.query(
-                func.sum(FileDetail.file_size)
-            ).filter(
-                FileDetail.file_delete_yn == 'N'
-            ).scalar() or 0
-            
-            # 평균 파일 크기
-            avg_file_size = Decimal(total_size) / Decimal(total_files) if total_files > 0 else Decimal(0)
-            
-            # 파일 타입별 통계
-            file_types = {}
-            type_stats = db.query(
-                FileDetail.file_extsn,
-                func.count(FileDetail.file_sn).label('count'),
-                func.sum(FileDetail.file_size).label('total_size')
-            ).filter(
-                FileDetail.file_delete_yn == 'N'
-            ).group_by(FileDetail.file_extsn).all()
-            
-            for ext, count, size in type_stats:
-                file_types[ext or 'unknown'] = {
-                    'count': count,
-                    'total_size': size or 0
-                }
-            
-            # 업로드 추세 (최근 7일)
-            upload_trend = []
-            for i in range(7):
-                date = datetime.now() - timedelta(days=i)
-                start_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = start_date + timedelta(days=1)
-                
-                daily_count = db.query(FileDetail).filter(
-                    and_(
-                        FileDetail.file_delete_yn == 'N',
-                        FileDetail.frst_regist_pnttm >= start_date,
-                        FileDetail.frst_regist_pnttm < end_date
-                    )
-                ).count()
-                
-                upload_trend.append({
-                    'date': start_date.strftime('%Y-%m-%d'),
-                    'count': daily_count
-                })
-            
-            return {
-                'total_files': total_files,
-                'total_size': Decimal(total_size),
-                'avg_file_size': avg_file_size,
-                'file_types': file_types,
-                'upload_trend': upload_trend
-            }
+            return get_file_analytics().get_summary(db, days)
             
         except Exception as e:
             logger.error(f"❌ 파일 통계 조회 실패 - 오류: {str(e)}")
@@ -284,6 +227,31 @@ class FileDetailService(BaseService[FileDetail, FileDetailCreate, FileDetailUpda
             logger.error(f"❌ 그룹별 파일 목록 조회 실패 - atch_file_id: {atch_file_id}, 오류: {str(e)}")
             raise
     
+    async def get_files_by_group_async(
+        self, 
+        db: AsyncSession, 
+        atch_file_id: str
+    ) -> List[FileDetail]:
+        """
+        첨부파일 ID로 파일 목록 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            atch_file_id: 첨부파일 ID
+            
+        Returns:
+            해당 그룹의 파일 목록
+        """
+        try:
+            result = await db.scalars(select(FileDetail).where(
+                FileDetail.atch_file_id == atch_file_id,
+                FileDetail.file_delete_yn == 'N'
+            ).order_by(FileDetail.file_sn))
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"❌ 그룹별 파일 목록 조회 실패 - atch_file_id: {atch_file_id}, 오류: {str(e)}")
+            raise
+    
     def upload_file(
         self, 
         db: Session, 
@@ -361,6 +329,7 @@ class FileDetailService(BaseService[FileDetail, FileDetailCreate, FileDetailUpda
             }
             
             file_detail = self.create(db, file_detail_data)
+            get_file_analytics().invalidate()
             logger.info(f"✅ 파일 업로드 완료 - 파일명: {original_filename}, 크기: {file_size}bytes")
             return file_detail
             
@@ -446,6 +415,7 @@ class FileDetailService(BaseService[FileDetail, FileDetailCreate, FileDetailUpda
             
             db.add(file_detail)
             db.commit()
+            get_file_analytics().invalidate()
             
             logger.info(f"✅ 파일 삭제 완료 - file_sn: {file_sn}")
             return True
@@ -556,7 +526,7 @@ class FileDetailService(BaseService[FileDetail, FileDetailCreate, FileDetailUpda
     
     def get_file_statistics_by_type(self, db: Session) -> Dict[str, Any]:
         """
-        파일 유형별 통계 조회
+        파일 유형별 통계 조회 (파일 통계와 같은 확장자별 집계 캐시 사용)
         
         Args:
             db: 데이터베이스 세션
@@ -565,35 +535,7 @@ class FileDetailService(BaseService[FileDetail, FileDetailCreate, FileDetailUpda
             파일 유형별 통계 정보
         """
         try:
-            statistics = {}
-            
-            for file_type, extensions in self.allowed_extensions.items():
-                # 해당 유형의 파일 수와 총 크기 조회
-                ext_filter = or_(*[FileDetail.file_extsn == ext for ext in extensions])
-                
-                count = db.query(FileDetail).filter(
-                    and_(
-                        FileDetail.file_delete_yn == 'N',
-                        ext_filter
-                    )
-                ).count()
-                
-                total_size = db.query(
-                    func.sum(FileDetail.file_size)
-                ).filter(
-                    and_(
-                        FileDetail.file_delete_yn == 'N',
-                        ext_filter
-                    )
-                ).scalar() or 0
-                
-                statistics[file_type] = {
-                    'count': count,
-                    'total_size_bytes': total_size,
-                    'total_size_mb': round(total_size / (1024 * 1024), 2)
-                }
-            
-            return statistics
+            return get_file_analytics().get_type_summary(db, self.allowed_extensions)
             
         except Exception as e:
             logger.error(f"❌ 파일 유형별 통계 조회 실패 - 오류: {str(e)}")
@@ -3,18 +3,31 @@
 로그인 로그 관리를 위한 서비스 클래스를 정의합니다.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func, case
+from sqlalchemy import and_, or_, desc, asc, func, select
+from sqlalchemy.sql import Select
 from datetime import datetime, timedelta
 import logging
 
+from app.database.partitioning import cleanup_log_table
+from app.database.aggregates import AggregateQuery
+from app.database.export import DEFAULT_BATCH_SIZE, iter_rows
+from app.database.rollups import GRAIN_DAY, LOGIN_ROLLUP, rollup_dimension, rollup_source
 from app.models.log_models import LoginLog
 from app.schemas.log_schemas import LoginLogCreate, LoginLogUpdate
+from app.utils.page_total import TOTAL_EXACT, PageTotal
+from app.utils.record_stream import encode_records, gzip_chunks
 from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
 
+# 내보내기 필드 (CSV 헤더 순서)
+EXPORT_FIELDS = [
+    "log_id", "conect_id", "conect_ip", "conect_mthd",
+    "error_occrrnc_at", "error_code", "frst_regist_pnttm"
+]
+
 
 class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
     """로그인 로그 서비스
@@ -284,89 +297,27 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
             if not end_date:
                 end_date = datetime.now()
             
-            base_query = db.query(LoginLog).filter(
-                and_(
-                    LoginLog.frst_regist_pnttm >= start_date,
-                    LoginLog.frst_regist_pnttm <= end_date
-                )
-            )
-            
-            # 전체 로그인 시도 수
-            total_attempts = base_query.count()
-            
-            # 성공한 로그인 수
-            successful_logins = base_query.filter(
-                LoginLog.error_occrrnc_at == 'N'
-            ).count()
-            
-            # 실패한 로그인 수
-            failed_logins = base_query.filter(
-                LoginLog.error_occrrnc_at == 'Y'
-            ).count()
+            # 원본 로그 대신 시간별 집계에서 조회 (집계되지 않은 구간만 원본 조회)
+            stats = rollup_source(db, LOGIN_ROLLUP, start_date, end_date)
+            success = stats.c.error_occrrnc_at == 'N'
             
-            # 고유 사용자 수
-            unique_users = base_query.filter(
-                LoginLog.error_occrrnc_at == 'N'
-            ).distinct(LoginLog.conect_id).count()
-            
-            # 고유 IP 수
-            unique_ips = base_query.distinct(LoginLog.conect_ip).count()
-            
-            # 일별 로그인 통계
-            daily_stats = db.query(
-                func.date(LoginLog.frst_regist_pnttm).label('date'),
-                func.count(LoginLog.log_id).label('total'),
-                func.sum(
-                    case(
-                        (LoginLog.error_occrrnc_at == 'N', 1),
-                        else_=0
-                    )
-                ).label('success'),
-                func.sum(
-                    case(
-                        (LoginLog.error_occrrnc_at == 'Y', 1),
-                        else_=0
-                    )
-                ).label('fail')
-            ).filter(
-                and_(
-                    LoginLog.frst_regist_pnttm >= start_date,
-                    LoginLog.frst_regist_pnttm <= end_date
-                )
-            ).group_by(
-                func.date(LoginLog.frst_regist_pnttm)
-            ).order_by(
-                func.date(LoginLog.frst_regist_pnttm)
-            ).all()
+            # 시도/성공/실패 수와 고유 사용자/IP 수를 한 번에 집계
+            counts = self._login_counts(stats).one(db)
+            total_attempts = counts.total_attempts
+            successful_logins = counts.successful_logins
+            failed_logins = counts.failed_logins
+            unique_users = counts.unique_users
+            unique_ips = counts.unique_ips
             
             # 시간대별 로그인 통계
-            hourly_stats = db.query(
-                func.extract('hour', LoginLog.frst_regist_pnttm).label('hour'),
-                func.count(LoginLog.log_id).label('count')
-            ).filter(
-                and_(
-                    LoginLog.frst_regist_pnttm >= start_date,
-                    LoginLog.frst_regist_pnttm <= end_date,
-                    LoginLog.error_occrrnc_at == 'N'
-                )
-            ).group_by(
-                func.extract('hour', LoginLog.frst_regist_pnttm)
-            ).order_by(
-                func.extract('hour', LoginLog.frst_regist_pnttm)
-            ).all()
-            
-            # 상위 IP 주소
-            top_ips = db.query(
-                LoginLog.conect_ip,
-                func.count(LoginLog.log_id).label('count')
-            ).filter(
-                and_(
-                    LoginLog.frst_regist_pnttm >= start_date,
-                    LoginLog.frst_regist_pnttm <= end_date
-                )
-            ).group_by(LoginLog.conect_ip).order_by(
-                desc(func.count(LoginLog.log_id))
-            ).limit(10).all()
+            hour = func.extract('hour', stats.c.stats_pnttm)
+            hourly_stats = (
+                AggregateQuery(stats, success)
+                .sum('count', stats.c.log_co)
+                .group_by(hour.label('hour'))
+                .order_by(hour)
+                .all(db)
+            )
             
             # 평균 세션 지속시간 계산 (임시값)
             avg_session_duration = 0.0
@@ -392,6 +343,18 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
             logger.error(f"❌ 로그인 통계 조회 실패 - 오류: {str(e)}")
             raise
     
+    def _login_counts(self, stats) -> AggregateQuery:
+        """접속로그 집계의 시도/성공/실패 수와 성공한 고유 사용자/전체 고유 IP 수 집계"""
+        success = stats.c.error_occrrnc_at == 'N'
+        return (
+            AggregateQuery(stats)
+            .sum('total_attempts', stats.c.log_co)
+            .sum('successful_logins', stats.c.log_co, success)
+            .sum('failed_logins', stats.c.log_co, stats.c.error_occrrnc_at == 'Y')
+            .count_distinct('unique_users', rollup_dimension(stats.c.conect_id), success)
+            .count_distinct('unique_ips', rollup_dimension(stats.c.conect_ip))
+        )
+    
     def get_security_alerts(
         self, 
         db: Session,
@@ -537,29 +500,80 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
             검색된 로그인 로그 목록
         """
         try:
-            query = db.query(LoginLog)
-            
-            if search_params.login_id:
-                query = query.filter(LoginLog.conect_id == search_params.login_id)
-            
-            if search_params.login_ip:
-                query = query.filter(LoginLog.conect_ip.like(f"%{search_params.login_ip}%"))
-            
-            if search_params.error_occrrnc_at:
-                query = query.filter(LoginLog.error_occrrnc_at == search_params.error_occrrnc_at)
-            
-            if search_params.start_date:
-                query = query.filter(LoginLog.frst_regist_pnttm >= search_params.start_date)
-            
-            if search_params.end_date:
-                query = query.filter(LoginLog.frst_regist_pnttm <= search_params.end_date)
-            
+            query = db.query(LoginLog).filter(*self._search_conditions(search_params))
             return query.order_by(desc(LoginLog.frst_regist_pnttm)).offset(skip).limit(limit).all()
             
         except Exception as e:
             logger.error(f"❌ 로그인 로그 검색 실패 - 오류: {str(e)}")
             raise
     
+    def search_logs_page(
+        self,
+        db: Session,
+        search_params,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[LoginLog], Optional[str]]:
+        """
+        로그인 로그 검색 (최신순 키셋 페이지네이션)
+        
+        Args:
+            db: 데이터베이스 세션
+            search_params: 검색 파라미터
+            cursor: 이전 페이지의 next_cursor (None이면 skip부터 조회)
+            skip: cursor가 없을 때 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            
+        Returns:
+            (로그인 로그 목록, 다음 페이지 커서) 튜플
+        """
+        return self.get_page_after(
+            db,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            order_by="frst_regist_pnttm",
+            order_desc=True,
+            conditions=self._search_conditions(search_params)
+        )
+    
+    def count_logs(self, db: Session, search_params, strategy: str = TOTAL_EXACT) -> PageTotal:
+        """
+        검색 조건에 맞는 로그인 로그 수 (search_logs_page와 같은 조건)
+        
+        Args:
+            db: 데이터베이스 세션
+            search_params: 검색 파라미터
+            strategy: 개수 산출 방식 (exact, estimated, capped, none)
+            
+        Returns:
+            PageTotal (total, total_type)
+        """
+        return self.count_total(db, strategy, conditions=self._search_conditions(search_params))
+    
+    @staticmethod
+    def _search_conditions(search_params) -> List[Any]:
+        """로그인 로그 검색 조건"""
+        conditions = []
+        
+        if search_params.login_id:
+            conditions.append(LoginLog.conect_id == search_params.login_id)
+        
+        if search_params.login_ip:
+            conditions.append(LoginLog.conect_ip.like(f"%{search_params.login_ip}%"))
+        
+        if search_params.error_occrrnc_at:
+            conditions.append(LoginLog.error_occrrnc_at == search_params.error_occrrnc_at)
+        
+        if search_params.start_date:
+            conditions.append(LoginLog.frst_regist_pnttm >= search_params.start_date)
+        
+        if search_params.end_date:
+            conditions.append(LoginLog.frst_regist_pnttm <= search_params.end_date)
+        
+        return conditions
+    
     def get_recent_logs(
         self,
         db: Session,
@@ -639,34 +653,24 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
             
-            daily_stats = db.query(
-                func.date(LoginLog.frst_regist_pnttm).label('date'),
-                func.count(LoginLog.log_id).label('total'),
-                func.sum(
-                    case(
-                        (LoginLog.error_occrrnc_at == 'N', 1),
-                        else_=0
-                    )
-                ).label('success'),
-                func.sum(
-                    case(
-                        (LoginLog.error_occrrnc_at == 'Y', 1),
-                        else_=0
-                    )
-                ).label('fail')
-            ).filter(
-                LoginLog.frst_regist_pnttm >= cutoff_date
-            ).group_by(
-                func.date(LoginLog.frst_regist_pnttm)
-            ).order_by(
-                func.date(LoginLog.frst_regist_pnttm)
-            ).all()
+            stats = rollup_source(db, LOGIN_ROLLUP, cutoff_date, datetime.now(), GRAIN_DAY)
+            
+            daily_stats = (
+                AggregateQuery(stats)
+                .sum('total', stats.c.log_co)
+                .sum('success', stats.c.log_co, stats.c.error_occrrnc_at == 'N')
+                .sum('fail', stats.c.log_co, stats.c.error_occrrnc_at == 'Y')
+                .group_by(stats.c.stats_de.label('date'))
+                .order_by(stats.c.stats_de)
+                .all(db)
+            )
             
             return {
                 'period_days': days,
                 'daily_stats': [
                     {
-                        'date': stat.date.isoformat(),
+                        # SQLite에서는 날짜가 문자열로 조회됨
+                        'date': str(stat.date),
                         'total': stat.total,
                         'success': stat.success,
                         'fail': stat.fail
@@ -697,19 +701,16 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
             
-            hourly_stats = db.query(
-                func.extract('hour', LoginLog.frst_regist_pnttm).label('hour'),
-                func.count(LoginLog.log_id).label('count')
-            ).filter(
-                and_(
-                    LoginLog.frst_regist_pnttm >= cutoff_date,
-                    LoginLog.error_occrrnc_at == 'N'
-                )
-            ).group_by(
-                func.extract('hour', LoginLog.frst_regist_pnttm)
-            ).order_by(
-                func.extract('hour', LoginLog.frst_regist_pnttm)
-            ).all()
+            stats = rollup_source(db, LOGIN_ROLLUP, cutoff_date, datetime.now())
+            hour = func.extract('hour', stats.c.stats_pnttm)
+            
+            hourly_stats = (
+                AggregateQuery(stats, stats.c.error_occrrnc_at == 'N')
+                .sum('count', stats.c.log_co)
+                .group_by(hour.label('hour'))
+                .order_by(hour)
+                .all(db)
+            )
             
             return {
                 'period_days': days,
@@ -726,50 +727,85 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
             logger.error(f"❌ 시간별 로그인 통계 조회 실패 - 오류: {str(e)}")
             raise
     
+    def export_statement(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        user_id: Optional[str] = None,
+        login_ids: Optional[List[str]] = None,
+        include_successful: bool = True,
+        include_failed: bool = True
+    ) -> Select:
+        """
+        내보낼 로그인 로그 조회문 (최근 로그부터)
+        
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            user_id: 사용자 ID
+            login_ids: 접속 ID 목록
+            include_successful: 성공 로그인 포함 여부
+            include_failed: 실패 로그인 포함 여부
+            
+        Returns:
+            EXPORT_FIELDS 컬럼을 조회하는 SELECT 문
+        """
+        statement = select(*[getattr(LoginLog, field) for field in EXPORT_FIELDS])
+        
+        if start_date:
+            statement = statement.where(LoginLog.frst_regist_pnttm >= start_date)
+        if end_date:
+            statement = statement.where(LoginLog.frst_regist_pnttm <= end_date)
+        if user_id:
+            statement = statement.where(LoginLog.conect_id == user_id)
+        if login_ids:
+            statement = statement.where(LoginLog.conect_id.in_(login_ids))
+        if not include_successful:
+            statement = statement.where(LoginLog.error_occrrnc_at == 'Y')
+        if not include_failed:
+            statement = statement.where(LoginLog.error_occrrnc_at == 'N')
+        
+        return statement.order_by(desc(LoginLog.frst_regist_pnttm))
+    
     def export_logs(
         self,
         db: Session,
         format: str = "csv",
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        user_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+        user_id: Optional[str] = None,
+        compress: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[bytes]:
         """
         로그 데이터 내보내기
         
+        로그를 서버 측 커서로 batch_size 건씩 읽어 바로 인코딩하므로 로그 수와
+        관계없이 메모리 사용량이 일정합니다. 조회는 반환된 이터레이터를 소비할 때
+        시작됩니다. 파일로 저장하는 내보내기는 ExportJobManager를 사용합니다.
+        
         Args:
             db: 데이터베이스 세션
-            format: 내보내기 형식
+            format: 내보내기 형식 (json, ndjson, csv)
             start_date: 시작 날짜
             end_date: 종료 날짜
             user_id: 사용자 ID
+            compress: gzip 압축 여부
+            batch_size: 한 번에 가져올 행 수
             
         Returns:
-            내보내기 결과
-        """
-        try:
-            query = db.query(LoginLog)
-            
-            if start_date:
-                query = query.filter(LoginLog.frst_regist_pnttm >= start_date)
-            if end_date:
-                query = query.filter(LoginLog.frst_regist_pnttm <= end_date)
-            if user_id:
-                query = query.filter(LoginLog.conect_id == user_id)
-            
-            logs = query.order_by(desc(LoginLog.frst_regist_pnttm)).all()
-            
-            # 간단한 내보내기 응답 (실제로는 파일 생성 로직 필요)
-            return {
-                'format': format,
-                'total_records': len(logs),
-                'export_time': datetime.now().isoformat(),
-                'file_url': f'/exports/login_logs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{format}'
-            }
+            내보내기 파일 바이트 청크 이터레이터
             
-        except Exception as e:
-            logger.error(f"❌ 로그 데이터 내보내기 실패 - 오류: {str(e)}")
-            raise
+        Raises:
+            ValueError: 지원하지 않는 형식
+        """
+        chunks = encode_records(
+            iter_rows(db, self.export_statement(start_date, end_date, user_id), batch_size),
+            format,
+            EXPORT_FIELDS,
+            metadata={"format": format, "export_time": datetime.now().isoformat()}
+        )
+        return gzip_chunks(chunks) if compress else chunks
     
     def analyze_logs(
         self,
@@ -791,23 +827,15 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
             
-            base_query = db.query(LoginLog).filter(
-                LoginLog.frst_regist_pnttm >= cutoff_date
-            )
+            # 시간대가 필요 없으므로 일별 집계 위주로 조회
+            stats = rollup_source(db, LOGIN_ROLLUP, cutoff_date, datetime.now(), GRAIN_DAY)
             
-            total_attempts = base_query.count()
-            successful_logins = base_query.filter(
-                LoginLog.error_occrrnc_at == 'N'
-            ).count()
-            failed_logins = base_query.filter(
-                LoginLog.error_occrrnc_at == 'Y'
-            ).count()
-            
-            unique_users = base_query.filter(
-                LoginLog.error_occrrnc_at == 'N'
-            ).distinct(LoginLog.conect_id).count()
-            
-            unique_ips = base_query.distinct(LoginLog.conect_ip).count()
+            counts = self._login_counts(stats).one(db)
+            total_attempts = counts.total_attempts
+            successful_logins = counts.successful_logins
+            failed_logins = counts.failed_logins
+            unique_users = counts.unique_users
+            unique_ips = counts.unique_ips
             
             return {
                 'analysis_type': analysis_type,
@@ -871,34 +899,24 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
     def cleanup_old_logs(
         self, 
         db: Session,
-        days_to_keep: int = 90
-    ) -> int:
+        days_to_keep: int = 90,
+        mode: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         오래된 로그 정리
         
+        월별 파티션 테이블이면 보관 기간이 지난 파티션을 DROP/DETACH 하고,
+        기준 시점이 걸친 파티션에서만 행을 삭제합니다.
+        
         Args:
             db: 데이터베이스 세션
             days_to_keep: 보관할 일수
+            mode: 파티션 정리 방식 (drop, detach, 기본값: LOG_RETENTION_MODE)
             
         Returns:
-            삭제된 로그 수
+            삭제된 로그 수(deleted_count)와 정리된 파티션 목록
         """
-        try:
-            cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-            
-            deleted_count = db.query(LoginLog).filter(
-                LoginLog.frst_regist_pnttm < cutoff_date
-            ).delete()
-            
-            db.commit()
-            
-            logger.info(f"✅ 오래된 로그 정리 완료 - 삭제된 로그 수: {deleted_count}")
-            return deleted_count
-            
-        except Exception as e:
-            db.rollback()
-            logger.error(f"❌ 오래된 로그 정리 실패 - 오류: {str(e)}")
-            raise
+        return cleanup_log_table(db, LoginLog.__table__, days_to_keep, mode)
     
     def get_suspicious_activities(
         self, 
@@ -1029,19 +1047,17 @@ class LoginLogService(BaseService[LoginLog, LoginLogCreate, LoginLogUpdate]):
         try:
             start_date = datetime.now() - timedelta(days=days)
             
-            top_ips = db.query(
-                LoginLog.conect_ip,
-                func.count(LoginLog.log_id).label('login_count'),
-                func.count(func.distinct(LoginLog.conect_id)).label('unique_users'),
-                func.sum(case((LoginLog.error_occrrnc_at == 'N', 1), else_=0)).label('success_count'),
-                func.sum(case((LoginLog.error_occrrnc_at == 'Y', 1), else_=0)).label('fail_count')
-            ).filter(
-                LoginLog.frst_regist_pnttm >= start_date
-            ).group_by(
-                LoginLog.conect_ip
-            ).order_by(
-                desc(func.count(LoginLog.log_id))
-            ).limit(limit).all()
+            top_ips = (
+                AggregateQuery(LoginLog, LoginLog.frst_regist_pnttm >= start_date)
+                .count('login_count')
+                .count_distinct('unique_users', LoginLog.conect_id)
+                .count('success_count', LoginLog.error_occrrnc_at == 'N')
+                .count('fail_count', LoginLog.error_occrrnc_at == 'Y')
+                .group_by(LoginLog.conect_ip)
+                .order_by(desc('login_count'))
+                .limit(limit)
+                .all(db)
+            )
             
             result = []
             for ip_stat in top_ips:
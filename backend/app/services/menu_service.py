@@ -3,19 +3,43 @@
 메뉴 정보 관리를 위한 서비스 클래스를 정의합니다.
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, or_, desc, asc, exists, func, insert, literal, select, update, DateTime, Numeric
 from datetime import datetime
 from decimal import Decimal
 import logging
 
+from pydantic import TypeAdapter
+
+from app.database.aggregates import AggregateQuery
 from app.models.menu_models import MenuInfo
-from app.schemas.menu_schemas import MenuInfoCreate, MenuInfoUpdate
+from app.schemas.menu_schemas import MenuInfoCreate, MenuInfoUpdate, MenuTreeNode
+from app.utils.hierarchy import AdjacencyMap, HierarchyQuery, make_path
+from app.utils.menu_tree_cache import MenuTreeEntry, get_menu_tree_cache
+from app.utils.record_stream import encode_records, gzip_chunks
 from .base_service import BaseService
 
 logger = logging.getLogger(__name__)
 
+# 캐시 본문을 응답 스키마(List[MenuTreeNode])와 동일하게 인코딩하기 위한 어댑터
+menu_tree_adapter = TypeAdapter(List[MenuTreeNode])
+
+# 메뉴 계층(상위 경로, 하위 여부, 최대 깊이) 조회
+menu_hierarchy = HierarchyQuery(MenuInfo, "menu_no", "upper_menu_no")
+
+# 메뉴 가져오기 UPSERT 단위 및 새 메뉴 필수 항목
+IMPORT_CHUNK_SIZE = 500
+IMPORT_REQUIRED_FIELDS = ("menu_nm", "progrm_file_nm", "menu_ordr")
+
+# 내보내기 항목과 서버 측 커서로 한 번에 가져올 행 수
+EXPORT_FIELDS = (
+    "menu_no", "menu_nm", "upper_menu_no", "progrm_file_nm", "menu_dc",
+    "menu_ordr", "display_yn", "relate_image_path", "relate_image_nm"
+)
+EXPORT_BATCH_SIZE = 1000
+
 
 class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
     """메뉴 정보 서비스
@@ -101,10 +125,76 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             logger.error(f"❌ 하위 메뉴 조회 실패 - parent_menu_id: {parent_menu_id}, 오류: {str(e)}")
             raise
     
+    async def get_by_menu_id_async(self, db: AsyncSession, menu_id: str) -> Optional[MenuInfo]:
+        """
+        메뉴 ID로 메뉴 정보 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            menu_id: 메뉴 ID
+            
+        Returns:
+            메뉴 정보 또는 None
+        """
+        try:
+            return await db.scalar(select(MenuInfo).where(
+                MenuInfo.menu_no == menu_id,
+                MenuInfo.display_yn == 'Y'
+            ))
+        except Exception as e:
+            logger.error(f"❌ 메뉴 조회 실패 - menu_id: {menu_id}, 오류: {str(e)}")
+            raise
+    
+    async def get_root_menus_async(self, db: AsyncSession, use_at: Optional[str] = None) -> List[MenuInfo]:
+        """
+        최상위 메뉴 목록 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            use_at: 사용 여부 필터
+            
+        Returns:
+            최상위 메뉴 목록
+        """
+        try:
+            result = await db.scalars(select(MenuInfo).where(
+                MenuInfo.upper_menu_no.is_(None),
+                MenuInfo.display_yn == (use_at or 'Y')
+            ).order_by(MenuInfo.menu_ordr))
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"❌ 최상위 메뉴 조회 실패 - 오류: {str(e)}")
+            raise
+    
+    async def get_child_menus_async(self, db: AsyncSession, parent_menu_id: str, use_at: Optional[str] = None) -> List[MenuInfo]:
+        """
+        하위 메뉴 목록 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            parent_menu_id: 상위 메뉴 ID
+            use_at: 사용 여부 필터
+            
+        Returns:
+            하위 메뉴 목록
+        """
+        try:
+            result = await db.scalars(select(MenuInfo).where(
+                MenuInfo.upper_menu_no == parent_menu_id,
+                MenuInfo.display_yn == (use_at or 'Y')
+            ).order_by(MenuInfo.menu_ordr))
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"❌ 하위 메뉴 조회 실패 - parent_menu_id: {parent_menu_id}, 오류: {str(e)}")
+            raise
+    
     def get_menu_tree(self, db: Session, parent_menu_id: Optional[str] = None, use_at: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         계층형 메뉴 트리 조회
         
+        전체 메뉴를 한 번의 쿼리로 조회한 뒤 상위 메뉴별 자식 인덱스를 만들어
+        메모리에서 O(N)으로 트리를 구성합니다.
+        
         Args:
             db: 데이터베이스 세션
             parent_menu_id: 상위 메뉴 ID (None이면 전체 트리)
@@ -114,45 +204,148 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             계층형 메뉴 트리
         """
         try:
-            def build_menu_tree(parent_id: Optional[str]) -> List[Dict[str, Any]]:
-                if parent_id is None:
-                    menus = self.get_root_menus(db, use_at)
-                else:
-                    menus = self.get_child_menus(db, parent_id, use_at)
-                
-                menu_tree = []
-                for menu in menus:
-                    children = build_menu_tree(menu.menu_no)
-                    menu_dict = {
-                        'id': int(menu.menu_no) if menu.menu_no.isdigit() else menu.menu_no,  # 프론트엔드가 기대하는 id 필드
-                        'name': menu.menu_nm,  # 프론트엔드가 기대하는 name 필드
-                        'menu_id': menu.menu_no,  # 기존 호환성을 위해 유지
-                        'menu_no': menu.menu_no,
-                        'menu_nm': menu.menu_nm,
-                        'path': getattr(menu, 'menu_url', None),  # 메뉴 URL이 있다면 path로 설정
-                        'icon': getattr(menu, 'menu_icon', None),  # 메뉴 아이콘이 있다면 설정
-                        'parent_id': int(menu.upper_menu_no) if menu.upper_menu_no and menu.upper_menu_no.isdigit() else menu.upper_menu_no,
-                        'order_num': menu.menu_ordr,
-                        'is_active': getattr(menu, 'use_at', 'Y') == 'Y',  # 사용 여부를 boolean으로 변환
-                        'menu_level': Decimal('1') if menu.upper_menu_no is None else Decimal('2'),
-                        'menu_ordr': menu.menu_ordr,
-                        'leaf_at': 'Y' if not children else 'N',
-                        'children': children
-                    }
-                    menu_tree.append(menu_dict)
-                
-                return menu_tree
-            
-            return build_menu_tree(parent_menu_id)
+            # 깊이 계산을 위해 표시 여부와 관계없이 전체 메뉴를 조회하고 필터는 메모리에서 적용
+            menus = db.query(MenuInfo).order_by(MenuInfo.menu_ordr).all()
+            return self._build_menu_tree(menus, parent_menu_id, use_at or 'Y')
             
         except Exception as e:
             logger.error(f"❌ 메뉴 트리 조회 실패 - parent_menu_id: {parent_menu_id}, 오류: {str(e)}")
             raise
     
+    def get_cached_menu_tree(self, db: Session, use_at: Optional[str] = None) -> MenuTreeEntry:
+        """
+        캐시된 전체 메뉴 트리 조회
+        
+        메뉴가 변경되지 않았다면 DB 조회 없이 트리와 미리 인코딩된 JSON 본문,
+        ETag를 반환합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            use_at: 사용 여부 필터
+            
+        Returns:
+            MenuTreeEntry (tree, body, etag)
+        """
+        cache = get_menu_tree_cache()
+        use_at = use_at or 'Y'
+        entry = cache.get(use_at)
+        if entry is not None:
+            return entry
+        
+        # 조회 전에 버전을 읽어 두어 조회 도중 변경된 경우 캐시에 저장되지 않도록 함
+        version = cache.version
+        try:
+            menus = db.query(MenuInfo).order_by(MenuInfo.menu_ordr).all()
+        except Exception as e:
+            logger.error(f"❌ 메뉴 트리 조회 실패 - use_at: {use_at}, 오류: {str(e)}")
+            raise
+        
+        return self._cache_menu_tree(cache, version, use_at, menus)
+    
+    async def get_cached_menu_tree_async(self, db: AsyncSession, use_at: Optional[str] = None) -> MenuTreeEntry:
+        """
+        캐시된 전체 메뉴 트리 조회 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            use_at: 사용 여부 필터
+            
+        Returns:
+            MenuTreeEntry (tree, body, etag)
+        """
+        cache = get_menu_tree_cache()
+        use_at = use_at or 'Y'
+        entry = cache.get(use_at)
+        if entry is not None:
+            return entry
+        
+        version = cache.version
+        try:
+            menus = (await db.scalars(select(MenuInfo).order_by(MenuInfo.menu_ordr))).all()
+        except Exception as e:
+            logger.error(f"❌ 메뉴 트리 조회 실패 - use_at: {use_at}, 오류: {str(e)}")
+            raise
+        
+        return self._cache_menu_tree(cache, version, use_at, menus)
+    
+    def _cache_menu_tree(self, cache, version: int, use_at: str, menus: List[MenuInfo]) -> MenuTreeEntry:
+        """조회한 전체 메뉴로 트리를 구성해 캐시에 저장합니다."""
+        tree = self._build_menu_tree(menus, None, use_at)
+        # response_model처럼 MenuTreeNode로 검증하여 스키마에 정의된 필드만 본문에 포함
+        body = menu_tree_adapter.dump_json(menu_tree_adapter.validate_python(tree))
+        return cache.set(use_at, version, tree, body)
+    
+    def _build_menu_tree(
+        self,
+        menus: List[MenuInfo],
+        parent_menu_id: Optional[str],
+        display_yn: str
+    ) -> List[Dict[str, Any]]:
+        """
+        메뉴 목록으로 계층형 트리를 구성합니다.
+        
+        Args:
+            menus: menu_ordr 순으로 정렬된 전체 메뉴 목록
+            parent_menu_id: 트리의 시작 상위 메뉴 ID (None이면 최상위부터)
+            display_yn: 트리에 포함할 메뉴 표시 여부
+            
+        Returns:
+            계층형 메뉴 트리
+        """
+        parent_map = {menu.menu_no: menu.upper_menu_no for menu in menus}
+        children_index: Dict[Optional[str], List[MenuInfo]] = {}
+        for menu in menus:
+            if menu.display_yn == display_yn:
+                children_index.setdefault(menu.upper_menu_no, []).append(menu)
+        
+        # 시작 메뉴의 실제 깊이 (최상위 메뉴가 1)
+        base_depth = 0
+        ancestor_id = parent_menu_id
+        visited = set()
+        while ancestor_id is not None and ancestor_id not in visited:
+            visited.add(ancestor_id)
+            base_depth += 1
+            ancestor_id = parent_map.get(ancestor_id)
+        
+        built = set()
+        
+        def build_menu_tree(parent_id: Optional[str], depth: int) -> List[Dict[str, Any]]:
+            menu_tree = []
+            for menu in children_index.get(parent_id, []):
+                # 순환 참조 데이터가 있어도 각 메뉴는 한 번만 포함
+                if menu.menu_no in built:
+                    continue
+                built.add(menu.menu_no)
+                
+                children = build_menu_tree(menu.menu_no, depth + 1)
+                menu_dict = {
+                    'id': int(menu.menu_no) if menu.menu_no.isdigit() else menu.menu_no,  # 프론트엔드가 기대하는 id 필드
+                    'name': menu.menu_nm,  # 프론트엔드가 기대하는 name 필드
+                    'menu_id': menu.menu_no,  # 기존 호환성을 위해 유지
+                    'menu_no': menu.menu_no,
+                    'menu_nm': menu.menu_nm,
+                    'path': getattr(menu, 'menu_url', None),  # 메뉴 URL이 있다면 path로 설정
+                    'icon': getattr(menu, 'menu_icon', None),  # 메뉴 아이콘이 있다면 설정
+                    'parent_id': int(menu.upper_menu_no) if menu.upper_menu_no and menu.upper_menu_no.isdigit() else menu.upper_menu_no,
+                    'order_num': menu.menu_ordr,
+                    'is_active': getattr(menu, 'use_at', 'Y') == 'Y',  # 사용 여부를 boolean으로 변환
+                    'menu_level': Decimal(depth),
+                    'menu_ordr': menu.menu_ordr,
+                    'leaf_at': 'Y' if not children else 'N',
+                    'children': children
+                }
+                menu_tree.append(menu_dict)
+            
+            return menu_tree
+        
+        return build_menu_tree(parent_menu_id, base_depth + 1)
+    
     def get_menu_breadcrumb(self, db: Session, menu_id: str) -> List[MenuInfo]:
         """
         메뉴 경로(breadcrumb) 조회
         
+        상위 경로 전체를 WITH RECURSIVE 쿼리 한 번으로 조회합니다.
+        
         Args:
             db: 데이터베이스 세션
             menu_id: 메뉴 ID
@@ -162,14 +355,8 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
         """
         try:
             breadcrumb = []
-            current_menu_id = menu_id
             
-            while current_menu_id:
-                # 매번 새로운 쿼리로 메뉴 조회
-                menu_obj = db.query(MenuInfo).filter(MenuInfo.menu_no == current_menu_id).first()
-                if not menu_obj:
-                    break
-                
+            for menu_obj in menu_hierarchy.get_ancestors(db, menu_id):
                 # 세션 바인딩 문제를 방지하기 위해 객체를 새로 생성
                 detached_menu = MenuInfo(
                     menu_no=menu_obj.menu_no,
@@ -189,10 +376,7 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
                     last_updusr_id=menu_obj.last_updusr_id
                 )
                 
-                breadcrumb.insert(0, detached_menu)
-                
-                # 상위 메뉴 ID로 이동
-                current_menu_id = menu_obj.upper_menu_no
+                breadcrumb.append(detached_menu)
             
             return breadcrumb
             
@@ -244,6 +428,46 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             logger.error(f"❌ 메뉴 검색 실패 - 오류: {str(e)}")
             raise
     
+    async def search_menus_async(
+        self, 
+        db: AsyncSession, 
+        search_term: Optional[str] = None,
+        parent_menu_id: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[MenuInfo]:
+        """
+        메뉴 검색 (비동기)
+        
+        Args:
+            db: 비동기 데이터베이스 세션
+            search_term: 검색어 (메뉴명, 설명)
+            parent_menu_id: 상위 메뉴 ID
+            skip: 건너뛸 레코드 수
+            limit: 조회할 최대 레코드 수
+            
+        Returns:
+            검색된 메뉴 목록
+        """
+        try:
+            stmt = select(MenuInfo)
+            
+            if search_term:
+                stmt = stmt.where(or_(
+                    MenuInfo.menu_nm.like(f"%{search_term}%"),
+                    MenuInfo.menu_dc.like(f"%{search_term}%")
+                ))
+            
+            if parent_menu_id:
+                stmt = stmt.where(MenuInfo.upper_menu_no == parent_menu_id)
+            
+            result = await db.scalars(stmt.order_by(MenuInfo.menu_ordr).offset(skip).limit(limit))
+            return list(result.all())
+            
+        except Exception as e:
+            logger.error(f"❌ 메뉴 검색 실패 - 오류: {str(e)}")
+            raise
+    
     def create_menu(
         self, 
         db: Session, 
@@ -276,9 +500,15 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             ).order_by(desc(MenuInfo.menu_ordr)).first()
             
             menu_order = (max_order[0] if max_order else 0) + 1
+            menu_path, menu_depth = self._build_menu_path(db, menu_data.menu_no, upper_menu_no)
             
             # 메뉴 생성
-            menu = self.create(db, menu_data, menu_ordr=menu_order, frst_register_id=user_id)
+            menu = self.create(
+                db, menu_data,
+                menu_ordr=menu_order, frst_register_id=user_id,
+                menu_path=menu_path, menu_depth=menu_depth
+            )
+            get_menu_tree_cache().bump()
             logger.info(f"✅ 메뉴 생성 완료 - menu_no: {menu.menu_no}")
             return menu
             
@@ -286,6 +516,40 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             logger.error(f"❌ 메뉴 생성 실패 - menu_no: {menu_data.menu_no}, 오류: {str(e)}")
             raise
     
+    def update(
+        self,
+        db: Session,
+        db_obj: MenuInfo,
+        obj_in: MenuInfoUpdate,
+        **kwargs
+    ) -> MenuInfo:
+        """
+        메뉴 정보 수정 (메뉴 트리 캐시 무효화 포함)
+        
+        Args:
+            db: 데이터베이스 세션
+            db_obj: 수정할 메뉴
+            obj_in: 메뉴 수정 데이터
+            **kwargs: 추가 필드 값
+            
+        Returns:
+            수정된 메뉴 정보
+        """
+        # 상위 메뉴가 바뀌면 하위 메뉴 경로까지 같은 트랜잭션에서 갱신
+        if hasattr(obj_in, 'model_dump'):
+            changes = obj_in.model_dump(exclude_unset=True)
+        else:
+            changes = {key: value for key, value in obj_in.items() if value is not None}
+        changes.update(kwargs)
+        new_parent_id = changes.get('upper_menu_no', db_obj.upper_menu_no)
+        if new_parent_id != db_obj.upper_menu_no:
+            self._rewrite_subtree_paths(db, db_obj, new_parent_id)
+            kwargs.update(menu_path=db_obj.menu_path, menu_depth=db_obj.menu_depth)
+        
+        menu = super().update(db, db_obj, obj_in, **kwargs)
+        get_menu_tree_cache().bump()
+        return menu
+    
     def move_menu(
         self, 
         db: Session, 
@@ -327,6 +591,9 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
                 ).order_by(desc(MenuInfo.menu_ordr)).first()
                 new_order = (max_order[0] if max_order else 0) + 1
             
+            # 메뉴 및 하위 메뉴 경로 갱신
+            self._rewrite_subtree_paths(db, menu, new_parent_id)
+            
             # 메뉴 업데이트
             menu.upper_menu_no = new_parent_id
             menu.menu_ordr = new_order
@@ -335,6 +602,7 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             
             db.add(menu)
             db.commit()
+            get_menu_tree_cache().bump()
             
             logger.info(f"✅ 메뉴 이동 완료 - menu_no: {menu.menu_no}, 새 상위: {new_parent_id}")
             return True
@@ -380,6 +648,7 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
                     db.add(menu)
             
             db.commit()
+            get_menu_tree_cache().bump()
             logger.info(f"✅ 메뉴 순서 업데이트 완료 - 업데이트된 메뉴 수: {len(menu_orders)}")
             return True
             
@@ -399,32 +668,22 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             메뉴 통계 정보
         """
         try:
-            from sqlalchemy import func
-            
-            # 전체 메뉴 수
-            total_menus = db.query(MenuInfo).count()
-            
-            # 활성 메뉴 수
-            active_menus = db.query(MenuInfo).filter(
-                MenuInfo.display_yn == 'Y'
-            ).count()
-            
-            # 최상위 메뉴 수
-            root_menus = db.query(MenuInfo).filter(
-                MenuInfo.upper_menu_no.is_(None)
-            ).count()
-            
-            # 하위 메뉴 수
-            child_menus = db.query(MenuInfo).filter(
-                MenuInfo.upper_menu_no.is_not(None)
-            ).count()
-            
-            # 리프 메뉴 수 (하위 메뉴가 없는 메뉴)
-            leaf_menus = db.query(MenuInfo).filter(
-                ~db.query(MenuInfo.menu_no).filter(
-                    MenuInfo.upper_menu_no == MenuInfo.menu_no
-                ).exists()
-            ).count()
+            # 전체/활성/최상위/하위/리프(하위 메뉴가 없는) 메뉴 수를 한 번에 집계
+            child = aliased(MenuInfo)
+            counts = (
+                AggregateQuery(MenuInfo)
+                .count('total_menus')
+                .count('active_menus', MenuInfo.display_yn == 'Y')
+                .count('root_menus', MenuInfo.upper_menu_no.is_(None))
+                .count('child_menus', MenuInfo.upper_menu_no.is_not(None))
+                .count('leaf_menus', ~exists().where(child.upper_menu_no == MenuInfo.menu_no))
+                .one(db)
+            )
+            total_menus = counts.total_menus
+            active_menus = counts.active_menus
+            root_menus = counts.root_menus
+            child_menus = counts.child_menus
+            leaf_menus = counts.leaf_menus
             
             # 최대 깊이 계산 (간단히 2로 설정)
             max_depth = 2 if child_menus > 0 else 1
@@ -457,14 +716,8 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
         Returns:
             하위 메뉴 여부
         """
-        current_menu = self.get_by_menu_id(db, descendant_id)
-        
-        while current_menu and current_menu.upper_menu_no:
-            if current_menu.upper_menu_no == ancestor_id:
-                return True
-            current_menu = self.get_by_menu_id(db, current_menu.upper_menu_no)
-        
-        return False
+        # 이동 검증은 다른 워커의 변경이 반영되지 않은 캐시 대신 쓰기 트랜잭션 안에서 조회
+        return menu_hierarchy.is_descendant(db, ancestor_id, descendant_id)
     
 
     
@@ -504,29 +757,188 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             logger.error(f"❌ 메뉴 데이터 검증 실패: {str(e)}")
             raise
     
-    def _get_max_child_depth(self, db: Session, menu_id: str, current_depth: int = 0) -> int:
+    def _get_max_child_depth(self, db: Session, menu_id: str) -> int:
         """
         메뉴의 최대 하위 깊이를 계산합니다.
         
         Args:
             db: 데이터베이스 세션
             menu_id: 메뉴 ID
-            current_depth: 현재 깊이
             
         Returns:
-            최대 하위 깊이
+            최대 하위 깊이 (하위 메뉴가 없으면 0)
+        """
+        # 구체화 경로가 있으면 경로 인덱스 범위 조회로 계산
+        menu = db.query(MenuInfo.menu_path, MenuInfo.menu_depth).filter(MenuInfo.menu_no == menu_id).first()
+        if menu and menu.menu_path and menu.menu_depth is not None:
+            max_depth = db.query(func.max(MenuInfo.menu_depth)).filter(
+                MenuInfo.menu_path.startswith(menu.menu_path, autoescape=True)
+            ).scalar()
+            return int(max_depth - menu.menu_depth) if max_depth is not None else 0
+        
+        return menu_hierarchy.get_max_depth(db, menu_id)
+    
+    def _get_menu_depth(self, db: Session, menu_id: str) -> int:
+        """
+        메뉴의 상위 메뉴 개수(최상위 메뉴는 0)를 계산합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            menu_id: 메뉴 ID
+            
+        Returns:
+            상위 메뉴 개수 (메뉴가 없으면 0)
+        """
+        menu_depth = db.query(MenuInfo.menu_depth).filter(MenuInfo.menu_no == menu_id).scalar()
+        if menu_depth is not None:
+            return int(menu_depth) - 1
+        
+        return max(len(menu_hierarchy.get_ancestors(db, menu_id)) - 1, 0)
+    
+    def get_menu_subtree(self, db: Session, menu_id: str) -> List[MenuInfo]:
+        """
+        메뉴와 모든 하위 메뉴 조회
+        
+        구체화 경로가 있으면 경로 인덱스 범위 조회로, 없으면 WITH RECURSIVE 쿼리로
+        조회합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            menu_id: 시작 메뉴 ID
+            
+        Returns:
+            메뉴 목록 (시작 메뉴부터 얕은 메뉴 순, 메뉴가 없으면 빈 목록)
+        """
+        menu = db.query(MenuInfo).filter(MenuInfo.menu_no == menu_id).first()
+        if menu is None:
+            return []
+        
+        if menu.menu_path and menu.menu_depth is not None:
+            return db.query(MenuInfo).filter(
+                MenuInfo.menu_path.startswith(menu.menu_path, autoescape=True)
+            ).order_by(MenuInfo.menu_depth, MenuInfo.menu_ordr).all()
+        
+        return [subtree_menu for subtree_menu, _ in menu_hierarchy.get_subtree(db, menu_id)]
+    
+    def _build_menu_path(
+        self,
+        db: Session,
+        menu_no: str,
+        upper_menu_no: Optional[str]
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """
+        상위 메뉴 경로로 메뉴의 구체화 경로와 깊이를 계산합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            menu_no: 메뉴 번호
+            upper_menu_no: 상위 메뉴 번호
+            
+        Returns:
+            (경로, 깊이) 튜플 (상위 메뉴 경로를 알 수 없으면 (None, None))
         """
-        children = db.query(MenuInfo).filter(MenuInfo.upper_menu_no == menu_id).all()
+        if not upper_menu_no:
+            return make_path(None, menu_no), 1
         
-        if not children:
-            return current_depth
+        parent = db.query(MenuInfo.menu_path, MenuInfo.menu_depth).filter(
+            MenuInfo.menu_no == upper_menu_no
+        ).first()
+        if parent is None or not parent.menu_path or parent.menu_depth is None:
+            return None, None
+        return make_path(parent.menu_path, menu_no), int(parent.menu_depth) + 1
+    
+    def _rewrite_subtree_paths(self, db: Session, menu: MenuInfo, new_parent_id: Optional[str]) -> None:
+        """
+        메뉴를 새 상위 메뉴 아래로 옮길 때 메뉴와 하위 메뉴의 경로를 한 번에 갱신합니다.
+        
+        커밋은 호출자가 수행합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            menu: 이동할 메뉴
+            new_parent_id: 새로운 상위 메뉴 ID
+        """
+        new_path, new_depth = self._build_menu_path(db, menu.menu_no, new_parent_id)
+        old_path, old_depth = menu.menu_path, menu.menu_depth
         
-        max_depth = current_depth
-        for child in children:
-            child_depth = self._get_max_child_depth(db, child.menu_no, current_depth + 1)
-            max_depth = max(max_depth, child_depth)
+        if old_path:
+            subtree = db.query(MenuInfo).filter(MenuInfo.menu_path.startswith(old_path, autoescape=True))
+            if new_path and old_depth is not None:
+                subtree.update({
+                    MenuInfo.menu_path: literal(new_path) + func.substr(MenuInfo.menu_path, len(old_path) + 1),
+                    MenuInfo.menu_depth: MenuInfo.menu_depth + (new_depth - int(old_depth))
+                }, synchronize_session=False)
+            else:
+                # 새 경로를 알 수 없으면 하위 메뉴 경로도 비워 재귀 조회로 대체
+                subtree.update({
+                    MenuInfo.menu_path: None,
+                    MenuInfo.menu_depth: None
+                }, synchronize_session=False)
         
-        return max_depth
+        menu.menu_path = new_path
+        menu.menu_depth = new_depth
+    
+    def _collect_menu_path_fixes(self, db: Session) -> Tuple[int, List[str], List[Dict[str, Any]]]:
+        """
+        전체 메뉴를 한 번에 조회해 저장된 경로와 다시 계산한 경로를 비교합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            
+        Returns:
+            (전체 수, 최상위까지 이어지지 않는 메뉴 번호 목록, bulk_update_mappings용 수정 목록)
+        """
+        rows = db.query(
+            MenuInfo.menu_no, MenuInfo.upper_menu_no, MenuInfo.menu_path, MenuInfo.menu_depth
+        ).all()
+        adjacency = AdjacencyMap.from_rows((row.menu_no, row.upper_menu_no) for row in rows)
+        
+        unreachable = []
+        updates = []
+        for row in rows:
+            expected = adjacency.get_path(row.menu_no)
+            if expected is None:
+                # 순환 참조나 없는 상위 메뉴로 끊긴 메뉴는 경로를 비워 재귀 조회로 대체
+                unreachable.append(row.menu_no)
+                expected = (None, None)
+            
+            stored_depth = int(row.menu_depth) if row.menu_depth is not None else None
+            if (row.menu_path, stored_depth) != expected:
+                updates.append({"menu_no": row.menu_no, "menu_path": expected[0], "menu_depth": expected[1]})
+        
+        return len(rows), unreachable, updates
+    
+    def check_menu_paths(self, db: Session, fix: bool = False) -> Dict[str, Any]:
+        """
+        저장된 메뉴 경로를 upper_menu_no 기준으로 다시 계산해 비교합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            fix: 불일치한 경로를 바로잡을지 여부
+            
+        Returns:
+            검사 결과 (전체 수, 불일치 메뉴, 최상위까지 이어지지 않는 메뉴, 수정 수)
+        """
+        try:
+            total_count, unreachable, updates = self._collect_menu_path_fixes(db)
+            
+            if fix and updates:
+                db.bulk_update_mappings(MenuInfo, updates)
+                db.commit()
+                get_menu_tree_cache().bump()
+            
+            logger.info(f"🔍 메뉴 경로 검사 - 전체: {total_count}, 불일치: {len(updates)}, 연결 끊김: {len(unreachable)}")
+            return {
+                "total_count": total_count,
+                "mismatched": [update["menu_no"] for update in updates],
+                "unreachable": unreachable,
+                "fixed_count": len(updates) if fix else 0
+            }
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ 메뉴 경로 검사 실패: {str(e)}")
+            raise
     
     def copy_menu(
         self, 
@@ -536,13 +948,14 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
         new_menu_nm: Optional[str] = None,
         new_parent_id: Optional[str] = None,
         copy_children: bool = False,
-        user_id: str = 'system',
-        _depth: int = 0,
-        _copied_menus: Optional[set] = None
+        user_id: str = 'system'
     ) -> MenuInfo:
         """
         메뉴 복사
         
+        하위 메뉴를 포함하면 원본 하위 트리를 한 번에 조회하고, 복사본 메뉴 ID를
+        미리 할당한 뒤 한 번의 INSERT(executemany)로 모든 복사본을 저장합니다.
+        
         Args:
             db: 데이터베이스 세션
             source_menu_id: 원본 메뉴 ID
@@ -551,67 +964,23 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             new_parent_id: 새로운 상위 메뉴 ID
             copy_children: 하위 메뉴 포함 복사 여부
             user_id: 생성자 ID
-            _depth: 재귀 깊이 (내부 사용)
-            _copied_menus: 복사된 메뉴 추적 (내부 사용)
             
         Returns:
             복사된 메뉴 객체
         """
         try:
-            # 실제 메뉴 트리 깊이 계산
-            if _depth == 0:  # 최초 호출 시에만 전체 깊이 체크
-                # 새로운 부모 메뉴의 깊이 계산
-                parent_depth = 0
-                if new_parent_id:
-                    current_parent = new_parent_id
-                    while current_parent:
-                        parent_menu = self.get_by_menu_id(db, current_parent)
-                        if parent_menu and parent_menu.upper_menu_no:
-                            parent_depth += 1
-                            current_parent = parent_menu.upper_menu_no
-                        else:
-                            break
-                
-                # 복사할 메뉴의 최대 하위 깊이 계산
-                max_child_depth = self._get_max_child_depth(db, source_menu_id)
-                total_depth = parent_depth + 1 + max_child_depth  # 부모깊이 + 현재메뉴 + 하위깊이
-                
-                logger.info(f"🔍 메뉴 복사 깊이 체크 - 부모깊이: {parent_depth}, 하위깊이: {max_child_depth}, 총깊이: {total_depth}")
-                
-                if total_depth > 10:
-                    logger.warning(f"⚠️ 메뉴 복사 깊이 제한 초과: {total_depth}")
-                    raise ValueError(f"메뉴 복사 깊이가 너무 깊습니다 (최대 10레벨, 예상: {total_depth}레벨)")
-            
-            # 재귀 호출 깊이 체크 (안전장치)
-            logger.info(f"🔍 메뉴 복사 재귀 깊이 체크 - 현재 깊이: {_depth}, 원본 메뉴: {source_menu_id}")
-            if _depth > 15:  # 재귀 호출 안전장치
-                logger.warning(f"⚠️ 메뉴 복사 재귀 깊이 제한 초과: {_depth}")
-                raise ValueError(f"메뉴 복사 재귀 깊이가 너무 깊습니다 (최대 15레벨, 현재: {_depth}레벨)")
-            
-            # 복사된 메뉴 추적 초기화
-            if _copied_menus is None:
-                _copied_menus = set()
-            
             # 자기 자신을 복사하는 것 방지
             if source_menu_id == new_parent_id:
                 logger.warning(f"⚠️ 자기 자신을 복사하려고 시도: {source_menu_id}")
                 raise ValueError(f"자기 자신을 복사할 수 없습니다: {source_menu_id}")
             
-            # 순환 참조 방지
-            if source_menu_id in _copied_menus:
-                logger.warning(f"⚠️ 순환 참조 감지: {source_menu_id}")
-                raise ValueError(f"순환 참조가 감지되었습니다: {source_menu_id}")
-            
-            # 현재 메뉴를 복사된 목록에 추가
-            _copied_menus.add(source_menu_id)
             # 원본 메뉴 조회
             source_menu = self.get_by_menu_id(db, source_menu_id)
             if not source_menu:
                 raise ValueError(f"원본 메뉴를 찾을 수 없습니다: {source_menu_id}")
             
-            # 새로운 메뉴 ID 중복 확인
-            existing_menu = self.get_by_menu_id(db, new_menu_id)
-            if existing_menu:
+            # 새로운 메뉴 ID 중복 확인 (표시 여부와 관계없이)
+            if db.query(MenuInfo.menu_no).filter(MenuInfo.menu_no == new_menu_id).first():
                 raise ValueError(f"이미 존재하는 메뉴 ID입니다: {new_menu_id}")
             
             # 새로운 상위 메뉴 존재 확인
@@ -620,68 +989,117 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
                 if not parent_menu:
                     raise ValueError(f"상위 메뉴를 찾을 수 없습니다: {new_parent_id}")
             
-            # 새로운 순서 계산
+            # 복사할 하위 트리를 한 번에 조회하고 원본 기준 상대 깊이 계산 (얕은 메뉴부터 정렬됨)
+            subtree = self.get_menu_subtree(db, source_menu_id) if copy_children else [source_menu]
+            relative_depths = {source_menu_id: 0}
+            for menu in subtree[1:]:
+                if menu.upper_menu_no in relative_depths and menu.menu_no not in relative_depths:
+                    relative_depths[menu.menu_no] = relative_depths[menu.upper_menu_no] + 1
+            max_child_depth = max(relative_depths.values())
+            
+            # 재귀 깊이 체크 (안전장치, 순환 참조 데이터는 재귀 조회 상한까지 내려가므로 여기서 걸림)
+            if max_child_depth > 15:
+                logger.warning(f"⚠️ 메뉴 복사 재귀 깊이 제한 초과: {max_child_depth}")
+                raise ValueError(f"메뉴 복사 재귀 깊이가 너무 깊습니다 (최대 15레벨, 현재: {max_child_depth}레벨)")
+            
+            # 실제 메뉴 트리 깊이 체크: 부모깊이 + 현재메뉴 + 하위깊이
+            parent_depth = self._get_menu_depth(db, new_parent_id) if new_parent_id else 0
+            total_depth = parent_depth + 1 + max_child_depth
+            logger.info(f"🔍 메뉴 복사 깊이 체크 - 부모깊이: {parent_depth}, 하위깊이: {max_child_depth}, 총깊이: {total_depth}")
+            if total_depth > 10:
+                logger.warning(f"⚠️ 메뉴 복사 깊이 제한 초과: {total_depth}")
+                raise ValueError(f"메뉴 복사 깊이가 너무 깊습니다 (최대 10레벨, 예상: {total_depth}레벨)")
+            
+            # 새로운 순서 계산 (하위 메뉴는 원본 순서 유지)
             max_order = db.query(MenuInfo.menu_ordr).filter(
                 MenuInfo.upper_menu_no == new_parent_id
             ).order_by(desc(MenuInfo.menu_ordr)).first()
             new_order = (max_order[0] if max_order else 0) + 1
-            
-            # 메뉴 복사
-            copied_menu = MenuInfo(
-                menu_no=new_menu_id,
-                menu_nm=new_menu_nm or source_menu.menu_nm,
-                upper_menu_no=new_parent_id,
-                menu_ordr=new_order,
-                menu_dc=source_menu.menu_dc,
-                progrm_file_nm=source_menu.progrm_file_nm,
-                display_yn=source_menu.display_yn,
-                use_tag_yn=source_menu.use_tag_yn,
-                relate_image_path=source_menu.relate_image_path,
-                relate_image_nm=source_menu.relate_image_nm,
-                menu_tag=source_menu.menu_tag,
-                frst_register_id=user_id,
-                frst_regist_pnttm=datetime.now(),
-                last_updusr_id=user_id,
-                last_updt_pnttm=datetime.now()
-            )
-            
-            db.add(copied_menu)
-            db.flush()  # ID 생성을 위해 flush
-            
-            # 하위 메뉴 복사 (재귀적)
-            if copy_children:
-                children = db.query(MenuInfo).filter(
-                    MenuInfo.upper_menu_no == source_menu_id
-                ).all()
+            menu_path, menu_depth = self._build_menu_path(db, new_menu_id, new_parent_id)
+            
+            # 원본 메뉴 ID -> 복사본 메뉴 ID
+            children = [menu for menu in subtree[1:] if menu.menu_no in relative_depths]
+            new_ids = {source_menu_id: new_menu_id}
+            new_ids.update(zip(
+                (menu.menu_no for menu in children),
+                self._allocate_copy_ids(db, new_menu_id, len(children))
+            ))
+            copied_paths = {new_menu_id: menu_path}
+            
+            now = datetime.now()
+            rows = []
+            for menu in [source_menu] + children:
+                copied_id = new_ids[menu.menu_no]
+                if menu.menu_no == source_menu_id:
+                    copied_parent_id = new_parent_id
+                    copied_path = menu_path
+                    copied_depth = menu_depth
+                else:
+                    copied_parent_id = new_ids[menu.upper_menu_no]
+                    parent_path = copied_paths[copied_parent_id]
+                    copied_path = make_path(parent_path, copied_id) if parent_path else None
+                    copied_depth = menu_depth + relative_depths[menu.menu_no] if copied_path else None
+                copied_paths[copied_id] = copied_path
                 
-                for i, child in enumerate(children):
-                    # 고유한 새 메뉴 ID 생성 (타임스탬프 포함)
-                    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-                    child_new_id = f"{new_menu_id}_{i+1:03d}_{timestamp[-6:]}"
-                    
-                    # 재귀 호출 시 깊이와 추적 정보 전달
-                    self.copy_menu(
-                        db=db,
-                        source_menu_id=child.menu_no,
-                        new_menu_id=child_new_id,
-                        new_menu_nm=child.menu_nm,
-                        new_parent_id=new_menu_id,
-                        copy_children=True,
-                        user_id=user_id,
-                        _depth=_depth + 1,
-                        _copied_menus=_copied_menus.copy()  # 복사본 전달
-                    )
-            
+                rows.append({
+                    "menu_no": copied_id,
+                    "menu_nm": (new_menu_nm or menu.menu_nm) if copied_id == new_menu_id else menu.menu_nm,
+                    "upper_menu_no": copied_parent_id,
+                    "menu_ordr": new_order if copied_id == new_menu_id else menu.menu_ordr,
+                    "menu_dc": menu.menu_dc,
+                    "progrm_file_nm": menu.progrm_file_nm,
+                    "display_yn": menu.display_yn,
+                    "use_tag_yn": menu.use_tag_yn,
+                    "relate_image_path": menu.relate_image_path,
+                    "relate_image_nm": menu.relate_image_nm,
+                    "menu_tag": menu.menu_tag,
+                    "menu_path": copied_path,
+                    "menu_depth": copied_depth,
+                    "frst_register_id": user_id,
+                    "frst_regist_pnttm": now,
+                    "last_updusr_id": user_id,
+                    "last_updt_pnttm": now
+                })
+            
+            # 상위 메뉴가 먼저 오도록 정렬된 행을 한 번에 저장
+            db.execute(insert(MenuInfo), rows)
             db.commit()
+            get_menu_tree_cache().bump()
             
-            logger.info(f"✅ 메뉴 복사 완료 - 원본: {source_menu_id}, 복사본: {new_menu_id}")
-            return copied_menu
+            logger.info(f"✅ 메뉴 복사 완료 - 원본: {source_menu_id}, 복사본: {new_menu_id}, 메뉴 수: {len(rows)}")
+            return db.query(MenuInfo).filter(MenuInfo.menu_no == new_menu_id).first()
             
         except Exception as e:
             db.rollback()
             logger.error(f"❌ 메뉴 복사 실패 - 원본: {source_menu_id}, 오류: {str(e)}")
             raise
     
+    def _allocate_copy_ids(self, db: Session, new_menu_id: str, count: int) -> List[str]:
+        """
+        하위 메뉴 복사본 ID를 미리 할당합니다.
+        
+        "{새 메뉴 ID}_{일련번호}" 후보 중 이미 사용 중인 ID를 한 번에 조회해 건너뜁니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            new_menu_id: 복사본 최상위 메뉴 ID
+            count: 할당할 ID 개수
+            
+        Returns:
+            충돌 없는 메뉴 ID 목록
+        """
+        allocated = []
+        sequence = 0
+        while len(allocated) < count:
+            candidates = [f"{new_menu_id}_{sequence + i + 1:03d}" for i in range(count - len(allocated))]
+            sequence += len(candidates)
+            taken = {
+                row.menu_no for row in
+                db.query(MenuInfo.menu_no).filter(MenuInfo.menu_no.in_(candidates)).all()
+            }
+            allocated.extend(candidate for candidate in candidates if candidate not in taken)
+        return allocated
+    
     def soft_delete(self, db: Session, menu_id: str, user_id: str) -> Optional[MenuInfo]:
         """
         메뉴 논리적 삭제 (display_yn을 'N'으로 설정)
@@ -706,6 +1124,7 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
                 db.add(menu)
                 db.commit()
                 db.refresh(menu)
+                get_menu_tree_cache().bump()
                 
                 logger.info(f"✅ 메뉴 논리적 삭제 완료 - menu_id: {menu_id}")
                 return menu
@@ -716,84 +1135,81 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             logger.error(f"❌ 메뉴 논리적 삭제 실패 - menu_id: {menu_id}, 오류: {str(e)}")
             raise
     
-    def export_menu_data(self, db: Session, format: str = "json", include_inactive: bool = False) -> Dict[str, Any]:
+    def export_menu_data(
+        self,
+        db: Session,
+        format: str = "json",
+        include_inactive: bool = False,
+        compress: bool = False,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ) -> Iterator[bytes]:
         """메뉴 데이터 내보내기
         
+        메뉴를 서버 측 커서로 batch_size 건씩 읽어 바로 인코딩하므로 메뉴 수와
+        관계없이 메모리 사용량이 일정하고 임시 파일을 만들지 않습니다.
+        조회는 반환된 이터레이터를 소비할 때 시작됩니다.
+        
         Args:
             db: 데이터베이스 세션
-            format: 내보내기 형식
+            format: 내보내기 형식 (json, ndjson, csv)
             include_inactive: 비활성 메뉴 포함 여부
+            compress: gzip 압축 여부
+            batch_size: 한 번에 가져올 행 수
             
         Returns:
-            내보내기 데이터
+            내보내기 파일 바이트 청크 이터레이터
+            
+        Raises:
+            ValueError: 지원하지 않는 형식
         """
+        chunks = encode_records(
+            self._iter_export_rows(db, include_inactive, batch_size),
+            format,
+            EXPORT_FIELDS,
+            metadata={"format": format, "export_time": datetime.now().isoformat()}
+        )
+        return gzip_chunks(chunks) if compress else chunks
+    
+    def _iter_export_rows(self, db: Session, include_inactive: bool, batch_size: int) -> Iterator[Dict[str, Any]]:
+        """내보낼 메뉴 행을 서버 측 커서로 batch_size 건씩 읽습니다."""
+        query = db.query(*[getattr(MenuInfo, field) for field in EXPORT_FIELDS])
+        
+        if not include_inactive:
+            query = query.filter(MenuInfo.display_yn == 'Y')
+        
+        count = 0
         try:
-            query = db.query(MenuInfo)
-            
-            if not include_inactive:
-                query = query.filter(MenuInfo.display_yn == 'Y')
-            
-            menus = query.all()
-            
-            # 임시 파일 생성 및 데이터 저장
-            import uuid
-            import json
-            import os
-            from datetime import timedelta
-            
-            export_id = str(uuid.uuid4())
-            file_name = f"menu_export_{export_id[:8]}.json"
-            file_path = os.path.join("uploads", file_name)
-            
-            export_data = {
-                "format": format,
-                "export_time": datetime.now().isoformat(),
-                "total_count": len(menus),
-                "data": []
-            }
-            
-            for menu in menus:
-                menu_dict = {
-                    "menu_no": menu.menu_no,
-                    "menu_nm": menu.menu_nm,
-                    "upper_menu_no": menu.upper_menu_no,
-                    "progrm_file_nm": menu.progrm_file_nm,
-                    "menu_dc": menu.menu_dc,
-                    "menu_ordr": str(menu.menu_ordr),
-                    "display_yn": menu.display_yn,
-                    "relate_image_path": menu.relate_image_path,
-                    "relate_image_nm": menu.relate_image_nm
-                }
-                export_data["data"].append(menu_dict)
-            
-            # 파일 저장
-            os.makedirs("uploads", exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
-            
-            file_size = os.path.getsize(file_path)
-            expires_at = datetime.now() + timedelta(hours=24)
-            
-            return {
-                "export_id": export_id,
-                "file_name": file_name,
-                "file_size": file_size,
-                "download_url": f"/api/v1/files/download/{file_name}",
-                "expires_at": expires_at
-            }
-            
+            for row in query.order_by(MenuInfo.menu_no).yield_per(batch_size):
+                count += 1
+                yield row._asdict()
         except Exception as e:
             logger.error(f"❌ 메뉴 데이터 내보내기 실패: {str(e)}")
             raise
+        
+        logger.info(f"📤 메뉴 데이터 내보내기 완료 - {count}건")
     
-    def import_menu_data(self, db: Session, data: List[Dict], format: str = "json", overwrite: bool = False) -> Dict[str, Any]:
+    def import_menu_data(
+        self,
+        db: Session,
+        data: Iterable[Dict],
+        format: str = "json",
+        overwrite: bool = False,
+        validate_only: bool = False,
+        chunk_size: int = IMPORT_CHUNK_SIZE
+    ) -> Dict[str, Any]:
         """메뉴 데이터 가져오기
         
+        기존 메뉴 키를 한 번에 조회한 뒤 상위 메뉴 참조와 순환 참조를 메모리에서
+        검증하고, 통과한 행을 상위 메뉴부터 chunk_size 단위 UPSERT로 저장합니다.
+        data는 리스트뿐 아니라 record_stream의 스트리밍 리더 같은 이터러블도 받습니다.
+        
         Args:
             db: 데이터베이스 세션
             data: 가져올 데이터
             format: 데이터 형식
             overwrite: 덮어쓰기 여부
+            validate_only: 검증만 수행하고 저장하지 않을지 여부
+            chunk_size: UPSERT 한 번에 저장할 행 수
             
         Returns:
             가져오기 결과
@@ -805,36 +1221,100 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
                 "errors": []
             }
             
+            def reject(message: str) -> None:
+                result["error_count"] += 1
+                result["errors"].append(message)
+            
+            # 기존 메뉴 키와 상위 관계를 한 번에 조회
+            existing_parents = dict(db.query(MenuInfo.menu_no, MenuInfo.upper_menu_no).all())
+            
+            accepted: Dict[str, Dict[str, Any]] = {}
             for menu_data in data:
                 try:
-                    existing_menu = self.get_by_menu_id(db, menu_data["menu_no"])
-                    
-                    if existing_menu and not overwrite:
-                        result["error_count"] += 1
-                        result["errors"].append(f"메뉴 번호가 이미 존재합니다: {menu_data['menu_no']}")
+                    row = self._normalize_import_row(menu_data)
+                except Exception as e:
+                    menu_no = menu_data.get('menu_no', 'Unknown') if isinstance(menu_data, dict) else 'Unknown'
+                    reject(f"메뉴 처리 실패 {menu_no}: {str(e)}")
+                    continue
+                
+                menu_no = row["menu_no"]
+                if menu_no in existing_parents and not overwrite:
+                    reject(f"메뉴 번호가 이미 존재합니다: {menu_no}")
+                    continue
+                if menu_no in accepted:
+                    reject(f"메뉴 번호가 중복되었습니다: {menu_no}")
+                    continue
+                if menu_no not in existing_parents:
+                    missing = [field for field in IMPORT_REQUIRED_FIELDS if row.get(field) is None]
+                    if missing:
+                        reject(f"메뉴 처리 실패 {menu_no}: 필수 항목 누락 ({', '.join(missing)})")
                         continue
-                    
-                    if existing_menu and overwrite:
-                        # 기존 메뉴 업데이트
-                        for key, value in menu_data.items():
-                            if hasattr(existing_menu, key):
-                                setattr(existing_menu, key, value)
-                        existing_menu.last_updt_pnttm = datetime.now()
-                        db.add(existing_menu)
+                accepted[menu_no] = row
+            
+            # 가져온 뒤의 상위 관계로 상위 메뉴 존재 여부와 순환 참조를 검증
+            parents = dict(existing_parents)
+            for menu_no, row in accepted.items():
+                parents[menu_no] = row.get("upper_menu_no", existing_parents.get(menu_no))
+            merged = AdjacencyMap(parents)
+            
+            # 행을 거부하면 그 하위 행의 상위 메뉴가 사라질 수 있으므로 변화가 없을 때까지 반복
+            rejected = True
+            while rejected:
+                rejected = False
+                for menu_no in list(accepted):
+                    upper_menu_no = parents[menu_no]
+                    if upper_menu_no is not None and upper_menu_no not in parents:
+                        reject(f"메뉴 처리 실패 {menu_no}: 상위 메뉴를 찾을 수 없습니다: {upper_menu_no}")
+                    elif merged.get_path(menu_no) is None:
+                        reject(f"메뉴 처리 실패 {menu_no}: 순환 참조가 감지되었습니다")
                     else:
-                        # 새 메뉴 생성
-                        new_menu = MenuInfo(**menu_data)
-                        new_menu.frst_regist_pnttm = datetime.now()
-                        new_menu.last_updt_pnttm = datetime.now()
-                        db.add(new_menu)
-                    
-                    result["success_count"] += 1
+                        continue
                     
-                except Exception as e:
-                    result["error_count"] += 1
-                    result["errors"].append(f"메뉴 처리 실패 {menu_data.get('menu_no', 'Unknown')}: {str(e)}")
+                    del accepted[menu_no]
+                    if menu_no in existing_parents:
+                        parents[menu_no] = existing_parents[menu_no]
+                    else:
+                        del parents[menu_no]
+                    rejected = True
+            
+            result["success_count"] = len(accepted)
+            if validate_only or not accepted:
+                return result
+            
+            # 경로를 함께 기록하고, 새 메뉴는 INSERT 한 문장에 넣을 수 있도록 컬럼 구성을 맞춤
+            now = datetime.now()
+            new_rows = []
+            updated_rows = []
+            for menu_no, row in accepted.items():
+                row["menu_path"], row["menu_depth"] = merged.get_path(menu_no)
+                row["last_updt_pnttm"] = now
+                if menu_no in existing_parents:
+                    updated_rows.append(row)
+                else:
+                    row.setdefault("display_yn", 'Y')
+                    row.setdefault("use_tag_yn", 'N')
+                    row.setdefault("frst_regist_pnttm", now)
+                    new_rows.append(row)
+            
+            new_columns = {key for row in new_rows for key in row}
+            new_rows = [{key: row.get(key) for key in new_columns} for row in new_rows]
+            
+            # 상위 메뉴가 먼저 저장되도록 깊이순으로 정렬해 chunk_size 단위로 저장
+            new_rows.sort(key=lambda row: row["menu_depth"])
+            for start in range(0, len(new_rows), chunk_size):
+                self._upsert_menu_rows(db, new_rows[start:start + chunk_size], overwrite)
+            for start in range(0, len(updated_rows), chunk_size):
+                db.execute(update(MenuInfo), updated_rows[start:start + chunk_size])
+            
+            # 기존 메뉴의 상위 메뉴가 바뀌었으면 가져오지 않은 하위 메뉴 경로도 다시 계산
+            if any(menu_no in existing_parents and parents[menu_no] != existing_parents[menu_no] for menu_no in accepted):
+                _, _, path_updates = self._collect_menu_path_fixes(db)
+                if path_updates:
+                    db.bulk_update_mappings(MenuInfo, path_updates)
             
             db.commit()
+            get_menu_tree_cache().bump()
+            logger.info(f"✅ 메뉴 데이터 가져오기 완료 - 성공: {result['success_count']}, 실패: {result['error_count']}")
             return result
             
         except Exception as e:
@@ -842,6 +1322,86 @@ class MenuInfoService(BaseService[MenuInfo, MenuInfoCreate, MenuInfoUpdate]):
             logger.error(f"❌ 메뉴 데이터 가져오기 실패: {str(e)}")
             raise
     
+    def _normalize_import_row(self, menu_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        가져올 메뉴 데이터를 컬럼 타입에 맞게 변환합니다.
+        
+        모델에 없는 키와 경로 컬럼(다시 계산됨)은 버리고, 빈 문자열은 None으로,
+        숫자/일시 문자열은 Decimal/datetime으로 변환합니다 (CSV 대응).
+        
+        Args:
+            menu_data: 가져올 메뉴 데이터
+            
+        Returns:
+            컬럼명 -> 값 딕셔너리
+            
+        Raises:
+            ValueError: 메뉴 번호가 없거나 값을 변환할 수 없는 경우
+        """
+        if not isinstance(menu_data, dict):
+            raise ValueError("메뉴 데이터는 객체여야 합니다")
+        
+        row = {}
+        for column in MenuInfo.__table__.columns:
+            if column.name not in menu_data or column.name in ("menu_path", "menu_depth"):
+                continue
+            value = menu_data[column.name]
+            if value == "":
+                value = None
+            elif value is not None:
+                if isinstance(column.type, Numeric):
+                    value = Decimal(str(value))
+                elif isinstance(column.type, DateTime):
+                    value = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+                else:
+                    value = str(value)
+            row[column.name] = value
+        
+        if not row.get("menu_no"):
+            raise ValueError("메뉴 번호(menu_no)가 없습니다")
+        return row
+    
+    def _upsert_menu_rows(self, db: Session, rows: List[Dict[str, Any]], overwrite: bool) -> None:
+        """
+        컬럼 구성이 같은 새 메뉴 행을 한 번의 INSERT ... ON CONFLICT로 저장합니다.
+        
+        사전 조회 이후 다른 요청이 같은 메뉴 번호를 먼저 저장한 경우 overwrite에 따라
+        덮어쓰거나 건너뜁니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            rows: 저장할 행 목록
+            overwrite: 이미 존재하는 메뉴를 덮어쓸지 여부 (False면 건너뜀)
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        else:
+            # ON CONFLICT를 지원하지 않는 DB는 기존 여부로 나눠 일괄 저장
+            existing = {
+                row.menu_no for row in
+                db.query(MenuInfo.menu_no).filter(MenuInfo.menu_no.in_([row["menu_no"] for row in rows])).all()
+            }
+            db.bulk_insert_mappings(MenuInfo, [row for row in rows if row["menu_no"] not in existing])
+            if overwrite:
+                db.bulk_update_mappings(MenuInfo, [row for row in rows if row["menu_no"] in existing])
+            return
+        
+        statement = upsert(MenuInfo.__table__).values(rows)
+        if overwrite:
+            statement = statement.on_conflict_do_update(
+                index_elements=[MenuInfo.menu_no],
+                set_={
+                    key: statement.excluded[key] for key in rows[0]
+                    if key not in ("menu_no", "frst_regist_pnttm", "frst_register_id")
+                }
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=[MenuInfo.menu_no])
+        db.execute(statement)
+    
     def validate_menu_data(self, db: Session, menu_data: MenuInfoCreate) -> dict:
         """
         메뉴 데이터를 검증합니다.
@@ -3,16 +3,21 @@
 시스템 로그, 웹 로그, 프로그램 목록 관련 CRUD 및 비즈니스 로직을 처리합니다.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from datetime import datetime, timedelta, date
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import Numeric, and_, or_, func, desc, asc, text
+from sqlalchemy import and_, or_, func, desc, asc, select, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import Select
 from fastapi import HTTPException, status
 import psutil
 import time
 
+from app.database.partitioning import cleanup_log_table
+from app.database.aggregates import AggregateQuery
+from app.database.export import DEFAULT_BATCH_SIZE, iter_rows
+from app.database.rollups import GRAIN_DAY, SYSLOG_ROLLUP, WEBLOG_ROLLUP, rollup_dimension, rollup_source
 from app.models.system_models import SysLog, WebLog, ProgrmList
 from app.models.user_models import UserInfo
 from app.schemas.system_schemas import (
@@ -24,10 +29,43 @@ from app.schemas.system_schemas import (
 )
 from app.services.base_service import BaseService
 from app.utils.auth import logger
+from app.utils.record_stream import encode_records, gzip_chunks
 
 # 시스템 시작 시간 (서버 가동시간 계산용)
 SYSTEM_START_TIME = time.time()
 
+# 오류로 집계하는 처리구분코드
+ERROR_PROCESS_CODES = ['ERROR', 'EXCEPTION', 'FAIL']
+
+# 내보내기 필드 (CSV 헤더 순서)
+SYSLOG_EXPORT_FIELDS = [
+    'requst_id', 'occrrnc_de', 'job_se_code', 'instt_code', 'rqester_ip', 'rqester_id',
+    'trget_menu_nm', 'svc_nm', 'method_nm', 'process_se_code', 'process_co', 'process_time',
+    'rspns_code', 'error_se', 'error_co', 'error_code'
+]
+WEBLOG_EXPORT_FIELDS = [
+    'requst_id', 'rqest_de', 'url', 'rqester_id', 'rqester_ip', 'rqester_nm',
+    'trget_menu_nm', 'process_se_code', 'process_cn', 'process_time'
+]
+
+
+def _export_chunks(
+    db: Session,
+    statement: Select,
+    fields: List[str],
+    format: str,
+    compress: bool,
+    batch_size: int
+) -> Iterator[bytes]:
+    """조회 결과를 서버 측 커서로 읽어 형식에 맞게 인코딩(필요하면 gzip 압축)한 바이트 청크"""
+    chunks = encode_records(
+        iter_rows(db, statement, batch_size),
+        format,
+        fields,
+        metadata={"format": format, "export_time": datetime.now().isoformat()}
+    )
+    return gzip_chunks(chunks) if compress else chunks
+
 
 class SysLogService(BaseService[SysLog, SysLogCreate, SysLogUpdate]):
     """시스템 로그 서비스 클래스"""
@@ -69,7 +107,7 @@ class SysLogService(BaseService[SysLog, SysLogCreate, SysLogUpdate]):
         obj_data = obj_in.model_dump()
         obj_data["frst_regist_pnttm"] = datetime.now()
         obj_data["frst_register_id"] = current_user_id
-        obj_data["occrrnc_de"] = obj_data.get("occrrnc_de", datetime.now())
+        obj_data["occrrnc_de"] = obj_data.get("occrrnc_de") or datetime.now()
         
         db_obj = SysLog(**obj_data)
         db.add(db_obj)
@@ -220,94 +258,91 @@ class SysLogService(BaseService[SysLog, SysLogCreate, SysLogUpdate]):
                 detail=f"시스템 로그 삭제 중 오류가 발생했습니다: {str(e)}"
             )
     
+    def cleanup_old_logs(self, db: Session, days_to_keep: int = 90, mode: Optional[str] = None) -> Dict[str, Any]:
+        """시스템 로그 정리 (보관 기간이 지난 월별 파티션은 DROP/DETACH)"""
+        return cleanup_log_table(db, SysLog.__table__, days_to_keep, mode)
+    
+    def export_statement(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Select:
+        """내보낼 시스템 로그 조회문 (종료일자 포함, 최근 로그부터)"""
+        statement = select(*[getattr(SysLog, field) for field in SYSLOG_EXPORT_FIELDS])
+        if start_date:
+            statement = statement.where(SysLog.occrrnc_de >= datetime.combine(start_date, datetime.min.time()))
+        if end_date:
+            statement = statement.where(SysLog.occrrnc_de < datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
+        return statement.order_by(desc(SysLog.occrrnc_de))
+    
+    def export_logs(
+        self,
+        db: Session,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        format: str = "csv",
+        compress: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[bytes]:
+        """시스템 로그 내보내기 (서버 측 커서로 읽어 바로 인코딩하는 바이트 청크, 형식 오류는 ValueError)"""
+        return _export_chunks(db, self.export_statement(start_date, end_date), SYSLOG_EXPORT_FIELDS, format, compress, batch_size)
+    
     def get_log_statistics(self, db: Session, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> LogStatistics:
-        """로그 통계 조회"""
+        """로그 통계 조회 (시간별 집계에서 조회, 집계되지 않은 구간만 원본 조회)"""
         if start_date is None:
             start_date = datetime.now() - timedelta(days=30)
         if end_date is None:
             end_date = datetime.now()
         
-        # 전체 요청 수
-        total_requests = db.query(func.count(SysLog.requst_id)).filter(
-            SysLog.occrrnc_de >= start_date
-        ).scalar() or 0
-        
-        # 고유 사용자 수
-        unique_users = db.query(
-            func.count(func.distinct(SysLog.rqester_id))
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.rqester_id.isnot(None)
-            )
-        ).scalar() or 0
+        stats = rollup_source(db, SYSLOG_ROLLUP, start_date, end_date)
+        
+        # 전체/오류 요청 수, 고유 사용자 수, 처리시간 합계를 한 번에 집계
+        counts = (
+            AggregateQuery(stats)
+            .sum('total_requests', stats.c.log_co)
+            .sum('error_requests', stats.c.log_co, stats.c.process_se_code.in_(ERROR_PROCESS_CODES))
+            .count_distinct('unique_users', rollup_dimension(stats.c.rqester_id))
+            .sum('process_time_sum', stats.c.process_time_sum)
+            .sum('process_time_count', stats.c.process_time_co)
+            .one(db)
+        )
+        total_requests = counts.total_requests
+        unique_users = counts.unique_users
         
         # 시간별 요청 수
-        hourly_requests = db.query(
-            func.extract('hour', SysLog.occrrnc_de).label('hour'),
-            func.count(SysLog.requst_id).label('count')
-        ).filter(
-            SysLog.occrrnc_de >= start_date
-        ).group_by(
-            func.extract('hour', SysLog.occrrnc_de)
-        ).all()
+        hour = func.extract('hour', stats.c.stats_pnttm)
+        hourly_requests = AggregateQuery(stats).sum('count', stats.c.log_co).group_by(hour.label('hour')).all(db)
         requests_by_hour = {str(int(hour)): count for hour, count in hourly_requests}
         
         # 메뉴별 요청 수
-        menu_requests = db.query(
-            SysLog.trget_menu_nm,
-            func.count(SysLog.requst_id).label('count')
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.trget_menu_nm.isnot(None)
-            )
-        ).group_by(SysLog.trget_menu_nm).all()
+        menu_requests = (
+            AggregateQuery(stats, stats.c.trget_menu_nm != '')
+            .sum('count', stats.c.log_co)
+            .group_by(stats.c.trget_menu_nm)
+            .all(db)
+        )
         requests_by_menu = {menu: count for menu, count in menu_requests}
         
         # 처리구분별 요청 수
-        process_requests = db.query(
-            SysLog.process_se_code,
-            func.count(SysLog.requst_id).label('count')
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.process_se_code.isnot(None)
-            )
-        ).group_by(SysLog.process_se_code).all()
+        process_requests = (
+            AggregateQuery(stats, stats.c.process_se_code != '')
+            .sum('count', stats.c.log_co)
+            .group_by(stats.c.process_se_code)
+            .all(db)
+        )
         requests_by_process_type = {process: count for process, count in process_requests}
         
-        # 평균 처리시간 (문자열을 숫자로 변환하여 계산)
-        try:
-            avg_process_time_result = db.query(
-                func.avg(func.cast(SysLog.process_time, Numeric))
-            ).filter(
-                and_(
-                    SysLog.occrrnc_de >= start_date,
-                    SysLog.process_time.isnot(None),
-                    SysLog.process_time != '',
-                    func.length(SysLog.process_time) > 0
-                )
-            ).scalar()
-            avg_process_time = float(avg_process_time_result) if avg_process_time_result else 0.0
-        except Exception as e:
-            logger.warning(f"평균 처리시간 계산 중 오류: {e}")
+        # 평균 처리시간 (처리시간 합계 / 처리시간이 기록된 로그 수)
+        if counts.process_time_count:
+            avg_process_time = float(counts.process_time_sum) / counts.process_time_count
+        else:
             avg_process_time = 0.0
         
         # 상위 사용자 목록
-        top_users = db.query(
-            SysLog.rqester_id,
-            func.count(SysLog.requst_id).label('request_count')
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.rqester_id.is_not(None)
-            )
-        ).group_by(
-            SysLog.rqester_id
-        ).order_by(
-            desc('request_count')
-        ).limit(10).all()
+        top_users = (
+            AggregateQuery(stats, stats.c.rqester_id != '')
+            .sum('request_count', stats.c.log_co)
+            .group_by(stats.c.rqester_id)
+            .order_by(desc('request_count'))
+            .limit(10)
+            .all(db)
+        )
         
         top_users_list = [
             {
@@ -319,14 +354,7 @@ class SysLogService(BaseService[SysLog, SysLogCreate, SysLogUpdate]):
         ]
         
         # 오류율 계산
-        error_requests = db.query(func.count(SysLog.requst_id)).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.process_se_code.in_(['ERROR', 'EXCEPTION', 'FAIL'])
-            )
-        ).scalar() or 0
-        
-        error_rate = (error_requests / total_requests * 100) if total_requests > 0 else 0.0
+        error_rate = (counts.error_requests / total_requests * 100) if total_requests > 0 else 0.0
         
         return LogStatistics(
             total_requests=total_requests,
@@ -399,7 +427,7 @@ class WebLogService(BaseService[WebLog, WebLogCreate, WebLogUpdate]):
         obj_data = obj_in.model_dump()
         obj_data["frst_regist_pnttm"] = datetime.now()
         obj_data["frst_register_id"] = current_user_id
-        obj_data["rqest_de"] = obj_data.get("rqest_de", datetime.now())
+        obj_data["rqest_de"] = obj_data.get("rqest_de") or datetime.now()
         
         db_obj = WebLog(**obj_data)
         db.add(db_obj)
@@ -477,18 +505,16 @@ class WebLogService(BaseService[WebLog, WebLogCreate, WebLogUpdate]):
         if end_date is None:
             end_date = datetime.now()
         
-        popular_pages = db.query(
-            WebLog.trget_menu_nm,
-            func.count(WebLog.requst_id).label('visit_count')
-        ).filter(
-            and_(
-                WebLog.rqest_de >= start_date,
-                WebLog.rqest_de <= end_date,
-                WebLog.trget_menu_nm.isnot(None)
-            )
-        ).group_by(WebLog.trget_menu_nm).order_by(
-            desc('visit_count')
-        ).limit(limit).all()
+        stats = rollup_source(db, WEBLOG_ROLLUP, start_date, end_date, GRAIN_DAY)
+        
+        popular_pages = (
+            AggregateQuery(stats, stats.c.trget_menu_nm != '')
+            .sum('visit_count', stats.c.log_co)
+            .group_by(stats.c.trget_menu_nm)
+            .order_by(desc('visit_count'))
+            .limit(limit)
+            .all(db)
+        )
         
         return [
             {"menu_name": menu_name, "visit_count": count}
@@ -503,17 +529,16 @@ class WebLogService(BaseService[WebLog, WebLogCreate, WebLogUpdate]):
         start_date = datetime.combine(target_date, datetime.min.time())
         end_date = start_date + timedelta(days=1)
         
-        hourly_traffic = db.query(
-            func.extract('hour', WebLog.rqest_de).label('hour'),
-            func.count(WebLog.requst_id).label('request_count')
-        ).filter(
-            and_(
-                WebLog.rqest_de >= start_date,
-                WebLog.rqest_de < end_date
-            )
-        ).group_by(
-            func.extract('hour', WebLog.rqest_de)
-        ).order_by('hour').all()
+        stats = rollup_source(db, WEBLOG_ROLLUP, start_date, end_date, include_end=False)
+        hour = func.extract('hour', stats.c.stats_pnttm)
+        
+        hourly_traffic = (
+            AggregateQuery(stats)
+            .sum('request_count', stats.c.log_co)
+            .group_by(hour.label('hour'))
+            .order_by(hour)
+            .all(db)
+        )
         
         return [
             {"hour": int(hour), "request_count": count}
@@ -562,7 +587,7 @@ class WebLogService(BaseService[WebLog, WebLogCreate, WebLogUpdate]):
         """오류 웹 로그 조회"""
         try:
             query = db.query(WebLog).filter(
-                WebLog.process_se_code.in_(['ERROR', 'EXCEPTION', 'FAIL'])
+                WebLog.process_se_code.in_(ERROR_PROCESS_CODES)
             )
             total = query.count()
             items = query.order_by(desc(WebLog.rqest_de)).offset(skip).limit(limit).all()
@@ -601,6 +626,31 @@ class WebLogService(BaseService[WebLog, WebLogCreate, WebLogUpdate]):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"웹 로그 삭제 중 오류가 발생했습니다: {str(e)}"
             )
+    
+    def cleanup_old_logs(self, db: Session, days_to_keep: int = 90, mode: Optional[str] = None) -> Dict[str, Any]:
+        """웹 로그 정리 (보관 기간이 지난 월별 파티션은 DROP/DETACH)"""
+        return cleanup_log_table(db, WebLog.__table__, days_to_keep, mode)
+    
+    def export_statement(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Select:
+        """내보낼 웹 로그 조회문 (종료일자 포함, 최근 로그부터)"""
+        statement = select(*[getattr(WebLog, field) for field in WEBLOG_EXPORT_FIELDS])
+        if start_date:
+            statement = statement.where(WebLog.rqest_de >= datetime.combine(start_date, datetime.min.time()))
+        if end_date:
+            statement = statement.where(WebLog.rqest_de < datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
+        return statement.order_by(desc(WebLog.rqest_de))
+    
+    def export_logs(
+        self,
+        db: Session,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        format: str = "csv",
+        compress: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[bytes]:
+        """웹 로그 내보내기 (서버 측 커서로 읽어 바로 인코딩하는 바이트 청크, 형식 오류는 ValueError)"""
+        return _export_chunks(db, self.export_statement(start_date, end_date), WEBLOG_EXPORT_FIELDS, format, compress, batch_size)
 
 
 class ProgrmListService(BaseService[ProgrmList, ProgrmListCreate, ProgrmListUpdate]):
@@ -761,8 +811,23 @@ class SystemMonitoringService:
         """시스템 상태 확인 (라우터 호환성을 위한 메서드)"""
         return self.get_system_health_check(db)
     
-    def get_system_health_check(self, db: Session) -> SystemHealthCheck:
-        """시스템 상태 확인"""
+    def get_system_health_check(
+        self,
+        db: Session,
+        cpu_usage: Optional[float] = None,
+        memory_usage: Optional[float] = None
+    ) -> SystemHealthCheck:
+        """
+        시스템 상태 확인
+        
+        Args:
+            db: 데이터베이스 세션
+            cpu_usage: 미리 측정한 CPU 사용률 (없으면 직전 측정 이후 평균을 기다림 없이 측정)
+            memory_usage: 미리 측정한 메모리 사용률 (없으면 측정)
+        
+        Returns:
+            시스템 상태
+        """
         try:
             # 데이터베이스 상태 확인
             db.execute(text("SELECT 1"))
@@ -773,36 +838,16 @@ class SystemMonitoringService:
         # API 상태 (현재 메서드가 실행되고 있으므로 정상)
         api_status = "정상"
         
-        # 오늘 로그 수 조회
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
-        
-        log_count_today = db.query(func.count(SysLog.requst_id)).filter(
-            and_(
-                SysLog.occrrnc_de >= today,
-                SysLog.occrrnc_de < tomorrow
-            )
-        ).scalar() or 0
-        
-        # 오늘 오류 수 조회
-        error_count_today = db.query(func.count(SysLog.requst_id)).filter(
-            and_(
-                SysLog.occrrnc_de >= today,
-                SysLog.occrrnc_de < tomorrow,
-                SysLog.process_se_code.in_(['ERROR', 'EXCEPTION', 'FAIL'])
-            )
-        ).scalar() or 0
-        
-        # 오늘 활성 사용자 수 (로그에 기록된 고유 사용자)
-        active_users_today = db.query(
-            func.count(func.distinct(SysLog.rqester_id))
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= today,
-                SysLog.occrrnc_de < tomorrow,
-                SysLog.rqester_id.isnot(None)
-            )
-        ).scalar() or 0
+        # 오늘 로그 수, 오류 수, 활성 사용자 수 (로그에 기록된 고유 사용자)
+        # 데이터베이스 오류 시에는 집계하지 않고 0으로 표시
+        log_count_today = error_count_today = active_users_today = 0
+        if database_status == "정상":
+            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            tomorrow = today + timedelta(days=1)
+            today_counts = self._today_counts(db, today, tomorrow).one(db)
+            log_count_today = today_counts.total_requests
+            error_count_today = today_counts.error_requests
+            active_users_today = today_counts.active_users
         
         # 시스템 가동시간
         uptime_seconds = time.time() - SYSTEM_START_TIME
@@ -810,13 +855,15 @@ class SystemMonitoringService:
         uptime_minutes = int((uptime_seconds % 3600) // 60)
         system_uptime = f"{uptime_hours}시간 {uptime_minutes}분"
         
-        # 메모리 및 CPU 사용률
+        # 메모리 및 CPU 사용률 (cpu_percent(interval=None)은 기다리지 않음)
         try:
-            memory_usage = psutil.virtual_memory().percent
-            cpu_usage = psutil.cpu_percent(interval=1)
+            if memory_usage is None:
+                memory_usage = psutil.virtual_memory().percent
+            if cpu_usage is None:
+                cpu_usage = psutil.cpu_percent(interval=None)
         except Exception:
-            memory_usage = 0.0
-            cpu_usage = 0.0
+            memory_usage = memory_usage or 0.0
+            cpu_usage = cpu_usage or 0.0
         
         return SystemHealthCheck(
             database_status=database_status,
@@ -829,169 +876,48 @@ class SystemMonitoringService:
             cpu_usage=cpu_usage
         )
     
+    def _today_counts(self, db: Session, today: datetime, tomorrow: datetime) -> AggregateQuery:
+        """오늘 시스템 로그의 총 요청/오류 요청/활성 사용자 수 집계"""
+        stats = rollup_source(db, SYSLOG_ROLLUP, today, tomorrow, include_end=False)
+        return (
+            AggregateQuery(stats)
+            .sum('total_requests', stats.c.log_co)
+            .sum('error_requests', stats.c.log_co, stats.c.process_se_code.in_(ERROR_PROCESS_CODES))
+            .count_distinct('active_users', rollup_dimension(stats.c.rqester_id))
+        )
+    
     def get_log_statistics(self, db: Session, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> LogStatistics:
         """로그 통계 조회"""
-        if start_date is None:
-            start_date = datetime.now() - timedelta(days=30)
-        if end_date is None:
-            end_date = datetime.now()
-        
-        # 전체 요청 수
-        total_requests = db.query(func.count(SysLog.requst_id)).filter(
-            SysLog.occrrnc_de >= start_date
-        ).scalar() or 0
-        
-        # 고유 사용자 수
-        unique_users = db.query(
-            func.count(func.distinct(SysLog.rqester_id))
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.rqester_id.isnot(None)
-            )
-        ).scalar() or 0
-        
-        # 시간별 요청 수
-        hourly_requests = db.query(
-            func.extract('hour', SysLog.occrrnc_de).label('hour'),
-            func.count(SysLog.requst_id).label('count')
-        ).filter(
-            SysLog.occrrnc_de >= start_date
-        ).group_by(
-            func.extract('hour', SysLog.occrrnc_de)
-        ).all()
-        requests_by_hour = {str(int(hour)): count for hour, count in hourly_requests}
-        
-        # 메뉴별 요청 수
-        menu_requests = db.query(
-            SysLog.trget_menu_nm,
-            func.count(SysLog.requst_id).label('count')
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.trget_menu_nm.isnot(None)
-            )
-        ).group_by(SysLog.trget_menu_nm).all()
-        requests_by_menu = {menu: count for menu, count in menu_requests}
-        
-        # 처리구분별 요청 수
-        process_requests = db.query(
-            SysLog.process_se_code,
-            func.count(SysLog.requst_id).label('count')
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.process_se_code.isnot(None)
-            )
-        ).group_by(SysLog.process_se_code).all()
-        requests_by_process_type = {process: count for process, count in process_requests}
-        
-        # 평균 처리시간
-        avg_process_time = db.query(
-            func.avg(SysLog.process_time)
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.process_time.isnot(None)
-            )
-        ).scalar() or 0.0
-        
-        # 상위 사용자 목록
-        top_users = db.query(
-            SysLog.rqester_id,
-            func.count(SysLog.requst_id).label('request_count')
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.rqester_id.isnot(None)
-            )
-        ).group_by(
-            SysLog.rqester_id
-        ).order_by(
-            desc('request_count')
-        ).limit(10).all()
-        
-        top_users_list = [
-            {
-                "user_id": user_id,
-                "user_name": "알 수 없음",
-                "request_count": count
-            }
-            for user_id, count in top_users
-        ]
-        
-        # 오류율 계산
-        error_requests = db.query(func.count(SysLog.requst_id)).filter(
-            and_(
-                SysLog.occrrnc_de >= start_date,
-                SysLog.process_se_code.in_(['ERROR', 'EXCEPTION', 'FAIL'])
-            )
-        ).scalar() or 0
-        
-        error_rate = (error_requests / total_requests * 100) if total_requests > 0 else 0.0
-        
-        return LogStatistics(
-            total_requests=total_requests,
-            unique_users=unique_users,
-            requests_by_hour=requests_by_hour,
-            requests_by_menu=requests_by_menu,
-            requests_by_process_type=requests_by_process_type,
-            average_process_time=float(avg_process_time),
-            top_users=top_users_list,
-            error_rate=error_rate
-        )
+        return self.syslog_service.get_log_statistics(db, start_date, end_date)
     
     def get_dashboard_summary(self, db: Session) -> DashboardSummary:
         """대시보드 요약 정보 조회"""
-        from app.models.user_models import UserInfo
-        
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         tomorrow = today + timedelta(days=1)
         
-        # 전체 사용자 수
-        total_users = db.query(func.count(UserInfo.user_id)).scalar() or 0
-        
-        # 오늘 활성 사용자 수
-        active_users_today = db.query(
-            func.count(func.distinct(SysLog.rqester_id))
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= today,
-                SysLog.occrrnc_de < tomorrow,
-                SysLog.rqester_id.isnot(None)
-            )
-        ).scalar() or 0
-        
-        # 오늘 총 요청 수
-        total_requests_today = db.query(func.count(SysLog.requst_id)).filter(
-            and_(
-                SysLog.occrrnc_de >= today,
-                SysLog.occrrnc_de < tomorrow
-            )
-        ).scalar() or 0
-        
-        # 오늘 오류 요청 수
-        error_requests_today = db.query(func.count(SysLog.requst_id)).filter(
-            and_(
-                SysLog.occrrnc_de >= today,
-                SysLog.occrrnc_de < tomorrow,
-                SysLog.process_se_code.in_(['ERROR', 'EXCEPTION', 'FAIL'])
-            )
-        ).scalar() or 0
+        # 오늘 통계는 시간별 집계, 최근 7일 인기 메뉴는 일별 집계 위주로 조회
+        # 전체 사용자 수와 오늘 활성 사용자/총 요청/오류 요청 수를 한 번에 집계
+        today_counts = (
+            self._today_counts(db, today, tomorrow)
+            .add('total_users', select(func.count()).select_from(UserInfo).scalar_subquery())
+            .one(db)
+        )
+        total_users = today_counts.total_users
+        active_users_today = today_counts.active_users
+        total_requests_today = today_counts.total_requests
+        error_requests_today = today_counts.error_requests
         
         # 인기 메뉴 목록 (최근 7일)
         week_ago = datetime.now() - timedelta(days=7)
-        popular_menus = db.query(
-            SysLog.trget_menu_nm,
-            func.count(SysLog.requst_id).label('count')
-        ).filter(
-            and_(
-                SysLog.occrrnc_de >= week_ago,
-                SysLog.trget_menu_nm.isnot(None)
-            )
-        ).group_by(SysLog.trget_menu_nm).order_by(
-            desc('count')
-        ).limit(5).all()
+        week_stats = rollup_source(db, SYSLOG_ROLLUP, week_ago, datetime.now(), GRAIN_DAY)
+        popular_menus = (
+            AggregateQuery(week_stats, week_stats.c.trget_menu_nm != '')
+            .sum('count', week_stats.c.log_co)
+            .group_by(week_stats.c.trget_menu_nm)
+            .order_by(desc('count'))
+            .limit(5)
+            .all(db)
+        )
         
         popular_menus_list = [
             {"menu_name": menu, "access_count": count}
@@ -1018,14 +944,14 @@ class SystemMonitoringService:
         system_alerts = db.query(SysLog).filter(
             and_(
                 SysLog.occrrnc_de >= week_ago,
-                SysLog.process_se_code.in_(['ERROR', 'EXCEPTION', 'FAIL'])
+                SysLog.process_se_code.in_(ERROR_PROCESS_CODES)
             )
         ).order_by(desc(SysLog.occrrnc_de)).limit(5).all()
         
         system_alerts_list = [
             {
                 "type": "error",
-                "message": log.process_cn or "시스템 오류 발생",
+                "message": f"시스템 오류 발생 ({log.error_code})" if log.error_code else "시스템 오류 발생",
                 "timestamp": log.occrrnc_de.isoformat() if log.occrrnc_de else None,
                 "user_id": log.rqester_id
             }
@@ -4,7 +4,7 @@
 """
 
 from typing import List, Optional, Dict, Any, Union
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 import uuid
 import logging
@@ -13,6 +13,7 @@ from sqlalchemy import and_, or_, func, desc, asc
 from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from sqlalchemy.exc import SQLAlchemyError
+from app.database.aggregates import AggregateQuery
 from app.models.user_models import UserInfo
 from app.models.org_models import Org
 from app.models.zip_models import Zip
@@ -23,6 +24,8 @@ from app.schemas.user_schemas import (
     UserStatistics, OrgTreeNode
 )
 from app.services.base_service import BaseService
+from app.services.auth_service import invalidate_user_principal
+from app.utils.hierarchy import HierarchyQuery
 
 # 비밀번호 암호화 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -128,6 +131,7 @@ class UserInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
         
         db.commit()
         db.refresh(db_obj)
+        invalidate_user_principal(db_obj.user_id)
         return db_obj
     
     def delete(self, db: Session, user_id: str) -> Optional[UserInfo]:
@@ -146,6 +150,7 @@ class UserInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
             if obj:
                 db.delete(obj)
                 db.commit()
+                invalidate_user_principal(user_id)
                 return obj
             return None
             
@@ -215,47 +220,35 @@ class UserInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
         return users, total
     
     def get_user_statistics(self, db: Session) -> UserStatistics:
-        """사용자 통계 조회"""
-        # 전체 사용자 수
-        total_users = db.query(func.count(UserInfo.user_id)).scalar()
-        
-        # 활성 사용자 수 (상태코드가 'A'인 사용자)
-        active_users = db.query(func.count(UserInfo.user_id)).filter(
-            UserInfo.emplyr_sttus_code == 'A'
-        ).scalar()
-        
-        # 잠금된 사용자 수
-        locked_users = db.query(func.count(UserInfo.user_id)).filter(
-            UserInfo.lock_at == 'Y'
-        ).scalar()
-        
-        # 상태별 사용자 수
-        status_stats = db.query(
-            UserInfo.emplyr_sttus_code,
-            func.count(UserInfo.user_id)
-        ).group_by(UserInfo.emplyr_sttus_code).all()
-        users_by_status = {status: count for status, count in status_stats}
-        
-        # 조직별 사용자 수
-        org_stats = db.query(
-            UserInfo.orgnzt_id,
-            func.count(UserInfo.user_id)
-        ).filter(UserInfo.orgnzt_id.isnot(None)).group_by(UserInfo.orgnzt_id).all()
-        users_by_organization = {org_id: count for org_id, count in org_stats}
+        """사용자 통계 조회 (상태/조직별 집계 한 번으로 전체 수치 계산)"""
+        # 최근 30일 가입자 기준일
+        thirty_days_ago = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=30)
+        
+        # 상태별 x 조직별 사용자 수, 잠금 사용자 수, 최근 가입자 수
+        groups = (
+            AggregateQuery(UserInfo)
+            .count('users')
+            .count('locked', UserInfo.lock_at == 'Y')
+            .count('recent', UserInfo.sbscrb_de >= thirty_days_ago)
+            .group_by(UserInfo.emplyr_sttus_code, UserInfo.orgnzt_id)
+            .all(db)
+        )
         
-        # 최근 30일 가입자 수
-        thirty_days_ago = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        recent_registrations = db.query(func.count(UserInfo.user_id)).filter(
-            UserInfo.sbscrb_de >= thirty_days_ago
-        ).scalar()
+        users_by_status: Dict[str, int] = {}
+        users_by_organization: Dict[str, int] = {}
+        for group in groups:
+            users_by_status[group.emplyr_sttus_code] = users_by_status.get(group.emplyr_sttus_code, 0) + group.users
+            if group.orgnzt_id is not None:
+                users_by_organization[group.orgnzt_id] = users_by_organization.get(group.orgnzt_id, 0) + group.users
         
         return UserStatistics(
-            total_users=total_users or 0,
-            active_users=active_users or 0,
-            locked_users=locked_users or 0,
+            total_users=sum(group.users for group in groups),
+            # 활성 사용자 수 (상태코드가 'A'인 사용자)
+            active_users=users_by_status.get('A', 0),
+            locked_users=sum(group.locked for group in groups),
             users_by_status=users_by_status,
             users_by_organization=users_by_organization,
-            recent_registrations=recent_registrations or 0
+            recent_registrations=sum(group.recent for group in groups)
         )
     
     def lock_user(self, db: Session, user_id: str, current_user_id: Optional[str] = None) -> UserInfo:
@@ -275,6 +268,7 @@ class UserInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
         
         db.commit()
         db.refresh(user)
+        invalidate_user_principal(user_id)
         return user
     
     def unlock_user(self, db: Session, user_id: str, current_user_id: Optional[str] = None) -> UserInfo:
@@ -292,6 +286,7 @@ class UserInfoService(BaseService[UserInfo, UserInfoCreate, UserInfoUpdate]):
         
         db.commit()
         db.refresh(user)
+        invalidate_user_principal(user_id)
         return user
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -304,6 +299,7 @@ class OrgService(BaseService[Org, OrgCreate, OrgUpdate]):
     
     def __init__(self):
         super().__init__(Org)
+        self.hierarchy = HierarchyQuery(Org, "org_no", "parent_org_no")
     
     def get(self, db: Session, org_no: Any) -> Optional[Org]:
         """
@@ -443,18 +439,8 @@ class OrgService(BaseService[Org, OrgCreate, OrgUpdate]):
         ).order_by(asc(Org.org_ordr)).all()
     
     def get_organization_path(self, db: Session, org_no: Decimal) -> List[Org]:
-        """조직 경로 조회 (루트부터 현재 조직까지)"""
-        path = []
-        current_org = self.get(db, org_no)
-        
-        while current_org:
-            path.insert(0, current_org)
-            if current_org.parent_org_no:
-                current_org = self.get(db, current_org.parent_org_no)
-            else:
-                break
-        
-        return path
+        """조직 경로 조회 (루트부터 현재 조직까지, WITH RECURSIVE 쿼리 한 번)"""
+        return self.hierarchy.get_ancestors(db, org_no)
     
     def update(self, db: Session, org_no: Any, obj_in: OrgUpdate, current_user_id: Optional[str] = None) -> Optional[Org]:
         """
@@ -475,6 +461,16 @@ class OrgService(BaseService[Org, OrgCreate, OrgUpdate]):
                 return None
             
             obj_data = obj_in.model_dump(exclude_unset=True)
+            
+            # 자기 자신이나 하위 조직을 상위 조직으로 설정하는 것 방지
+            new_parent_org_no = obj_data.get("parent_org_no")
+            if new_parent_org_no is not None and new_parent_org_no != db_obj.parent_org_no:
+                if new_parent_org_no == db_obj.org_no or self.hierarchy.is_descendant(db, db_obj.org_no, new_parent_org_no):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="자기 자신이나 하위 조직을 상위 조직으로 설정할 수 없습니다."
+                    )
+            
             obj_data["last_updt_pnttm"] = datetime.now()
             obj_data["last_updusr_id"] = current_user_id
             
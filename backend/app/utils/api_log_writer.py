@@ -0,0 +1,294 @@
+"""API 사용 로그 비동기 배치 저장기
+
+APIUsageMiddleware가 요청마다 DB에 INSERT/COMMIT 하지 않도록
+프로세스 내부의 bounded 큐에 로그를 적재하고, 백그라운드 태스크가
+일정 크기 또는 일정 시간마다 다건 INSERT로 한 번에 저장합니다.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.database.database import SessionLocal
+from app.models.log_models import APIUsageLog
+
+logger = logging.getLogger(__name__)
+
+
+class APIUsageLogWriter:
+    """
+    API 사용 로그 write-behind 저장기
+
+    - enqueue(): 요청 경로에서 호출, DB 접근 없이 큐에 적재
+    - 백그라운드 태스크: batch_size 도달 또는 flush_interval 경과 시 일괄 INSERT
+    - 큐가 high water mark를 넘으면 오류 응답을 제외한 로그를 샘플링
+    - 큐가 가득 차면 overflow_policy에 따라 대기(block) 또는 폐기(drop)
+    - stop(): 남은 로그를 모두 저장한 뒤 종료
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        overflow_policy: str = "drop",
+        enqueue_timeout: float = 0.05,
+        high_water_ratio: float = 0.8,
+        sample_rate: float = 0.1
+    ):
+        """
+        저장기 초기화
+
+        Args:
+            max_queue_size: 큐 최대 크기
+            batch_size: 1회 INSERT 최대 건수
+            flush_interval: 최대 저장 지연 시간(초)
+            overflow_policy: 큐가 가득 찼을 때 정책 ("drop" 또는 "block")
+            enqueue_timeout: block 정책에서 최대 대기 시간(초)
+            high_water_ratio: 샘플링을 시작하는 큐 사용률
+            sample_rate: 샘플링 구간에서 정상 응답 로그를 보존할 비율
+        """
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.enqueue_timeout = enqueue_timeout
+        self.high_water_mark = int(max_queue_size * high_water_ratio)
+        self.sample_rate = sample_rate
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+
+        # 통계
+        self.enqueued_count = 0
+        self.written_count = 0
+        self.dropped_count = 0
+        self.sampled_out_count = 0
+        self.failed_count = 0
+        self.last_flush_at: Optional[datetime] = None
+
+    @property
+    def is_running(self) -> bool:
+        """백그라운드 저장 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """
+        백그라운드 저장 태스크를 시작합니다.
+        """
+        if self.is_running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run(), name="api-usage-log-writer")
+        logger.info(
+            f"🚀 API 로그 저장기 시작 - queue: {self.max_queue_size}, "
+            f"batch: {self.batch_size}, interval: {self.flush_interval}s"
+        )
+
+    async def stop(self) -> None:
+        """
+        백그라운드 태스크를 종료하고 큐에 남은 로그를 모두 저장합니다.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # 진행 중이던 배치 저장 완료 대기
+        if self._inflight is not None and not self._inflight.done():
+            await self._inflight
+        self._inflight = None
+
+        # 남은 로그 저장
+        remaining = self._drain(self._queue.qsize())
+        while remaining:
+            await self._flush(remaining)
+            remaining = self._drain(self.batch_size)
+
+        logger.info(
+            f"🛑 API 로그 저장기 종료 - 저장: {self.written_count}, "
+            f"폐기: {self.dropped_count}, 샘플링 제외: {self.sampled_out_count}"
+        )
+
+    async def enqueue(self, record: Dict[str, Any]) -> bool:
+        """
+        API 사용 로그를 큐에 적재합니다.
+
+        Args:
+            record: tb_api_usage_log 컬럼명을 키로 하는 로그 데이터
+
+        Returns:
+            적재 여부 (샘플링 제외 또는 폐기 시 False)
+        """
+        record.setdefault("frst_regist_pnttm", datetime.now())
+
+        # 저장기가 실행 중이 아니면 (lifespan 미실행 등) 직접 저장
+        if not self.is_running:
+            await self._flush([record])
+            return True
+
+        # 큐 사용률이 높으면 정상 응답 로그는 샘플링
+        if self._queue.qsize() >= self.high_water_mark and not self._is_error(record):
+            if random.random() >= self.sample_rate:
+                self.sampled_out_count += 1
+                return False
+
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            if self.overflow_policy != "block":
+                self.dropped_count += 1
+                return False
+            try:
+                await asyncio.wait_for(self._queue.put(record), timeout=self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.dropped_count += 1
+                return False
+
+        self.enqueued_count += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        저장기 상태 통계를 반환합니다.
+
+        Returns:
+            큐 크기 및 누적 처리 건수
+        """
+        return {
+            "running": self.is_running,
+            "queue_size": self._queue.qsize() if self._queue else 0,
+            "max_queue_size": self.max_queue_size,
+            "enqueued": self.enqueued_count,
+            "written": self.written_count,
+            "dropped": self.dropped_count,
+            "sampled_out": self.sampled_out_count,
+            "failed": self.failed_count,
+            "last_flush_at": self.last_flush_at.isoformat() if self.last_flush_at else None
+        }
+
+    async def _run(self) -> None:
+        """
+        큐를 소비하며 크기/시간 기준으로 일괄 저장하는 루프
+        """
+        while True:
+            # 첫 로그가 들어올 때까지 대기
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            # batch_size 또는 flush_interval 중 먼저 도달할 때까지 수집
+            try:
+                while len(batch) < self.batch_size:
+                    batch.extend(self._drain(self.batch_size - len(batch)))
+                    if len(batch) >= self.batch_size:
+                        break
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # 수집 중 종료되면 배치를 큐에 되돌려 stop()에서 저장
+                for record in batch:
+                    try:
+                        self._queue.put_nowait(record)
+                    except asyncio.QueueFull:
+                        self.dropped_count += 1
+                raise
+
+            # 종료(cancel) 중에도 진행 중인 저장은 끝까지 수행되도록 보호
+            self._inflight = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._inflight)
+
+    def _drain(self, max_items: int) -> List[Dict[str, Any]]:
+        """
+        대기 없이 큐에서 최대 max_items건을 꺼냅니다.
+        """
+        items: List[Dict[str, Any]] = []
+        if self._queue is None:
+            return items
+        while len(items) < max_items:
+            try:
+                items.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return items
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        배치를 워커 스레드에서 저장하여 이벤트 루프를 막지 않습니다.
+        """
+        if not batch:
+            return
+        await asyncio.to_thread(self._write_batch, batch)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        배치를 다건 INSERT 한 번과 COMMIT 한 번으로 저장합니다.
+
+        Args:
+            batch: 저장할 로그 목록
+        """
+        db = SessionLocal()
+        try:
+            db.execute(insert(APIUsageLog), batch)
+            db.commit()
+            self.written_count += len(batch)
+            self.last_flush_at = datetime.now()
+            logger.debug(f"✅ API 로그 일괄 저장 완료 - {len(batch)}건")
+        except Exception as e:
+            db.rollback()
+            self.failed_count += len(batch)
+            logger.error(f"❌ API 로그 일괄 저장 실패 - {len(batch)}건, 오류: {str(e)}")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _is_error(record: Dict[str, Any]) -> bool:
+        """오류 응답 로그 여부 (샘플링 대상에서 제외)"""
+        status = record.get("response_status") or 0
+        return status >= 400 or bool(record.get("error_message"))
+
+
+def _create_writer_from_env() -> APIUsageLogWriter:
+    """
+    환경 변수에서 저장기 설정을 읽어 인스턴스를 생성합니다.
+    """
+    return APIUsageLogWriter(
+        max_queue_size=int(os.getenv("API_LOG_QUEUE_SIZE", "10000")),
+        batch_size=int(os.getenv("API_LOG_BATCH_SIZE", "200")),
+        flush_interval=float(os.getenv("API_LOG_FLUSH_INTERVAL", "1.0")),
+        overflow_policy=os.getenv("API_LOG_OVERFLOW_POLICY", "drop").lower(),
+        enqueue_timeout=float(os.getenv("API_LOG_ENQUEUE_TIMEOUT", "0.05")),
+        high_water_ratio=float(os.getenv("API_LOG_HIGH_WATER_RATIO", "0.8")),
+        sample_rate=float(os.getenv("API_LOG_SAMPLE_RATE", "0.1"))
+    )
+
+
+# 전역 저장기 인스턴스
+api_log_writer = _create_writer_from_env()
+
+
+def get_api_log_writer() -> APIUsageLogWriter:
+    """
+    API 사용 로그 저장기 인스턴스 반환
+
+    Returns:
+        APIUsageLogWriter 인스턴스
+    """
+    return api_log_writer
@@ -6,9 +6,9 @@
 import logging
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.services import AuthorInfoService
 
 # 로거 설정
@@ -18,14 +18,16 @@ logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
 
-def get_current_user_from_bearer(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)):
+async def get_current_user_from_bearer(credentials: HTTPAuthorizationCredentials = Depends(security), db: AsyncSession = Depends(get_async_db)):
     """
     HTTPBearer 토큰에서 현재 사용자 정보를 추출합니다.
+    
+    사용자 조회는 비동기 세션으로 수행하여 이벤트 루프를 막지 않습니다.
     """
     try:
         token = credentials.credentials
         auth_service = AuthorInfoService()
-        user_info = auth_service.get_current_user_from_token(db, token)
+        user_info = await auth_service.get_current_user_from_token_async(db, token)
         
         if not user_info:
             raise HTTPException(
@@ -0,0 +1,107 @@
+"""프로세스 내부 캐시 유틸리티
+
+짧은 TTL과 최대 크기를 가진 스레드 안전 LRU 캐시를 제공합니다.
+워커 프로세스마다 독립적으로 유지되므로, 다른 워커의 변경은
+TTL이 지나야 반영됩니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """
+    TTL 기반 LRU 캐시
+
+    - get(): 만료되지 않은 값 반환, 만료 항목은 제거
+    - set(): 값 저장, 최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거
+    - invalidate(): 특정 키 무효화
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 30.0):
+        """
+        캐시 초기화
+
+        Args:
+            max_size: 최대 저장 항목 수 (0이면 캐시 비활성화)
+            ttl: 항목 유효 시간(초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        캐시된 값을 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 항목별 유효 시간(초), 생략 시 기본 TTL
+        """
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        특정 키를 무효화합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -0,0 +1,87 @@
+"""키셋(커서) 페이지네이션 커서 인코딩
+
+커서는 마지막으로 내려준 행의 (정렬 키, 기본 키) 값과 정렬 조건을 담은
+불투명 문자열입니다. 다음 페이지는 OFFSET 없이 "이 값 다음" 조건으로 조회하므로
+얼마나 깊이 스크롤하든 조회 비용이 limit에 비례합니다.
+
+값은 타입을 보존하도록 JSON으로 직렬화한 뒤 URL-safe base64로 인코딩합니다.
+정렬 조건이 다른 요청에 커서를 재사용하면 InvalidCursorError가 발생합니다.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Sequence
+
+
+class InvalidCursorError(ValueError):
+    """형식이 잘못되었거나 정렬 조건이 일치하지 않는 커서"""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any], order: str) -> str:
+    """
+    마지막 행의 키 값을 커서 문자열로 인코딩합니다.
+
+    Args:
+        values: (정렬 키, 기본 키...) 값 목록
+        order: 정렬 조건 식별자 (디코딩 시 같은 값이어야 함)
+
+    Returns:
+        URL-safe base64 커서 문자열
+    """
+    payload = json.dumps(
+        {"o": order, "v": [_encode_value(value) for value in values]},
+        ensure_ascii=False, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order: str, size: int) -> List[Any]:
+    """
+    커서 문자열을 키 값 목록으로 디코딩합니다.
+
+    Args:
+        cursor: encode_cursor가 만든 커서 문자열
+        order: 현재 요청의 정렬 조건 식별자
+        size: 기대하는 키 값 개수
+
+    Returns:
+        (정렬 키, 기본 키...) 값 목록
+
+    Raises:
+        InvalidCursorError: 형식 오류 또는 정렬 조건 불일치
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_decode_value(value) for value in payload["v"]]
+        cursor_order = payload["o"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {e}") from e
+
+    if cursor_order != order or len(values) != size:
+        raise InvalidCursorError("커서의 정렬 조건이 요청과 일치하지 않습니다.")
+    return values
@@ -0,0 +1,194 @@
+"""동기 DB 작업 스레드 풀 오프로딩
+
+async 라우트에서 동기 Session으로 서비스 메서드를 호출하면 쿼리가 끝날 때까지
+이벤트 루프가 멈춰 같은 워커의 다른 요청이 모두 대기합니다. offload(service)는
+서비스의 동기 메서드를 크기가 제한된 전용 스레드 풀에서 실행하는 프록시를 반환합니다.
+
+    menu_service = offload(MenuInfoService())
+    menu = await menu_service.create_menu(db=db, menu_data=menu_data)
+
+비동기 메서드(*_async)와 메서드가 아닌 속성은 그대로 반환합니다. Session은 스레드
+안전하지 않지만, 한 요청 안의 호출은 await로 순서대로 실행되므로 한 시점에 한
+스레드만 세션을 사용합니다.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.database.pool_metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DBOffloader:
+    """
+    동기 DB 호출 전용 스레드 풀
+
+    - 스레드 수는 max_workers로 제한 (기본: 동기 커넥션 풀 크기 + 오버플로)
+    - 풀이 모두 사용 중이면 호출은 대기열에서 기다리며, 대기 시간을 히스토그램으로 기록
+    - 호출한 쪽의 contextvars를 그대로 전달
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        스레드 풀 초기화
+
+        Args:
+            max_workers: 최대 스레드 수
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self.queue_wait = Histogram()
+        self.run_time = Histogram()
+
+        # 통계
+        self.call_count = 0
+        self.error_count = 0
+        self.active = 0
+        self.max_active = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="db-offload"
+                )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        동기 함수를 스레드 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            func: 실행할 동기 함수
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            함수 반환값 (예외는 그대로 전파)
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        submitted_at = time.perf_counter()
+
+        def call() -> T:
+            started_at = time.perf_counter()
+            self.queue_wait.observe(started_at - submitted_at)
+            with self._lock:
+                self.call_count += 1
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                return context.run(func, *args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self.error_count += 1
+                raise
+            finally:
+                self.run_time.observe(time.perf_counter() - started_at)
+                with self._lock:
+                    self.active -= 1
+
+        return await loop.run_in_executor(self._get_executor(), call)
+
+    def shutdown(self) -> None:
+        """스레드 풀을 종료합니다. (다음 호출 시 다시 생성)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        스레드 풀 지표를 반환합니다.
+
+        Returns:
+            최대 스레드 수, 누적 호출/오류 수, 사용 중 스레드 수, 대기/실행 시간 히스토그램
+        """
+        with self._lock:
+            counters = {
+                "max_workers": self.max_workers,
+                "calls": self.call_count,
+                "errors": self.error_count,
+                "active": self.active,
+                "max_active": self.max_active
+            }
+        return {
+            **counters,
+            "queue_wait_seconds": self.queue_wait.snapshot(),
+            "run_seconds": self.run_time.snapshot()
+        }
+
+
+class OffloadedService:
+    """서비스의 동기 메서드를 DBOffloader에서 실행하는 프록시"""
+
+    def __init__(self, service: Any, offloader: DBOffloader):
+        self._service = service
+        self._offloader = offloader
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if name.startswith("_") or not callable(attr) or inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._offloader.run(attr, *args, **kwargs)
+
+        return call
+
+    def __repr__(self) -> str:
+        return f"<OffloadedService {self._service!r}>"
+
+
+def _create_offloader_from_env() -> DBOffloader:
+    """
+    환경 변수에서 스레드 풀 크기를 읽어 인스턴스를 생성합니다.
+
+    DB_OFFLOAD_THREADS가 없으면 동기 커넥션 풀이 동시에 내줄 수 있는 최대 연결 수
+    (DB_POOL_SIZE + DB_MAX_OVERFLOW)를 사용하여 스레드가 연결을 기다리지 않도록 합니다.
+    """
+    default = int(os.getenv("DB_POOL_SIZE", "5")) + int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    max_workers = int(os.getenv("DB_OFFLOAD_THREADS", str(default)))
+    if max_workers < 1:
+        raise ValueError(f"DB_OFFLOAD_THREADS는 1 이상이어야 합니다: {max_workers}")
+    return DBOffloader(max_workers=max_workers)
+
+
+db_offloader = _create_offloader_from_env()
+
+
+def get_db_offloader() -> DBOffloader:
+    """
+    동기 DB 작업 스레드 풀 인스턴스 반환
+
+    Returns:
+        DBOffloader 인스턴스
+    """
+    return db_offloader
+
+
+def offload(service: Any) -> OffloadedService:
+    """
+    서비스의 동기 메서드를 스레드 풀에서 실행하도록 감쌉니다.
+
+    Args:
+        service: BaseService 등 동기 Session을 사용하는 서비스 인스턴스
+
+    Returns:
+        동기 메서드를 await 가능한 코루틴 함수로 노출하는 프록시
+    """
+    return OffloadedService(service, get_db_offloader())
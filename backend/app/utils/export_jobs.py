@@ -0,0 +1,413 @@
+"""로그 내보내기 작업
+
+대용량 로그 내보내기를 요청 밖에서 실행하여 EXPORT_DIR에 파일로 쓰고,
+진행 상황을 조회할 수 있게 합니다.
+
+- submit(): 작업을 등록하고 전용 스레드 풀에서 실행 (바로 반환)
+- get(): 작업 상태 조회 (기록한 행 수, 전체 행 수, 진행률)
+- path_of(): 완료된 작업의 파일 경로
+
+PostgreSQL에서 CSV는 COPY ... TO STDOUT으로, 그 밖의 형식(또는 DB)은 서버 측
+커서로 읽은 행을 record_stream으로 인코딩하여 씁니다. 어느 쪽이든 파일에 바로
+쓰고(gzip은 점진 압축) 메모리 사용량은 행 수와 관계없이 일정합니다.
+파일은 <작업ID>.part에 쓴 뒤 완료되면 이름을 바꾸므로 미완성 파일은 내려받을 수 없습니다.
+
+작업 상태는 <작업ID>.status.json으로도 저장하므로 EXPORT_DIR을 공유하는 다른 워커에서도
+조회할 수 있습니다. 완료 후 EXPORT_JOB_TTL초가 지난 작업과 파일은 이 작업을 실행한
+워커가 다음 작업 등록 시 정리합니다.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.database.database import SessionLocal
+from app.database.export import DEFAULT_BATCH_SIZE, copy_csv, iter_rows, supports_copy
+from app.utils.record_stream import RECORD_FORMATS, encode_records
+
+logger = logging.getLogger(__name__)
+
+EXPORT_PENDING = "pending"
+EXPORT_RUNNING = "running"
+EXPORT_COMPLETED = "completed"
+EXPORT_FAILED = "failed"
+
+# 진행 상황 저장 주기(초)
+PROGRESS_INTERVAL = 1.0
+
+
+@dataclass
+class ExportJob:
+    """내보내기 작업 상태"""
+    export_id: str
+    name: str
+    format: str
+    compress: bool = False
+    owner: Optional[str] = None
+    status: str = EXPORT_PENDING
+    record_count: int = 0
+    total_count: Optional[int] = None
+    file_size: Optional[int] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+    @property
+    def extension(self) -> str:
+        """파일 확장자"""
+        return f"{self.format}.gz" if self.compress else self.format
+
+    @property
+    def file_name(self) -> str:
+        """내려받을 파일 이름"""
+        return f"{self.name}_{self.created_at:%Y%m%d_%H%M%S}.{self.extension}"
+
+    @property
+    def progress(self) -> Optional[float]:
+        """진행률(%, 전체 행 수를 모르면 None)"""
+        if self.status == EXPORT_COMPLETED:
+            return 100.0
+        if not self.total_count:
+            return None
+        return round(min(self.record_count / self.total_count, 1.0) * 100, 1)
+
+    @property
+    def finished(self) -> bool:
+        """완료 또는 실패 여부"""
+        return self.status in (EXPORT_COMPLETED, EXPORT_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 파일/응답용 딕셔너리"""
+        return {**asdict(self), "file_name": self.file_name, "progress": self.progress}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExportJob":
+        """상태 파일에서 작업을 복원합니다."""
+        values = {key: data.get(key) for key in cls.__dataclass_fields__ if key in data}
+        for key in ("created_at", "finished_at"):
+            if values.get(key):
+                values[key] = datetime.fromisoformat(values[key])
+        return cls(**values)
+
+
+class _ProgressWriter:
+    """COPY 출력을 파일에 쓰면서 줄 수로 진행 상황을 기록하는 파일 객체"""
+
+    def __init__(self, fp: BinaryIO, on_line: Callable[[int], None]):
+        self.fp = fp
+        self.on_line = on_line
+
+    def write(self, data: Any) -> int:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.fp.write(data)
+        self.on_line(data.count(b"\n"))
+        return len(data)
+
+
+class ExportJobManager:
+    """
+    로그 내보내기 작업 관리자
+
+    - submit(): 내보내기 작업 등록 (전용 스레드 풀에서 실행)
+    - get()/path_of(): 작업 상태와 완료된 파일 경로
+    - cleanup_expired(): 유효 시간이 지난 작업과 파일 삭제
+    - shutdown(): 스레드 풀 종료 (애플리케이션 lifespan에서 호출)
+    """
+
+    def __init__(
+        self,
+        export_dir: str = "./exports",
+        max_workers: int = 2,
+        ttl: float = 3600,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        """
+        관리자 초기화
+
+        Args:
+            export_dir: 내보내기 파일과 상태 파일을 저장할 디렉터리
+            max_workers: 동시에 실행할 작업 수 (나머지는 대기)
+            ttl: 완료된 작업과 파일을 보관할 시간(초)
+            batch_size: 서버 측 커서에서 한 번에 가져올 행 수
+            session_factory: 세션 생성 함수
+        """
+        self.export_dir = Path(export_dir)
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+
+        self._jobs: Dict[str, ExportJob] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # 통계
+        self.completed_count = 0
+        self.failed_count = 0
+        self.expired_count = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="log-export"
+                )
+            return self._executor
+
+    def path_of(self, job: ExportJob) -> Path:
+        """작업 파일 경로"""
+        return self.export_dir / f"{job.export_id}.{job.extension}"
+
+    def _status_path(self, export_id: str) -> Path:
+        return self.export_dir / f"{export_id}.status.json"
+
+    def _save(self, job: ExportJob) -> None:
+        """작업 상태 파일을 원자적으로 갱신합니다."""
+        path = self._status_path(job.export_id)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(json.dumps(job.to_dict(), default=str), encoding="utf-8")
+        os.replace(temp_path, path)
+
+    def submit(
+        self,
+        name: str,
+        statement: Select,
+        format: str = "csv",
+        compress: bool = False,
+        owner: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> ExportJob:
+        """
+        내보내기 작업을 등록합니다. 작업은 스레드 풀에서 실행되며 바로 반환합니다.
+
+        Args:
+            name: 파일 이름 접두어 (예: login_logs)
+            statement: 내보낼 SELECT 문 (컬럼 이름이 필드 이름)
+            format: 내보내기 형식 (json, ndjson, csv)
+            compress: gzip 압축 여부
+            owner: 요청한 사용자 ID
+            metadata: JSON 문서 머리에 쓸 항목
+
+        Returns:
+            등록된 작업
+
+        Raises:
+            ValueError: 지원하지 않는 형식
+        """
+        if format not in RECORD_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {format} (지원: {', '.join(RECORD_FORMATS)})")
+
+        self.cleanup_expired()
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        job = ExportJob(export_id=uuid.uuid4().hex, name=name, format=format, compress=compress, owner=owner)
+        with self._lock:
+            self._jobs[job.export_id] = job
+        self._save(job)
+
+        self._get_executor().submit(self.run, job, statement, metadata)
+        logger.info(f"📤 내보내기 작업 등록 - {job.export_id} ({name}, {job.extension})")
+        return job
+
+    def run(self, job: ExportJob, statement: Select, metadata: Optional[Dict[str, Any]] = None) -> ExportJob:
+        """
+        작업을 실행합니다. (submit()이 스레드 풀에서 호출)
+
+        Args:
+            job: 실행할 작업
+            statement: 내보낼 SELECT 문
+            metadata: JSON 문서 머리에 쓸 항목
+
+        Returns:
+            완료 또는 실패한 작업
+        """
+        path = self.path_of(job)
+        temp_path = path.with_name(path.name + ".part")
+        job.status = EXPORT_RUNNING
+        self._save(job)
+
+        db = None
+        try:
+            db = self.session_factory()
+            job.total_count = db.execute(
+                select(func.count()).select_from(statement.order_by(None).subquery())
+            ).scalar()
+            self._save(job)
+
+            opener = gzip.open if job.compress else open
+            with opener(temp_path, "wb") as fp:
+                if job.format == "csv" and supports_copy(db):
+                    self._write_copy(db, job, statement, fp)
+                else:
+                    fields = [column.key for column in statement.selected_columns]
+                    rows = self._track(job, iter_rows(db, statement, self.batch_size))
+                    for chunk in encode_records(rows, job.format, fields, metadata):
+                        fp.write(chunk)
+
+            os.replace(temp_path, path)
+            job.file_size = path.stat().st_size
+            job.status = EXPORT_COMPLETED
+            self.completed_count += 1
+            logger.info(f"✅ 내보내기 완료 - {job.export_id}: {job.record_count}건, {job.file_size} bytes")
+        except Exception as e:
+            job.status = EXPORT_FAILED
+            job.error = str(e)
+            self.failed_count += 1
+            temp_path.unlink(missing_ok=True)
+            logger.error(f"❌ 내보내기 실패 - {job.export_id}: {e}")
+        finally:
+            if db is not None:
+                db.close()
+            job.finished_at = datetime.now()
+            self._save(job)
+        return job
+
+    def _write_copy(self, db: Session, job: ExportJob, statement: Select, fp: BinaryIO) -> None:
+        """COPY ... TO STDOUT으로 CSV를 씁니다. (진행 상황은 줄 수로 추정)"""
+        # record_stream CSV와 같이 엑셀용 BOM을 먼저 씀
+        fp.write("\ufeff".encode("utf-8"))
+        lines = 0
+        saved_at = time.monotonic()
+
+        def on_line(count: int) -> None:
+            nonlocal lines, saved_at
+            lines += count
+            # 첫 줄은 헤더
+            job.record_count = max(lines - 1, 0)
+            if time.monotonic() - saved_at >= PROGRESS_INTERVAL:
+                saved_at = time.monotonic()
+                self._save(job)
+
+        job.record_count = copy_csv(db, statement, _ProgressWriter(fp, on_line))
+
+    def _track(self, job: ExportJob, rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """행을 넘기면서 기록한 행 수를 세고 주기적으로 진행 상황을 저장합니다."""
+        saved_at = time.monotonic()
+        for row in rows:
+            job.record_count += 1
+            if time.monotonic() - saved_at >= PROGRESS_INTERVAL:
+                saved_at = time.monotonic()
+                self._save(job)
+            yield row
+
+    def get(self, export_id: str) -> Optional[ExportJob]:
+        """
+        작업 상태를 조회합니다. 다른 워커가 실행한 작업은 상태 파일에서 읽습니다.
+
+        Args:
+            export_id: 작업 ID
+
+        Returns:
+            작업 (없거나 만료되었으면 None)
+        """
+        job = self._jobs.get(export_id)
+        if job is not None:
+            return job
+        # 경로 조작 방지: 작업 ID는 uuid4 hex
+        if len(export_id) != 32 or not export_id.isalnum():
+            return None
+        path = self._status_path(export_id)
+        try:
+            return ExportJob.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def expires_at(self, job: ExportJob) -> Optional[datetime]:
+        """작업 만료 시각 (끝나지 않았으면 None)"""
+        return job.finished_at + timedelta(seconds=self.ttl) if job.finished_at else None
+
+    def describe(self, job: ExportJob) -> Dict[str, Any]:
+        """작업 상태와 만료 시각 (응답용)"""
+        return {**job.to_dict(), "expires_at": self.expires_at(job)}
+
+    def cleanup_expired(self, now: Optional[datetime] = None) -> int:
+        """
+        완료 후 ttl이 지난 작업과 파일을 삭제합니다.
+
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            삭제한 작업 수
+        """
+        now = now or datetime.now()
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values()
+                if job.finished and self.expires_at(job) <= now
+            ]
+            for job in expired:
+                del self._jobs[job.export_id]
+
+        for job in expired:
+            self.path_of(job).unlink(missing_ok=True)
+            self._status_path(job.export_id).unlink(missing_ok=True)
+        self.expired_count += len(expired)
+        return len(expired)
+
+    def shutdown(self) -> None:
+        """스레드 풀을 종료합니다. 실행 중인 작업은 끝까지 진행하고 대기 중인 작업은 취소합니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        작업 관리자 상태 통계를 반환합니다.
+
+        Returns:
+            설정값과 상태별 작업 수
+        """
+        with self._lock:
+            statuses: Dict[str, int] = {}
+            for job in self._jobs.values():
+                statuses[job.status] = statuses.get(job.status, 0) + 1
+        return {
+            "export_dir": str(self.export_dir),
+            "max_workers": self.max_workers,
+            "ttl": self.ttl,
+            "jobs": statuses,
+            "completed": self.completed_count,
+            "failed": self.failed_count,
+            "expired": self.expired_count
+        }
+
+
+def _create_export_job_manager_from_env() -> ExportJobManager:
+    """
+    환경 변수에서 내보내기 작업 설정을 읽어 인스턴스를 생성합니다.
+    """
+    return ExportJobManager(
+        export_dir=os.getenv("EXPORT_DIR", "./exports"),
+        max_workers=int(os.getenv("EXPORT_JOB_WORKERS", "2")),
+        ttl=float(os.getenv("EXPORT_JOB_TTL", "3600")),
+        batch_size=int(os.getenv("EXPORT_BATCH_SIZE", str(DEFAULT_BATCH_SIZE)))
+    )
+
+
+export_job_manager = _create_export_job_manager_from_env()
+
+
+def get_export_job_manager() -> ExportJobManager:
+    """
+    로그 내보내기 작업 관리자 인스턴스 반환
+
+    Returns:
+        ExportJobManager 인스턴스
+    """
+    return export_job_manager
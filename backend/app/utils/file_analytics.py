@@ -0,0 +1,252 @@
+"""파일 통계 조회 및 캐시
+
+파일 통계(/files/statistics)와 유형별 통계(/file-details/statistics)를
+최대 두 번의 그룹 쿼리로 계산합니다.
+
+- 확장자별 파일 수/크기: GROUP BY file_extsn 한 번. 전체 수/크기와 평균,
+  유형별(image, document, ...) 통계는 이 결과를 합산해 만듭니다.
+- 최근 N일 업로드 추세: 일자별 GROUP BY 한 번. PostgreSQL에서는
+  generate_series로 업로드가 없는 날도 0건으로 채우고, 그 밖의 DB에서는
+  조회한 일자 외의 날을 0건으로 채웁니다.
+
+결과는 FILE_STATS_CACHE_TTL초 동안 캐시하며, 파일 업로드/삭제 시 invalidate()로
+버전을 올려 기존 결과를 모두 무효화합니다. 조회 도중 무효화되면 그 결과는
+이전 버전 키로 저장되므로 다시 사용되지 않습니다.
+다른 워커의 캐시에는 TTL이 지난 뒤 반영됩니다.
+"""
+
+import logging
+import os
+import threading
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Date, cast, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from app.models.file_models import FileDetail
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# 업로드 추세 최대 조회 일수
+MAX_TREND_DAYS = 366
+
+
+def _active():
+    return FileDetail.file_delete_yn == 'N'
+
+
+def query_extension_stats(db: Session) -> Dict[str, Dict[str, Any]]:
+    """
+    삭제되지 않은 파일의 확장자별 파일 수와 총 크기를 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        {확장자: {"count", "total_size"}} (확장자가 없으면 'unknown')
+    """
+    rows = db.execute(
+        select(
+            FileDetail.file_extsn,
+            func.count().label('count'),
+            func.coalesce(func.sum(FileDetail.file_size), 0).label('total_size')
+        ).where(_active()).group_by(FileDetail.file_extsn)
+    ).all()
+
+    stats: Dict[str, Dict[str, Any]] = {}
+    for ext, count, total_size in rows:
+        entry = stats.setdefault(ext or 'unknown', {'count': 0, 'total_size': 0})
+        entry['count'] += count
+        entry['total_size'] += total_size
+    return stats
+
+
+def query_upload_trend(db: Session, days: int, today: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    최근 days일의 일자별 업로드 수를 조회합니다. 업로드가 없는 날은 0건입니다.
+
+    Args:
+        db: 데이터베이스 세션
+        days: 조회 일수 (오늘 포함)
+        today: 기준일 (기본값: 오늘)
+
+    Returns:
+        [{"date": "YYYY-MM-DD", "count"}] (최근 일자부터)
+    """
+    today = today or date.today()
+    first_day = today - timedelta(days=days - 1)
+    is_postgresql = db.get_bind().dialect.name == "postgresql"
+    day = cast(FileDetail.frst_regist_pnttm, Date) if is_postgresql else func.date(FileDetail.frst_regist_pnttm)
+    daily = (
+        select(day.label('day'), func.count().label('count'))
+        .where(
+            _active(),
+            FileDetail.frst_regist_pnttm >= datetime.combine(first_day, time.min),
+            FileDetail.frst_regist_pnttm < datetime.combine(today + timedelta(days=1), time.min)
+        )
+        .group_by(day)
+    )
+
+    if is_postgresql:
+        # generate_series로 기간의 모든 일자를 만들고 업로드 수를 붙임
+        series = func.generate_series(
+            cast(first_day, Date), cast(today, Date), literal_column("interval '1 day'")
+        ).table_valued("day").render_derived(name="days")
+        counts = daily.subquery("daily")
+        series_day = cast(series.c.day, Date)
+        rows = db.execute(
+            select(series_day.label('day'), func.coalesce(counts.c.count, 0).label('count'))
+            .select_from(series.outerjoin(counts, counts.c.day == series_day))
+            .order_by(series_day.desc())
+        ).all()
+        return [{'date': str(row.day), 'count': row.count} for row in rows]
+
+    counts = {str(row.day): row.count for row in db.execute(daily).all()}
+    trend = []
+    for offset in range(days):
+        day_str = (today - timedelta(days=offset)).isoformat()
+        trend.append({'date': day_str, 'count': counts.get(day_str, 0)})
+    return trend
+
+
+class FileAnalytics:
+    """
+    파일 통계 조회기
+
+    - get_summary(): 전체 수/크기/평균, 확장자별 통계, 업로드 추세
+    - get_type_summary(): 유형별 파일 수/크기
+    - invalidate(): 파일 업로드/삭제 시 캐시 무효화
+    """
+
+    def __init__(self, ttl: float = 60.0, trend_days: int = 7, max_size: int = 64):
+        """
+        조회기 초기화
+
+        Args:
+            ttl: 결과 캐시 유효 시간(초, 0이면 캐시 비활성화)
+            trend_days: 업로드 추세 기본 조회 일수
+            max_size: 캐시할 최대 결과 수 (추세 조회 일수별로 하나씩)
+        """
+        self.trend_days = trend_days
+        self.cache = TTLCache(max_size=max_size if ttl > 0 else 0, ttl=ttl)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """현재 캐시 버전"""
+        return self._version
+
+    def invalidate(self) -> None:
+        """캐시된 통계를 모두 무효화합니다. (파일 업로드/삭제 후 호출)"""
+        with self._lock:
+            self._version += 1
+        self.cache.clear()
+
+    def _cached(self, key: Any, load):
+        version = self._version
+        value = self.cache.get((version, key))
+        if value is None:
+            value = load()
+            self.cache.set((version, key), value)
+        return value
+
+    def extension_stats(self, db: Session) -> Dict[str, Dict[str, Any]]:
+        """확장자별 파일 수와 총 크기 (캐시)"""
+        return self._cached("extensions", lambda: query_extension_stats(db))
+
+    def upload_trend(self, db: Session, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        최근 days일의 일자별 업로드 수 (캐시)
+
+        Args:
+            db: 데이터베이스 세션
+            days: 조회 일수 (기본값: trend_days, 최대 MAX_TREND_DAYS)
+
+        Returns:
+            [{"date", "count"}] (최근 일자부터)
+        """
+        days = max(1, min(days or self.trend_days, MAX_TREND_DAYS))
+        today = date.today()
+        return self._cached(("trend", days, today), lambda: query_upload_trend(db, days, today))
+
+    def get_summary(self, db: Session, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        파일 통계를 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            days: 업로드 추세 조회 일수
+
+        Returns:
+            total_files, total_size, avg_file_size, file_types, upload_trend
+        """
+        file_types = self.extension_stats(db)
+        total_files = sum(entry['count'] for entry in file_types.values())
+        total_size = Decimal(sum(entry['total_size'] for entry in file_types.values()))
+
+        return {
+            'total_files': total_files,
+            'total_size': total_size,
+            'avg_file_size': total_size / Decimal(total_files) if total_files > 0 else Decimal(0),
+            'file_types': file_types,
+            'upload_trend': self.upload_trend(db, days)
+        }
+
+    def get_type_summary(self, db: Session, type_extensions: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        유형별 파일 수와 총 크기를 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            type_extensions: {유형: [확장자, ...]}
+
+        Returns:
+            {유형: {"count", "total_size_bytes", "total_size_mb"}}
+        """
+        file_types = self.extension_stats(db)
+        statistics = {}
+        for file_type, extensions in type_extensions.items():
+            entries = [file_types[ext] for ext in extensions if ext in file_types]
+            total_size = sum(entry['total_size'] for entry in entries)
+            statistics[file_type] = {
+                'count': sum(entry['count'] for entry in entries),
+                'total_size_bytes': total_size,
+                'total_size_mb': round(total_size / (1024 * 1024), 2)
+            }
+        return statistics
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 상태 통계를 반환합니다.
+
+        Returns:
+            버전과 캐시 적중 통계
+        """
+        return {"version": self._version, "trend_days": self.trend_days, **self.cache.get_stats()}
+
+
+def _create_file_analytics_from_env() -> FileAnalytics:
+    """
+    환경 변수에서 파일 통계 설정을 읽어 인스턴스를 생성합니다.
+    """
+    return FileAnalytics(
+        ttl=float(os.getenv("FILE_STATS_CACHE_TTL", "60")),
+        trend_days=int(os.getenv("FILE_STATS_TREND_DAYS", "7"))
+    )
+
+
+file_analytics = _create_file_analytics_from_env()
+
+
+def get_file_analytics() -> FileAnalytics:
+    """
+    파일 통계 조회기 인스턴스 반환
+
+    Returns:
+        FileAnalytics 인스턴스
+    """
+    return file_analytics
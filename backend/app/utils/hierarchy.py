@@ -0,0 +1,319 @@
+"""계층 구조 조회 유틸리티
+
+자기 참조 테이블(메뉴, 조직 등)의 상위 경로, 하위 여부, 하위 트리,
+최대 하위 깊이를 WITH RECURSIVE 쿼리 한 번으로 조회합니다.
+
+이미 메모리에 올라온 (노드 ID -> 상위 노드 ID) 인접 맵이 있으면
+AdjacencyMap으로 같은 질의를 DB 왕복 없이 처리할 수 있습니다.
+두 구현 모두 순환 참조 데이터에서 무한 루프에 빠지지 않습니다.
+
+구체화 경로(materialized path)는 "/최상위ID/.../노드ID/" 형식이며
+make_path()로 만들고 AdjacencyMap.get_path()로 다시 계산할 수 있습니다.
+"""
+
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import Session
+
+ModelType = TypeVar("ModelType")
+
+# 구체화 경로 구분자
+PATH_SEPARATOR = "/"
+
+
+def make_path(parent_path: Optional[str], node_id: Any) -> str:
+    """
+    상위 노드 경로에 노드 ID를 이어 붙인 구체화 경로를 만듭니다.
+
+    Args:
+        parent_path: 상위 노드 경로 (최상위 노드는 None)
+        node_id: 노드 ID
+
+    Returns:
+        구체화 경로 (예: "/1/11/")
+    """
+    return f"{parent_path or PATH_SEPARATOR}{node_id}{PATH_SEPARATOR}"
+
+
+class AdjacencyMap:
+    """
+    메모리 인접 맵 기반 계층 조회
+
+    캐시된 (노드 ID -> 상위 노드 ID) 맵으로 HierarchyQuery와 같은 질의에 답합니다.
+    """
+
+    def __init__(self, parents: Dict[Any, Optional[Any]]):
+        """
+        인접 맵 초기화
+
+        Args:
+            parents: 노드 ID -> 상위 노드 ID 맵 (최상위 노드는 None)
+        """
+        self.parents = parents
+        self.children: Dict[Any, List[Any]] = {}
+        for node_id, parent_id in parents.items():
+            if parent_id is not None:
+                self.children.setdefault(parent_id, []).append(node_id)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[Any, Optional[Any]]]) -> "AdjacencyMap":
+        """(노드 ID, 상위 노드 ID) 행 목록으로 인접 맵을 생성합니다."""
+        return cls({node_id: parent_id for node_id, parent_id in rows})
+
+    def __contains__(self, node_id: Any) -> bool:
+        return node_id in self.parents
+
+    def get_ancestor_ids(self, node_id: Any) -> List[Any]:
+        """
+        최상위 노드부터 현재 노드까지의 ID 경로를 반환합니다.
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            ID 경로 (노드가 없으면 빈 목록)
+        """
+        path = []
+        seen = set()
+        current = node_id
+        while current is not None and current in self.parents and current not in seen:
+            seen.add(current)
+            path.append(current)
+            current = self.parents[current]
+        path.reverse()
+        return path
+
+    def is_descendant(self, ancestor_id: Any, node_id: Any) -> bool:
+        """
+        node_id가 ancestor_id의 하위 노드인지 확인합니다.
+
+        Args:
+            ancestor_id: 상위 노드 ID
+            node_id: 확인할 노드 ID
+
+        Returns:
+            하위 노드 여부 (자기 자신은 하위 노드가 아님)
+        """
+        return ancestor_id in self.get_ancestor_ids(node_id)[:-1]
+
+    def get_path(self, node_id: Any) -> Optional[Tuple[str, int]]:
+        """
+        노드의 구체화 경로와 깊이를 계산합니다.
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            (경로, 깊이) 튜플 (최상위 노드가 깊이 1), 순환 참조나 없는 상위 노드로
+            최상위까지 이어지지 않으면 None
+        """
+        ancestor_ids = self.get_ancestor_ids(node_id)
+        if not ancestor_ids or self.parents[ancestor_ids[0]] is not None:
+            return None
+
+        path = None
+        for ancestor_id in ancestor_ids:
+            path = make_path(path, ancestor_id)
+        return path, len(ancestor_ids)
+
+    def get_subtree_ids(self, node_id: Any) -> List[Tuple[Any, int]]:
+        """
+        노드와 모든 하위 노드의 (ID, 상대 깊이) 목록을 반환합니다.
+
+        Args:
+            node_id: 시작 노드 ID
+
+        Returns:
+            (노드 ID, 깊이) 목록 (시작 노드가 깊이 0, 노드가 없으면 빈 목록)
+        """
+        if node_id not in self.parents:
+            return []
+
+        result = [(node_id, 0)]
+        seen = {node_id}
+        index = 0
+        while index < len(result):
+            current, depth = result[index]
+            index += 1
+            for child_id in self.children.get(current, []):
+                if child_id not in seen:
+                    seen.add(child_id)
+                    result.append((child_id, depth + 1))
+        return result
+
+    def get_max_depth(self, node_id: Any) -> int:
+        """
+        노드 아래 최대 하위 깊이를 반환합니다.
+
+        Args:
+            node_id: 시작 노드 ID
+
+        Returns:
+            최대 하위 깊이 (하위 노드가 없으면 0)
+        """
+        return max((depth for _, depth in self.get_subtree_ids(node_id)), default=0)
+
+
+class HierarchyQuery(Generic[ModelType]):
+    """
+    WITH RECURSIVE 기반 계층 조회
+
+    - get_ancestors(): 최상위부터 현재 노드까지의 경로
+    - is_descendant(): 하위 노드 여부
+    - get_subtree(): 노드와 모든 하위 노드 (상대 깊이 포함)
+    - get_max_depth(): 최대 하위 깊이
+    - load_adjacency(): 전체 인접 맵 (AdjacencyMap)
+
+    각 메서드는 계층 깊이와 관계없이 쿼리 한 번으로 처리합니다.
+    """
+
+    def __init__(self, model: Type[ModelType], id_attr: str, parent_attr: str, max_levels: int = 64):
+        """
+        계층 조회 초기화
+
+        Args:
+            model: 자기 참조 SQLAlchemy 모델 클래스
+            id_attr: 노드 ID 컬럼 속성명
+            parent_attr: 상위 노드 ID 컬럼 속성명
+            max_levels: 재귀 최대 단계 (순환 참조 데이터 안전장치)
+        """
+        self.model = model
+        self.id_column = getattr(model, id_attr)
+        self.parent_column = getattr(model, parent_attr)
+        self.max_levels = max_levels
+
+    def _ancestors_cte(self, node_id: Any):
+        """node_id에서 시작해 상위 방향으로 올라가는 재귀 CTE"""
+        anchor = select(
+            self.id_column.label("node_id"),
+            self.parent_column.label("parent_id"),
+            literal(0).label("lvl")
+        ).where(self.id_column == node_id).cte("ancestors", recursive=True)
+
+        step = select(
+            self.id_column,
+            self.parent_column,
+            anchor.c.lvl + 1
+        ).where(
+            self.id_column == anchor.c.parent_id,
+            anchor.c.lvl < self.max_levels
+        )
+        return anchor.union_all(step)
+
+    def _descendants_cte(self, node_id: Any):
+        """node_id에서 시작해 하위 방향으로 내려가는 재귀 CTE"""
+        anchor = select(
+            self.id_column.label("node_id"),
+            literal(0).label("lvl")
+        ).where(self.id_column == node_id).cte("descendants", recursive=True)
+
+        step = select(
+            self.id_column,
+            anchor.c.lvl + 1
+        ).where(
+            self.parent_column == anchor.c.node_id,
+            anchor.c.lvl < self.max_levels
+        )
+        return anchor.union_all(step)
+
+    def get_ancestors(self, db: Session, node_id: Any) -> List[ModelType]:
+        """
+        최상위 노드부터 현재 노드까지의 경로를 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            node_id: 노드 ID
+
+        Returns:
+            노드 경로 (노드가 없으면 빈 목록)
+        """
+        cte = self._ancestors_cte(node_id)
+        rows = db.query(self.model, cte.c.lvl).join(
+            cte, self.id_column == cte.c.node_id
+        ).order_by(cte.c.lvl).all()
+
+        # 순환 참조가 있으면 같은 노드가 반복되므로 처음 만난 곳에서 멈춤
+        path = []
+        seen = set()
+        for obj, _ in rows:
+            key = getattr(obj, self.id_column.key)
+            if key in seen:
+                break
+            seen.add(key)
+            path.append(obj)
+        path.reverse()
+        return path
+
+    def is_descendant(self, db: Session, ancestor_id: Any, node_id: Any) -> bool:
+        """
+        node_id가 ancestor_id의 하위 노드인지 확인합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            ancestor_id: 상위 노드 ID
+            node_id: 확인할 노드 ID
+
+        Returns:
+            하위 노드 여부 (자기 자신은 하위 노드가 아님)
+        """
+        cte = self._ancestors_cte(node_id)
+        found = db.query(cte.c.node_id).filter(
+            cte.c.node_id == ancestor_id,
+            cte.c.lvl > 0
+        ).limit(1).first()
+        return found is not None
+
+    def get_subtree(self, db: Session, node_id: Any) -> List[Tuple[ModelType, int]]:
+        """
+        노드와 모든 하위 노드를 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            node_id: 시작 노드 ID
+
+        Returns:
+            (노드, 깊이) 목록 (시작 노드가 깊이 0, 얕은 노드부터)
+        """
+        cte = self._descendants_cte(node_id)
+        rows = db.query(self.model, cte.c.lvl).join(
+            cte, self.id_column == cte.c.node_id
+        ).order_by(cte.c.lvl).all()
+
+        subtree = []
+        seen = set()
+        for obj, depth in rows:
+            key = getattr(obj, self.id_column.key)
+            if key not in seen:
+                seen.add(key)
+                subtree.append((obj, depth))
+        return subtree
+
+    def get_max_depth(self, db: Session, node_id: Any) -> int:
+        """
+        노드 아래 최대 하위 깊이를 조회합니다.
+
+        순환 참조 데이터에서는 max_levels에서 재귀가 멈춥니다.
+
+        Args:
+            db: 데이터베이스 세션
+            node_id: 시작 노드 ID
+
+        Returns:
+            최대 하위 깊이 (하위 노드가 없으면 0)
+        """
+        cte = self._descendants_cte(node_id)
+        max_depth = db.query(func.max(cte.c.lvl)).scalar()
+        return int(max_depth or 0)
+
+    def load_adjacency(self, db: Session) -> AdjacencyMap:
+        """
+        전체 (노드 ID, 상위 노드 ID) 인접 맵을 한 번에 조회합니다.
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            AdjacencyMap
+        """
+        return AdjacencyMap.from_rows(db.query(self.id_column, self.parent_column).all())
@@ -3,11 +3,15 @@
 JWT 토큰 생성, 검증, 디코딩 기능을 제공합니다.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from jose import jwt
 from jose.exceptions import JWTError
+import hashlib
 import os
+import threading
+import time
 from dotenv import load_dotenv
 import logging
 
@@ -19,6 +23,7 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("JWT_VERIFIED_CACHE_SIZE", "4096"))
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -134,6 +139,127 @@ def verify_token(token: str, token_type: str = "access") -> Optional[Dict[str, A
         return None
 
 
+class VerifiedTokenCache:
+    """
+    검증이 끝난 JWT 페이로드 LRU 캐시
+    
+    토큰 원문 대신 SHA-256 digest를 키로 저장하며, 각 항목은 토큰의
+    exp 클레임 시각까지만 유효합니다. 같은 클라이언트의 반복 요청에서
+    서명(HMAC) 검증과 JSON 디코딩을 생략하기 위해 사용합니다.
+    """
+    
+    def __init__(self, max_size: int = 4096):
+        """
+        캐시 초기화
+        
+        Args:
+            max_size: 최대 저장 토큰 수
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _key(token: str, token_type: str) -> Tuple[str, str]:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest(), token_type
+    
+    def get(self, token: str, token_type: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 페이로드를 조회합니다. 만료된 항목은 제거됩니다.
+        
+        Args:
+            token: JWT 토큰
+            token_type: 토큰 타입
+            
+        Returns:
+            페이로드 복사본 또는 None
+        """
+        key = self._key(token, token_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(payload)
+    
+    def put(self, token: str, token_type: str, payload: Dict[str, Any]) -> None:
+        """
+        검증된 페이로드를 저장합니다. exp 클레임이 없으면 저장하지 않습니다.
+        
+        Args:
+            token: JWT 토큰
+            token_type: 토큰 타입
+            payload: 검증된 페이로드
+        """
+        exp = payload.get("exp")
+        if not exp or self.max_size <= 0:
+            return
+        
+        key = self._key(token, token_type)
+        with self._lock:
+            self._entries[key] = (float(exp), dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 적중 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+# 전역 검증 토큰 캐시
+verified_token_cache = VerifiedTokenCache(VERIFIED_TOKEN_CACHE_SIZE)
+
+
+def verify_token_cached(token: str, token_type: str = "access") -> Optional[Dict[str, Any]]:
+    """
+    검증 토큰 캐시를 거쳐 JWT 토큰을 검증합니다.
+    
+    캐시에 있고 exp 이전이면 서명 검증 없이 페이로드를 반환하고,
+    없으면 verify_token으로 검증한 뒤 결과를 캐시에 저장합니다.
+    
+    Args:
+        token: 검증할 JWT 토큰
+        token_type: 토큰 타입 ("access" 또는 "refresh")
+        
+    Returns:
+        토큰이 유효한 경우 페이로드, 그렇지 않으면 None
+    """
+    if not token or not isinstance(token, str):
+        return verify_token(token, token_type)
+    
+    payload = verified_token_cache.get(token, token_type)
+    if payload is not None:
+        return payload
+    
+    payload = verify_token(token, token_type)
+    if payload:
+        verified_token_cache.put(token, token_type, payload)
+    return payload
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
     JWT 토큰을 디코딩합니다 (검증 없이).
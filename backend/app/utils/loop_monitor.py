@@ -0,0 +1,223 @@
+"""이벤트 루프 지연(loop lag) 모니터
+
+백그라운드 태스크가 interval마다 깨어나 예정 시각보다 얼마나 늦게 깨어났는지를
+측정합니다. 늦어진 시간은 그동안 이벤트 루프를 점유한 동기 작업(동기 DB 호출,
+CPU 작업 등)의 시간입니다.
+
+지연이 threshold 이상이면 그 구간에 처리 중이던 요청의 엔드포인트에 지연을
+기록하여 루프를 가장 오래 막은 엔드포인트를 찾을 수 있게 합니다. 같은 구간에
+처리 중이던 요청이 여럿이면 모두에 기록되므로 엔드포인트별 값은 상한입니다.
+워커 프로세스마다 이벤트 루프가 따로 있으므로 값도 프로세스 단위입니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+from app.database.pool_metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# 루프 지연 히스토그램 구간 상한(초)
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class _EndpointLag:
+    """엔드포인트별 루프 지연 누적값"""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, lag: float) -> None:
+        self.count += 1
+        self.total += lag
+        self.max = max(self.max, lag)
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 모니터
+
+    - start()/stop(): 측정 태스크 시작/종료 (애플리케이션 lifespan에서 호출)
+    - request_started()/request_finished(): LoopLagMiddleware가 요청마다 호출
+    - get_stats(): 지연 히스토그램과 지연을 가장 많이 일으킨 엔드포인트 목록
+    """
+
+    def __init__(self, interval: float = 0.05, threshold: float = 0.1, top: int = 10):
+        """
+        모니터 초기화
+
+        Args:
+            interval: 측정 주기(초)
+            threshold: 엔드포인트에 기록할 최소 지연(초)
+            top: 통계에 표시할 엔드포인트 수
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.top = top
+        self.lag = Histogram(LAG_BUCKETS)
+
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._next_id = 0
+        # 요청 ID -> ASGI scope (라우팅 후 scope["route"]로 엔드포인트 확인)
+        self._inflight: Dict[int, Dict[str, Any]] = {}
+        # 최근 끝난 요청 (종료 시각, 엔드포인트): 지연 구간 중에 끝난 요청도 기록하기 위함
+        self._recent: deque = deque(maxlen=256)
+        self._endpoints: Dict[str, _EndpointLag] = {}
+
+        # 통계
+        self.blocked_count = 0
+        self.blocked_seconds = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """측정 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """측정 태스크를 시작합니다."""
+        if self.interval <= 0 or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"✅ 이벤트 루프 지연 모니터 시작 - 주기: {self.interval}s, 기준: {self.threshold}s")
+
+    async def stop(self) -> None:
+        """측정 태스크를 종료합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        expected = loop.time() + self.interval
+        while True:
+            await asyncio.sleep(self.interval)
+            now = loop.time()
+            self.record(max(0.0, now - expected), since=expected)
+            expected = now + self.interval
+
+    def record(self, lag: float, since: float) -> None:
+        """
+        측정한 지연을 기록합니다.
+
+        Args:
+            lag: 예정 시각보다 늦어진 시간(초)
+            since: 지연 구간 시작 시각 (loop.time() 기준)
+        """
+        self.lag.observe(lag)
+        if lag < self.threshold:
+            return
+
+        endpoints = {self._endpoint_key(scope) for scope in self._inflight.values()}
+        endpoints.update(endpoint for finished_at, endpoint in self._recent if finished_at >= since)
+
+        with self._lock:
+            self.blocked_count += 1
+            self.blocked_seconds += lag
+            for endpoint in endpoints:
+                self._endpoints.setdefault(endpoint, _EndpointLag()).add(lag)
+
+        logger.warning(
+            f"⚠️ 이벤트 루프 지연 {lag * 1000:.0f}ms - 처리 중 엔드포인트: {', '.join(sorted(endpoints)) or '없음'}"
+        )
+
+    def request_started(self, scope: Dict[str, Any]) -> int:
+        """
+        요청 시작을 기록합니다.
+
+        Returns:
+            request_finished에 전달할 요청 ID
+        """
+        self._next_id += 1
+        self._inflight[self._next_id] = scope
+        return self._next_id
+
+    def request_finished(self, request_id: int, finished_at: float) -> None:
+        """
+        요청 종료를 기록합니다.
+
+        Args:
+            request_id: request_started가 반환한 요청 ID
+            finished_at: 종료 시각 (loop.time() 기준)
+        """
+        scope = self._inflight.pop(request_id, None)
+        if scope is not None:
+            self._recent.append((finished_at, self._endpoint_key(scope)))
+
+    @staticmethod
+    def _endpoint_key(scope: Dict[str, Any]) -> str:
+        """라우트 경로 템플릿 기준 엔드포인트 이름 (라우팅 전이면 요청 경로)"""
+        route = scope.get("route")
+        path = getattr(route, "path", None) or scope.get("path", "")
+        return f"{scope.get('method', '')} {path}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        루프 지연 지표를 반환합니다.
+
+        Returns:
+            실행 여부, 측정 설정, 누적 지연, 지연 히스토그램, 지연이 큰 엔드포인트 목록
+        """
+        with self._lock:
+            ranked = sorted(self._endpoints.items(), key=lambda item: item[1].total, reverse=True)
+            worst = [
+                {
+                    "endpoint": endpoint,
+                    "count": lag.count,
+                    "total_seconds": round(lag.total, 6),
+                    "max_seconds": round(lag.max, 6)
+                }
+                for endpoint, lag in ranked[:self.top]
+            ]
+            blocked = {
+                "blocked_count": self.blocked_count,
+                "blocked_seconds": round(self.blocked_seconds, 6)
+            }
+
+        return {
+            "pid": os.getpid(),
+            "running": self.is_running,
+            "interval_seconds": self.interval,
+            "threshold_seconds": self.threshold,
+            **blocked,
+            "inflight_requests": len(self._inflight),
+            "lag_seconds": self.lag.snapshot(),
+            "worst_endpoints": worst
+        }
+
+
+def _create_monitor_from_env() -> LoopLagMonitor:
+    """
+    환경 변수에서 모니터 설정을 읽어 인스턴스를 생성합니다.
+    """
+    return LoopLagMonitor(
+        interval=float(os.getenv("LOOP_LAG_INTERVAL", "0.05")),
+        threshold=float(os.getenv("LOOP_LAG_THRESHOLD", "0.1")),
+        top=int(os.getenv("LOOP_LAG_TOP_ENDPOINTS", "10"))
+    )
+
+
+loop_lag_monitor = _create_monitor_from_env()
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """
+    이벤트 루프 지연 모니터 인스턴스 반환
+
+    Returns:
+        LoopLagMonitor 인스턴스
+    """
+    return loop_lag_monitor
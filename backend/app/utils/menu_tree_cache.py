@@ -0,0 +1,244 @@
+"""메뉴 트리 캐시
+
+use_at별로 구성된 메뉴 트리와 미리 인코딩한 JSON 바이트, ETag를
+버전 번호와 함께 보관합니다. 메뉴를 변경하는 서비스 메서드가 bump()를
+호출하면 버전이 올라가 기존 항목이 모두 무효화됩니다.
+
+여러 워커가 떠 있는 환경에서는 MENU_TREE_CACHE_SYNC=redis로 설정하면
+bump() 시 Redis 채널에 무효화 메시지를 발행하고, 각 워커의 구독 태스크가
+이를 받아 자신의 캐시를 무효화합니다. 메시지 유실에 대비해 항목은
+MENU_TREE_CACHE_TTL이 지나면 만료됩니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MenuTreeEntry(NamedTuple):
+    """캐시된 메뉴 트리 항목"""
+    version: int
+    tree: List[Dict[str, Any]]
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+class MenuTreeCache:
+    """
+    버전 기반 메뉴 트리 캐시
+
+    - get(): 현재 버전이고 만료되지 않은 항목 반환
+    - set(): 조회 시작 시점의 버전으로 항목 저장 (그 사이 bump 되었으면 저장하지 않음)
+    - bump(): 버전 증가 및 전체 무효화, Redis 동기화 시 다른 워커에 전파
+    - start()/stop(): Redis 무효화 채널 구독 태스크 시작/종료
+    """
+
+    CHANNEL = "skyboot:menu_tree:invalidate"
+
+    def __init__(self, ttl: float = 300.0, redis_url: Optional[str] = None):
+        """
+        캐시 초기화
+
+        Args:
+            ttl: 항목 유효 시간(초, 0이면 캐시 비활성화)
+            redis_url: 워커 간 무효화 전파에 사용할 Redis URL (None이면 프로세스 단위)
+        """
+        self.ttl = ttl
+        self.redis_url = redis_url
+        self.worker_id = uuid.uuid4().hex
+        self._version = 0
+        self._entries: Dict[str, MenuTreeEntry] = {}
+        self._lock = threading.Lock()
+        self._publisher = None
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        """현재 캐시 버전"""
+        return self._version
+
+    def get(self, use_at: str) -> Optional[MenuTreeEntry]:
+        """
+        캐시된 메뉴 트리를 조회합니다.
+
+        Args:
+            use_at: 사용 여부 필터
+
+        Returns:
+            MenuTreeEntry 또는 None (없거나 무효화/만료된 경우)
+        """
+        with self._lock:
+            entry = self._entries.get(use_at)
+            if entry is None or entry.version != self._version or entry.expires_at <= time.monotonic():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry
+
+    def set(self, use_at: str, version: int, tree: List[Dict[str, Any]], body: bytes) -> MenuTreeEntry:
+        """
+        메뉴 트리를 저장합니다.
+
+        Args:
+            use_at: 사용 여부 필터
+            version: 트리를 조회하기 전에 읽은 캐시 버전
+            tree: 메뉴 트리
+            body: 미리 인코딩한 JSON 응답 본문
+
+        Returns:
+            생성된 MenuTreeEntry (버전이 바뀌었으면 저장되지 않은 항목)
+        """
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        entry = MenuTreeEntry(version, tree, body, etag, time.monotonic() + self.ttl)
+        if self.ttl <= 0:
+            return entry
+
+        with self._lock:
+            # 조회 도중 메뉴가 변경되었으면 오래된 트리를 저장하지 않음
+            if version == self._version:
+                self._entries[use_at] = entry
+        return entry
+
+    def invalidate_local(self) -> int:
+        """
+        이 프로세스의 캐시를 무효화합니다.
+
+        Returns:
+            증가된 버전
+        """
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            return self._version
+
+    def bump(self) -> int:
+        """
+        메뉴 변경 후 캐시를 무효화하고 다른 워커에 전파합니다.
+
+        Returns:
+            증가된 버전
+        """
+        version = self.invalidate_local()
+        if self.redis_url:
+            try:
+                if self._publisher is None:
+                    import redis
+
+                    self._publisher = redis.Redis.from_url(
+                        self.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+                    )
+                self._publisher.publish(self.CHANNEL, self.worker_id)
+            except Exception as e:
+                # 전파 실패 시 다른 워커는 TTL 만료 후 갱신
+                logger.error(f"❌ 메뉴 트리 캐시 무효화 전파 실패: {str(e)}")
+        logger.info(f"🔄 메뉴 트리 캐시 무효화 - version: {version}")
+        return version
+
+    @property
+    def is_running(self) -> bool:
+        """구독 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """
+        Redis 무효화 채널 구독 태스크를 시작합니다.
+        """
+        if not self.redis_url or self.is_running:
+            return
+
+        self._task = asyncio.create_task(self._listen(), name="menu-tree-cache-listener")
+        logger.info("🚀 메뉴 트리 캐시 무효화 구독 시작")
+
+    async def stop(self) -> None:
+        """
+        구독 태스크를 종료합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._publisher is not None:
+            self._publisher.close()
+            self._publisher = None
+
+    async def _listen(self) -> None:
+        """무효화 메시지를 구독하고 연결이 끊기면 재접속합니다."""
+        import redis.asyncio as redis_asyncio
+
+        backoff = 1.0
+        while True:
+            client = redis_asyncio.from_url(self.redis_url)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.CHANNEL)
+                    # 구독 전에 발생한 변경을 놓치지 않도록 재접속 시 무효화
+                    self.invalidate_local()
+                    backoff = 1.0
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        sender = message.get("data")
+                        if isinstance(sender, bytes):
+                            sender = sender.decode()
+                        if sender != self.worker_id:
+                            self.invalidate_local()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ 메뉴 트리 캐시 구독 오류, {backoff:.0f}초 후 재접속: {str(e)}")
+                self.invalidate_local()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                await client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 상태를 반환합니다."""
+        with self._lock:
+            return {
+                "version": self._version,
+                "size": len(self._entries),
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "sync": "redis" if self.redis_url else "local"
+            }
+
+
+def _create_cache_from_env() -> MenuTreeCache:
+    """
+    환경 변수에서 캐시 설정을 읽어 인스턴스를 생성합니다.
+    """
+    sync = os.getenv("MENU_TREE_CACHE_SYNC", "local").lower()
+    return MenuTreeCache(
+        ttl=float(os.getenv("MENU_TREE_CACHE_TTL", "300")),
+        redis_url=os.getenv("REDIS_URL") if sync == "redis" else None
+    )
+
+
+# 전역 메뉴 트리 캐시 인스턴스
+menu_tree_cache = _create_cache_from_env()
+
+
+def get_menu_tree_cache() -> MenuTreeCache:
+    """
+    메뉴 트리 캐시 인스턴스 반환
+
+    Returns:
+        MenuTreeCache 인스턴스
+    """
+    return menu_tree_cache
@@ -0,0 +1,173 @@
+"""목록 응답 전체 개수(total) 산출 전략
+
+페이지마다 COUNT(*)를 실행하면 큰 로그 테이블에서는 목록 조회와 비슷한 비용이
+한 번 더 듭니다. 엔드포인트별로 다음 전략 중 하나를 선택합니다.
+
+- exact: COUNT(*) (결과는 짧게 캐시)
+- estimated: PostgreSQL 통계 기반 추정치 (조건이 없으면 pg_class.reltuples,
+  있으면 EXPLAIN 예상 행 수). 추정할 수 없으면 exact로 대체
+- capped: cap + 1개까지만 세어 cap을 넘으면 "cap 이상"으로 표시 (예: 1000+)
+- none: 개수를 세지 않음. 다음 페이지 여부는 limit + 1개 조회(has_more)로 판단
+
+계산한 값은 정규화한 조회 조건(SQL + 파라미터)을 키로 PAGE_COUNT_CACHE_TTL초 동안
+캐시하므로, 같은 조건으로 페이지를 넘길 때는 다시 세지 않습니다.
+"""
+
+import json
+import logging
+import os
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import func, literal, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+TOTAL_EXACT = "exact"
+TOTAL_ESTIMATED = "estimated"
+TOTAL_CAPPED = "capped"
+TOTAL_NONE = "none"
+TOTAL_STRATEGIES = (TOTAL_EXACT, TOTAL_ESTIMATED, TOTAL_CAPPED, TOTAL_NONE)
+
+# 쿼리 파라미터 검증용 패턴 (Query(pattern=...))
+TOTAL_STRATEGY_PATTERN = f"^({'|'.join(TOTAL_STRATEGIES)})$"
+
+# capped 전략의 기본 상한
+DEFAULT_TOTAL_CAP = int(os.getenv("PAGE_TOTAL_CAP", "1000"))
+
+# 정규화한 조회 조건 -> PageTotal
+page_count_cache = TTLCache(
+    max_size=int(os.getenv("PAGE_COUNT_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("PAGE_COUNT_CACHE_TTL", "10"))
+)
+
+
+class PageTotal:
+    """
+    전체 개수 산출 결과
+
+    - total: 전체 개수 (none 전략이면 None, capped면 상한값)
+    - total_type: 실제 산출 방식 (exact, estimated, capped, none)
+    """
+
+    __slots__ = ("total", "total_type")
+
+    def __init__(self, total: Optional[int], total_type: str):
+        self.total = total
+        self.total_type = total_type
+
+    def pages(self, limit: int) -> Optional[int]:
+        """전체 페이지 수 (개수를 세지 않았으면 None)"""
+        if self.total is None:
+            return None
+        return (self.total + limit - 1) // limit
+
+    def __repr__(self) -> str:
+        return f"<PageTotal {self.total_type}={self.total}>"
+
+
+def count_key(stmt: Any, strategy: str, cap: int) -> Hashable:
+    """조회문을 SQL 문자열과 파라미터로 정규화한 캐시 키"""
+    compiled = stmt.compile()
+    params = sorted((name, repr(value)) for name, value in compiled.params.items())
+    return strategy, cap if strategy == TOTAL_CAPPED else None, compiled.string, tuple(params)
+
+
+def exact_count(db: Session, stmt: Any) -> int:
+    """조건에 맞는 행 수 (서브쿼리 없이 SELECT count(*) FROM ... WHERE ...)"""
+    count_stmt = stmt.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+    return db.scalar(count_stmt) or 0
+
+
+def capped_count(db: Session, stmt: Any, cap: int) -> int:
+    """cap + 1개까지만 센 행 수"""
+    limited = stmt.with_only_columns(literal(1), maintain_column_froms=True).order_by(None).limit(cap + 1)
+    return db.scalar(select(func.count()).select_from(limited.subquery())) or 0
+
+
+def estimated_count(db: Session, stmt: Any) -> Optional[int]:
+    """
+    PostgreSQL 통계 기반 추정 행 수
+
+    조건이 없으면 pg_class.reltuples를, 있으면 EXPLAIN의 예상 행 수를 사용합니다.
+    PostgreSQL이 아니거나 통계가 없으면 None을 반환합니다.
+    """
+    connection = db.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+
+    try:
+        # 조회가 실패해도 트랜잭션이 중단되지 않도록 SAVEPOINT 안에서 실행 (실패 시 정확한 개수로 대체)
+        with db.begin_nested():
+            froms = stmt.get_final_froms()
+            if stmt.whereclause is None and len(froms) == 1 and hasattr(froms[0], "fullname"):
+                reltuples = db.scalar(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+                    {"name": froms[0].fullname}
+                )
+                # 한 번도 ANALYZE되지 않은 테이블은 -1
+                if reltuples is not None and reltuples >= 0:
+                    return int(reltuples)
+
+            compiled = stmt.order_by(None).compile(dialect=connection.dialect)
+            params = (
+                tuple(compiled.params[name] for name in compiled.positiontup)
+                if compiled.positional else compiled.params
+            )
+            plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except SQLAlchemyError as e:
+        logger.warning(f"⚠️ 전체 개수 추정 실패, 정확한 개수로 대체 - 오류: {str(e)}")
+        return None
+
+
+def resolve_total(
+    db: Session,
+    stmt: Any,
+    strategy: str = TOTAL_EXACT,
+    cap: int = DEFAULT_TOTAL_CAP
+) -> PageTotal:
+    """
+    전략에 따라 조회문의 전체 개수를 구합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        stmt: 목록 조회문 (select(Model).where(...), 정렬/LIMIT 무시)
+        strategy: exact, estimated, capped, none
+        cap: capped 전략의 상한
+
+    Returns:
+        PageTotal
+
+    Raises:
+        ValueError: 지원하지 않는 전략
+    """
+    if strategy not in TOTAL_STRATEGIES:
+        raise ValueError(f"지원하지 않는 개수 산출 방식입니다: {strategy}")
+    if strategy == TOTAL_NONE:
+        return PageTotal(None, TOTAL_NONE)
+
+    key = count_key(stmt, strategy, cap)
+    cached = page_count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = None
+    if strategy == TOTAL_ESTIMATED:
+        estimate = estimated_count(db, stmt)
+        if estimate is not None:
+            result = PageTotal(estimate, TOTAL_ESTIMATED)
+    elif strategy == TOTAL_CAPPED:
+        count = capped_count(db, stmt, cap)
+        result = PageTotal(cap, TOTAL_CAPPED) if count > cap else PageTotal(count, TOTAL_EXACT)
+
+    if result is None:
+        result = PageTotal(exact_count(db, stmt), TOTAL_EXACT)
+
+    page_count_cache.set(key, result)
+    return result
@@ -0,0 +1,183 @@
+"""로그 테이블 파티션 유지보수 작업
+
+백그라운드 태스크가 주기적으로 로그 테이블의 월별 파티션을 미리 생성하고,
+LOG_RETENTION_DAYS가 설정되어 있으면 보관 기간이 지난 파티션을 정리합니다.
+여러 워커가 동시에 실행해도 테이블별 advisory lock으로 한 번씩만 처리됩니다.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+from app.database.database import SessionLocal
+from app.database.partitioning import DEFAULT_RETENTION_MODE, ensure_partitions, purge_before
+from app.models.log_models import APIUsageLog, LoginLog
+from app.models.system_models import SysLog, WebLog
+
+logger = logging.getLogger(__name__)
+
+# 파티션을 관리하는 로그 테이블
+LOG_TABLES: List[Table] = [
+    LoginLog.__table__,
+    SysLog.__table__,
+    WebLog.__table__,
+    APIUsageLog.__table__,
+]
+
+
+class PartitionMaintainer:
+    """
+    로그 파티션 유지보수기
+
+    - start()/stop(): 유지보수 태스크 시작/종료 (애플리케이션 lifespan에서 호출)
+    - run_once(): 파티션 생성과 보관 기간 정리를 한 번 수행 (manage_db.py에서도 사용)
+    - get_stats(): 최근 실행 결과
+    """
+
+    def __init__(
+        self,
+        interval: float = 21600,
+        months_ahead: int = 3,
+        retention_days: int = 0,
+        mode: str = DEFAULT_RETENTION_MODE,
+        session_factory: Callable[[], Session] = SessionLocal,
+        tables: Optional[List[Table]] = None
+    ):
+        """
+        유지보수기 초기화
+
+        Args:
+            interval: 실행 주기(초, 0이면 비활성화)
+            months_ahead: 미리 만들 파티션 개월 수
+            retention_days: 로그 보관 일수 (0이면 정리하지 않음)
+            mode: 지난 파티션 정리 방식 (drop 또는 detach)
+            session_factory: 세션 생성 함수
+            tables: 관리할 테이블 (기본값: LOG_TABLES)
+        """
+        self.interval = interval
+        self.months_ahead = months_ahead
+        self.retention_days = retention_days
+        self.mode = mode
+        self.session_factory = session_factory
+        self.tables = tables if tables is not None else LOG_TABLES
+
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.run_count = 0
+        self.failed_count = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_result: Dict[str, Any] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """유지보수 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """유지보수 태스크를 시작합니다. (시작 즉시 한 번 실행)"""
+        if self.interval <= 0 or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="log-partition-maintainer")
+        logger.info(
+            f"✅ 로그 파티션 유지보수 시작 - 주기: {self.interval}s, "
+            f"미리 생성: {self.months_ahead}개월, 보관: {self.retention_days or '무제한'}일"
+        )
+
+    async def stop(self) -> None:
+        """유지보수 태스크를 종료합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            # 파티션 DDL은 동기 작업이므로 워커 스레드에서 실행
+            await asyncio.to_thread(self.run_once)
+            await asyncio.sleep(self.interval)
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        모든 로그 테이블의 파티션을 생성하고 보관 기간이 지난 로그를 정리합니다.
+
+        테이블 하나가 실패해도 나머지 테이블은 계속 처리합니다.
+
+        Returns:
+            테이블별 결과 {"created", "deleted_count", "dropped_partitions",
+            "detached_partitions"} 또는 {"error"}
+        """
+        results: Dict[str, Any] = {}
+        db = self.session_factory()
+        try:
+            for table in self.tables:
+                try:
+                    result: Dict[str, Any] = {"created": ensure_partitions(db, table, self.months_ahead)}
+                    if self.retention_days > 0:
+                        cutoff = datetime.now() - timedelta(days=self.retention_days)
+                        result.update(purge_before(db, table, cutoff, self.mode))
+                    results[table.name] = result
+                except Exception as e:
+                    self.failed_count += 1
+                    results[table.name] = {"error": str(e)}
+                    logger.error(f"❌ {table.name} 파티션 유지보수 실패 - 오류: {str(e)}")
+        finally:
+            db.close()
+
+        self.run_count += 1
+        self.last_run_at = datetime.now()
+        self.last_result = results
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        유지보수기 상태 통계를 반환합니다.
+
+        Returns:
+            설정값과 최근 실행 결과
+        """
+        return {
+            "running": self.is_running,
+            "interval": self.interval,
+            "months_ahead": self.months_ahead,
+            "retention_days": self.retention_days,
+            "mode": self.mode,
+            "runs": self.run_count,
+            "failed": self.failed_count,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_result": self.last_result
+        }
+
+
+def _create_maintainer_from_env() -> PartitionMaintainer:
+    """
+    환경 변수에서 유지보수기 설정을 읽어 인스턴스를 생성합니다.
+    """
+    return PartitionMaintainer(
+        interval=float(os.getenv("LOG_PARTITION_INTERVAL", "21600")),
+        months_ahead=int(os.getenv("LOG_PARTITION_MONTHS_AHEAD", "3")),
+        retention_days=int(os.getenv("LOG_RETENTION_DAYS", "0")),
+        mode=os.getenv("LOG_RETENTION_MODE", DEFAULT_RETENTION_MODE).lower()
+    )
+
+
+partition_maintainer = _create_maintainer_from_env()
+
+
+def get_partition_maintainer() -> PartitionMaintainer:
+    """
+    로그 파티션 유지보수기 인스턴스 반환
+
+    Returns:
+        PartitionMaintainer 인스턴스
+    """
+    return partition_maintainer
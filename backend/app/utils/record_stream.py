@@ -0,0 +1,309 @@
+"""레코드 스트림 읽기/쓰기
+
+업로드된 JSON/NDJSON/CSV 파일을 전체를 메모리에 올리지 않고 레코드 단위로
+읽어 들입니다. JSON은 최상위 배열 또는 {"data": [...]} 형식의 객체를 지원하며
+(내보내기 파일 형식), 배열 원소를 하나씩 디코딩합니다.
+
+내보내기는 반대로 레코드 이터레이터를 같은 형식의 바이트 청크로 인코딩하며,
+필요하면 gzip으로 점진 압축합니다.
+"""
+
+import codecs
+import csv
+import io
+import json
+import zlib
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Sequence
+
+# 지원하는 레코드 형식
+RECORD_FORMATS = ("json", "ndjson", "csv")
+
+# 형식별 응답 미디어 타입
+RECORD_MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# 한 번에 읽을 바이트 수
+READ_SIZE = 64 * 1024
+
+# 내보내기 청크 크기 (이 크기를 넘으면 청크를 내보냄)
+WRITE_SIZE = 64 * 1024
+
+
+class _JsonArrayReader:
+    """바이너리 스트림에서 JSON 배열 원소를 하나씩 디코딩하는 리더"""
+
+    def __init__(self, fp: BinaryIO, read_size: int = READ_SIZE):
+        self.fp = fp
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """버퍼에 데이터를 더 읽어 옵니다. 더 읽을 데이터가 없으면 False"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            self.buffer = self.buffer[self.pos:] + self.text_decoder.decode(b"", final=True)
+        else:
+            self.buffer = self.buffer[self.pos:] + self.text_decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def _peek(self) -> Optional[str]:
+        """공백을 건너뛴 다음 문자 (스트림 끝이면 None)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if char is None or char not in chars:
+            raise ValueError(f"JSON 형식 오류: '{chars}'가 필요하지만 '{char or 'EOF'}'를 만났습니다")
+        self.pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """다음 JSON 값을 디코딩합니다 (값이 버퍼 경계에 걸리면 더 읽어서 재시도)"""
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # 숫자 등은 버퍼 끝에서 잘려도 디코딩되므로 끝에 닿았으면 더 읽어서 확인
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise ValueError(f"JSON 형식 오류: {e.msg} (위치 {e.pos})") from e
+            self._fill()
+
+    def _items(self) -> Iterator[Any]:
+        """현재 위치의 배열 원소를 하나씩 반환합니다."""
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def records(self, array_key: str = "data") -> Iterator[Any]:
+        """최상위 배열 또는 최상위 객체의 array_key 배열 원소를 반환합니다."""
+        first = self._peek()
+        if first == "[":
+            yield from self._items()
+            return
+        if first != "{":
+            raise ValueError("JSON 형식 오류: 최상위 값은 배열 또는 객체여야 합니다")
+
+        self.pos += 1
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == array_key:
+                yield from self._items()
+            else:
+                self._value()
+            if self._expect(",}") == "}":
+                return
+
+
+def iter_json_records(fp: BinaryIO, array_key: str = "data", read_size: int = READ_SIZE) -> Iterator[Any]:
+    """
+    JSON 배열 원소를 하나씩 읽습니다.
+
+    Args:
+        fp: 바이너리 파일 객체
+        array_key: 최상위가 객체일 때 레코드 배열이 들어 있는 키
+        read_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        레코드 이터레이터
+    """
+    return _JsonArrayReader(fp, read_size).records(array_key)
+
+
+def iter_ndjson_records(fp: BinaryIO) -> Iterator[Any]:
+    """
+    NDJSON(한 줄에 JSON 값 하나)을 한 줄씩 읽습니다.
+
+    Args:
+        fp: 바이너리 파일 객체
+
+    Returns:
+        레코드 이터레이터
+    """
+    for line_no, line in enumerate(_iter_lines(fp), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"NDJSON 형식 오류: {line_no}번째 줄 - {e.msg}") from e
+
+
+def iter_csv_records(fp: BinaryIO) -> Iterator[Dict[str, str]]:
+    """
+    헤더가 있는 CSV를 한 행씩 읽습니다.
+
+    Args:
+        fp: 바이너리 파일 객체
+
+    Returns:
+        {헤더: 값} 레코드 이터레이터
+    """
+    text = io.TextIOWrapper(fp, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        # 업로드 파일 객체는 호출자가 닫도록 분리
+        text.detach()
+
+
+def _iter_lines(fp: BinaryIO) -> Iterator[str]:
+    """바이너리 스트림을 UTF-8 텍스트 줄 단위로 읽습니다."""
+    text = io.TextIOWrapper(fp, encoding="utf-8-sig")
+    try:
+        yield from text
+    finally:
+        text.detach()
+
+
+def _check_format(format: str) -> None:
+    """지원하는 형식인지 확인합니다."""
+    if format not in RECORD_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {format} (지원: {', '.join(RECORD_FORMATS)})")
+
+
+def iter_records(fp: BinaryIO, format: str) -> Iterator[Any]:
+    """
+    형식에 맞는 스트리밍 리더로 레코드를 읽습니다.
+
+    Args:
+        fp: 바이너리 파일 객체
+        format: 레코드 형식 (json, ndjson, csv)
+
+    Returns:
+        레코드 이터레이터
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+    """
+    if format == "json":
+        return iter_json_records(fp)
+    if format == "ndjson":
+        return iter_ndjson_records(fp)
+    _check_format(format)
+    return iter_csv_records(fp)
+
+
+def encode_records(
+    records: Iterable[Dict[str, Any]],
+    format: str,
+    fields: Sequence[str],
+    metadata: Optional[Dict[str, Any]] = None,
+    write_size: int = WRITE_SIZE
+) -> Iterator[bytes]:
+    """
+    레코드를 형식에 맞게 점진적으로 인코딩합니다.
+
+    JSON은 {메타데이터..., "data": [...], "total_count": N} 문서로 쓰며
+    (iter_json_records로 다시 읽을 수 있음), 레코드 수는 끝까지 쓴 뒤에 알 수
+    있으므로 마지막에 씁니다.
+
+    Args:
+        records: 레코드 이터러블
+        format: 레코드 형식 (json, ndjson, csv)
+        fields: 내보낼 필드 (CSV 헤더 순서)
+        metadata: JSON 문서 머리에 쓸 항목
+        write_size: 청크 크기
+
+    Returns:
+        UTF-8 바이트 청크 이터레이터
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+    """
+    _check_format(format)
+    return _encode_records(records, format, fields, metadata or {}, write_size)
+
+
+def _encode_records(
+    records: Iterable[Dict[str, Any]],
+    format: str,
+    fields: Sequence[str],
+    metadata: Dict[str, Any],
+    write_size: int
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n") if format == "csv" else None
+
+    def dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+    if format == "json":
+        buffer.write("{")
+        for key, value in metadata.items():
+            buffer.write(f"{dumps(key)}: {dumps(value)}, ")
+        buffer.write('"data": [')
+    elif format == "csv":
+        # 엑셀에서 한글이 깨지지 않도록 BOM 추가 (iter_csv_records는 BOM을 무시)
+        buffer.write("\ufeff")
+        writer.writerow(fields)
+
+    count = 0
+    for record in records:
+        if format == "csv":
+            writer.writerow(["" if record.get(field) is None else record.get(field) for field in fields])
+        else:
+            line = dumps({field: record.get(field) for field in fields})
+            if format == "json":
+                buffer.write(f"{',' if count else ''}\n{line}")
+            else:
+                buffer.write(f"{line}\n")
+        count += 1
+
+        if buffer.tell() >= write_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if format == "json":
+        buffer.write(f"\n], \"total_count\": {count}}}\n")
+    tail = buffer.getvalue()
+    if tail:
+        yield tail.encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    바이트 청크를 gzip 형식으로 점진 압축합니다.
+
+    Args:
+        chunks: 원본 바이트 청크
+        level: 압축 수준 (1~9)
+
+    Returns:
+        gzip 바이트 청크 이터레이터
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
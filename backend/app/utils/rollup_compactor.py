@@ -0,0 +1,164 @@
+"""로그 통계 집계 작업
+
+백그라운드 태스크가 주기적으로 접속로그/시스템로그/웹로그의 끝난 시간대를
+시간별/일별 집계 테이블로 옮깁니다. (app.database.rollups.compact_rollup)
+여러 워커가 동시에 실행해도 집계별 advisory lock으로 한 번씩만 처리됩니다.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.database.database import SessionLocal
+from app.database.rollups import ROLLUPS, RollupSpec, compact_rollup, get_watermark
+
+logger = logging.getLogger(__name__)
+
+
+class RollupCompactor:
+    """
+    로그 통계 집계기
+
+    - start()/stop(): 집계 태스크 시작/종료 (애플리케이션 lifespan에서 호출)
+    - run_once(): 모든 집계를 한 번 수행 (manage_db.py에서도 사용)
+    - get_stats(): 집계별 watermark와 최근 실행 결과
+    """
+
+    def __init__(
+        self,
+        interval: float = 300,
+        delay: float = 120,
+        chunk_hours: int = 24,
+        session_factory: Callable[[], Session] = SessionLocal,
+        specs: Optional[List[RollupSpec]] = None
+    ):
+        """
+        집계기 초기화
+
+        Args:
+            interval: 실행 주기(초, 0이면 비활성화)
+            delay: 늦게 기록되는 로그를 기다리는 시간(초), 현재 시각에서 이만큼 지난 시간대까지만 집계
+            chunk_hours: 한 번에 집계할 시간 수
+            session_factory: 세션 생성 함수
+            specs: 수행할 집계 (기본값: ROLLUPS)
+        """
+        self.interval = interval
+        self.delay = delay
+        self.chunk_hours = chunk_hours
+        self.session_factory = session_factory
+        self.specs = specs if specs is not None else ROLLUPS
+
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.run_count = 0
+        self.failed_count = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_result: Dict[str, Any] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """집계 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """집계 태스크를 시작합니다. (시작 즉시 한 번 실행)"""
+        if self.interval <= 0 or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="log-rollup-compactor")
+        logger.info(f"✅ 로그 통계 집계 시작 - 주기: {self.interval}s, 대기: {self.delay}s")
+
+    async def stop(self) -> None:
+        """집계 태스크를 종료합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            # 집계 쿼리는 동기 작업이므로 워커 스레드에서 실행
+            await asyncio.to_thread(self.run_once)
+            await asyncio.sleep(self.interval)
+
+    def run_once(self, until: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        모든 집계를 수행합니다. 집계 하나가 실패해도 나머지는 계속 처리합니다.
+
+        Args:
+            until: 이 시점이 속한 시간대 이전까지 집계 (기본값: 현재 시각 - delay)
+
+        Returns:
+            집계별 결과 {"created", "watermark"} 또는 {"error"}
+        """
+        until = until or datetime.now() - timedelta(seconds=self.delay)
+        results: Dict[str, Any] = {}
+        db = self.session_factory()
+        try:
+            for spec in self.specs:
+                try:
+                    created = compact_rollup(db, spec, until, self.chunk_hours)
+                    watermark = get_watermark(db, spec)
+                    results[spec.name] = {
+                        "created": created,
+                        "watermark": watermark.isoformat() if watermark else None
+                    }
+                except Exception as e:
+                    self.failed_count += 1
+                    results[spec.name] = {"error": str(e)}
+        finally:
+            db.close()
+
+        self.run_count += 1
+        self.last_run_at = datetime.now()
+        self.last_result = results
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        집계기 상태 통계를 반환합니다.
+
+        Returns:
+            설정값과 최근 실행 결과
+        """
+        return {
+            "running": self.is_running,
+            "interval": self.interval,
+            "delay": self.delay,
+            "runs": self.run_count,
+            "failed": self.failed_count,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_result": self.last_result
+        }
+
+
+def _create_compactor_from_env() -> RollupCompactor:
+    """
+    환경 변수에서 집계기 설정을 읽어 인스턴스를 생성합니다.
+    """
+    return RollupCompactor(
+        interval=float(os.getenv("LOG_ROLLUP_INTERVAL", "300")),
+        delay=float(os.getenv("LOG_ROLLUP_DELAY", "120")),
+        chunk_hours=int(os.getenv("LOG_ROLLUP_CHUNK_HOURS", "24"))
+    )
+
+
+rollup_compactor = _create_compactor_from_env()
+
+
+def get_rollup_compactor() -> RollupCompactor:
+    """
+    로그 통계 집계기 인스턴스 반환
+
+    Returns:
+        RollupCompactor 인스턴스
+    """
+    return rollup_compactor
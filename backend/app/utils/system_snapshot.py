@@ -0,0 +1,282 @@
+"""시스템 상태/대시보드 스냅샷
+
+/system/health와 /system/dashboard는 요청마다 여러 집계 쿼리를 실행하고, 상태
+확인은 CPU 사용률을 재기 위해 1초씩 기다렸습니다. 백그라운드 태스크가 interval마다
+CPU/메모리 사용률을 기다림 없이 측정하고(psutil.cpu_percent(interval=None): 직전
+측정 이후 평균) 두 응답을 미리 계산해 두면, 엔드포인트는 최근 스냅샷을 바로 반환합니다.
+
+스냅샷 나이에 따른 동작 (stale-while-revalidate):
+- stale_after 이하: 그대로 반환
+- stale_after 초과: 그대로 반환하면서 백그라운드에서 다시 계산
+- max_age 초과 또는 스냅샷 없음: 다시 계산한 뒤 반환
+
+같은 종류의 재계산이 이미 진행 중이면 그 결과를 함께 기다립니다.
+워커 프로세스마다 스냅샷을 따로 가지므로 값도 프로세스 단위입니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import psutil
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.database.database import SessionLocal
+from app.services.system_service import SystemMonitoringService
+
+logger = logging.getLogger(__name__)
+
+HEALTH = "health"
+DASHBOARD = "dashboard"
+SNAPSHOT_KINDS = (HEALTH, DASHBOARD)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """미리 계산한 응답과 계산 시각"""
+    payload: BaseModel
+    taken_at: datetime
+    # 나이 계산용 단조 시계 값
+    created: float
+
+    @property
+    def age(self) -> float:
+        """스냅샷 나이(초)"""
+        return max(0.0, time.monotonic() - self.created)
+
+
+class SystemSnapshotEngine:
+    """
+    시스템 상태/대시보드 스냅샷 엔진
+
+    - start()/stop(): 스냅샷 갱신 태스크 시작/종료 (애플리케이션 lifespan에서 호출)
+    - get(): 최근 스냅샷 반환 (오래되었으면 재계산)
+    - run_once(): 리소스 측정과 모든 스냅샷 계산을 한 번 수행
+    - get_stats(): 스냅샷 나이와 갱신 통계
+    """
+
+    def __init__(
+        self,
+        interval: float = 15,
+        stale_after: Optional[float] = None,
+        max_age: float = 300,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        """
+        엔진 초기화
+
+        Args:
+            interval: 갱신 주기(초, 0이면 백그라운드 갱신 없이 요청마다 계산)
+            stale_after: 이 나이(초)를 넘은 스냅샷은 반환하면서 백그라운드에서 재계산 (기본값: interval x 2)
+            max_age: 이 나이(초)를 넘은 스냅샷은 반환하지 않고 재계산
+            session_factory: 세션 생성 함수
+        """
+        self.interval = interval
+        self.stale_after = stale_after if stale_after is not None else interval * 2
+        self.max_age = max_age
+        self.session_factory = session_factory
+
+        self._task: Optional[asyncio.Task] = None
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._refreshing: Dict[str, asyncio.Future] = {}
+
+        # 최근 리소스 측정값
+        self.cpu_usage = 0.0
+        self.memory_usage = 0.0
+
+        # 통계
+        self.build_count = 0
+        self.failed_count = 0
+        self.served_count = 0
+        self.stale_served_count = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def is_running(self) -> bool:
+        """갱신 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """갱신 태스크를 시작합니다. (시작 즉시 한 번 계산)"""
+        # 첫 cpu_percent(None) 호출은 0.0을 반환하므로 측정 기준점을 먼저 잡아 둠
+        self.sample_resources()
+        if self.interval <= 0 or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run(), name="system-snapshot-engine")
+        logger.info(f"✅ 시스템 스냅샷 갱신 시작 - 주기: {self.interval}s, 최대 나이: {self.max_age}s")
+
+    async def stop(self) -> None:
+        """갱신 태스크를 종료합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            # 집계 쿼리는 동기 작업이므로 워커 스레드에서 실행
+            await asyncio.to_thread(self.run_once)
+            await asyncio.sleep(self.interval)
+
+    def sample_resources(self) -> Tuple[float, float]:
+        """
+        CPU/메모리 사용률을 기다림 없이 측정합니다.
+
+        Returns:
+            (CPU 사용률, 메모리 사용률). CPU는 직전 측정 이후의 평균입니다.
+        """
+        try:
+            self.cpu_usage = psutil.cpu_percent(interval=None)
+            self.memory_usage = psutil.virtual_memory().percent
+        except Exception as e:
+            logger.warning(f"⚠️ 시스템 리소스 측정 실패: {e}")
+        return self.cpu_usage, self.memory_usage
+
+    def build(self, kind: str) -> Snapshot:
+        """
+        스냅샷 하나를 계산해 저장합니다.
+
+        Args:
+            kind: 스냅샷 종류 (health 또는 dashboard)
+
+        Returns:
+            새 스냅샷
+        """
+        service = SystemMonitoringService()
+        db = self.session_factory()
+        try:
+            if kind == HEALTH:
+                cpu_usage, memory_usage = self.sample_resources()
+                payload = service.get_system_health_check(db, cpu_usage=cpu_usage, memory_usage=memory_usage)
+            elif kind == DASHBOARD:
+                payload = service.get_dashboard_summary(db)
+            else:
+                raise ValueError(f"알 수 없는 스냅샷 종류: {kind}")
+        except Exception as e:
+            self.failed_count += 1
+            self.last_error = f"{kind}: {e}"
+            raise
+        finally:
+            db.close()
+
+        snapshot = Snapshot(payload=payload, taken_at=datetime.now(), created=time.monotonic())
+        self._snapshots[kind] = snapshot
+        self.build_count += 1
+        return snapshot
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        모든 스냅샷을 계산합니다. 하나가 실패해도 나머지는 계속 처리하며,
+        실패한 종류는 이전 스냅샷을 유지합니다.
+
+        Returns:
+            종류별 결과 {"taken_at"} 또는 {"error"}
+        """
+        results: Dict[str, Any] = {}
+        for kind in SNAPSHOT_KINDS:
+            try:
+                results[kind] = {"taken_at": self.build(kind).taken_at.isoformat()}
+            except Exception as e:
+                logger.error(f"❌ 시스템 스냅샷 계산 실패 ({kind}): {e}")
+                results[kind] = {"error": str(e)}
+        return results
+
+    def _start_refresh(self, kind: str) -> asyncio.Future:
+        """같은 종류의 재계산이 진행 중이면 그 계산을, 아니면 새 계산을 반환합니다."""
+        future = self._refreshing.get(kind)
+        if future is None or future.done():
+            future = asyncio.ensure_future(asyncio.to_thread(self.build, kind))
+            # 기다리는 요청이 없어도 실패가 미회수 예외로 남지 않도록 결과를 확인 (실패는 build()에서 기록)
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._refreshing[kind] = future
+        return future
+
+    async def refresh(self, kind: str) -> Snapshot:
+        """
+        스냅샷을 다시 계산합니다. 같은 종류의 계산이 진행 중이면 그 결과를 기다립니다.
+
+        Args:
+            kind: 스냅샷 종류
+
+        Returns:
+            새 스냅샷
+        """
+        # 기다리던 요청이 취소되어도 다른 요청이 함께 기다리는 계산은 계속
+        return await asyncio.shield(self._start_refresh(kind))
+
+    async def get(self, kind: str) -> Snapshot:
+        """
+        최근 스냅샷을 반환합니다. (stale-while-revalidate)
+
+        Args:
+            kind: 스냅샷 종류
+
+        Returns:
+            스냅샷 (age로 나이 확인)
+        """
+        snapshot = self._snapshots.get(kind)
+        if snapshot is None or self.interval <= 0 or snapshot.age > self.max_age:
+            return await self.refresh(kind)
+
+        self.served_count += 1
+        if snapshot.age > self.stale_after:
+            self.stale_served_count += 1
+            self._start_refresh(kind)
+        return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        스냅샷 엔진 상태 통계를 반환합니다.
+
+        Returns:
+            설정값, 종류별 스냅샷 나이와 갱신 통계
+        """
+        return {
+            "running": self.is_running,
+            "interval": self.interval,
+            "stale_after": self.stale_after,
+            "max_age": self.max_age,
+            "snapshots": {
+                kind: {"taken_at": snapshot.taken_at.isoformat(), "age": round(snapshot.age, 3)}
+                for kind, snapshot in self._snapshots.items()
+            },
+            "builds": self.build_count,
+            "failed": self.failed_count,
+            "served": self.served_count,
+            "stale_served": self.stale_served_count,
+            "last_error": self.last_error
+        }
+
+
+def _create_snapshot_engine_from_env() -> SystemSnapshotEngine:
+    """
+    환경 변수에서 스냅샷 엔진 설정을 읽어 인스턴스를 생성합니다.
+    """
+    stale_after = os.getenv("SYSTEM_SNAPSHOT_STALE_AFTER")
+    return SystemSnapshotEngine(
+        interval=float(os.getenv("SYSTEM_SNAPSHOT_INTERVAL", "15")),
+        stale_after=float(stale_after) if stale_after else None,
+        max_age=float(os.getenv("SYSTEM_SNAPSHOT_MAX_AGE", "300"))
+    )
+
+
+system_snapshot_engine = _create_snapshot_engine_from_env()
+
+
+def get_system_snapshot_engine() -> SystemSnapshotEngine:
+    """
+    시스템 스냅샷 엔진 인스턴스 반환
+
+    Returns:
+        SystemSnapshotEngine 인스턴스
+    """
+    return system_snapshot_engine
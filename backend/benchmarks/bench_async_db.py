@@ -0,0 +1,171 @@
+"""동기 세션 vs 비동기 세션 동시 처리량 벤치마크
+
+async 라우트 안에서 동기 Session으로 조회하는 기존 방식(쿼리 동안 이벤트 루프가
+멈춤)과 AsyncSession으로 조회하는 방식에 같은 수의 동시 요청을 보내 처리량과
+지연 시간을 비교합니다. 두 앱 모두 활성 게시판 목록 조회(get_active_boards)를
+수행하며, 네트워크/DB 지연을 흉내 내기 위해 요청마다 --latency-ms 만큼 DB에서
+대기하는 쿼리를 함께 실행합니다 (SQLite는 사용자 정의 함수, PostgreSQL은 pg_sleep).
+
+기본값은 임시 SQLite 파일(aiosqlite)이며, --database-url로 PostgreSQL을 지정할 수 있습니다.
+
+사용법:
+    python -m benchmarks.bench_async_db [--requests 400] [--concurrency 50] [--latency-ms 5]
+    python -m benchmarks.bench_async_db --database-url postgresql://user:pw@localhost/skybootcore
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.database.database import to_async_database_url
+from app.models.board_models import BbsMaster
+from app.services.board_service import BbsMasterService
+
+
+def _register_sleep(dbapi_connection, connection_record) -> None:
+    """SQLite 연결에 bench_sleep(ms) 함수를 등록합니다."""
+    dbapi_connection.create_function("bench_sleep", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+
+def latency_sql(database_url: str, latency_ms: float):
+    """DB에서 latency_ms 동안 대기하는 쿼리"""
+    if database_url.startswith("sqlite"):
+        return text(f"SELECT bench_sleep({latency_ms})")
+    return text(f"SELECT pg_sleep({latency_ms / 1000})")
+
+
+def build_engines(database_url: str, pool_size: int):
+    """같은 DB를 바라보는 동기/비동기 엔진 생성"""
+    # SQLite 파일 DB도 풀을 쓰도록 풀 클래스를 지정
+    options = {"pool_size": pool_size, "max_overflow": 0}
+    sync_engine = create_engine(database_url, poolclass=QueuePool, **options)
+    async_engine = create_async_engine(
+        to_async_database_url(database_url), poolclass=AsyncAdaptedQueuePool, **options
+    )
+    if database_url.startswith("sqlite"):
+        sync_engine = sync_engine.execution_options(schema_translate_map={"skybootcore": None})
+        async_engine = async_engine.execution_options(schema_translate_map={"skybootcore": None})
+        event.listen(sync_engine.engine, "connect", _register_sleep)
+        event.listen(async_engine.sync_engine, "connect", _register_sleep)
+    return sync_engine, async_engine
+
+
+def seed(sync_engine, boards: int = 20) -> None:
+    """벤치마크용 게시판 마스터 생성 (SQLite만)"""
+    BbsMaster.__table__.create(sync_engine, checkfirst=True)
+    with sessionmaker(bind=sync_engine)() as db:
+        for index in range(boards):
+            db.add(BbsMaster(bbs_id=f"bench{index:02d}", bbs_nm=f"게시판{index}",
+                             bbs_ty_code="BBST01", frst_register_id="bench"))
+        db.commit()
+
+
+def build_app(sync_engine, async_engine, latency) -> FastAPI:
+    """동기 세션 라우트와 비동기 세션 라우트를 가진 앱 생성"""
+    app = FastAPI()
+    service = BbsMasterService()
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    AsyncSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    @app.get("/sync")
+    async def sync_in_async(db=Depends(get_sync_db)):
+        db.execute(latency)
+        return len(service.get_active_boards(db))
+
+    @app.get("/async")
+    async def native_async(db=Depends(get_async_db)):
+        await db.execute(latency)
+        return len(await service.get_active_boards_async(db))
+
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int, concurrency: int):
+    """동시 요청을 보내 (전체 소요 시간, 요청별 지연 시간 목록)을 반환합니다."""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(20, requests)):  # warm-up
+            await client.get(path)
+
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path)
+                timings.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    return elapsed, timings
+
+
+def summarize(name: str, elapsed: float, timings: list) -> float:
+    """측정 결과를 출력하고 초당 처리량을 반환합니다."""
+    ordered = sorted(timings)
+    throughput = len(ordered) / elapsed
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(f"{name:<28} {throughput:8.1f} req/s  mean {statistics.fmean(ordered):7.1f}ms"
+          f"  p50 {p50:7.1f}ms  p99 {p99:7.1f}ms")
+    return throughput
+
+
+async def main(args) -> None:
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        sync_engine, async_engine = build_engines(database_url, args.concurrency)
+        if database_url.startswith("sqlite"):
+            seed(sync_engine)
+
+        app = build_app(sync_engine, async_engine, latency_sql(database_url, args.latency_ms))
+        sync_result = await measure(app, "/sync", args.requests, args.concurrency)
+        async_result = await measure(app, "/async", args.requests, args.concurrency)
+
+        await async_engine.dispose()
+        sync_engine.dispose()
+
+    print(f"GET active boards x {args.requests}, concurrency {args.concurrency}, "
+          f"DB latency {args.latency_ms}ms")
+    sync_throughput = summarize("sync Session in async def", *sync_result)
+    async_throughput = summarize("AsyncSession", *async_result)
+    print(f"{'speedup':<28} {async_throughput / sync_throughput:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="동기 세션 vs 비동기 세션 동시 처리량 벤치마크")
+    parser.add_argument("--requests", type=int, default=400, help="측정 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수 (풀 크기도 같게 설정)")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="요청마다 DB에서 대기할 시간(ms)")
+    parser.add_argument("--database-url", default=None, help="측정할 DB URL (기본: 임시 SQLite 파일)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,108 @@
+"""IP 접근 규칙 매칭 벤치마크
+
+수천 개의 CIDR 규칙에 대해, 요청마다 규칙 문자열을 파싱하며 순회하는
+기존 방식과 정렬된 정수 구간 테이블(IPAccessRules)의 조회 시간을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_ip_filter [--rules 5000] [--lookups 2000]
+"""
+
+import argparse
+import ipaddress
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.middleware.ip_filter import IPAccessRules
+
+
+def legacy_check(client_ip: str, allowed_ips: set, blocked_ips: set) -> bool:
+    """기존 SecurityMiddleware._check_ip_access 방식 (요청마다 규칙 파싱)"""
+    ip_obj = ipaddress.ip_address(client_ip)
+    for blocked_ip in blocked_ips:
+        if ip_obj in ipaddress.ip_network(blocked_ip, strict=False):
+            return False
+    if allowed_ips:
+        for allowed_ip in allowed_ips:
+            if ip_obj in ipaddress.ip_network(allowed_ip, strict=False):
+                return True
+        return False
+    return True
+
+
+def generate_rules(count: int, rng: random.Random) -> list:
+    """IPv4/IPv6가 섞인 임의의 CIDR 규칙을 생성합니다."""
+    rules = []
+    for index in range(count):
+        if index % 4 == 3:
+            prefix = rng.choice([48, 56, 64])
+            address = ipaddress.IPv6Address(rng.getrandbits(128))
+            rules.append(str(ipaddress.ip_network(f"{address}/{prefix}", strict=False)))
+        else:
+            prefix = rng.choice([16, 20, 24, 28, 32])
+            address = ipaddress.IPv4Address(rng.getrandbits(32))
+            rules.append(str(ipaddress.ip_network(f"{address}/{prefix}", strict=False)))
+    return rules
+
+
+def measure(check, ips: list) -> list:
+    """조회당 소요 시간(마이크로초) 목록을 반환합니다."""
+    timings = []
+    for ip in ips:
+        start = time.perf_counter()
+        check(ip)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def summarize(name: str, timings: list) -> float:
+    """측정 결과를 출력하고 평균값을 반환합니다."""
+    ordered = sorted(timings)
+    mean = statistics.fmean(ordered)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(f"{name:<28} mean {mean:10.1f}us  p50 {p50:10.1f}us  p99 {p99:10.1f}us")
+    return mean
+
+
+def main(rule_count: int, lookups: int) -> None:
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(42)
+    blocked = generate_rules(rule_count, rng)
+    allowed = generate_rules(rule_count, rng)
+    ips = [
+        str(ipaddress.IPv4Address(rng.getrandbits(32))) if index % 4 else
+        str(ipaddress.IPv6Address(rng.getrandbits(128)))
+        for index in range(lookups)
+    ]
+
+    start = time.perf_counter()
+    rules = IPAccessRules(allowed, blocked)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    # 두 방식의 판정 결과가 같은지 확인
+    blocked_set, allowed_set = set(blocked), set(allowed)
+    for ip in ips[:200]:
+        assert rules.is_allowed(ip) == legacy_check(ip, allowed_set, blocked_set), ip
+
+    print(f"{rule_count} allowed + {rule_count} blocked CIDR rules, {lookups} lookups")
+    print(f"{'compile':<28} {compile_ms:10.1f}ms  {rules.get_stats()}")
+    legacy_mean = summarize(
+        "legacy (parse per request)",
+        measure(lambda ip: legacy_check(ip, allowed_set, blocked_set), ips[:max(50, lookups // 20)])
+    )
+    compiled_mean = summarize("compiled interval table", measure(rules.is_allowed, ips))
+    print(f"{'speedup':<28} {legacy_mean / compiled_mean:10.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IP 접근 규칙 매칭 벤치마크")
+    parser.add_argument("--rules", type=int, default=5000, help="허용/차단 목록별 CIDR 규칙 수")
+    parser.add_argument("--lookups", type=int, default=2000, help="측정 조회 수")
+    args = parser.parse_args()
+    main(args.rules, args.lookups)
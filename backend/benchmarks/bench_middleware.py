@@ -0,0 +1,109 @@
+"""미들웨어 스택 오버헤드 벤치마크
+
+main.py와 동일한 순서로 미들웨어를 쌓은 앱과 미들웨어가 없는 앱에
+/health 요청을 반복 전송하여 요청당 미들웨어 오버헤드를 측정합니다.
+DB 접근을 배제하기 위해 API 사용 로그 저장기는 메모리에서 폐기합니다.
+
+사용법:
+    python -m benchmarks.bench_middleware [--requests 3000]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.middleware.api_usage_middleware import APIUsageMiddleware
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.logging_middleware import LoggingMiddleware, RequestSizeMiddleware
+from app.middleware.security import APIKeyMiddleware, SecurityMiddleware
+from app.utils.api_log_writer import get_api_log_writer
+
+
+def build_app(with_middlewares: bool) -> FastAPI:
+    """벤치마크용 앱 생성 (main.py와 동일한 미들웨어 순서)"""
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy", "service": "SkyBoot Core API"}
+
+    if with_middlewares:
+        app.add_middleware(RequestSizeMiddleware, max_size=50 * 1024 * 1024)
+        app.add_middleware(APIUsageMiddleware)
+        app.add_middleware(AuthMiddleware)
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(APIKeyMiddleware, api_keys=["bench-key"])
+        app.add_middleware(SecurityMiddleware, rate_limit_requests=10 ** 9)
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+            allow_headers=["*"],
+        )
+    return app
+
+
+async def measure(app: FastAPI, requests: int, path: str = "/health") -> list:
+    """요청당 소요 시간(마이크로초) 목록을 반환합니다."""
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    timings = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(200, requests)):  # warm-up
+            await client.get(path)
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = await client.get(path)
+            timings.append((time.perf_counter() - start) * 1_000_000)
+            assert response.status_code == 200, response.status_code
+    return timings
+
+
+def summarize(name: str, timings: list) -> float:
+    """측정 결과를 출력하고 평균값을 반환합니다."""
+    ordered = sorted(timings)
+    mean = statistics.fmean(ordered)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(f"{name:<28} mean {mean:8.1f}us  p50 {p50:8.1f}us  p99 {p99:8.1f}us")
+    return mean
+
+
+async def main(requests: int) -> None:
+    # 로그 출력과 DB 저장 비용은 측정 대상에서 제외
+    logging.disable(logging.CRITICAL)
+    writer = get_api_log_writer()
+    writer._write_batch = lambda batch: None
+    await writer.start()
+
+    bare = build_app(with_middlewares=False)
+    stacked = build_app(with_middlewares=True)
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        bare_timings = await measure(bare, requests)
+        stacked_timings = await measure(stacked, requests)
+
+    await writer.stop()
+
+    print(f"GET /health x {requests}")
+    bare_mean = summarize("no middleware", bare_timings)
+    stacked_mean = summarize("full middleware stack", stacked_timings)
+    print(f"{'per-request overhead':<28} {stacked_mean - bare_mean:8.1f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미들웨어 스택 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=3000, help="측정 요청 수")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -12,9 +12,20 @@ load_dotenv()
 from app.middleware.logging_middleware import LoggingMiddleware, RequestSizeMiddleware
 from app.middleware.auth_middleware import AuthMiddleware
 from app.middleware.api_usage_middleware import APIUsageMiddleware
+from app.middleware.loop_lag_middleware import LoopLagMiddleware
 from app.middleware.security import SecurityMiddleware, APIKeyMiddleware, get_security_config
+from app.middleware.ip_filter import get_ip_access_rules
+from app.middleware.rate_limit import create_rate_limit_backend
 from app.middleware.static_files import setup_static_files, get_static_file_config
 from app.utils.logger import get_api_logger
+from app.utils.api_log_writer import get_api_log_writer
+from app.utils.menu_tree_cache import get_menu_tree_cache
+from app.utils.loop_monitor import get_loop_lag_monitor
+from app.utils.partition_maintainer import get_partition_maintainer
+from app.utils.rollup_compactor import get_rollup_compactor
+from app.utils.system_snapshot import get_system_snapshot_engine
+from app.utils.db_offload import get_db_offloader
+from app.utils.export_jobs import get_export_job_manager
 from app.utils.production_logger import get_production_logger, setup_production_logging
 import os
 
@@ -43,9 +54,51 @@ async def lifespan(app: FastAPI):
             environment=environment
         )
     
+    # API 사용 로그 일괄 저장기 시작
+    api_log_writer = get_api_log_writer()
+    await api_log_writer.start()
+    
+    # 메뉴 트리 캐시 무효화 구독 시작 (MENU_TREE_CACHE_SYNC=redis인 경우)
+    menu_tree_cache = get_menu_tree_cache()
+    await menu_tree_cache.start()
+    
+    # 이벤트 루프 지연 측정 시작 (LOOP_LAG_INTERVAL=0이면 비활성화)
+    loop_lag_monitor = get_loop_lag_monitor()
+    await loop_lag_monitor.start()
+    
+    # 로그 테이블 월별 파티션 사전 생성/보관 기간 정리 (LOG_PARTITION_INTERVAL=0이면 비활성화)
+    partition_maintainer = get_partition_maintainer()
+    await partition_maintainer.start()
+    
+    # 로그 통계 시간별/일별 집계 (LOG_ROLLUP_INTERVAL=0이면 비활성화)
+    rollup_compactor = get_rollup_compactor()
+    await rollup_compactor.start()
+    
+    # 시스템 상태/대시보드 스냅샷 갱신 (SYSTEM_SNAPSHOT_INTERVAL=0이면 요청마다 계산)
+    system_snapshot_engine = get_system_snapshot_engine()
+    await system_snapshot_engine.start()
+    
+    # IP 규칙 파일 변경 감시/SIGHUP 처리 (IP_RULES_FILE이 없으면 비활성화)
+    ip_access_rules = get_ip_access_rules()
+    await ip_access_rules.start()
+    
     yield
     
-    # 종료 이벤트
+    # 종료 이벤트 (큐에 남은 API 사용 로그 저장)
+    await api_log_writer.stop()
+    await menu_tree_cache.stop()
+    await loop_lag_monitor.stop()
+    await partition_maintainer.stop()
+    await rollup_compactor.stop()
+    await system_snapshot_engine.stop()
+    await ip_access_rules.stop()
+    get_db_offloader().shutdown()
+    get_export_job_manager().shutdown()
+    
+    # Rate limit 백엔드 연결 정리
+    if rate_limit_backend is not None:
+        await rate_limit_backend.close()
+    
     if environment == "production":
         prod_logger = get_production_logger()
         prod_logger.app_logger.info("🛑 SkyBoot Core API 서버가 종료되었습니다.")
@@ -84,15 +137,24 @@ if security_config.get("api_keys"):
     app.add_middleware(APIKeyMiddleware, api_keys=security_config["api_keys"])
 
 # 보안 미들웨어 (프로덕션 환경에서만)
+rate_limit_backend = None
 if os.getenv("ENVIRONMENT", "development") == "production":
+    # 다중 워커/노드 환경에서는 RATE_LIMIT_BACKEND=redis로 한도를 공유
+    rate_limit_backend = create_rate_limit_backend(
+        limit=security_config["rate_limit_requests"],
+        window=security_config["rate_limit_window"],
+        backend=security_config["rate_limit_backend"],
+        redis_url=security_config["redis_url"]
+    )
     app.add_middleware(
         SecurityMiddleware,
         rate_limit_requests=security_config["rate_limit_requests"],
         rate_limit_window=security_config["rate_limit_window"],
         max_request_size=security_config["max_request_size"],
-        allowed_ips=security_config["allowed_ips"],
-        blocked_ips=security_config["blocked_ips"],
-        enable_security_headers=security_config["enable_security_headers"]
+        enable_security_headers=security_config["enable_security_headers"],
+        rate_limit_backend=rate_limit_backend,
+        # ALLOWED_IPS/BLOCKED_IPS와 IP_RULES_FILE로 컴파일된 전역 규칙 (규칙 파일 변경 시 갱신)
+        ip_rules=get_ip_access_rules()
     )
 
 # CORS 미들웨어 설정 (환경별 설정)
@@ -109,6 +171,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 이벤트 루프 지연 추적 (가장 바깥에서 응답 전송까지 포함한 처리 구간을 등록)
+app.add_middleware(LoopLagMiddleware)
+
 # 루트 엔드포인트
 @app.get("/")
 async def root():
@@ -15,7 +15,7 @@ sys.path.append(str(Path(__file__).parent))
 
 from app.database.database import (
     create_database, drop_database, check_database_connection,
-    engine, get_db
+    engine, get_db, SessionLocal
 )
 from app.database.init_db import initialize_database
 from app.database.migration import (
@@ -159,6 +159,151 @@ def show_status():
         return False
 
 
+def check_menu_paths(fix: bool = False):
+    """메뉴 구체화 경로(menu_path/menu_depth) 정합성 검사"""
+    from app.services.menu_service import MenuInfoService
+    
+    try:
+        logger.info("메뉴 경로 검사 시작...")
+        db = SessionLocal()
+        try:
+            result = MenuInfoService().check_menu_paths(db, fix=fix)
+        finally:
+            db.close()
+        
+        print(f"전체 메뉴 수: {result['total_count']}")
+        print(f"경로 불일치: {len(result['mismatched'])}")
+        if result['mismatched']:
+            print(f"  {', '.join(result['mismatched'][:50])}")
+        print(f"최상위까지 이어지지 않는 메뉴: {len(result['unreachable'])}")
+        if result['unreachable']:
+            print(f"  {', '.join(result['unreachable'][:50])}")
+        if fix:
+            print(f"수정된 메뉴 수: {result['fixed_count']}")
+        
+        # 수정 모드가 아니면 불일치가 있을 때 실패 코드로 종료
+        return fix or not result['mismatched']
+        
+    except Exception as e:
+        logger.error(f"메뉴 경로 검사 실패: {e}")
+        return False
+
+
+def explain_queries(user_id: str, bbs_id: str = None, min_rows: int = 0, only: str = None, show_sql: bool = False):
+    """주요 서비스 조회의 실행 계획 점검 (순차 스캔 탐지)"""
+    from app.database.query_advisor import analyze_catalog
+    
+    try:
+        logger.info("실행 계획 점검 시작...")
+        db = SessionLocal()
+        try:
+            results = analyze_catalog(
+                db, params={"user_id": user_id, "bbs_id": bbs_id}, min_rows=min_rows, only=only
+            )
+        finally:
+            db.close()
+        
+        flagged = 0
+        for result in results:
+            if result.get("error"):
+                print(f"[오류] {result['name']}: {result['error']}")
+                continue
+            
+            label = "SEQ" if result["seq_scans"] else "OK "
+            print(
+                f"[{label}] {result['name']}: 실행 {result['execution_ms']:.2f}ms, "
+                f"버퍼 hit={result['shared_hit']} read={result['shared_read']}"
+            )
+            for scan in result["seq_scans"]:
+                print(f"      Seq Scan {scan['relation']} 읽은 행={scan['rows_scanned']} 반환 행={scan['rows_returned']}")
+                if scan["filter"]:
+                    print(f"        Filter: {scan['filter']}")
+            if show_sql or result["seq_scans"]:
+                print(f"      SQL: {' '.join(result['statement'].split())}")
+            flagged += bool(result["seq_scans"])
+        
+        print(f"점검한 쿼리 수: {len(results)}, 순차 스캔 쿼리 수: {flagged}")
+        
+        # 순차 스캔이나 오류가 있으면 실패 코드로 종료
+        return flagged == 0 and not any(result.get("error") for result in results)
+        
+    except Exception as e:
+        logger.error(f"실행 계획 점검 실패: {e}")
+        return False
+
+
+def maintain_partitions(months_ahead: int = 3, retention_days: int = 0, mode: str = None, list_only: bool = False):
+    """로그 테이블 월별 파티션 생성 및 보관 기간 정리"""
+    from app.database.partitioning import DEFAULT_RETENTION_MODE, is_partitioned, list_partitions
+    from app.utils.partition_maintainer import LOG_TABLES, PartitionMaintainer
+    
+    try:
+        if not list_only:
+            logger.info("로그 파티션 유지보수 시작...")
+            maintainer = PartitionMaintainer(
+                months_ahead=months_ahead, retention_days=retention_days,
+                mode=mode or DEFAULT_RETENTION_MODE
+            )
+            for table_name, result in maintainer.run_once().items():
+                if result.get("error"):
+                    print(f"[오류] {table_name}: {result['error']}")
+                    continue
+                print(f"{table_name}: 생성 {len(result['created'])}개 {', '.join(result['created'])}".rstrip())
+                if retention_days > 0:
+                    print(
+                        f"      삭제된 로그 수: {result['deleted_count']}, "
+                        f"DROP: {', '.join(result['dropped_partitions']) or '-'}, "
+                        f"DETACH: {', '.join(result['detached_partitions']) or '-'}"
+                    )
+            if maintainer.failed_count:
+                return False
+        
+        db = SessionLocal()
+        try:
+            for table in LOG_TABLES:
+                if not is_partitioned(db, table):
+                    print(f"{table.name}: 파티션 테이블이 아닙니다. (마이그레이션 필요)")
+                    continue
+                names = [name for name, _ in list_partitions(db, table)]
+                print(f"{table.name}: 파티션 {len(names)}개 - {', '.join(names)}")
+        finally:
+            db.close()
+        return True
+        
+    except Exception as e:
+        logger.error(f"로그 파티션 유지보수 실패: {e}")
+        return False
+
+
+def compact_log_rollups(rebuild: bool = False):
+    """로그 통계 시간별/일별 집계 (rebuild면 집계를 비우고 처음부터 다시 집계)"""
+    from app.database.rollups import ROLLUPS, reset_rollup
+    from app.utils.rollup_compactor import RollupCompactor
+    
+    try:
+        if rebuild:
+            logger.info("로그 통계 집계 초기화...")
+            db = SessionLocal()
+            try:
+                for spec in ROLLUPS:
+                    reset_rollup(db, spec)
+            finally:
+                db.close()
+        
+        logger.info("로그 통계 집계 시작...")
+        compactor = RollupCompactor()
+        for name, result in compactor.run_once().items():
+            if result.get("error"):
+                print(f"[오류] {name}: {result['error']}")
+            else:
+                print(f"{name}: 시간별 집계 {result['created']}건, 집계 시점: {result['watermark']}")
+        return compactor.failed_count == 0
+        
+    except Exception as e:
+        logger.error(f"로그 통계 집계 실패: {e}")
+        return False
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description='데이터베이스 관리 스크립트')
@@ -188,6 +333,29 @@ def main():
     # status 명령어
     subparsers.add_parser('status', help='데이터베이스 상태 확인')
     
+    # menu-paths 명령어
+    menu_paths_parser = subparsers.add_parser('menu-paths', help='메뉴 경로 정합성 검사')
+    menu_paths_parser.add_argument('--fix', action='store_true', help='불일치한 경로 수정')
+    
+    # explain 명령어
+    explain_parser = subparsers.add_parser('explain', help='주요 조회 쿼리 실행 계획 점검 (EXPLAIN ANALYZE, 순차 스캔 탐지)')
+    explain_parser.add_argument('--user-id', default='admin', help='사용자별 조회에 사용할 사용자 ID')
+    explain_parser.add_argument('--bbs-id', default=None, help='게시글 목록 조회에 사용할 게시판 ID')
+    explain_parser.add_argument('--min-rows', type=int, default=0, help='보고할 순차 스캔의 최소 읽은 행 수')
+    explain_parser.add_argument('--only', default=None, help='이름이 이 값으로 시작하는 쿼리만 점검 (예: loginlog)')
+    explain_parser.add_argument('--show-sql', action='store_true', help='모든 쿼리의 SQL 출력')
+    
+    # partitions 명령어
+    partitions_parser = subparsers.add_parser('partitions', help='로그 테이블 월별 파티션 생성 및 보관 기간 정리')
+    partitions_parser.add_argument('--months-ahead', type=int, default=3, help='미리 만들 파티션 개월 수')
+    partitions_parser.add_argument('--retention-days', type=int, default=0, help='로그 보관 일수 (0이면 정리하지 않음)')
+    partitions_parser.add_argument('--mode', choices=['drop', 'detach'], default=None, help='지난 파티션 정리 방식')
+    partitions_parser.add_argument('--list', action='store_true', help='파티션 목록만 출력')
+    
+    # rollups 명령어
+    rollups_parser = subparsers.add_parser('rollups', help='로그 통계 시간별/일별 집계')
+    rollups_parser.add_argument('--rebuild', action='store_true', help='집계를 비우고 처음부터 다시 집계')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -213,6 +381,14 @@ def main():
             migration_parser.print_help()
     elif args.command == 'status':
         success = show_status()
+    elif args.command == 'menu-paths':
+        success = check_menu_paths(args.fix)
+    elif args.command == 'explain':
+        success = explain_queries(args.user_id, args.bbs_id, args.min_rows, args.only, args.show_sql)
+    elif args.command == 'partitions':
+        success = maintain_partitions(args.months_ahead, args.retention_days, args.mode, args.list)
+    elif args.command == 'rollups':
+        success = compact_log_rollups(args.rebuild)
     
     sys.exit(0 if success else 1)
 
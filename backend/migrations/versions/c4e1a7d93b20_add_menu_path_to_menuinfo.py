@@ -0,0 +1,53 @@
+"""Add materialized menu_path and menu_depth to tb_menuinfo
+
+Revision ID: c4e1a7d93b20
+Revises: 39fedd9d24a2
+Create Date: 2026-10-16 21:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a7d93b20'
+down_revision: Union[str, None] = '39fedd9d24a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tb_menuinfo', sa.Column('menu_path', sa.String(), nullable=True, comment='메뉴경로 (/최상위메뉴번호/.../메뉴번호/)'), schema='skybootcore')
+    op.add_column('tb_menuinfo', sa.Column('menu_depth', sa.Numeric(precision=3), nullable=True, comment='메뉴깊이 (최상위 메뉴가 1)'), schema='skybootcore')
+    op.create_index('ix_menuinfo_02', 'tb_menuinfo', ['menu_path'], unique=False, schema='skybootcore', postgresql_ops={'menu_path': 'varchar_pattern_ops'})
+
+    # 기존 메뉴 경로 채우기 (순환 참조 등으로 최상위까지 이어지지 않는 메뉴는 NULL로 남김)
+    op.execute("""
+        WITH RECURSIVE paths AS (
+            SELECT menu_no,
+                   CAST('/' || menu_no || '/' AS VARCHAR) AS menu_path,
+                   1 AS menu_depth
+              FROM skybootcore.tb_menuinfo
+             WHERE upper_menu_no IS NULL
+            UNION ALL
+            SELECT m.menu_no,
+                   CAST(p.menu_path || m.menu_no || '/' AS VARCHAR),
+                   p.menu_depth + 1
+              FROM skybootcore.tb_menuinfo m
+              JOIN paths p ON m.upper_menu_no = p.menu_no
+             WHERE p.menu_depth < 64
+        )
+        UPDATE skybootcore.tb_menuinfo t
+           SET menu_path = paths.menu_path,
+               menu_depth = paths.menu_depth
+          FROM paths
+         WHERE t.menu_no = paths.menu_no
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_menuinfo_02', table_name='tb_menuinfo', schema='skybootcore')
+    op.drop_column('tb_menuinfo', 'menu_depth', schema='skybootcore')
+    op.drop_column('tb_menuinfo', 'menu_path', schema='skybootcore')
@@ -0,0 +1,58 @@
+"""Add composite and partial indexes for log and board queries
+
+Revision ID: d5f3b8e21c47
+Revises: c4e1a7d93b20
+Create Date: 2026-10-16 23:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f3b8e21c47'
+down_revision: Union[str, None] = 'c4e1a7d93b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스명, 테이블명, 컬럼, 추가 옵션)
+INDEXES = [
+    ('ix_syslog_01', 'tb_syslog', ['occrrnc_de'], {}),
+    ('ix_syslog_02', 'tb_syslog', ['rqester_id', 'occrrnc_de'], {}),
+    ('ix_syslog_03', 'tb_syslog', ['process_se_code', 'occrrnc_de'], {}),
+    ('ix_syslog_04', 'tb_syslog', ['occrrnc_de'], {'postgresql_where': sa.text("error_se = 'Y'")}),
+    ('ix_weblog_01', 'tb_weblog', ['rqest_de'], {}),
+    ('ix_weblog_02', 'tb_weblog', ['occrrnc_de'], {}),
+    ('ix_weblog_03', 'tb_weblog', ['rqester_id', 'rqest_de'], {}),
+    ('ix_loginlog_01', 'tb_loginlog', ['frst_regist_pnttm'], {}),
+    ('ix_loginlog_02', 'tb_loginlog', ['conect_id', 'frst_regist_pnttm'], {}),
+    ('ix_loginlog_03', 'tb_loginlog', ['conect_ip', 'frst_regist_pnttm'], {}),
+    ('ix_loginlog_04', 'tb_loginlog', ['error_occrrnc_at', 'frst_regist_pnttm'], {}),
+    ('ix_api_usage_log_01', 'tb_api_usage_log', ['frst_regist_pnttm'], {}),
+    ('ix_api_usage_log_02', 'tb_api_usage_log', ['user_id', 'frst_regist_pnttm'], {}),
+    ('ix_api_usage_log_03', 'tb_api_usage_log', ['ip_address', 'frst_regist_pnttm'], {}),
+    ('ix_bbs_02', 'tb_bbs', ['bbs_id', 'delete_at', sa.text('frst_regist_pnttm DESC')], {}),
+]
+
+
+def upgrade() -> None:
+    # 로그 테이블은 크고 쓰기가 계속 들어오므로 쓰기를 막지 않도록 CONCURRENTLY로 생성
+    # (CONCURRENTLY는 트랜잭션 안에서 실행할 수 없음)
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False, schema='skybootcore',
+                postgresql_concurrently=True, if_not_exists=True, **options
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, schema='skybootcore',
+                postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,125 @@
+"""Partition log tables by month
+
+Revision ID: e8a4c2f61d90
+Revises: d5f3b8e21c47
+Create Date: 2026-10-17 01:20:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a4c2f61d90'
+down_revision: Union[str, None] = 'd5f3b8e21c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SCHEMA = 'skybootcore'
+MONTHS_AHEAD = 3
+
+# (테이블명, ID 컬럼, 파티션 키, 키가 NULL인 기존 행에 채울 값, 테이블 코멘트, 인덱스)
+TABLES = [
+    ('tb_loginlog', 'log_id', 'frst_regist_pnttm', 'COALESCE(last_updt_pnttm, now())', '접속로그', [
+        ('ix_loginlog_01', 'frst_regist_pnttm', ''),
+        ('ix_loginlog_02', 'conect_id, frst_regist_pnttm', ''),
+        ('ix_loginlog_03', 'conect_ip, frst_regist_pnttm', ''),
+        ('ix_loginlog_04', 'error_occrrnc_at, frst_regist_pnttm', ''),
+    ]),
+    ('tb_syslog', 'requst_id', 'occrrnc_de', 'COALESCE(frst_regist_pnttm, now())', '시스템로그', [
+        ('ix_syslog_01', 'occrrnc_de', ''),
+        ('ix_syslog_02', 'rqester_id, occrrnc_de', ''),
+        ('ix_syslog_03', 'process_se_code, occrrnc_de', ''),
+        ('ix_syslog_04', 'occrrnc_de', "WHERE error_se = 'Y'"),
+    ]),
+    ('tb_weblog', 'requst_id', 'rqest_de', 'COALESCE(occrrnc_de, frst_regist_pnttm, now())', '웹로그', [
+        ('ix_weblog_01', 'rqest_de', ''),
+        ('ix_weblog_02', 'occrrnc_de', ''),
+        ('ix_weblog_03', 'rqester_id, rqest_de', ''),
+    ]),
+    ('tb_api_usage_log', 'log_id', 'frst_regist_pnttm', 'COALESCE(last_updt_pnttm, now())', 'API 사용 로그', [
+        ('ix_api_usage_log_01', 'frst_regist_pnttm', ''),
+        ('ix_api_usage_log_02', 'user_id, frst_regist_pnttm', ''),
+        ('ix_api_usage_log_03', 'ip_address, frst_regist_pnttm', ''),
+    ]),
+]
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes(table: str, indexes) -> None:
+    for name, columns, where in indexes:
+        op.execute(f"CREATE INDEX {name} ON {SCHEMA}.{table} ({columns}) {where}")
+
+
+def _drop_indexes(indexes) -> None:
+    for name, _, _ in indexes:
+        op.execute(f"DROP INDEX IF EXISTS {SCHEMA}.{name}")
+
+
+def upgrade() -> None:
+    # 기존 테이블을 옮겨 두고 같은 컬럼의 월별 범위 파티션 테이블을 만든 뒤 데이터를 복사
+    # (일반 테이블을 파티션 테이블로 직접 바꾸는 방법은 없음)
+    bind = op.get_bind()
+    this_month = date.today().replace(day=1)
+
+    for table, id_column, key, fallback, comment, indexes in TABLES:
+        legacy = f"{table}_legacy"
+
+        # 파티션 키는 기본 키에 포함되므로 NULL일 수 없음
+        op.execute(f"UPDATE {SCHEMA}.{table} SET {key} = {fallback} WHERE {key} IS NULL")
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} RENAME TO {legacy}")
+        op.execute(f"ALTER TABLE {SCHEMA}.{legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+        _drop_indexes(indexes)
+
+        op.execute(
+            f"CREATE TABLE {SCHEMA}.{table} (LIKE {SCHEMA}.{legacy} INCLUDING DEFAULTS INCLUDING COMMENTS) "
+            f"PARTITION BY RANGE ({key})"
+        )
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} ALTER COLUMN {key} SET NOT NULL")
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({id_column}, {key})")
+        op.execute(f"COMMENT ON TABLE {SCHEMA}.{table} IS '{comment}'")
+        _create_indexes(table, indexes)
+
+        # 가장 오래된 로그의 월부터 이번 달 + MONTHS_AHEAD개월까지 파티션 생성
+        oldest = bind.execute(sa.text(f"SELECT min({key}) FROM {SCHEMA}.{legacy}")).scalar()
+        month = min(date(oldest.year, oldest.month, 1), this_month) if oldest else this_month
+        last = _add_months(this_month, MONTHS_AHEAD)
+        while month <= last:
+            op.execute(
+                f"CREATE TABLE {SCHEMA}.{table}_p{month:%Y%m} PARTITION OF {SCHEMA}.{table} "
+                f"FOR VALUES FROM ('{month}') TO ('{_add_months(month, 1)}')"
+            )
+            month = _add_months(month, 1)
+        op.execute(f"CREATE TABLE {SCHEMA}.{table}_default PARTITION OF {SCHEMA}.{table} DEFAULT")
+
+        op.execute(f"INSERT INTO {SCHEMA}.{table} SELECT * FROM {SCHEMA}.{legacy}")
+        op.execute(f"DROP TABLE {SCHEMA}.{legacy}")
+
+
+def downgrade() -> None:
+    for table, id_column, key, _, comment, indexes in reversed(TABLES):
+        partitioned = f"{table}_partitioned"
+
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} RENAME TO {partitioned}")
+        op.execute(f"ALTER TABLE {SCHEMA}.{partitioned} RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey")
+        _drop_indexes(indexes)
+
+        op.execute(
+            f"CREATE TABLE {SCHEMA}.{table} (LIKE {SCHEMA}.{partitioned} INCLUDING DEFAULTS INCLUDING COMMENTS)"
+        )
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} ALTER COLUMN {key} DROP NOT NULL")
+        op.execute(f"ALTER TABLE {SCHEMA}.{table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({id_column})")
+        op.execute(f"COMMENT ON TABLE {SCHEMA}.{table} IS '{comment}'")
+
+        op.execute(f"INSERT INTO {SCHEMA}.{table} SELECT * FROM {SCHEMA}.{partitioned}")
+        # 파티션 테이블을 삭제하면 모든 파티션이 함께 삭제됨
+        op.execute(f"DROP TABLE {SCHEMA}.{partitioned}")
+        _create_indexes(table, indexes)
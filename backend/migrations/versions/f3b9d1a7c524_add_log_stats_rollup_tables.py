@@ -0,0 +1,103 @@
+"""Add hourly and daily log statistics rollup tables
+
+Revision ID: f3b9d1a7c524
+Revises: e8a4c2f61d90
+Create Date: 2026-10-17 03:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b9d1a7c524'
+down_revision: Union[str, None] = 'e8a4c2f61d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 집계 테이블은 비어 있는 상태로 생성하며, 첫 집계 작업(RollupCompactor 또는
+    # manage_db.py rollups)이 가장 오래된 로그부터 채움
+    op.create_table('tb_loginlog_hour_stats',
+    sa.Column('stats_pnttm', sa.DateTime(), nullable=False, comment='집계시점(시간 시작)'),
+    sa.Column('conect_id', sa.String(length=20), nullable=False, comment='접속ID'),
+    sa.Column('conect_ip', sa.String(length=23), nullable=False, comment='접속IP'),
+    sa.Column('error_occrrnc_at', sa.String(length=1), nullable=False, comment='오류발생여부'),
+    sa.Column('log_co', sa.Integer(), nullable=False, comment='로그수'),
+    sa.PrimaryKeyConstraint('stats_pnttm', 'conect_id', 'conect_ip', 'error_occrrnc_at'),
+    schema='skybootcore',
+    comment='접속로그 시간별 집계'
+    )
+    op.create_table('tb_loginlog_day_stats',
+    sa.Column('stats_de', sa.Date(), nullable=False, comment='집계일자'),
+    sa.Column('conect_id', sa.String(length=20), nullable=False, comment='접속ID'),
+    sa.Column('conect_ip', sa.String(length=23), nullable=False, comment='접속IP'),
+    sa.Column('error_occrrnc_at', sa.String(length=1), nullable=False, comment='오류발생여부'),
+    sa.Column('log_co', sa.Integer(), nullable=False, comment='로그수'),
+    sa.PrimaryKeyConstraint('stats_de', 'conect_id', 'conect_ip', 'error_occrrnc_at'),
+    schema='skybootcore',
+    comment='접속로그 일별 집계'
+    )
+    op.create_table('tb_syslog_hour_stats',
+    sa.Column('stats_pnttm', sa.DateTime(), nullable=False, comment='집계시점(시간 시작)'),
+    sa.Column('rqester_id', sa.String(length=20), nullable=False, comment='요청자ID'),
+    sa.Column('trget_menu_nm', sa.String(length=255), nullable=False, comment='대상메뉴명'),
+    sa.Column('process_se_code', sa.String(length=3), nullable=False, comment='처리구분코드'),
+    sa.Column('log_co', sa.Integer(), nullable=False, comment='로그수'),
+    sa.Column('process_time_sum', sa.Numeric(), nullable=True, comment='처리시간합계'),
+    sa.Column('process_time_co', sa.Integer(), nullable=False, comment='처리시간기록수'),
+    sa.PrimaryKeyConstraint('stats_pnttm', 'rqester_id', 'trget_menu_nm', 'process_se_code'),
+    schema='skybootcore',
+    comment='시스템로그 시간별 집계'
+    )
+    op.create_table('tb_syslog_day_stats',
+    sa.Column('stats_de', sa.Date(), nullable=False, comment='집계일자'),
+    sa.Column('rqester_id', sa.String(length=20), nullable=False, comment='요청자ID'),
+    sa.Column('trget_menu_nm', sa.String(length=255), nullable=False, comment='대상메뉴명'),
+    sa.Column('process_se_code', sa.String(length=3), nullable=False, comment='처리구분코드'),
+    sa.Column('log_co', sa.Integer(), nullable=False, comment='로그수'),
+    sa.Column('process_time_sum', sa.Numeric(), nullable=True, comment='처리시간합계'),
+    sa.Column('process_time_co', sa.Integer(), nullable=False, comment='처리시간기록수'),
+    sa.PrimaryKeyConstraint('stats_de', 'rqester_id', 'trget_menu_nm', 'process_se_code'),
+    schema='skybootcore',
+    comment='시스템로그 일별 집계'
+    )
+    op.create_table('tb_weblog_hour_stats',
+    sa.Column('stats_pnttm', sa.DateTime(), nullable=False, comment='집계시점(시간 시작)'),
+    sa.Column('rqester_id', sa.String(length=20), nullable=False, comment='요청자ID'),
+    sa.Column('trget_menu_nm', sa.String(length=60), nullable=False, comment='대상메뉴명'),
+    sa.Column('log_co', sa.Integer(), nullable=False, comment='로그수'),
+    sa.PrimaryKeyConstraint('stats_pnttm', 'rqester_id', 'trget_menu_nm'),
+    schema='skybootcore',
+    comment='웹로그 시간별 집계'
+    )
+    op.create_table('tb_weblog_day_stats',
+    sa.Column('stats_de', sa.Date(), nullable=False, comment='집계일자'),
+    sa.Column('rqester_id', sa.String(length=20), nullable=False, comment='요청자ID'),
+    sa.Column('trget_menu_nm', sa.String(length=60), nullable=False, comment='대상메뉴명'),
+    sa.Column('log_co', sa.Integer(), nullable=False, comment='로그수'),
+    sa.PrimaryKeyConstraint('stats_de', 'rqester_id', 'trget_menu_nm'),
+    schema='skybootcore',
+    comment='웹로그 일별 집계'
+    )
+    op.create_table('tb_stats_watermark',
+    sa.Column('stats_nm', sa.String(length=30), nullable=False, comment='집계명'),
+    sa.Column('watermark_pnttm', sa.DateTime(), nullable=False, comment='집계완료시점'),
+    sa.Column('last_updt_pnttm', sa.DateTime(), nullable=True, comment='최종수정시점'),
+    sa.PrimaryKeyConstraint('stats_nm'),
+    schema='skybootcore',
+    comment='로그 집계 진행 시점'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tb_stats_watermark', schema='skybootcore')
+    op.drop_table('tb_weblog_day_stats', schema='skybootcore')
+    op.drop_table('tb_weblog_hour_stats', schema='skybootcore')
+    op.drop_table('tb_syslog_day_stats', schema='skybootcore')
+    op.drop_table('tb_syslog_hour_stats', schema='skybootcore')
+    op.drop_table('tb_loginlog_day_stats', schema='skybootcore')
+    op.drop_table('tb_loginlog_hour_stats', schema='skybootcore')
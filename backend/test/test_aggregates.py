@@ -0,0 +1,271 @@
+"""단일 SELECT 조건부 집계 테스트
+
+AggregateQuery가 FILTER (WHERE ...) 절(미지원 DB에서는 CASE 식)로 조건부 집계를
+한 번의 SELECT에서 계산하는지, 각 서비스의 통계 메서드가 정해진 횟수의 쿼리만
+실행하면서 기존과 같은 값을 반환하는지 테스트합니다.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, desc, event
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.aggregates import AggregateQuery
+from app.models.common_models import CmmnCode, CmmnGrpCode
+from app.models.log_models import LoginLog
+from app.models.menu_models import MenuInfo
+from app.models.stats_models import (
+    LoginLogDayStats, LoginLogHourStats, StatsWatermark,
+    SysLogDayStats, SysLogHourStats, WebLogDayStats, WebLogHourStats
+)
+from app.models.system_models import SysLog, WebLog
+from app.models.user_models import UserInfo
+from app.services.common_service import CmmnCodeService, CmmnGrpCodeService
+from app.services.log_service import LoginLogService
+from app.services.menu_service import MenuInfoService
+from app.services.system_service import SysLogService, SystemMonitoringService
+from app.services.user_service import UserInfoService
+
+TABLES = [
+    UserInfo, MenuInfo, CmmnGrpCode, CmmnCode, LoginLog, SysLog, WebLog,
+    LoginLogHourStats, LoginLogDayStats, SysLogHourStats, SysLogDayStats,
+    WebLogHourStats, WebLogDayStats, StatsWatermark,
+]
+
+
+@pytest.fixture
+def db():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB (실행된 SQL을 db.statements에 기록)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    for model in TABLES:
+        model.__table__.create(engine)
+
+    now = datetime.now()
+    session = sessionmaker(bind=engine)()
+    for index, (status, org, lock_at) in enumerate([
+        ("A", "ORG1", "N"), ("A", "ORG1", "Y"), ("A", "ORG2", "N"), ("D", None, "Y"), ("P", "ORG2", None)
+    ]):
+        session.add(UserInfo(
+            user_id=f"user{index}", user_nm=f"사용자{index}", password="x",
+            emplyr_sttus_code=status, orgnzt_id=org, lock_at=lock_at,
+            sbscrb_de=now - timedelta(days=20 * index)
+        ))
+    for menu_no, upper_menu_no, display_yn in [
+        ("1", None, "Y"), ("2", None, "N"), ("11", "1", "Y"), ("12", "1", "Y"), ("111", "11", "N")
+    ]:
+        session.add(MenuInfo(
+            menu_no=menu_no, menu_nm=f"메뉴{menu_no}", progrm_file_nm="dir",
+            upper_menu_no=upper_menu_no, menu_ordr=Decimal(1), display_yn=display_yn
+        ))
+    session.add_all([
+        CmmnGrpCode(code_id="G1", code_id_nm="그룹1", use_yn="Y"),
+        CmmnGrpCode(code_id="G2", code_id_nm="그룹2", use_yn="N"),
+        CmmnGrpCode(code_id="G3", code_id_nm="그룹3", use_yn="Y"),
+        CmmnCode(code_id="G1", code="A", code_nm="A", use_yn="Y"),
+        CmmnCode(code_id="G1", code="B", code_nm="B", use_yn="N"),
+        CmmnCode(code_id="G1", code="C", code_nm="C", use_yn="Y"),
+        CmmnCode(code_id="G2", code="A", code_nm="A", use_yn="Y"),
+    ])
+    for index in range(20):
+        logged_at = now - timedelta(hours=5 * index)
+        user = None if index % 5 == 0 else f"user{index % 3}"
+        session.add(LoginLog(
+            log_id=f"L{index:03d}", conect_id=user, conect_ip=f"10.0.0.{index % 4}",
+            error_occrrnc_at="Y" if index % 4 == 0 else "N", frst_regist_pnttm=logged_at
+        ))
+        session.add(SysLog(
+            requst_id=f"S{index:03d}", rqester_id=user, occrrnc_de=logged_at,
+            trget_menu_nm=f"menu{index % 2}", process_se_code="ERROR" if index % 7 == 0 else "SEL",
+            process_time=str(index * 10) if index % 3 else None
+        ))
+        session.add(WebLog(
+            requst_id=f"W{index:03d}", rqester_id=user, rqest_de=logged_at, trget_menu_nm=f"page{index % 3}"
+        ))
+    session.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session.statements = statements
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def select_count(db, call):
+    """call 실행 중 실행된 SELECT 문 수와 결과"""
+    db.statements.clear()
+    result = call()
+    return sum(1 for statement in db.statements if statement.lstrip().upper().startswith("SELECT")), result
+
+
+class TestAggregateQuery:
+    """조건부 집계 빌더 테스트 클래스"""
+
+    def build(self):
+        return (
+            AggregateQuery(UserInfo)
+            .count("total")
+            .count("locked", UserInfo.lock_at == "Y")
+            .count_distinct("organizations", UserInfo.orgnzt_id, UserInfo.emplyr_sttus_code == "A")
+            .sum("locked_active", 1, UserInfo.lock_at == "Y", UserInfo.emplyr_sttus_code == "A")
+        )
+
+    def test_filter_clause_on_postgresql(self):
+        """PostgreSQL에서는 FILTER (WHERE ...) 절로 컴파일하는지 테스트"""
+        sql = str(self.build().statement(postgresql.dialect()).compile(dialect=postgresql.dialect()))
+
+        assert sql.count("FILTER (WHERE") == 3
+        assert "CASE" not in sql
+        assert sql.count("FROM") == 1
+
+    def test_case_fallback_without_filter_support(self, db):
+        """FILTER 미지원 DB용 CASE 식도 같은 결과를 내는지 테스트"""
+        query = self.build()
+        fallback = query.statement(mysql.dialect())
+
+        assert "CASE" in str(fallback.compile(dialect=mysql.dialect()))
+        assert db.execute(fallback).one() == query.one(db) == (5, 2, 2, 1)
+
+    def test_single_select(self, db):
+        """집계 수와 관계없이 SELECT 한 번으로 실행하는지 테스트"""
+        count, row = select_count(db, lambda: self.build().one(db))
+
+        assert count == 1
+        assert (row.total, row.locked, row.organizations, row.locked_active) == (5, 2, 2, 1)
+
+    def test_empty_source(self, db):
+        """대상 행이 없으면 COUNT/SUM은 0, AVG/MAX는 NULL인지 테스트"""
+        row = (
+            AggregateQuery(UserInfo, UserInfo.user_id == "없음")
+            .count("total")
+            .sum("locks", UserInfo.lock_cnt)
+            .avg("avg_locks", UserInfo.lock_cnt)
+            .max("last", UserInfo.sbscrb_de)
+            .one(db)
+        )
+
+        assert (row.total, row.locks, row.avg_locks, row.last) == (0, 0, None, None)
+
+    def test_group_by_order_limit(self, db):
+        """그룹별 집계와 정렬/건수 제한"""
+        rows = (
+            AggregateQuery(UserInfo)
+            .count("users")
+            .count("locked", UserInfo.lock_at == "Y")
+            .group_by(UserInfo.emplyr_sttus_code)
+            .order_by(desc("users"), UserInfo.emplyr_sttus_code)
+            .limit(2)
+            .all(db)
+        )
+
+        assert [tuple(row) for row in rows] == [("A", 3, 1), ("D", 1, 1)]
+
+
+class TestStatisticsQueryCount:
+    """서비스 통계 메서드의 쿼리 수 테스트 클래스"""
+
+    def test_user_statistics(self, db):
+        """사용자 통계: 상태/조직별 집계 한 번"""
+        count, stats = select_count(db, lambda: UserInfoService().get_user_statistics(db))
+
+        assert count == 1
+        assert stats.total_users == 5
+        assert stats.active_users == 3
+        assert stats.locked_users == 2
+        assert stats.users_by_status == {"A": 3, "D": 1, "P": 1}
+        assert stats.users_by_organization == {"ORG1": 2, "ORG2": 2}
+        assert stats.recent_registrations == 2
+
+    def test_menu_statistics(self, db):
+        """메뉴 통계: SELECT 한 번"""
+        count, stats = select_count(db, lambda: MenuInfoService().get_menu_statistics(db))
+
+        assert count == 1
+        assert stats == {
+            "total_menus": 5,
+            "active_menus": 3,
+            "inactive_menus": 2,
+            "leaf_menus": 3,
+            "max_depth": 2,
+            "avg_children_per_menu": 1.5,
+        }
+
+    def test_code_statistics(self, db):
+        """공통 코드 통계: 그룹별 집계 한 번 (그룹 지정 시에도 한 번)"""
+        count, stats = select_count(db, lambda: CmmnCodeService().get_code_statistics(db))
+
+        assert count == 1
+        assert stats == {
+            "total_codes": 4,
+            "active_codes": 3,
+            "inactive_codes": 1,
+            "codes_by_group": {"G1": 3, "G2": 1},
+            "most_used_group": "G1",
+        }
+
+        count, stats = select_count(db, lambda: CmmnCodeService().get_code_statistics(db, group_id="G1"))
+        assert count == 1
+        assert (stats["total_codes"], stats["active_codes"]) == (3, 2)
+
+    def test_group_code_statistics(self, db):
+        """공통 그룹 코드 통계: SELECT 한 번"""
+        service = CmmnGrpCodeService()
+
+        count, stats = select_count(db, lambda: service.get_group_code_statistics(db))
+        assert count == 1
+        assert stats == {
+            "total_groups": 3,
+            "active_groups": 2,
+            "inactive_groups": 1,
+            "total_codes": 4,
+            "avg_codes_per_group": 1.33,
+        }
+
+        count, stats = select_count(db, lambda: service.get_group_statistics(db))
+        assert count == 1
+        assert (stats["total_groups"], stats["active_groups"]) == (3, 2)
+        assert {item["group_id"]: item["code_count"] for item in stats["group_code_counts"]} == {
+            "G1": 2, "G2": 1, "G3": 0
+        }
+
+    def test_login_statistics(self, db):
+        """로그인 통계: watermark 조회 + 카운터 집계 한 번 + 시간대별 집계 한 번"""
+        count, stats = select_count(db, lambda: LoginLogService().get_login_statistics(db))
+
+        assert count == 3
+        assert stats["total_logins"] == 20
+        assert stats["successful_logins"] + stats["failed_logins"] == 20
+        assert stats["failed_logins"] == 5
+        assert stats["unique_ips"] == 4
+
+        count, analysis = select_count(db, lambda: LoginLogService().analyze_logs(db))
+        assert count == 2
+        assert analysis["summary"]["unique_users"] == stats["unique_users"]
+
+    def test_log_statistics(self, db):
+        """시스템 로그 통계: 카운터 집계를 한 번으로 합친 쿼리 수"""
+        count, stats = select_count(db, lambda: SysLogService().get_log_statistics(db))
+
+        # watermark + 카운터 + 시간별/메뉴별/처리구분별/상위 사용자
+        assert count == 6
+        assert stats.total_requests == 20
+        assert stats.error_rate == 15.0
+
+    def test_dashboard_summary(self, db):
+        """대시보드: 전체 사용자 수와 오늘 수치를 한 번에 집계"""
+        count, summary = select_count(db, lambda: SystemMonitoringService().get_dashboard_summary(db))
+
+        assert summary.total_users == 5
+        assert summary.total_requests_today > 0
+        # watermark(오늘/최근 7일) + 오늘 수치 + 인기 메뉴 + 최근 활동 + 시스템 알림
+        assert count == 6
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,98 @@
+"""API 사용 로그 일괄 저장기 테스트
+
+APIUsageLogWriter의 배치 저장, 샘플링, 종료 시 flush 동작을 테스트합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.api_log_writer import APIUsageLogWriter
+
+
+def _make_record(index: int, status: int = 200) -> dict:
+    """테스트용 API 로그 레코드 생성"""
+    return {
+        "log_id": f"log{index:017d}",
+        "endpoint": "/health",
+        "method": "GET",
+        "response_status": status
+    }
+
+
+class TestAPIUsageLogWriter:
+    """API 사용 로그 저장기 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.batches = []
+
+    def _make_writer(self, **kwargs) -> APIUsageLogWriter:
+        """DB 대신 배치를 기록하는 저장기 생성"""
+        writer = APIUsageLogWriter(**kwargs)
+        writer._write_batch = lambda batch: self.batches.append(list(batch))
+        return writer
+
+    def test_flush_by_batch_size(self):
+        """batch_size 도달 시 다건 단위로 저장되는지 테스트"""
+        async def scenario():
+            writer = self._make_writer(batch_size=10, flush_interval=5.0)
+            await writer.start()
+            for i in range(25):
+                await writer.enqueue(_make_record(i))
+            await asyncio.sleep(0.1)
+            await writer.stop()
+
+        asyncio.run(scenario())
+
+        # Then: 10, 10건은 크기 기준, 남은 5건은 종료 시 저장
+        assert [len(batch) for batch in self.batches] == [10, 10, 5]
+
+    def test_flush_by_interval(self):
+        """flush_interval 경과 시 batch_size 미만이어도 저장되는지 테스트"""
+        async def scenario():
+            writer = self._make_writer(batch_size=100, flush_interval=0.05)
+            await writer.start()
+            for i in range(3):
+                await writer.enqueue(_make_record(i))
+            await asyncio.sleep(0.3)
+            flushed_before_stop = sum(len(batch) for batch in self.batches)
+            await writer.stop()
+            return flushed_before_stop
+
+        assert asyncio.run(scenario()) == 3
+
+    def test_drop_when_queue_full(self):
+        """큐가 가득 차면 drop 정책에 따라 폐기되고 오류 로그는 샘플링되지 않는지 테스트"""
+        async def scenario():
+            writer = self._make_writer(
+                max_queue_size=4, batch_size=100, flush_interval=5.0,
+                high_water_ratio=0.5, sample_rate=0.0
+            )
+            await writer.start()
+            # 소비 태스크가 첫 레코드를 가져가기 전에 연속 적재
+            results = [await writer.enqueue(_make_record(i, status=500)) for i in range(6)]
+            sampled = await writer.enqueue(_make_record(99))
+            stats = writer.get_stats()
+            await writer.stop()
+            return results, sampled, stats
+
+        results, sampled, stats = asyncio.run(scenario())
+
+        assert results == [True] * 4 + [False] * 2
+        assert sampled is False
+        assert stats["dropped"] == 2
+        assert stats["sampled_out"] == 1
+        assert sum(len(batch) for batch in self.batches) == 4
+
+    def test_direct_write_when_not_started(self):
+        """저장기가 시작되지 않았으면 즉시 저장되는지 테스트"""
+        writer = self._make_writer()
+
+        assert asyncio.run(writer.enqueue(_make_record(1))) is True
+        assert len(self.batches) == 1
+        assert "frst_regist_pnttm" in self.batches[0][0]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,209 @@
+"""비동기 데이터베이스 계층 테스트
+
+BaseService 비동기 CRUD와 게시판/메뉴/인증 조회의 비동기 버전이 동기 버전과
+같은 결과를 반환하는지, 비동기 URL 변환과 풀 설정을 테스트합니다.
+aiosqlite 메모리 DB를 사용합니다.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database.database import get_async_engine_options, to_async_database_url
+from app.models.board_models import Bbs, BbsMaster
+from app.models.menu_models import MenuInfo
+from app.models.user_models import UserInfo
+from app.services.auth_service import AuthorInfoService, user_principal_cache
+from app.services.board_service import BbsMasterService, BbsService
+from app.services.menu_service import MenuInfoService
+from app.utils import menu_tree_cache as menu_tree_cache_module
+from app.utils.jwt_utils import create_access_token
+from app.utils.menu_tree_cache import MenuTreeCache
+
+
+def run(scenario):
+    """비동기 세션을 열어 시나리오를 실행합니다."""
+    async def main():
+        engine = create_async_engine(
+            "sqlite+aiosqlite://", poolclass=StaticPool
+        ).execution_options(schema_translate_map={"skybootcore": None})
+        async with engine.begin() as conn:
+            for table in (BbsMaster.__table__, Bbs.__table__, MenuInfo.__table__, UserInfo.__table__):
+                await conn.run_sync(table.create)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        try:
+            async with session_factory() as db:
+                await _seed(db)
+                return await scenario(db)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+async def _seed(db):
+    """테스트 데이터 저장"""
+    now = datetime(2025, 1, 1)
+    db.add(BbsMaster(bbs_id="notice", bbs_nm="공지", bbs_ty_code="BBST01", frst_register_id="admin"))
+    for index in range(1, 6):
+        db.add(Bbs(
+            ntt_id=Decimal(index), bbs_id="notice", ntt_sj=f"제목{index}", ntt_cn="내용",
+            ntcr_nm="홍길동" if index == 3 else "관리자", rdcnt=index, delete_at="Y" if index == 5 else "N",
+            frst_register_id="admin" if index % 2 else "user", frst_regist_pnttm=now + timedelta(days=index)
+        ))
+    db.add(MenuInfo(menu_no="1", menu_nm="루트", progrm_file_nm="dir", menu_ordr=Decimal(1), display_yn="Y"))
+    db.add(MenuInfo(menu_no="11", menu_nm="하위", progrm_file_nm="dir", upper_menu_no="1",
+                    menu_ordr=Decimal(1), display_yn="Y"))
+    db.add(UserInfo(user_id="admin", user_nm="관리자", password="x", emplyr_sttus_code="1",
+                    email_adres="admin@example.com"))
+    await db.commit()
+
+
+class TestAsyncBaseService:
+    """BaseService 비동기 CRUD 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = BbsMasterService()
+
+    def test_create_get_update_soft_delete(self):
+        """생성/조회/수정/논리 삭제 흐름 테스트"""
+        async def scenario(db):
+            created = await self.service.create_async(
+                db, {"bbs_id": "free", "bbs_nm": "자유", "bbs_ty_code": "BBST01", "frst_register_id": "admin"}
+            )
+            fetched = await self.service.get_async(db, "free")
+            updated = await self.service.update_async(db, fetched, {"bbs_nm": "자유게시판", "bbs_intrcn": None})
+            deleted = await self.service.soft_delete_async(db, "free", "manager")
+            return created, updated, deleted
+
+        created, updated, deleted = run(scenario)
+
+        assert created.frst_regist_pnttm is not None
+        assert updated.bbs_nm == "자유게시판"
+        assert deleted.delete_at == "Y"
+        assert deleted.last_updusr_id == "manager"
+
+    def test_get_multi_and_count(self):
+        """필터, 정렬, 페이지네이션과 개수 조회 테스트"""
+        service = BbsService()
+
+        async def scenario(db):
+            items = await service.get_multi_async(
+                db, skip=1, limit=2, filters={"delete_at": "N"}, order_by="ntt_id", order_desc=True
+            )
+            total = await service.count_async(db, filters={"delete_at": "N"})
+            like = await service.count_async(db, filters={"ntt_sj": "제목%"})
+            return [int(item.ntt_id) for item in items], total, like
+
+        assert run(scenario) == ([3, 2], 4, 5)
+
+
+class TestAsyncReadPaths:
+    """비동기 조회 경로 테스트 클래스"""
+
+    def test_board_reads(self):
+        """게시판 조회가 삭제 글을 제외하고 정렬되는지 테스트"""
+        service = BbsService()
+
+        async def scenario(db):
+            board = await BbsMasterService().get_by_bbs_id_async(db, "notice")
+            latest = await service.get_board_posts_async(db, "notice", limit=2)
+            views = await service.get_board_posts_async(db, "notice", order_by="views")
+            deleted = await service.get_by_ntt_id_async(db, 5)
+            return board.bbs_nm, latest, views, deleted
+
+        board_nm, latest, views, deleted = run(scenario)
+
+        assert board_nm == "공지"
+        assert [int(post.ntt_id) for post in latest] == [4, 3]
+        assert [int(post.ntt_id) for post in views] == [4, 3, 2, 1]
+        assert deleted is None
+
+    def test_search_posts_without_author(self):
+        """작성자 없이 검색어만으로도 검색하는지 테스트"""
+        service = BbsService()
+
+        async def scenario(db):
+            by_term = await service.search_posts_async(db, search_term="홍길동")
+            by_author = await service.search_posts_async(db, author="user")
+            return [int(post.ntt_id) for post in by_term], [int(post.ntt_id) for post in by_author]
+
+        assert run(scenario) == ([3], [4, 2])
+
+    def test_increase_view_count_single_update(self):
+        """조회수를 UPDATE 한 번으로 증가시키는지 테스트"""
+        service = BbsService()
+
+        async def scenario(db):
+            increased = await service.increase_view_count_async(db, 2)
+            missing = await service.increase_view_count_async(db, 5)
+            post = await service.get_by_ntt_id_async(db, 2)
+            await db.refresh(post)
+            return increased, missing, int(post.rdcnt)
+
+        assert run(scenario) == (True, False, 3)
+
+    def test_cached_menu_tree(self, monkeypatch):
+        """비동기 메뉴 트리 조회가 캐시를 채우고 재사용하는지 테스트"""
+        monkeypatch.setattr(menu_tree_cache_module, "menu_tree_cache", MenuTreeCache(ttl=60))
+        service = MenuInfoService()
+
+        async def scenario(db):
+            first = await service.get_cached_menu_tree_async(db)
+            second = await service.get_cached_menu_tree_async(db)
+            return first, second
+
+        first, second = run(scenario)
+
+        assert second is first
+        assert json.loads(first.body)[0]["children"][0]["menu_id"] == "11"
+
+    def test_current_user_from_token(self):
+        """토큰으로 활성 사용자 정보를 조회하고 캐시하는지 테스트"""
+        user_principal_cache.clear()
+        token = create_access_token({"sub": "admin", "user_id": "admin"})
+
+        async def scenario(db):
+            return await AuthorInfoService().get_current_user_from_token_async(db, token)
+
+        user_info = run(scenario)
+
+        assert user_info["email_adres"] == "admin@example.com"
+        assert user_principal_cache.get("admin") is not None
+        user_principal_cache.clear()
+
+
+class TestAsyncEngineOptions:
+    """비동기 엔진 설정 테스트 클래스"""
+
+    def test_async_url(self):
+        """드라이버를 비동기 드라이버로 바꾸고 client_encoding을 제거하는지 테스트"""
+        url = to_async_database_url("postgresql://user:pw@db:5432/core?client_encoding=utf8")
+
+        assert url == "postgresql+asyncpg://user:pw@db:5432/core"
+        assert to_async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+
+    def test_async_pool_options(self, monkeypatch):
+        """비동기 풀 크기와 문장 타임아웃 설정 테스트"""
+        monkeypatch.setenv("DB_POOL_SIZE", "8")
+        monkeypatch.setenv("DB_ASYNC_MAX_OVERFLOW", "2")
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "3000")
+        monkeypatch.delenv("DB_ASYNC_POOL_SIZE", raising=False)
+
+        options = get_async_engine_options("postgresql+asyncpg://localhost/db")
+
+        assert "poolclass" not in options
+        assert options["pool_size"] == 8
+        assert options["max_overflow"] == 2
+        assert options["connect_args"] == {"server_settings": {"statement_timeout": "3000"}}
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
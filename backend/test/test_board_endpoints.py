@@ -62,7 +62,9 @@ class TestBoardMasterEndpoints:
                 "bbs_ty_code": "NOTICE",
                 "use_at": "Y",
                 "creat_dt": datetime.now(),
-                "updt_dt": datetime.now()
+                "updt_dt": datetime.now(),
+                "frst_register_id": "admin",
+                "frst_regist_pnttm": datetime.now()
             }
         ]
     
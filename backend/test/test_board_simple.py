@@ -24,8 +24,11 @@ class TestBoardSimple:
                 "bbs_id": "notice",
                 "bbs_nm": "공지사항",
                 "bbs_dc": "공지사항 게시판",
+                "bbs_ty_code": "NOTICE",
                 "use_at": "Y",
-                "creat_dt": "2024-01-01T00:00:00"
+                "creat_dt": "2024-01-01T00:00:00",
+                "frst_register_id": "admin",
+                "frst_regist_pnttm": "2024-01-01T00:00:00"
             }
         ]
     
@@ -0,0 +1,230 @@
+"""키셋(커서) 페이지네이션 테스트
+
+커서 인코딩, BaseService.get_page_after의 정렬 키 동률/NULL/복합 기본 키 처리,
+오프셋 페이지에서 커서 페이지로 이어지는지와 목록 엔드포인트의 커서 응답을 테스트합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes.zip_router import router as zip_router
+from app.database import get_db
+from app.models.board_models import Bbs
+from app.models.log_models import LoginLog
+from app.models.zip_models import Zip
+from app.schemas.log_schemas import LoginLogSearchParams
+from app.services.board_service import BbsService
+from app.services.log_service import LoginLogService
+from app.services.user_service import ZipService
+from app.utils.auth import get_current_user_from_bearer
+from app.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from app.utils.page_total import page_count_cache
+
+BASE_TIME = datetime(2025, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture
+def db():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    page_count_cache.clear()
+    for table in (LoginLog.__table__, Zip.__table__):
+        table.create(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append((args[2], args[3])))
+
+    session = sessionmaker(bind=engine)()
+    # 같은 시각(동률) 로그와 시각이 없는(NULL) 로그를 섞어 저장
+    for index in range(1, 13):
+        session.add(LoginLog(
+            log_id=f"L{index:03d}", conect_id="admin" if index % 2 else "user",
+            error_occrrnc_at="N", frst_regist_pnttm=BASE_TIME + timedelta(minutes=index // 3),
+            last_updt_pnttm=BASE_TIME + timedelta(minutes=index // 3)
+        ))
+    for zip_code in ("06000", "06100"):
+        for sn in range(1, 4):
+            session.add(Zip(zip=zip_code, sn=Decimal(sn), ctprvn_nm="서울특별시"))
+    session.commit()
+    # None을 넣으면 컬럼 기본값이 적용되므로 UPDATE로 NULL 설정
+    # (frst_regist_pnttm은 파티션 키라 NULL일 수 없으므로 수정 시각으로 NULL 정렬을 확인)
+    session.execute(update(LoginLog).where(LoginLog.log_id.in_(["L005", "L010"])).values(last_updt_pnttm=None))
+    session.commit()
+
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def walk(fetch, limit):
+    """next_cursor를 따라 모든 페이지를 조회합니다."""
+    items, cursor, pages = [], None, 0
+    while True:
+        page, cursor = fetch(cursor, limit)
+        items.extend(page)
+        pages += 1
+        if cursor is None:
+            return items, pages
+
+
+class TestCursorEncoding:
+    """커서 인코딩 테스트 클래스"""
+
+    def test_round_trip_preserves_types(self):
+        """datetime/Decimal/None 값을 그대로 복원하는지 테스트"""
+        values = [BASE_TIME, Decimal("10.50"), None, "L001"]
+        cursor = encode_cursor(values, "tb:col:desc")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, "tb:col:desc", 4) == values
+
+    def test_rejects_tampered_or_mismatched_cursor(self):
+        """형식이 잘못되었거나 정렬 조건이 다른 커서를 거부하는지 테스트"""
+        cursor = encode_cursor(["L001"], "tb::asc")
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor!", "tb::asc", 1)
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "tb::desc", 1)
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "tb::asc", 2)
+
+
+class TestGetPageAfter:
+    """BaseService.get_page_after 테스트 클래스"""
+
+    def test_walk_matches_full_order_with_ties_and_nulls(self, db):
+        """동률과 NULL이 있는 정렬 컬럼도 중복/누락 없이 순회하는지 테스트"""
+        service = LoginLogService()
+
+        def fetch(cursor, limit):
+            return service.get_page_after(db, cursor=cursor, limit=limit, order_by="last_updt_pnttm", order_desc=True)
+
+        full, _ = service.get_page_after(db, limit=100, order_by="last_updt_pnttm", order_desc=True)
+        walked, pages = walk(fetch, 5)
+
+        assert [log.log_id for log in walked] == [log.log_id for log in full]
+        assert len(walked) == 12 and pages == 3
+        # 최신순, 같은 시각은 기본 키 역순, NULL은 마지막
+        assert full[0].log_id == "L012"
+        assert [log.log_id for log in full[-2:]] == ["L010", "L005"]
+
+    def test_cursor_query_has_no_offset(self, db):
+        """커서 조회는 OFFSET 없이 limit + 1개만 조회하는지 테스트"""
+        service = LoginLogService()
+        _, cursor = service.get_page_after(db, limit=4, order_by="frst_regist_pnttm")
+        db.statements.clear()
+
+        service.get_page_after(db, cursor=cursor, limit=4, order_by="frst_regist_pnttm")
+
+        statement, parameters = db.statements[-1]
+        # SQLite는 항상 LIMIT ? OFFSET ?를 렌더링하므로 OFFSET 값이 0인지 확인
+        assert "(main.tb_loginlog.frst_regist_pnttm, main.tb_loginlog.log_id) >" in statement
+        assert parameters[-2:] == (5, 0)
+
+    def test_offset_page_continues_with_cursor(self, db):
+        """skip으로 조회한 페이지의 next_cursor로 이어서 조회하는지 테스트"""
+        service = LoginLogService()
+        params = LoginLogSearchParams(login_id="admin")
+
+        first, cursor = service.search_logs_page(db, params, skip=2, limit=2)
+        rest, last_cursor = service.search_logs_page(db, params, cursor=cursor, limit=10)
+        full, _ = service.search_logs_page(db, params, limit=10)
+
+        assert [log.log_id for log in first + rest] == [log.log_id for log in full[2:]]
+        assert all(log.conect_id == "admin" for log in rest)
+        assert last_cursor is None
+
+    def test_composite_primary_key(self, db):
+        """복합 기본 키(우편번호, 일련번호) 순으로 순회하는지 테스트"""
+        service = ZipService()
+
+        walked, _ = walk(lambda cursor, limit: service.get_page_after(db, cursor=cursor, limit=limit), 4)
+
+        assert [(item.zip, int(item.sn)) for item in walked] == [
+            ("06000", 1), ("06000", 2), ("06000", 3), ("06100", 1), ("06100", 2), ("06100", 3)
+        ]
+
+    def test_cursor_from_other_order_is_rejected(self, db):
+        """다른 정렬 조건의 커서를 거부하는지 테스트"""
+        service = LoginLogService()
+        _, cursor = service.get_page_after(db, limit=2, order_by="frst_regist_pnttm", order_desc=True)
+
+        with pytest.raises(InvalidCursorError):
+            service.get_page_after(db, cursor=cursor, limit=2, order_by="frst_regist_pnttm")
+        with pytest.raises(ValueError):
+            service.get_page_after(db, limit=2, order_by="no_such_column")
+
+
+class TestAsyncPostPage:
+    """게시글 비동기 커서 조회 테스트 클래스"""
+
+    def test_search_posts_page_async(self):
+        """게시판/삭제 조건을 유지하며 최신순으로 순회하는지 테스트"""
+        async def main():
+            engine = create_async_engine(
+                "sqlite+aiosqlite://", poolclass=StaticPool
+            ).execution_options(schema_translate_map={"skybootcore": None})
+            async with engine.begin() as conn:
+                await conn.run_sync(Bbs.__table__.create)
+            try:
+                async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                    for index in range(1, 8):
+                        session.add(Bbs(
+                            ntt_id=Decimal(index), bbs_id="notice" if index != 4 else "free",
+                            ntt_sj=f"제목{index}", delete_at="Y" if index == 6 else "N", frst_register_id="admin",
+                            frst_regist_pnttm=BASE_TIME + timedelta(days=index)
+                        ))
+                    await session.commit()
+
+                    service = BbsService()
+                    first, cursor = await service.search_posts_page_async(session, bbs_id="notice", limit=2)
+                    rest, last = await service.search_posts_page_async(session, bbs_id="notice", cursor=cursor, limit=10)
+                    return first + rest, last
+            finally:
+                await engine.dispose()
+
+        posts, last = asyncio.run(main())
+
+        assert [int(post.ntt_id) for post in posts] == [7, 5, 3, 2, 1]
+        assert last is None
+
+
+class TestZipListEndpoint:
+    """우편번호 목록 엔드포인트 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        app = FastAPI()
+        app.include_router(zip_router)
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        self.app = app
+
+    def test_cursor_pages(self, db):
+        """next_cursor로 다음 페이지를 조회하고 잘못된 커서는 400을 반환하는지 테스트"""
+        self.app.dependency_overrides[get_db] = lambda: db
+        client = TestClient(self.app)
+
+        first = client.get("/zip-codes/", params={"limit": 4}).json()
+        second = client.get("/zip-codes/", params={"limit": 4, "cursor": first["next_cursor"]}).json()
+        invalid = client.get("/zip-codes/", params={"cursor": "broken"})
+
+        assert first["page"] == 1 and first["total"] == 6 and first["cursor"] is None
+        assert [(item["zip"], float(item["sn"])) for item in second["items"]] == [("06100", 2), ("06100", 3)]
+        assert second["page"] is None and second["next_cursor"] is None
+        assert invalid.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,259 @@
+"""동기 DB 작업 오프로딩과 이벤트 루프 지연 모니터 테스트
+
+스레드 풀 크기 제한, 예외/contextvars 전달, 서비스 프록시 동작과
+루프를 막은 엔드포인트 집계, 시스템 상태 응답의 지표 포함 여부를 테스트합니다.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes.log_router import log_router
+from app.api.routes.system_router import router as system_router
+from app.database import get_db
+from app.middleware.loop_lag_middleware import LoopLagMiddleware
+from app.schemas.system_schemas import SystemHealthCheck
+from app.utils.page_total import PageTotal
+from app.utils import db_offload as db_offload_module
+from app.utils import loop_monitor as loop_monitor_module
+from app.utils import system_snapshot as system_snapshot_module
+from app.utils.auth import get_current_user_from_bearer
+from app.utils.db_offload import DBOffloader, OffloadedService, _create_offloader_from_env
+from app.utils.loop_monitor import LoopLagMonitor
+from app.utils.system_snapshot import SystemSnapshotEngine
+
+request_user = contextvars.ContextVar("request_user", default=None)
+
+
+class SampleService:
+    """프록시 테스트용 서비스"""
+
+    def __init__(self):
+        self.threads = []
+
+    def get(self, value):
+        self.threads.append(threading.current_thread().name)
+        return value * 2
+
+    def whoami(self):
+        return request_user.get()
+
+    def fail(self):
+        raise ValueError("조회 실패")
+
+    async def get_async(self, value):
+        return value
+
+    def _helper(self):
+        return "private"
+
+
+class TestDBOffloader:
+    """스레드 풀 오프로딩 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.offloader = DBOffloader(max_workers=2)
+
+    def teardown_method(self):
+        """테스트 메서드 실행 후 정리"""
+        self.offloader.shutdown()
+
+    def test_runs_in_worker_thread_with_context(self):
+        """동기 메서드를 전용 스레드에서 호출한 쪽의 contextvars로 실행하는지 테스트"""
+        service = SampleService()
+        proxy = OffloadedService(service, self.offloader)
+
+        async def scenario():
+            request_user.set("admin")
+            return await proxy.get(21), await proxy.whoami()
+
+        assert asyncio.run(scenario()) == (42, "admin")
+        assert service.threads[0].startswith("db-offload")
+        assert self.offloader.get_stats()["calls"] == 2
+
+    def test_passes_through_async_and_private(self):
+        """비동기 메서드와 비공개 속성은 감싸지 않는지 테스트"""
+        service = SampleService()
+        proxy = OffloadedService(service, self.offloader)
+
+        assert proxy.get_async == service.get_async
+        assert proxy._helper() == "private"
+        assert asyncio.run(proxy.get_async(3)) == 3
+
+    def test_propagates_exceptions(self):
+        """예외를 그대로 전파하고 오류 수를 기록하는지 테스트"""
+        proxy = OffloadedService(SampleService(), self.offloader)
+
+        with pytest.raises(ValueError, match="조회 실패"):
+            asyncio.run(proxy.fail())
+        assert self.offloader.get_stats()["errors"] == 1
+
+    def test_bounded_concurrency(self):
+        """동시 실행 수가 max_workers를 넘지 않고 나머지는 대기하는지 테스트"""
+        async def scenario():
+            await asyncio.gather(*(self.offloader.run(time.sleep, 0.05) for _ in range(6)))
+
+        asyncio.run(scenario())
+        stats = self.offloader.get_stats()
+
+        assert stats["max_active"] == 2
+        assert stats["active"] == 0
+        assert stats["queue_wait_seconds"]["count"] == 6
+        assert stats["queue_wait_seconds"]["max"] >= 0.09
+
+    def test_thread_count_from_env(self, monkeypatch):
+        """스레드 수 기본값이 동기 풀 최대 연결 수인지 테스트"""
+        monkeypatch.setenv("DB_POOL_SIZE", "4")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "6")
+        monkeypatch.delenv("DB_OFFLOAD_THREADS", raising=False)
+        assert _create_offloader_from_env().max_workers == 10
+
+        monkeypatch.setenv("DB_OFFLOAD_THREADS", "0")
+        with pytest.raises(ValueError):
+            _create_offloader_from_env()
+
+
+class TestLoopLagMonitor:
+    """이벤트 루프 지연 모니터 테스트 클래스"""
+
+    def test_record_attributes_inflight_and_recent(self):
+        """지연 구간에 처리 중이거나 끝난 요청에만 지연을 기록하는지 테스트"""
+        monitor = LoopLagMonitor(interval=0.05, threshold=0.1)
+        route = Mock(path="/items/{item_id}")
+        inflight = monitor.request_started({"method": "GET", "path": "/items/1", "route": route})
+        finished = monitor.request_started({"method": "POST", "path": "/items"})
+        old = monitor.request_started({"method": "DELETE", "path": "/items/2"})
+        monitor.request_finished(finished, finished_at=10.0)
+        monitor.request_finished(old, finished_at=5.0)
+
+        monitor.record(0.05, since=9.5)
+        monitor.record(0.3, since=9.5)
+        stats = monitor.get_stats()
+
+        assert stats["blocked_count"] == 1
+        assert stats["lag_seconds"]["count"] == 2
+        assert {item["endpoint"] for item in stats["worst_endpoints"]} == {"GET /items/{item_id}", "POST /items"}
+        assert stats["inflight_requests"] == 1
+        monitor.request_finished(inflight, finished_at=11.0)
+
+    def test_blocking_endpoint_is_reported(self):
+        """루프를 막은 엔드포인트가 상위에 집계되는지 테스트"""
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+
+        @asynccontextmanager
+        async def lifespan(app):
+            await monitor.start()
+            yield
+            await monitor.stop()
+
+        app = FastAPI(lifespan=lifespan)
+        app.add_middleware(LoopLagMiddleware, monitor=monitor)
+
+        @app.get("/block/{seconds}")
+        async def block(seconds: float):
+            time.sleep(seconds)
+            return {}
+
+        @app.get("/fast")
+        async def fast():
+            return {}
+
+        with TestClient(app) as client:
+            client.get("/fast")
+            client.get("/block/0.2")
+            time.sleep(0.1)
+            stats = monitor.get_stats()
+
+        assert stats["running"] is True
+        assert stats["worst_endpoints"][0]["endpoint"] == "GET /block/{seconds}"
+        assert stats["worst_endpoints"][0]["max_seconds"] >= 0.15
+        assert "GET /fast" not in {item["endpoint"] for item in stats["worst_endpoints"]}
+
+
+class TestSystemHealthEndpoint:
+    """시스템 상태 엔드포인트 테스트 클래스"""
+
+    def test_health_includes_loop_and_offload_stats(self, monkeypatch):
+        """상태 스냅샷에 요청 시점의 루프/스레드 풀 지표를 더해 반환하는지 테스트"""
+        offloader = DBOffloader(max_workers=1)
+        monkeypatch.setattr(db_offload_module, "db_offloader", offloader)
+        monkeypatch.setattr(loop_monitor_module, "loop_lag_monitor", LoopLagMonitor())
+        monkeypatch.setattr(
+            system_snapshot_module, "system_snapshot_engine", SystemSnapshotEngine(session_factory=Mock)
+        )
+        threads = []
+
+        def fake_health(db, cpu_usage=None, memory_usage=None):
+            threads.append(threading.current_thread().name)
+            return SystemHealthCheck(
+                database_status="정상", api_status="정상", log_count_today=0, error_count_today=0,
+                active_users_today=0, system_uptime="1일", memory_usage=10.0, cpu_usage=5.0
+            )
+
+        app = FastAPI()
+        app.include_router(system_router)
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+
+        with patch("app.utils.system_snapshot.SystemMonitoringService") as service_class:
+            service_class.return_value.get_system_health_check.side_effect = fake_health
+            client = TestClient(app)
+            response = client.get("/system/health")
+            second = client.get("/system/health")
+        offloader.shutdown()
+
+        assert response.status_code == 200
+        body = response.json()
+        assert threads[0] != threading.current_thread().name
+        assert body["db_offload"]["calls"] == 0
+        assert body["event_loop"]["worst_endpoints"] == []
+        assert body["snapshot_at"] and body["snapshot_age"] >= 0
+        # 두 번째 요청은 스냅샷을 다시 계산하지 않음
+        assert len(threads) == 1
+        assert second.json()["snapshot_at"] == body["snapshot_at"]
+        assert "age" in second.headers
+
+
+class TestOffloadedRouters:
+    """라우터 서비스 호출 오프로딩 테스트 클래스"""
+
+    def test_login_log_list_runs_in_offload_pool(self, monkeypatch):
+        """로그인 로그 목록 조회/개수 계산이 이벤트 루프가 아닌 스레드 풀에서 실행되는지 테스트"""
+        offloader = DBOffloader(max_workers=1)
+        monkeypatch.setattr(db_offload_module, "db_offloader", offloader)
+        threads = []
+
+        def search_logs_page(**kwargs):
+            threads.append(threading.current_thread().name)
+            return [], None
+
+        def count_logs(**kwargs):
+            threads.append(threading.current_thread().name)
+            return PageTotal(0, "exact")
+
+        app = FastAPI()
+        app.include_router(log_router)
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        app.dependency_overrides[get_db] = lambda: Mock()
+
+        with patch("app.api.routes.log_router.LoginLogService") as service_class:
+            service_class.return_value.search_logs_page.side_effect = search_logs_page
+            service_class.return_value.count_logs.side_effect = count_logs
+            response = TestClient(app).get("/logs/")
+        offloader.shutdown()
+
+        assert response.status_code == 200
+        assert len(threads) == 2
+        assert all(name.startswith("db-offload") for name in threads)
+        assert offloader.get_stats()["calls"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,170 @@
+"""파일 통계 조회 및 캐시 테스트
+
+파일 통계와 유형별 통계를 확장자별 집계와 일자별 업로드 추세, 두 번의 그룹
+쿼리로 계산하는지, 업로드가 없는 날을 0건으로 채우는지, 결과를 캐시하고
+파일 업로드/삭제 시 무효화하는지 테스트합니다.
+"""
+
+import io
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.file_models import File, FileDetail
+from app.services.file_service import FileDetailService, FileService
+from app.utils.file_analytics import FileAnalytics, get_file_analytics, query_upload_trend
+
+
+@pytest.fixture
+def db():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB (실행된 SQL을 db.statements에 기록)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    File.__table__.create(engine)
+    FileDetail.__table__.create(engine)
+
+    now = datetime.now()
+    session = sessionmaker(bind=engine)()
+    session.add(File(atch_file_id="F1", creat_dt=now, frst_register_id="user0"))
+    for index, (ext, size, deleted, days_ago) in enumerate([
+        (".png", 100, "N", 0), (".jpg", 200, "N", 1), (".pdf", 300, "N", 1),
+        (".zip", 400, "Y", 2), (".exe", 500, "N", 10), (".png", 50, "N", 40),
+    ]):
+        session.add(FileDetail(
+            atch_file_id="F1", file_sn=Decimal(index + 1), file_stre_cours="/tmp/none", stre_file_nm=f"f{index}",
+            file_extsn=ext, file_size=Decimal(size), file_delete_yn=deleted,
+            frst_regist_pnttm=now - timedelta(days=days_ago)
+        ))
+    session.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session.statements = statements
+    get_file_analytics().invalidate()
+    yield session
+    session.close()
+    engine.dispose()
+    get_file_analytics().invalidate()
+
+
+def select_count(db, call):
+    """call 실행 중 실행된 SELECT 문 수와 결과"""
+    db.statements.clear()
+    result = call()
+    return sum(1 for statement in db.statements if statement.lstrip().upper().startswith("SELECT")), result
+
+
+class TestFileAnalytics:
+    """파일 통계 조회기 테스트 클래스"""
+
+    def test_summary_from_two_grouped_queries(self, db):
+        """전체/확장자별 통계와 업로드 추세를 그룹 쿼리 두 번으로 계산하는지 테스트"""
+        count, stats = select_count(db, lambda: FileAnalytics().get_summary(db))
+
+        assert count == 2
+        assert stats["total_files"] == 5
+        assert stats["total_size"] == Decimal(1150)
+        assert stats["avg_file_size"] == Decimal(230)
+        assert stats["file_types"][".png"] == {"count": 2, "total_size": 150}
+        assert ".zip" not in stats["file_types"]
+        assert [day["count"] for day in stats["upload_trend"]] == [1, 2, 0, 0, 0, 0, 0]
+        assert stats["upload_trend"][0]["date"] == date.today().isoformat()
+
+    def test_trend_fills_missing_days(self, db):
+        """조회 일수만큼 빈 날 없이 최근 일자부터 반환하는지 테스트"""
+        trend = FileAnalytics().upload_trend(db, days=90)
+
+        assert len(trend) == 90
+        assert trend[-1]["date"] == (date.today() - timedelta(days=89)).isoformat()
+        assert sum(day["count"] for day in trend) == 5
+        assert trend[10]["count"] == 1 and trend[40]["count"] == 1
+
+    def test_postgresql_uses_generate_series(self):
+        """PostgreSQL에서는 generate_series와 LEFT JOIN으로 빈 날을 채우는지 테스트"""
+        db = Mock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        db.execute.return_value.all.return_value = []
+
+        query_upload_trend(db, 30, date(2026, 1, 31))
+
+        sql = str(db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "generate_series" in sql
+        assert "LEFT OUTER JOIN" in sql
+        assert "GROUP BY" in sql
+
+    def test_results_are_cached(self, db):
+        """두 번째 조회와 유형별 통계는 쿼리 없이 캐시에서 반환하는지 테스트"""
+        analytics = FileAnalytics()
+        analytics.get_summary(db)
+
+        count, _ = select_count(db, lambda: analytics.get_summary(db))
+        assert count == 0
+
+        count, by_type = select_count(db, lambda: analytics.get_type_summary(db, FileDetailService().allowed_extensions))
+        assert count == 0
+        assert by_type["image"] == {"count": 3, "total_size_bytes": 350, "total_size_mb": 0.0}
+        assert by_type["document"]["count"] == 1
+        assert by_type["archive"]["count"] == 0
+
+        # 다른 추세 일수는 추세만 다시 조회
+        count, _ = select_count(db, lambda: analytics.get_summary(db, days=30))
+        assert count == 1
+
+    def test_result_loaded_before_invalidate_is_not_cached(self, db):
+        """조회 도중 무효화되면 그 결과를 캐시에 남기지 않는지 테스트"""
+        analytics = FileAnalytics()
+
+        def load():
+            analytics.invalidate()
+            return {"stale": True}
+
+        analytics._cached("extensions", load)
+
+        assert analytics.extension_stats(db) != {"stale": True}
+
+    def test_cache_disabled(self, db):
+        """ttl=0이면 매번 조회하는지 테스트"""
+        analytics = FileAnalytics(ttl=0)
+        analytics.get_summary(db)
+
+        count, _ = select_count(db, lambda: analytics.get_summary(db))
+        assert count == 2
+
+
+class TestFileStatisticsInvalidation:
+    """파일 업로드/삭제 시 통계 캐시 무효화 테스트 클래스"""
+
+    def test_delete_invalidates(self, db):
+        """파일 삭제 후 통계가 바로 반영되는지 테스트"""
+        assert FileService().get_file_statistics(db)["total_files"] == 5
+
+        FileDetailService().delete_file(db, "F1", 1, delete_physical=False)
+
+        stats = FileService().get_file_statistics(db)
+        assert stats["total_files"] == 4
+        assert stats["upload_trend"][0]["count"] == 0
+        assert FileDetailService().get_file_statistics_by_type(db)["image"]["count"] == 2
+
+    def test_upload_invalidates(self, db, tmp_path):
+        """파일 업로드 후 통계가 바로 반영되는지 테스트"""
+        service = FileDetailService()
+        service.upload_path = str(tmp_path)
+        assert service.get_file_statistics_by_type(db)["document"]["count"] == 1
+
+        service.upload_file(db, "F1", io.BytesIO(b"hello"), "memo.txt", user_id="user0")
+
+        assert service.get_file_statistics_by_type(db)["document"]["count"] == 2
+        stats = FileService().get_file_statistics(db)
+        assert stats["file_types"][".txt"] == {"count": 1, "total_size": 5}
+        assert stats["upload_trend"][0]["count"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
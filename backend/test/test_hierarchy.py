@@ -0,0 +1,208 @@
+"""계층 구조 조회 테스트
+
+WITH RECURSIVE 기반 HierarchyQuery와 메모리 AdjacencyMap이 같은 결과를
+쿼리 한 번으로 반환하는지, 메뉴/조직 서비스가 이를 사용하는지 테스트합니다.
+"""
+
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.menu_models import MenuInfo
+from app.models.org_models import Org
+from app.schemas.user_schemas import OrgUpdate
+from app.services.menu_service import MenuInfoService
+from app.services.user_service import OrgService
+from app.utils import menu_tree_cache as menu_tree_cache_module
+from app.utils.hierarchy import AdjacencyMap, HierarchyQuery
+from app.utils.menu_tree_cache import MenuTreeCache
+
+MENU_ROWS = [
+    ("1", None), ("2", None), ("11", "1"), ("12", "1"),
+    ("111", "11"), ("1111", "111"), ("21", "2"),
+]
+
+
+@pytest.fixture
+def db():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션"""
+    engine = create_engine("sqlite://").execution_options(schema_translate_map={"skybootcore": None})
+    MenuInfo.__table__.create(engine)
+    Org.__table__.create(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    session = sessionmaker(bind=engine)()
+    for index, (menu_no, upper_menu_no) in enumerate(MENU_ROWS):
+        session.add(MenuInfo(
+            menu_no=menu_no, menu_nm=f"메뉴{menu_no}", progrm_file_nm="dir",
+            upper_menu_no=upper_menu_no, menu_ordr=Decimal(index + 1), display_yn="Y"
+        ))
+    for org_no, parent_org_no in [(1, None), (2, 1), (3, 2), (4, 1)]:
+        session.add(Org(org_no=Decimal(org_no), parent_org_no=parent_org_no and Decimal(parent_org_no), org_nm=f"조직{org_no}"))
+    session.commit()
+    statements.clear()
+
+    session.statements = statements
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """테스트 전용 메뉴 트리 캐시"""
+    cache = MenuTreeCache(ttl=60)
+    monkeypatch.setattr(menu_tree_cache_module, "menu_tree_cache", cache)
+    return cache
+
+
+class TestHierarchyQuery:
+    """WITH RECURSIVE 계층 조회 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.hierarchy = HierarchyQuery(MenuInfo, "menu_no", "upper_menu_no")
+
+    def test_ancestors_in_single_query(self, db):
+        """상위 경로를 쿼리 한 번으로 조회하는지 테스트"""
+        path = self.hierarchy.get_ancestors(db, "1111")
+
+        assert [menu.menu_no for menu in path] == ["1", "11", "111", "1111"]
+        assert len(db.statements) == 1
+        assert "RECURSIVE" in db.statements[0].upper()
+
+    def test_missing_node(self, db):
+        """없는 노드는 빈 경로와 깊이 0을 반환하는지 테스트"""
+        assert self.hierarchy.get_ancestors(db, "999") == []
+        assert self.hierarchy.get_max_depth(db, "999") == 0
+        assert not self.hierarchy.is_descendant(db, "1", "999")
+
+    def test_is_descendant(self, db):
+        """하위 여부 판단 테스트"""
+        assert self.hierarchy.is_descendant(db, "1", "1111")
+        assert self.hierarchy.is_descendant(db, "11", "111")
+        assert not self.hierarchy.is_descendant(db, "1111", "1")
+        assert not self.hierarchy.is_descendant(db, "2", "1111")
+        assert not self.hierarchy.is_descendant(db, "1", "1")
+
+    def test_subtree_and_max_depth(self, db):
+        """하위 트리와 최대 깊이 테스트"""
+        subtree = self.hierarchy.get_subtree(db, "1")
+
+        assert sorted((menu.menu_no, depth) for menu, depth in subtree) == [
+            ("1", 0), ("11", 1), ("111", 2), ("1111", 3), ("12", 1)
+        ]
+        assert self.hierarchy.get_max_depth(db, "1") == 3
+        assert self.hierarchy.get_max_depth(db, "1111") == 0
+
+    def test_cycle_terminates(self, db):
+        """순환 참조 데이터에서도 종료되는지 테스트"""
+        db.query(MenuInfo).filter(MenuInfo.menu_no == "1").update({"upper_menu_no": "111"})
+        db.commit()
+
+        path = self.hierarchy.get_ancestors(db, "111")
+
+        assert sorted(menu.menu_no for menu in path) == ["1", "11", "111"]
+        assert self.hierarchy.is_descendant(db, "111", "1")
+        assert self.hierarchy.get_max_depth(db, "1") == self.hierarchy.max_levels
+
+
+class TestAdjacencyMap:
+    """메모리 인접 맵 테스트 클래스"""
+
+    def test_matches_recursive_query(self, db):
+        """인접 맵이 WITH RECURSIVE 조회와 같은 결과를 내는지 테스트"""
+        hierarchy = HierarchyQuery(MenuInfo, "menu_no", "upper_menu_no")
+        adjacency = hierarchy.load_adjacency(db)
+
+        for menu_no, _ in MENU_ROWS:
+            assert adjacency.get_ancestor_ids(menu_no) == [m.menu_no for m in hierarchy.get_ancestors(db, menu_no)]
+            assert adjacency.get_max_depth(menu_no) == hierarchy.get_max_depth(db, menu_no)
+            for other, _ in MENU_ROWS:
+                assert adjacency.is_descendant(menu_no, other) == hierarchy.is_descendant(db, menu_no, other)
+
+    def test_cycle_terminates(self):
+        """순환 참조 맵에서도 종료되는지 테스트"""
+        adjacency = AdjacencyMap({"a": "c", "b": "a", "c": "b"})
+
+        assert adjacency.get_ancestor_ids("a") == ["b", "c", "a"]
+        assert adjacency.get_max_depth("a") == 2
+
+
+class TestMenuServiceHierarchy:
+    """메뉴 서비스 계층 검증 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = MenuInfoService()
+
+    def test_breadcrumb_single_query(self, db, cache):
+        """breadcrumb가 쿼리 한 번으로 조회되는지 테스트"""
+        breadcrumb = self.service.get_menu_breadcrumb(db, "1111")
+
+        assert [menu.menu_no for menu in breadcrumb] == ["1", "11", "111", "1111"]
+        assert len(db.statements) == 1
+
+    def test_move_validation_single_query(self, db, cache):
+        """하위 메뉴 확인이 쿼리 한 번으로 처리되는지 테스트"""
+        assert self.service._is_descendant(db, "1", "1111")
+        assert len(db.statements) == 1
+        assert self.service._get_max_child_depth(db, "1") == 3
+
+        with pytest.raises(ValueError):
+            self.service.move_menu(db, "1", "1111")
+
+    def test_move_validation_ignores_stale_cache(self, db, cache):
+        """다른 워커가 변경해 캐시가 오래되어도 이동 검증은 DB 기준인지 테스트"""
+        self.service.get_cached_menu_tree(db)
+        # 이 워커의 캐시를 무효화하지 않고 "2"를 "1111" 아래로 이동
+        db.query(MenuInfo).filter(MenuInfo.menu_no == "2").update({"upper_menu_no": "1111"})
+        db.commit()
+
+        assert self.service._is_descendant(db, "1", "21")
+        assert self.service._get_max_child_depth(db, "1") == 5
+        assert self.service._get_menu_depth(db, "21") == 5
+        with pytest.raises(ValueError):
+            self.service.move_menu(db, "1", "21")
+
+    def test_copy_depth_limit(self, db, cache):
+        """복사 깊이 제한이 상위/하위 깊이를 반영하는지 테스트"""
+        for level in range(4):
+            parent = "1111" if level == 0 else f"deep{level - 1}"
+            db.add(MenuInfo(menu_no=f"deep{level}", menu_nm="deep", progrm_file_nm="dir",
+                            upper_menu_no=parent, menu_ordr=Decimal(1), display_yn="Y"))
+        db.commit()
+
+        # 부모 깊이 7 + 복사 메뉴 1 + 하위 깊이 3 = 11레벨
+        with pytest.raises(ValueError):
+            self.service.copy_menu(db, "1", "copy1", new_parent_id="deep3", copy_children=True)
+
+        copied = self.service.copy_menu(db, "12", "copy12", new_parent_id="deep3")
+        assert copied.upper_menu_no == "deep3"
+
+
+class TestOrgServiceHierarchy:
+    """조직 서비스 계층 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = OrgService()
+
+    def test_organization_path_single_query(self, db):
+        """조직 경로가 쿼리 한 번으로 조회되는지 테스트"""
+        path = self.service.get_organization_path(db, Decimal(3))
+
+        assert [int(org.org_no) for org in path] == [1, 2, 3]
+        assert len(db.statements) == 1
+
+    def test_cannot_move_under_descendant(self, db):
+        """하위 조직을 상위 조직으로 설정할 수 없는지 테스트"""
+        with pytest.raises(HTTPException):
+            self.service.update(db, Decimal(1), OrgUpdate(parent_org_no=Decimal(3)))
+
+        org = self.service.update(db, Decimal(4), OrgUpdate(parent_org_no=Decimal(3)))
+        assert int(org.parent_org_no) == 3
@@ -0,0 +1,198 @@
+"""IP 접근 규칙 테스트
+
+정렬된 정수 구간 테이블로 컴파일된 화이트리스트/블랙리스트가
+기존 규칙과 같은 판정을 내리고, 규칙 파일 변경 시 재시작 없이 교체되는지 테스트합니다.
+"""
+
+import asyncio
+import ipaddress
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes.system_router import router as system_router
+from app.middleware import ip_filter as ip_filter_module
+from app.middleware.ip_filter import IPAccessRules, IPRangeSet, parse_rules_file
+from app.utils.auth import get_current_user_from_bearer
+from app.middleware.security import SecurityMiddleware
+
+
+class TestIPRangeSet:
+    """IP 구간 집합 테스트 클래스"""
+
+    def test_contains_cidr_boundaries(self):
+        """CIDR 시작/끝 주소와 바깥 주소 판정 테스트"""
+        ranges = IPRangeSet(["10.0.0.0/24", "192.168.1.7"])
+
+        assert ranges.contains(ipaddress.ip_address("10.0.0.0"))
+        assert ranges.contains(ipaddress.ip_address("10.0.0.255"))
+        assert not ranges.contains(ipaddress.ip_address("10.0.1.0"))
+        assert ranges.contains(ipaddress.ip_address("192.168.1.7"))
+        assert not ranges.contains(ipaddress.ip_address("192.168.1.8"))
+        assert not ranges.contains(ipaddress.ip_address("9.255.255.255"))
+
+    def test_overlapping_and_adjacent_ranges_are_merged(self):
+        """겹치거나 인접한 구간이 하나로 병합되는지 테스트"""
+        ranges = IPRangeSet(["10.0.0.0/25", "10.0.0.128/25", "10.0.0.5", "10.0.0.0/16"])
+
+        assert len(ranges) == 1
+
+    def test_ipv4_and_ipv6_are_separated(self):
+        """IPv4 규칙이 IPv6 주소에 적용되지 않는지 테스트"""
+        ranges = IPRangeSet(["0.0.0.0/0", "2001:db8::/32"])
+
+        assert ranges.contains(ipaddress.ip_address("203.0.113.1"))
+        assert ranges.contains(ipaddress.ip_address("2001:db8::1"))
+        assert not ranges.contains(ipaddress.ip_address("2001:db9::1"))
+
+    def test_invalid_rule_is_skipped(self):
+        """잘못된 규칙 형식은 건너뛰고 invalid에 기록하는지 테스트"""
+        ranges = IPRangeSet(["10.0.0.300/24", "10.0.0.0/24"])
+
+        assert len(ranges) == 1
+        assert ranges.invalid == ["10.0.0.300/24"]
+
+
+class TestIPAccessRules:
+    """IP 접근 규칙 테스트 클래스"""
+
+    def test_blocklist_takes_precedence(self):
+        """차단 목록이 허용 목록보다 우선하는지 테스트"""
+        rules = IPAccessRules(allowed_ips=["10.0.0.0/8"], blocked_ips=["10.1.0.0/16"])
+
+        assert rules.is_allowed("10.2.3.4") is True
+        assert rules.is_allowed("10.1.3.4") is False
+        assert rules.is_allowed("172.16.0.1") is False
+
+    def test_empty_rules_allow_all(self):
+        """규칙이 없으면 모든 IP를 허용하는지 테스트"""
+        rules = IPAccessRules(allowed_ips=[""], blocked_ips=None)
+
+        assert rules.is_allowed("203.0.113.9") is True
+        assert rules.is_allowed("::1") is True
+
+    def test_reload_replaces_rules(self):
+        """reload()로 규칙이 교체되는지 테스트"""
+        rules = IPAccessRules(blocked_ips=["203.0.113.0/24"])
+        assert rules.is_allowed("203.0.113.9") is False
+
+        rules.reload(blocked_ips=["198.51.100.0/24"])
+
+        assert rules.is_allowed("203.0.113.9") is True
+        assert rules.is_allowed("198.51.100.1") is False
+        stats = rules.get_stats()
+        assert (stats["allowed_ranges"], stats["blocked_ranges"]) == (0, 1)
+
+    def test_invalid_entries_are_skipped(self):
+        """잘못된 규칙이 섞여 있어도 나머지 규칙은 적용되는지 테스트"""
+        rules = IPAccessRules(blocked_ips=["not-an-ip", "203.0.113.0/24"])
+
+        assert rules.is_allowed("203.0.113.9") is False
+        assert rules.get_stats()["invalid_entries"] == ["not-an-ip"]
+
+    def test_middleware_uses_shared_rules(self):
+        """미들웨어가 전달받은 규칙 인스턴스의 교체를 즉시 반영하는지 테스트"""
+        rules = IPAccessRules()
+        middleware = SecurityMiddleware(app=None, ip_rules=rules)
+        assert middleware._check_ip_access("203.0.113.9") is True
+
+        rules.reload(blocked_ips=["203.0.113.0/24"])
+
+        assert middleware._check_ip_access("203.0.113.9") is False
+        assert middleware._check_ip_access("testclient") is False
+
+
+class TestIPRulesFile:
+    """IP 규칙 파일 테스트 클래스"""
+
+    def test_parse_rules_file(self, tmp_path):
+        """allow/block 줄과 주석을 읽고 형식이 잘못된 줄은 건너뛰는지 테스트"""
+        path = tmp_path / "ip_rules.txt"
+        path.write_text("# 사내망\nallow 10.0.0.0/8\nblock 10.1.0.0/16  # 테스트망\ndeny 1.2.3.4\n\n", encoding="utf-8")
+
+        assert parse_rules_file(str(path)) == (["10.0.0.0/8"], ["10.1.0.0/16"])
+
+    def test_file_rules_are_combined_and_reloaded_on_change(self, tmp_path):
+        """규칙 파일을 고정 목록과 합치고, 수정 시각이 바뀌면 다시 읽는지 테스트"""
+        path = tmp_path / "ip_rules.txt"
+        path.write_text("block 203.0.113.0/24\n", encoding="utf-8")
+        rules = IPAccessRules(blocked_ips=["198.51.100.0/24"], rules_file=str(path))
+
+        assert rules.is_allowed("203.0.113.9") is False
+        assert rules.is_allowed("198.51.100.1") is False
+        assert rules.check_file() is False
+
+        path.write_text("block 192.0.2.0/24\n", encoding="utf-8")
+        os.utime(path, (1, 1))
+
+        assert rules.check_file() is True
+        assert rules.is_allowed("203.0.113.9") is True
+        assert rules.is_allowed("192.0.2.1") is False
+        assert rules.is_allowed("198.51.100.1") is False
+
+    def test_missing_file_keeps_previous_rules(self, tmp_path):
+        """규칙 파일을 읽지 못하면 마지막 규칙을 유지하는지 테스트"""
+        path = tmp_path / "ip_rules.txt"
+        path.write_text("block 203.0.113.0/24\n", encoding="utf-8")
+        rules = IPAccessRules(rules_file=str(path))
+        path.unlink()
+
+        assert rules.reload_file() is False
+        assert rules.is_allowed("203.0.113.9") is False
+        assert rules.get_stats()["last_error"]
+
+    def test_watch_task_picks_up_changes(self, tmp_path):
+        """감시 태스크가 주기적으로 규칙 파일 변경을 반영하는지 테스트"""
+        path = tmp_path / "ip_rules.txt"
+        path.write_text("", encoding="utf-8")
+        rules = IPAccessRules(rules_file=str(path), reload_interval=0.01)
+
+        async def scenario():
+            await rules.start()
+            path.write_text("block 203.0.113.0/24\n", encoding="utf-8")
+            os.utime(path, (1, 1))
+            await asyncio.sleep(0.1)
+            await rules.stop()
+
+        asyncio.run(scenario())
+
+        assert rules.is_allowed("203.0.113.9") is False
+
+    def test_lazy_global_rules_tolerate_bad_env(self, monkeypatch):
+        """전역 규칙은 처음 사용할 때 만들고, 잘못된 환경 변수 값에도 실패하지 않는지 테스트"""
+        monkeypatch.setattr(ip_filter_module, "ip_access_rules", None)
+        monkeypatch.setenv("BLOCKED_IPS", "203.0.113.0/24,bogus")
+        monkeypatch.delenv("ALLOWED_IPS", raising=False)
+        monkeypatch.delenv("IP_RULES_FILE", raising=False)
+
+        rules = ip_filter_module.get_ip_access_rules()
+
+        assert rules is ip_filter_module.get_ip_access_rules()
+        assert rules.is_allowed("203.0.113.9") is False
+        assert rules.get_stats()["invalid_entries"] == ["bogus"]
+
+    def test_reload_endpoint(self, tmp_path, monkeypatch):
+        """관리 엔드포인트가 인증된 요청으로 규칙 파일을 즉시 다시 읽는지 테스트"""
+        path = tmp_path / "ip_rules.txt"
+        path.write_text("", encoding="utf-8")
+        rules = IPAccessRules(rules_file=str(path))
+        monkeypatch.setattr(ip_filter_module, "ip_access_rules", rules)
+
+        app = FastAPI()
+        app.include_router(system_router)
+        client = TestClient(app)
+        assert client.post("/system/ip-rules/reload").status_code in (401, 403)
+
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        path.write_text("block 203.0.113.0/24\n", encoding="utf-8")
+        response = client.post("/system/ip-rules/reload")
+
+        assert response.status_code == 200
+        assert response.json()["blocked_ranges"] == 1
+        assert rules.is_allowed("203.0.113.9") is False
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
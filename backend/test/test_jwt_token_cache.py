@@ -0,0 +1,74 @@
+"""검증 토큰 캐시 테스트
+
+verify_token_cached가 이미 검증된 토큰의 서명 검증을 생략하고,
+exp 시각과 최대 크기에 따라 항목을 제거하는지 테스트합니다.
+"""
+
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.utils import jwt_utils
+from app.utils.jwt_utils import VerifiedTokenCache, create_access_token, verify_token_cached
+
+
+class TestVerifiedTokenCache:
+    """검증 토큰 캐시 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        jwt_utils.verified_token_cache.clear()
+        self.token = create_access_token({"sub": "admin", "user_id": "admin"})
+
+    def test_second_call_skips_signature_verification(self):
+        """같은 토큰의 두 번째 검증은 jwt.decode를 호출하지 않는지 테스트"""
+        with patch.object(jwt_utils.jwt, "decode", wraps=jwt_utils.jwt.decode) as mock_decode:
+            first = verify_token_cached(self.token)
+            second = verify_token_cached(self.token)
+
+        assert first["user_id"] == "admin"
+        assert second == first
+        assert mock_decode.call_count == 1
+
+    def test_token_type_is_part_of_key(self):
+        """access 토큰이 refresh 타입으로 캐시 적중되지 않는지 테스트"""
+        assert verify_token_cached(self.token, "access") is not None
+        assert verify_token_cached(self.token, "refresh") is None
+
+    def test_invalid_token_is_not_cached(self):
+        """검증 실패 토큰은 캐시에 저장되지 않는지 테스트"""
+        assert verify_token_cached("invalid.token.value") is None
+        assert jwt_utils.verified_token_cache.get_stats()["size"] == 0
+
+    def test_entry_expires_at_exp_claim(self):
+        """exp 시각이 지난 항목은 캐시에서 제거되는지 테스트"""
+        cache = VerifiedTokenCache(max_size=10)
+        cache.put("token", "access", {"user_id": "admin", "exp": time.time() - 1})
+
+        assert cache.get("token", "access") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 테스트"""
+        cache = VerifiedTokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.put("a", "access", {"exp": exp})
+        cache.put("b", "access", {"exp": exp})
+        cache.get("a", "access")
+        cache.put("c", "access", {"exp": exp})
+
+        assert cache.get("a", "access") is not None
+        assert cache.get("b", "access") is None
+        assert cache.get("c", "access") is not None
+
+    def test_expired_token_is_rejected(self):
+        """만료된 토큰은 검증되지 않는지 테스트"""
+        expired = create_access_token({"sub": "admin"}, expires_delta=timedelta(seconds=-1))
+
+        assert verify_token_cached(expired) is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
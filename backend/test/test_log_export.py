@@ -0,0 +1,294 @@
+"""로그 스트리밍 내보내기와 내보내기 작업 테스트
+
+로그인/시스템/웹 로그 내보내기가 서버 측 커서로 읽어 CSV/NDJSON/JSON 청크를
+점진적으로 만드는지, 내보내기 작업이 파일을 쓰고 진행 상황을 기록하는지,
+엔드포인트가 스트리밍/작업 등록/상태 조회/다운로드를 제공하는지 테스트합니다.
+"""
+
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes.log_router import log_router
+from app.api.routes.system_router import router as system_router
+from app.database import get_db
+from app.database.export import iter_rows, supports_copy
+from app.models.log_models import LoginLog
+from app.models.system_models import SysLog, WebLog
+from app.services.log_service import EXPORT_FIELDS, LoginLogService
+from app.services.system_service import SysLogService, WebLogService
+from app.utils import export_jobs as export_jobs_module
+from app.utils.auth import get_current_user_from_bearer
+from app.utils.export_jobs import EXPORT_COMPLETED, EXPORT_FAILED, ExportJobManager
+from app.utils.record_stream import iter_records
+
+NOW = datetime.now().replace(microsecond=0)
+
+
+@pytest.fixture
+def engine():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB (로그인/시스템/웹 로그 각 25건)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    for model in (LoginLog, SysLog, WebLog):
+        model.__table__.create(engine)
+
+    session = sessionmaker(bind=engine)()
+    for index in range(25):
+        logged_at = NOW - timedelta(hours=6 * index)
+        session.add(LoginLog(
+            log_id=f"L{index:03d}", conect_id=f"user{index % 3}", conect_ip=f"10.0.0.{index % 4}",
+            conect_mthd="I", error_occrrnc_at="Y" if index % 5 == 0 else "N", frst_regist_pnttm=logged_at
+        ))
+        session.add(SysLog(
+            requst_id=f"S{index:03d}", rqester_id=f"user{index % 3}", occrrnc_de=logged_at,
+            trget_menu_nm=f"메뉴, \"{index}\"", process_se_code="SEL"
+        ))
+        session.add(WebLog(
+            requst_id=f"W{index:03d}", rqester_id=f"user{index % 3}", rqest_de=logged_at,
+            url=f"/page/{index}", frst_regist_pnttm=logged_at
+        ))
+    session.commit()
+    session.close()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """실행된 SQL을 db.statements에 기록하는 세션"""
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session = sessionmaker(bind=engine)()
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def read_back(chunks, format):
+    """내보낸 청크를 가져오기 리더로 다시 읽기"""
+    return list(iter_records(io.BytesIO(b"".join(chunks)), format))
+
+
+class TestLogExportStream:
+    """로그 스트리밍 내보내기 테스트 클래스"""
+
+    @pytest.mark.parametrize("format", ["json", "ndjson", "csv"])
+    def test_round_trip(self, db, format):
+        """내보낸 파일을 다시 읽으면 최근 로그부터 모든 로그가 나오는지 테스트"""
+        records = read_back(LoginLogService().export_logs(db, format=format), format)
+
+        assert len(records) == 25
+        assert records[0]["log_id"] == "L000"
+        assert list(records[0]) == EXPORT_FIELDS
+
+    def test_filters(self, db):
+        """기간/사용자/성공 여부 조건을 적용하는지 테스트"""
+        service = LoginLogService()
+
+        recent = read_back(service.export_logs(db, format="ndjson", start_date=NOW - timedelta(hours=30)), "ndjson")
+        assert [record["log_id"] for record in recent] == [f"L{index:03d}" for index in range(6)]
+
+        statement = service.export_statement(login_ids=["user0"], include_successful=False)
+        failed = list(iter_rows(db, statement))
+        assert {row["conect_id"] for row in failed} == {"user0"}
+        assert {row["error_occrrnc_at"] for row in failed} == {"Y"}
+
+    def test_lazy_and_batched(self, db):
+        """소비하기 전에는 조회하지 않고, 여러 배치를 SELECT 한 번으로 읽는지 테스트"""
+        chunks = LoginLogService().export_logs(db, format="csv", batch_size=4)
+        assert db.statements == []
+
+        records = read_back(chunks, "csv")
+
+        assert len([sql for sql in db.statements if sql.lstrip().upper().startswith("SELECT")]) == 1
+        assert len(records) == 25
+
+    def test_gzip_and_invalid_format(self, db):
+        """gzip 압축 결과가 원본과 같고, 지원하지 않는 형식은 바로 오류를 내는지 테스트"""
+        service = LoginLogService()
+        plain = b"".join(service.export_logs(db, format="csv"))
+
+        assert gzip.decompress(b"".join(service.export_logs(db, format="csv", compress=True))) == plain
+        with pytest.raises(ValueError):
+            service.export_logs(db, format="xlsx")
+
+    def test_system_and_web_logs_date_range(self, db):
+        """시스템/웹 로그 내보내기가 종료일자를 포함하는지 테스트"""
+        today = NOW.date()
+        expected = sum(1 for index in range(25) if (NOW - timedelta(hours=6 * index)).date() == today)
+
+        syslogs = read_back(SysLogService().export_logs(db, today, today, "csv"), "csv")
+        weblogs = read_back(WebLogService().export_logs(db, today, today, "ndjson"), "ndjson")
+
+        assert len(syslogs) == len(weblogs) == expected
+        assert syslogs[0]["trget_menu_nm"] == '메뉴, "0"'
+        assert weblogs[0]["url"] == "/page/0"
+
+    def test_copy_only_on_postgresql(self, db):
+        """SQLite에서는 COPY 대신 서버 측 커서를 사용하는지 테스트"""
+        assert supports_copy(db) is False
+
+
+class TestExportJobManager:
+    """내보내기 작업 관리자 테스트 클래스"""
+
+    @pytest.fixture
+    def manager(self, engine, tmp_path):
+        manager = ExportJobManager(export_dir=str(tmp_path), batch_size=4, session_factory=sessionmaker(bind=engine))
+        yield manager
+        manager.shutdown()
+
+    def test_job_writes_file(self, manager, tmp_path):
+        """작업이 파일을 쓰고 진행 상황과 상태 파일을 기록하는지 테스트"""
+        job = manager.submit("login_logs", LoginLogService().export_statement(), format="ndjson", compress=True)
+        manager.shutdown()
+
+        assert job.status == EXPORT_COMPLETED
+        assert (job.record_count, job.total_count, job.progress) == (25, 25, 100.0)
+        path = manager.path_of(job)
+        assert job.file_size == path.stat().st_size
+        assert len(gzip.decompress(path.read_bytes()).splitlines()) == 25
+        assert job.file_name.startswith("login_logs_") and job.file_name.endswith(".ndjson.gz")
+        assert not list(tmp_path.glob("*.part"))
+
+        # 같은 디렉터리를 쓰는 다른 워커도 상태 파일로 조회
+        other = ExportJobManager(export_dir=str(tmp_path))
+        restored = other.get(job.export_id)
+        assert (restored.status, restored.record_count, restored.created_at) == (
+            EXPORT_COMPLETED, 25, job.created_at
+        )
+        assert other.get("../" + job.export_id) is None
+
+    def test_failed_job(self, tmp_path):
+        """실패한 작업은 오류를 기록하고 미완성 파일을 남기지 않는지 테스트"""
+        statement = SysLogService().export_statement()
+        # 테이블이 없는 DB
+        broken = ExportJobManager(export_dir=str(tmp_path), session_factory=sessionmaker(bind=create_engine("sqlite://")))
+        failed = broken.submit("system_logs", statement, format="csv")
+        broken.shutdown()
+
+        assert failed.status == EXPORT_FAILED
+        assert "no such table" in failed.error
+        assert broken.get(failed.export_id).finished_at is not None
+        assert not list(tmp_path.glob("*.part"))
+        assert broken.get_stats()["failed"] == 1
+
+    def test_cleanup_expired(self, manager):
+        """보관 시간이 지난 작업과 파일을 삭제하는지 테스트"""
+        job = manager.submit("login_logs", LoginLogService().export_statement(), format="csv")
+        manager.shutdown()
+        path = manager.path_of(job)
+        assert path.exists()
+
+        assert manager.cleanup_expired(now=datetime.now()) == 0
+        assert manager.cleanup_expired(now=datetime.now() + timedelta(seconds=manager.ttl + 1)) == 1
+
+        assert not path.exists()
+        assert manager.get(job.export_id) is None
+
+    def test_invalid_format(self, manager):
+        """지원하지 않는 형식은 작업을 등록하지 않는지 테스트"""
+        with pytest.raises(ValueError):
+            manager.submit("login_logs", LoginLogService().export_statement(), format="parquet")
+
+
+class TestLogExportEndpoints:
+    """로그 내보내기 엔드포인트 테스트 클래스"""
+
+    @pytest.fixture
+    def manager(self, engine, tmp_path, monkeypatch):
+        manager = ExportJobManager(export_dir=str(tmp_path), session_factory=sessionmaker(bind=engine))
+        monkeypatch.setattr(export_jobs_module, "export_job_manager", manager)
+        yield manager
+        manager.shutdown()
+
+    @pytest.fixture
+    def app(self, db, manager):
+        app = FastAPI()
+        app.include_router(log_router, prefix="/api/v1")
+        app.include_router(system_router, prefix="/api/v1")
+        app.dependency_overrides[get_db] = lambda: db
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        return app
+
+    def test_streams_login_logs(self, app):
+        """로그인 로그를 첨부 파일로 스트리밍하는지 테스트"""
+        response = TestClient(app).get("/api/v1/logs/export?format=csv&compress=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".csv.gz" in response.headers["content-disposition"]
+        assert len(read_back([gzip.decompress(response.content)], "csv")) == 25
+
+    def test_streams_system_logs(self, app):
+        """/system/logs/export가 로그 상세 조회 경로보다 먼저 처리되는지 테스트"""
+        client = TestClient(app)
+
+        response = client.get("/api/v1/system/logs/export?log_type=web&format=ndjson")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert len(response.content.splitlines()) == 25
+
+        assert client.get("/api/v1/system/logs/export?log_type=api").status_code == 400
+        assert client.get("/api/v1/system/logs/export?log_type=system&format=xml").status_code == 400
+
+    def test_job_poll_and_download(self, app, manager):
+        """작업 등록 후 상태를 조회하고 완료된 파일을 내려받는지 테스트"""
+        client = TestClient(app)
+        response = client.post("/api/v1/logs/export/jobs", json={
+            "start_date": (NOW - timedelta(days=30)).isoformat(),
+            "end_date": NOW.isoformat(),
+            "include_successful": False,
+            "export_format": "json"
+        })
+        assert response.status_code == 202
+        created = response.json()
+        assert created["status_url"] == f"/api/v1/system/exports/{created['export_id']}"
+        manager.shutdown()
+
+        status_body = client.get(created["status_url"]).json()
+        assert status_body["status"] == EXPORT_COMPLETED
+        assert status_body["progress"] == 100.0
+        assert status_body["expires_at"]
+
+        download = client.get(status_body["download_url"])
+        assert download.status_code == 200
+        document = json.loads(download.content)
+        assert document["total_count"] == status_body["record_count"] == 5
+        assert {record["error_occrrnc_at"] for record in document["data"]} == {"Y"}
+
+        # 다른 사용자의 작업은 조회할 수 없음
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "other"}
+        assert client.get(created["status_url"]).status_code == 404
+
+    def test_download_before_completion(self, app, manager):
+        """끝나지 않은 작업의 다운로드는 409를 반환하는지 테스트"""
+        client = TestClient(app)
+        job = manager.submit("system_logs", SysLogService().export_statement(), owner="admin")
+        manager.shutdown()
+        job.status = "running"
+
+        response = client.get(f"/api/v1/system/exports/{job.export_id}/download")
+
+        assert response.status_code == 409
+        assert client.get("/api/v1/system/exports/unknown").status_code == 404
+
+    def test_system_job_with_invalid_format(self, app):
+        """지원하지 않는 형식의 작업 등록은 400을 반환하는지 테스트"""
+        response = TestClient(app).post("/api/v1/system/logs/export/jobs?log_type=system&format=parquet")
+
+        assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,247 @@
+"""로그 테이블 월별 파티션 테스트
+
+월 계산/파티션 이름, 파티션되지 않은 테이블(SQLite)에서의 DELETE 정리,
+정리 엔드포인트와 유지보수기를 테스트합니다.
+PostgreSQL 파티션 생성/정리와 파티션 프루닝(EXPLAIN)은 TEST_POSTGRES_URL이
+설정된 경우에만 실행합니다.
+"""
+
+import os
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes.system_router import router as system_router
+from app.database import get_db
+from app.database.partitioning import (
+    add_months, ensure_partitions, is_partitioned, list_partitions,
+    month_start, partition_name, purge_before
+)
+from app.database.query_advisor import capture_statements, explain_statement
+from app.models.log_models import APIUsageLog, LoginLog
+from app.models.system_models import SysLog, WebLog
+from app.schemas.log_schemas import LoginLogSearchParams
+from app.services.log_service import LoginLogService
+from app.services.system_service import SysLogService, WebLogService
+from app.utils.auth import get_current_user_from_bearer
+from app.utils.partition_maintainer import PartitionMaintainer
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+LOG_TABLES = [LoginLog.__table__, SysLog.__table__, WebLog.__table__, APIUsageLog.__table__]
+
+
+@pytest.fixture
+def engine():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB (로그 테이블별로 오래된 로그 2건, 최근 로그 1건)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    for table in LOG_TABLES:
+        table.create(engine)
+
+    now = datetime.now()
+    session = sessionmaker(bind=engine)()
+    for index, logged_at in enumerate([now - timedelta(days=200), now - timedelta(days=100), now]):
+        session.add(LoginLog(log_id=f"L{index}", error_occrrnc_at="N", frst_regist_pnttm=logged_at))
+        session.add(SysLog(requst_id=f"S{index}", occrrnc_de=logged_at))
+        session.add(WebLog(requst_id=f"W{index}", rqest_de=logged_at))
+        session.add(APIUsageLog(log_id=f"A{index}", endpoint="/api/v1/test", method="GET", frst_regist_pnttm=logged_at))
+    session.commit()
+    session.close()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestPartitionNames:
+    """월 계산과 파티션 이름 테스트 클래스"""
+
+    def test_month_arithmetic(self):
+        """월 시작일과 연도를 넘는 월 더하기/빼기를 테스트"""
+        assert month_start(datetime(2025, 3, 31, 23, 59)) == date(2025, 3, 1)
+        assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+    def test_partition_name(self):
+        """파티션 이름 규칙을 테스트"""
+        assert partition_name("tb_loginlog", date(2025, 1, 1)) == "tb_loginlog_p202501"
+
+
+class TestCleanupWithoutPartitions:
+    """파티션되지 않은 테이블의 로그 정리 테스트 클래스"""
+
+    def test_sqlite_is_not_partitioned(self, db):
+        """PostgreSQL이 아니면 파티션 생성을 건너뛰는지 테스트"""
+        assert not is_partitioned(db, LoginLog.__table__)
+        assert ensure_partitions(db, LoginLog.__table__) == []
+
+    def test_services_delete_old_logs(self, db):
+        """각 서비스의 cleanup_old_logs가 보관 기간이 지난 로그만 삭제하는지 테스트"""
+        for service, model in ((LoginLogService(), LoginLog), (SysLogService(), SysLog), (WebLogService(), WebLog)):
+            result = service.cleanup_old_logs(db, days_to_keep=150)
+
+            assert result == {"deleted_count": 1, "dropped_partitions": [], "detached_partitions": []}
+            assert db.query(model).count() == 2
+
+    def test_invalid_mode(self, db):
+        """지원하지 않는 정리 방식은 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            purge_before(db, LoginLog.__table__, datetime.now(), mode="truncate")
+
+
+class TestCleanupEndpoint:
+    """시스템 로그 정리 엔드포인트 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        app = FastAPI()
+        app.include_router(system_router)
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        self.app = app
+
+    def test_cleanup_by_log_type(self, db):
+        """system/web/api 로그 타입별 정리와 잘못된 타입/방식 거부를 테스트"""
+        self.app.dependency_overrides[get_db] = lambda: db
+        client = TestClient(self.app)
+
+        for log_type in ("system", "web", "api"):
+            response = client.delete("/system/logs/cleanup", params={"log_type": log_type, "days": 30})
+            assert response.status_code == 200
+            assert response.json()["deleted_count"] == 2
+
+        assert client.delete("/system/logs/cleanup", params={"log_type": "login"}).status_code == 400
+        assert client.delete("/system/logs/cleanup", params={"log_type": "web", "mode": "truncate"}).status_code == 422
+
+
+class TestPartitionMaintainer:
+    """파티션 유지보수기 테스트 클래스"""
+
+    def test_run_once(self, engine):
+        """모든 로그 테이블을 처리하고 보관 기간이 지난 로그를 정리하는지 테스트"""
+        maintainer = PartitionMaintainer(retention_days=150, session_factory=sessionmaker(bind=engine))
+
+        results = maintainer.run_once()
+
+        assert set(results) == {table.name for table in LOG_TABLES}
+        assert all(result["created"] == [] and result["deleted_count"] == 1 for result in results.values())
+        stats = maintainer.get_stats()
+        assert stats["runs"] == 1 and stats["failed"] == 0 and not stats["running"]
+
+    def test_without_retention(self, engine):
+        """보관 일수가 0이면 로그를 정리하지 않는지 테스트"""
+        results = PartitionMaintainer(retention_days=0, session_factory=sessionmaker(bind=engine)).run_once()
+
+        assert all(result == {"created": []} for result in results.values())
+
+
+def scanned_relations(plan):
+    """실행 계획에서 스캔한 테이블(파티션) 이름 목록"""
+    relations, nodes = [], [plan["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.get("Plans", []))
+        if "Relation Name" in node:
+            relations.append(node["Relation Name"])
+    return sorted(set(relations))
+
+
+@pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL이 설정되지 않음")
+class TestPostgresPartitions:
+    """PostgreSQL 파티션 생성/정리/프루닝 테스트 클래스 (임시 스키마 사용)"""
+
+    def setup_method(self):
+        """임시 스키마에 파티션된 로그인 로그 테이블 생성"""
+        self.schema = f"test_partition_{uuid.uuid4().hex[:8]}"
+        base = create_engine(TEST_POSTGRES_URL)
+        with base.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA {self.schema}"))
+        self.engine = base.execution_options(schema_translate_map={"skybootcore": self.schema})
+        LoginLog.__table__.create(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.table = LoginLog.__table__
+
+    def teardown_method(self):
+        self.db.close()
+        with self.engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA {self.schema} CASCADE"))
+        self.engine.dispose()
+
+    def add_logs(self, *times):
+        for index, logged_at in enumerate(times):
+            self.db.add(LoginLog(log_id=f"L{index:03d}", conect_id="admin", error_occrrnc_at="N", frst_regist_pnttm=logged_at))
+        self.db.commit()
+
+    def test_ensure_partitions(self):
+        """기본 파티션과 months_ahead개월 뒤까지의 파티션을 한 번만 생성하는지 테스트"""
+        created = ensure_partitions(self.db, self.table, months_ahead=2, start=date(2025, 1, 1))
+
+        assert is_partitioned(self.db, self.table)
+        assert created == ["tb_loginlog_p202501", "tb_loginlog_p202502", "tb_loginlog_p202503"]
+        assert ensure_partitions(self.db, self.table, months_ahead=2, start=date(2025, 1, 1)) == []
+        assert [month for _, month in list_partitions(self.db, self.table)][-1] is None
+
+    def test_moves_rows_out_of_default_partition(self):
+        """기본 파티션에 있던 행을 새 월 파티션으로 옮기는지 테스트"""
+        ensure_partitions(self.db, self.table, months_ahead=0, start=date(2025, 1, 1))
+        self.add_logs(datetime(2025, 1, 10), datetime(2025, 4, 10))
+
+        ensure_partitions(self.db, self.table, months_ahead=0, start=date(2025, 4, 1))
+
+        placement = dict(self.db.execute(text(
+            f"SELECT log_id, tableoid::regclass::text FROM {self.schema}.tb_loginlog"
+        )).all())
+        assert placement == {
+            "L000": f"{self.schema}.tb_loginlog_p202501",
+            "L001": f"{self.schema}.tb_loginlog_p202504",
+        }
+
+    def test_query_prunes_to_one_partition(self):
+        """기간 조건이 있는 목록 조회가 해당 월 파티션만 스캔하는지 EXPLAIN으로 테스트"""
+        ensure_partitions(self.db, self.table, months_ahead=2, start=date(2025, 1, 1))
+        self.add_logs(datetime(2025, 1, 10), datetime(2025, 2, 10), datetime(2025, 3, 10))
+        params = LoginLogSearchParams(start_date=datetime(2025, 2, 1), end_date=datetime(2025, 2, 28))
+
+        statements = capture_statements(
+            self.db, lambda session: LoginLogService().search_logs_page(session, params, limit=10)
+        )
+        plan = explain_statement(self.db, *statements[0])
+
+        assert scanned_relations(plan) == ["tb_loginlog_p202502"]
+
+    def test_purge_drops_old_partitions(self):
+        """cutoff 이전 파티션은 DROP하고 cutoff가 걸친 파티션에서만 DELETE 하는지 테스트"""
+        ensure_partitions(self.db, self.table, months_ahead=2, start=date(2025, 1, 1))
+        self.add_logs(datetime(2025, 1, 10), datetime(2025, 2, 5), datetime(2025, 2, 25), datetime(2025, 3, 10))
+
+        result = purge_before(self.db, self.table, datetime(2025, 2, 15))
+
+        assert result["dropped_partitions"] == ["tb_loginlog_p202501"]
+        assert result["deleted_count"] == 1
+        assert self.db.query(LoginLog).count() == 2
+
+    def test_purge_detaches_old_partitions(self):
+        """detach 방식은 파티션을 분리만 하고 테이블을 남기는지 테스트"""
+        ensure_partitions(self.db, self.table, months_ahead=1, start=date(2025, 1, 1))
+        self.add_logs(datetime(2025, 1, 10), datetime(2025, 2, 10))
+
+        result = purge_before(self.db, self.table, datetime(2025, 2, 1), mode="detach")
+
+        assert result["detached_partitions"] == ["tb_loginlog_p202501"]
+        assert self.db.query(LoginLog).count() == 1
+        assert self.db.execute(text(f"SELECT count(*) FROM {self.schema}.tb_loginlog_p202501")).scalar() == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
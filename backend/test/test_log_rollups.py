@@ -0,0 +1,218 @@
+"""로그 통계 집계(rollup) 테스트
+
+시간별/일별 집계 작업(watermark, 구간 분할, 재실행), 집계 전후 통계 결과가
+같은지, 집계된 구간은 원본 로그 대신 집계 테이블을 읽는지 테스트합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, delete, func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.rollups import (
+    LOGIN_ROLLUP, ROLLUPS, SYSLOG_ROLLUP, compact_rollup, floor_hour, get_watermark, reset_rollup
+)
+from app.models.log_models import LoginLog
+from app.models.stats_models import (
+    LoginLogDayStats, LoginLogHourStats, StatsWatermark,
+    SysLogDayStats, SysLogHourStats, WebLogDayStats, WebLogHourStats
+)
+from app.models.system_models import SysLog, WebLog
+from app.models.user_models import UserInfo
+from app.services.log_service import LoginLogService
+from app.services.system_service import SysLogService, SystemMonitoringService, WebLogService
+from app.utils.rollup_compactor import RollupCompactor
+
+TABLES = [
+    LoginLog, SysLog, WebLog, UserInfo,
+    LoginLogHourStats, LoginLogDayStats, SysLogHourStats, SysLogDayStats,
+    WebLogHourStats, WebLogDayStats, StatsWatermark,
+]
+
+
+@pytest.fixture
+def engine():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB (최근 10일간 7시간 간격 로그)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    for model in TABLES:
+        model.__table__.create(engine)
+
+    now = datetime.now()
+    session = sessionmaker(bind=engine)()
+    for index in range(35):
+        logged_at = now - timedelta(hours=7 * index, minutes=index)
+        user = None if index % 5 == 0 else f"user{index % 3}"
+        session.add(LoginLog(
+            log_id=f"L{index:03d}", conect_id=user, conect_ip=f"10.0.0.{index % 4}",
+            error_occrrnc_at="Y" if index % 4 == 0 else "N", frst_regist_pnttm=logged_at
+        ))
+        session.add(SysLog(
+            requst_id=f"S{index:03d}", rqester_id=user, occrrnc_de=logged_at,
+            trget_menu_nm=None if index % 6 == 0 else f"menu{index % 2}",
+            process_se_code="ERR" if index % 7 == 0 else "SEL",
+            process_time=str(index * 10) if index % 3 else None
+        ))
+        session.add(WebLog(
+            requst_id=f"W{index:03d}", rqester_id=user, rqest_de=logged_at,
+            trget_menu_nm=f"page{index % 3}"
+        ))
+    session.commit()
+    session.close()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def all_statistics(db):
+    """집계를 읽는 통계 메서드 결과 모음"""
+    login_service = LoginLogService()
+    web_service = WebLogService()
+    dashboard = SystemMonitoringService().get_dashboard_summary(db)
+    return {
+        "login": login_service.get_login_statistics(db),
+        "daily": login_service.get_daily_login_stats(db),
+        "hourly": login_service.get_hourly_login_stats(db),
+        "analysis": {
+            key: value for key, value in login_service.analyze_logs(db).items() if key != "analysis_time"
+        },
+        "syslog": SysLogService().get_log_statistics(db).model_dump(),
+        "popular_pages": web_service.get_popular_pages(db),
+        "traffic": web_service.get_hourly_traffic(db),
+        "dashboard": (
+            dashboard.active_users_today, dashboard.total_requests_today,
+            dashboard.error_requests_today, dashboard.popular_menus
+        ),
+    }
+
+
+class TestCompactRollup:
+    """집계 작업 테스트 클래스"""
+
+    def test_compacts_closed_hours_once(self, db):
+        """끝난 시간대만 집계하고 watermark를 옮기며, 다시 실행해도 중복 집계하지 않는지 테스트"""
+        until = datetime.now()
+
+        created = compact_rollup(db, LOGIN_ROLLUP, until)
+
+        assert created > 0
+        assert get_watermark(db, LOGIN_ROLLUP) == floor_hour(until)
+        raw_count = db.query(LoginLog).filter(LoginLog.frst_regist_pnttm < floor_hour(until)).count()
+        assert db.query(func.sum(LoginLogHourStats.log_co)).scalar() == raw_count
+        assert db.query(func.sum(LoginLogDayStats.log_co)).scalar() == raw_count
+        # NULL 차원은 빈 문자열로 저장
+        assert db.query(LoginLogHourStats).filter(LoginLogHourStats.conect_id == "").count() > 0
+
+        assert compact_rollup(db, LOGIN_ROLLUP, until) == 0
+        assert db.query(func.sum(LoginLogHourStats.log_co)).scalar() == raw_count
+
+    def test_chunked_compaction_matches_single_pass(self, db):
+        """구간을 나누어 집계해도 한 번에 집계한 것과 같은지 테스트"""
+        until = datetime.now()
+
+        def snapshot():
+            return (
+                sorted(tuple(row) for row in db.execute(select(SysLogHourStats.__table__)).all()),
+                sorted(tuple(row) for row in db.execute(select(SysLogDayStats.__table__)).all()),
+            )
+
+        compact_rollup(db, SYSLOG_ROLLUP, until, chunk_hours=5)
+        chunked = snapshot()
+        reset_rollup(db, SYSLOG_ROLLUP)
+        assert get_watermark(db, SYSLOG_ROLLUP) is None
+
+        compact_rollup(db, SYSLOG_ROLLUP, until)
+
+        assert snapshot() == chunked
+
+    def test_empty_source(self, db):
+        """로그가 없으면 watermark만 현재 시간대로 설정하는지 테스트"""
+        db.execute(delete(LoginLog.__table__))
+        db.commit()
+        until = datetime.now()
+
+        assert compact_rollup(db, LOGIN_ROLLUP, until) == 0
+        assert get_watermark(db, LOGIN_ROLLUP) == floor_hour(until)
+
+    def test_non_numeric_process_time_is_skipped(self, db):
+        """숫자가 아닌 처리시간은 CAST하지 않고 평균 계산에서 제외하는지 테스트"""
+        logged_at = floor_hour(datetime.now()) - timedelta(hours=2)
+        for index, process_time in enumerate(["12ms", "", "abc", "1.5.2", "30", "4.5"]):
+            db.add(SysLog(
+                requst_id=f"B{index:03d}", occrrnc_de=logged_at + timedelta(minutes=index),
+                process_se_code="SEL", process_time=process_time
+            ))
+        db.commit()
+        window = (logged_at, logged_at + timedelta(hours=1))
+        before = SysLogService().get_log_statistics(db, *window)
+
+        compact_rollup(db, SYSLOG_ROLLUP, datetime.now())
+
+        row = db.execute(
+            select(func.sum(SysLogHourStats.process_time_sum), func.sum(SysLogHourStats.process_time_co))
+            .where(SysLogHourStats.stats_pnttm == logged_at)
+        ).one()
+        assert (float(row[0]), row[1]) == (34.5, 2)
+        assert before.average_process_time == pytest.approx(17.25)
+        assert SysLogService().get_log_statistics(db, *window) == before
+
+        # PostgreSQL에서는 CAST 전에 정규식으로 형식을 확인
+        sql = str(SYSLOG_ROLLUP.measures["process_time_sum"](SysLog.__table__).compile(dialect=postgresql.dialect()))
+        assert sql.index("~") < sql.index("CAST")
+
+
+class TestRollupStatistics:
+    """집계 기반 통계 조회 테스트 클래스"""
+
+    def test_statistics_match_raw_logs(self, db):
+        """집계 전(원본만 조회)과 집계 후(집계 + 원본 자투리) 통계가 같은지 테스트"""
+        before = all_statistics(db)
+        for spec in ROLLUPS:
+            compact_rollup(db, spec, datetime.now())
+
+        after = all_statistics(db)
+
+        assert after == before
+        assert before["login"]["total_logins"] == 35
+        assert before["syslog"]["total_requests"] == 35
+
+    def test_compacted_range_is_read_from_rollups(self, db):
+        """집계가 끝난 구간은 원본 로그를 지워도 통계가 그대로인지 테스트"""
+        watermark = floor_hour(datetime.now())
+        compact_rollup(db, LOGIN_ROLLUP, watermark)
+        before = LoginLogService().get_login_statistics(db)
+
+        db.execute(delete(LoginLog.__table__).where(LoginLog.frst_regist_pnttm < watermark - timedelta(hours=1)))
+        db.commit()
+
+        assert LoginLogService().get_login_statistics(db) == before
+
+
+class TestRollupCompactor:
+    """집계기 테스트 클래스"""
+
+    def test_run_once(self, engine):
+        """모든 집계를 수행하고 결과와 통계를 기록하는지 테스트"""
+        compactor = RollupCompactor(delay=0, session_factory=sessionmaker(bind=engine))
+
+        results = compactor.run_once()
+
+        assert set(results) == {spec.name for spec in ROLLUPS}
+        assert all(result["created"] > 0 and result["watermark"] for result in results.values())
+        assert all(result["created"] == 0 for result in compactor.run_once().values())
+        stats = compactor.get_stats()
+        assert stats["runs"] == 2 and stats["failed"] == 0 and not stats["running"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,141 @@
+"""메뉴 일괄 복사 테스트
+
+copy_menu가 하위 트리를 한 번에 조회하고 미리 할당한 ID로 한 번에 INSERT하는지,
+깊이/자기 복사 안전장치가 유지되는지 테스트합니다.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.menu_models import MenuInfo
+from app.services.menu_service import MenuInfoService
+from app.utils import menu_tree_cache as menu_tree_cache_module
+from app.utils.menu_tree_cache import MenuTreeCache
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션"""
+    monkeypatch.setattr(menu_tree_cache_module, "menu_tree_cache", MenuTreeCache(ttl=0))
+
+    engine = create_engine("sqlite://").execution_options(schema_translate_map={"skybootcore": None})
+    MenuInfo.__table__.create(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    session = sessionmaker(bind=engine)()
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def add_tree(db, fanout, levels, with_paths=True):
+    """ROOT 아래에 fanout x levels 크기의 메뉴 트리 추가"""
+    rows = [("ROOT", None, "/ROOT/", 1)]
+    frontier = [("ROOT", "/ROOT/", 1)]
+    for _ in range(levels):
+        next_frontier = []
+        for parent_no, parent_path, depth in frontier:
+            for index in range(fanout):
+                menu_no = f"{parent_no}.{index}"
+                path = f"{parent_path}{menu_no}/"
+                rows.append((menu_no, parent_no, path, depth + 1))
+                next_frontier.append((menu_no, path, depth + 1))
+        frontier = next_frontier
+
+    for order, (menu_no, upper_menu_no, path, depth) in enumerate(rows):
+        db.add(MenuInfo(
+            menu_no=menu_no, menu_nm=f"메뉴{menu_no}", progrm_file_nm="dir",
+            upper_menu_no=upper_menu_no, menu_ordr=Decimal(order), display_yn="Y",
+            menu_path=path if with_paths else None, menu_depth=depth if with_paths else None
+        ))
+    db.add(MenuInfo(menu_no="TARGET", menu_nm="대상", progrm_file_nm="dir", menu_ordr=Decimal(1),
+                    display_yn="Y", menu_path="/TARGET/" if with_paths else None,
+                    menu_depth=1 if with_paths else None))
+    db.commit()
+    db.statements.clear()
+    return len(rows)
+
+
+class TestBulkCopyMenu:
+    """메뉴 일괄 복사 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = MenuInfoService()
+
+    @pytest.mark.parametrize("with_paths", [True, False])
+    def test_round_trips_do_not_grow_with_subtree(self, db, with_paths):
+        """하위 트리 크기와 관계없이 쿼리 수가 일정한지 테스트"""
+        count = add_tree(db, fanout=3, levels=3, with_paths=with_paths)
+
+        copied = self.service.copy_menu(db, "ROOT", "COPY", new_parent_id="TARGET", copy_children=True)
+
+        inserts = [sql for sql in db.statements if sql.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 1
+        assert len(db.statements) <= 12
+        assert copied.menu_no == "COPY"
+        assert db.query(MenuInfo).filter(MenuInfo.menu_no.like("COPY%")).count() == count
+
+    def test_copied_tree_structure(self, db):
+        """복사본이 원본 구조와 순서, 경로를 유지하는지 테스트"""
+        add_tree(db, fanout=2, levels=2)
+
+        self.service.copy_menu(db, "ROOT", "COPY", new_menu_nm="복사본", new_parent_id="TARGET", copy_children=True)
+
+        copies = {menu.menu_no: menu for menu in db.query(MenuInfo).filter(MenuInfo.menu_no.like("COPY%"))}
+        root = copies["COPY"]
+        assert root.menu_nm == "복사본"
+        assert root.upper_menu_no == "TARGET"
+        children = sorted((menu for menu in copies.values() if menu.upper_menu_no == "COPY"), key=lambda m: m.menu_ordr)
+        assert [menu.menu_nm for menu in children] == ["메뉴ROOT.0", "메뉴ROOT.1"]
+        grandchild = next(menu for menu in copies.values() if menu.upper_menu_no == children[0].menu_no)
+        assert grandchild.menu_path == f"/TARGET/COPY/{children[0].menu_no}/{grandchild.menu_no}/"
+        assert int(grandchild.menu_depth) == 4
+        assert self.service.check_menu_paths(db)["mismatched"] == []
+
+    def test_repeated_copy_allocates_new_ids(self, db):
+        """이미 사용 중인 ID를 건너뛰어 할당하는지 테스트"""
+        add_tree(db, fanout=2, levels=1)
+        db.add(MenuInfo(menu_no="COPY_001", menu_nm="기존", progrm_file_nm="dir", menu_ordr=Decimal(1), display_yn="Y"))
+        db.commit()
+
+        self.service.copy_menu(db, "ROOT", "COPY", copy_children=True)
+
+        ids = {menu.menu_no for menu in db.query(MenuInfo).filter(MenuInfo.upper_menu_no == "COPY")}
+        assert ids == {"COPY_002", "COPY_003"}
+
+    def test_existing_id_rejected(self, db):
+        """이미 존재하는 새 메뉴 ID를 거부하는지 테스트"""
+        add_tree(db, fanout=1, levels=1)
+
+        with pytest.raises(ValueError):
+            self.service.copy_menu(db, "ROOT", "TARGET", copy_children=True)
+
+    def test_depth_guard(self, db):
+        """복사 후 깊이가 10레벨을 넘으면 거부하는지 테스트"""
+        add_tree(db, fanout=1, levels=10)
+
+        with pytest.raises(ValueError):
+            self.service.copy_menu(db, "ROOT", "COPY", new_parent_id="TARGET", copy_children=True)
+
+        assert db.query(MenuInfo).filter(MenuInfo.menu_no.like("COPY%")).count() == 0
+
+    def test_self_copy_guard(self, db):
+        """자기 자신 아래로 복사하는 것을 거부하는지 테스트"""
+        add_tree(db, fanout=1, levels=1)
+
+        with pytest.raises(ValueError):
+            self.service.copy_menu(db, "ROOT", "COPY", new_parent_id="ROOT", copy_children=True)
+
+    def test_copy_into_own_subtree_is_finite(self, db):
+        """자신의 하위 메뉴 아래로 복사해도 원본 스냅샷만 복사하는지 테스트"""
+        count = add_tree(db, fanout=2, levels=2)
+
+        self.service.copy_menu(db, "ROOT", "COPY", new_parent_id="ROOT.0", copy_children=True)
+
+        assert db.query(MenuInfo).filter(MenuInfo.menu_no.like("COPY%")).count() == count
@@ -0,0 +1,143 @@
+"""메뉴 스트리밍 내보내기 테스트
+
+export_menu_data가 임시 파일 없이 JSON/NDJSON/CSV 바이트 청크를 점진적으로
+만들고, 내보낸 파일을 가져오기 리더로 다시 읽을 수 있는지 테스트합니다.
+"""
+
+import gzip
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes.menu_router import menu_router
+from app.database import get_db
+from app.models.menu_models import MenuInfo
+from app.services.menu_service import MenuInfoService
+from app.utils.auth import get_current_user_from_bearer
+from app.utils.record_stream import encode_records, iter_records
+
+
+@pytest.fixture
+def db():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    MenuInfo.__table__.create(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    session = sessionmaker(bind=engine)()
+    for index in range(30):
+        session.add(MenuInfo(
+            menu_no=f"M{index:02d}", menu_nm=f"메뉴, \"{index}\"", progrm_file_nm="dir",
+            upper_menu_no="M00" if index else None, menu_ordr=Decimal(index),
+            display_yn="N" if index == 29 else "Y"
+        ))
+    session.commit()
+    statements.clear()
+
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def read_back(chunks, format):
+    """내보낸 청크를 가져오기 리더로 다시 읽기"""
+    return list(iter_records(io.BytesIO(b"".join(chunks)), format))
+
+
+class TestMenuExport:
+    """메뉴 스트리밍 내보내기 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = MenuInfoService()
+
+    @pytest.mark.parametrize("format", ["json", "ndjson", "csv"])
+    def test_round_trip(self, db, format):
+        """내보낸 파일을 다시 읽으면 같은 메뉴가 나오는지 테스트"""
+        records = read_back(self.service.export_menu_data(db, format=format), format)
+
+        assert len(records) == 29
+        assert records[3]["menu_nm"] == '메뉴, "3"'
+        assert Decimal(str(records[3]["menu_ordr"])) == 3
+        assert records[0]["upper_menu_no"] in (None, "")
+
+    def test_json_document(self, db):
+        """JSON 문서에 메타데이터와 전체 건수가 포함되는지 테스트"""
+        document = json.loads(b"".join(self.service.export_menu_data(db, include_inactive=True)))
+
+        assert document["format"] == "json"
+        assert document["total_count"] == 30
+        assert len(document["data"]) == 30
+
+    def test_lazy_and_batched(self, db):
+        """소비하기 전에는 조회하지 않고 청크를 나눠 만드는지 테스트"""
+        chunks = self.service.export_menu_data(db, format="ndjson", batch_size=7)
+        assert db.statements == []
+
+        records = read_back(chunks, "ndjson")
+
+        selects = [sql for sql in db.statements if sql.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+        assert len(records) == 29
+
+    def test_gzip(self, db):
+        """gzip 압축 결과가 원본과 같은지 테스트"""
+        plain = b"".join(self.service.export_menu_data(db, format="csv"))
+        compressed = b"".join(self.service.export_menu_data(db, format="csv", compress=True))
+
+        assert gzip.decompress(compressed) == plain
+
+    def test_invalid_format(self, db):
+        """지원하지 않는 형식은 바로 오류를 내는지 테스트"""
+        with pytest.raises(ValueError):
+            self.service.export_menu_data(db, format="xml")
+
+    def test_chunks_bounded_by_write_size(self):
+        """청크가 쓰기 단위 근처에서 나뉘는지 테스트"""
+        records = ({"id": index, "name": "x" * 50} for index in range(1000))
+
+        chunks = list(encode_records(records, "ndjson", ["id", "name"], write_size=1024))
+
+        assert len(chunks) > 10
+        assert max(len(chunk) for chunk in chunks) < 1024 + 200
+
+
+class TestMenuExportEndpoint:
+    """메뉴 내보내기 엔드포인트 테스트 클래스"""
+
+    @pytest.fixture
+    def client(self, db):
+        app = FastAPI()
+        app.include_router(menu_router, prefix="/api/v1")
+        app.dependency_overrides[get_db] = lambda: db
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        return TestClient(app)
+
+    def test_streams_attachment(self, client, tmp_path, monkeypatch):
+        """파일을 남기지 않고 첨부 파일로 스트리밍하는지 테스트"""
+        monkeypatch.chdir(tmp_path)
+
+        response = client.get("/api/v1/menus/export/json?format=ndjson&compress=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in response.headers["content-disposition"]
+        assert len(gzip.decompress(response.content).splitlines()) == 29
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_format_returns_400(self, client):
+        """지원하지 않는 형식에 400을 반환하는지 테스트"""
+        response = client.get("/api/v1/menus/export/json?format=xml")
+
+        assert response.status_code == 400
@@ -0,0 +1,216 @@
+"""메뉴 일괄 가져오기 테스트
+
+import_menu_data가 기존 키를 한 번에 조회하고 상위 참조/순환 참조를 메모리에서
+검증한 뒤 청크 단위 UPSERT로 저장하는지, 스트리밍 리더로 큰 파일을 읽는지 테스트합니다.
+"""
+
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes.menu_router import menu_router
+from app.database import get_db
+from app.models.menu_models import MenuInfo
+from app.services.menu_service import MenuInfoService
+from app.utils import menu_tree_cache as menu_tree_cache_module
+from app.utils.auth import get_current_user_from_bearer
+from app.utils.menu_tree_cache import MenuTreeCache
+from app.utils.record_stream import iter_json_records, iter_records
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션"""
+    monkeypatch.setattr(menu_tree_cache_module, "menu_tree_cache", MenuTreeCache(ttl=0))
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    MenuInfo.__table__.create(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    session = sessionmaker(bind=engine)()
+    session.add(MenuInfo(menu_no="1", menu_nm="기존", progrm_file_nm="dir", menu_ordr=Decimal(1),
+                         display_yn="Y", menu_path="/1/", menu_depth=1))
+    session.commit()
+    statements.clear()
+
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def menu(menu_no, upper_menu_no=None, **fields):
+    """가져오기용 메뉴 데이터"""
+    data = {"menu_no": menu_no, "menu_nm": f"메뉴{menu_no}", "progrm_file_nm": "dir",
+            "upper_menu_no": upper_menu_no, "menu_ordr": 1}
+    data.update(fields)
+    return data
+
+
+def stored(db):
+    """menu_no -> MenuInfo"""
+    db.expire_all()
+    return {item.menu_no: item for item in db.query(MenuInfo).all()}
+
+
+class TestMenuImport:
+    """메뉴 일괄 가져오기 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = MenuInfoService()
+
+    def test_bulk_import_is_set_based(self, db):
+        """행 수와 관계없이 조회 한 번과 청크 단위 INSERT로 저장하는지 테스트"""
+        data = [menu(f"P{i}", "1") for i in range(25)] + [menu(f"C{i}", f"P{i}") for i in range(25)]
+
+        result = self.service.import_menu_data(db, data, chunk_size=20)
+
+        selects = [sql for sql in db.statements if sql.lstrip().upper().startswith("SELECT")]
+        inserts = [sql for sql in db.statements if sql.lstrip().upper().startswith("INSERT")]
+        assert result == {"success_count": 50, "error_count": 0, "errors": []}
+        assert len(selects) == 1
+        assert len(inserts) == 3  # 50행을 깊이순으로 20행씩
+        assert stored(db)["C7"].menu_path == "/1/P7/C7/"
+        assert int(stored(db)["C7"].menu_depth) == 3
+
+    def test_children_before_parents(self, db):
+        """상위 메뉴가 나중에 와도 가져오는지 테스트"""
+        result = self.service.import_menu_data(db, [menu("21", "2"), menu("2")])
+
+        assert result["success_count"] == 2
+        assert stored(db)["21"].menu_path == "/2/21/"
+
+    def test_existing_without_overwrite(self, db):
+        """덮어쓰기가 아니면 기존 메뉴를 오류로 보고하는지 테스트"""
+        result = self.service.import_menu_data(db, [menu("1", menu_nm="변경")])
+
+        assert result["error_count"] == 1
+        assert result["errors"] == ["메뉴 번호가 이미 존재합니다: 1"]
+        assert stored(db)["1"].menu_nm == "기존"
+
+    def test_overwrite_updates_given_fields(self, db):
+        """덮어쓰기 시 전달된 항목만 갱신하는지 테스트"""
+        result = self.service.import_menu_data(db, [{"menu_no": "1", "menu_nm": "변경"}], overwrite=True)
+
+        assert result["success_count"] == 1
+        assert stored(db)["1"].menu_nm == "변경"
+        assert stored(db)["1"].progrm_file_nm == "dir"
+
+    def test_missing_parent_cascades(self, db):
+        """상위 메뉴가 없으면 그 하위 메뉴까지 거부하는지 테스트"""
+        result = self.service.import_menu_data(db, [menu("A", "NONE"), menu("B", "A"), menu("C", "1")])
+
+        assert result["success_count"] == 1
+        assert result["error_count"] == 2
+        assert set(stored(db)) == {"1", "C"}
+
+    def test_cycle_rejected(self, db):
+        """순환 참조 행을 거부하는지 테스트"""
+        result = self.service.import_menu_data(db, [menu("X", "Y"), menu("Y", "X"), menu("1", "X")], overwrite=True)
+
+        assert result["success_count"] == 0
+        assert any("순환 참조" in error for error in result["errors"])
+        assert set(stored(db)) == {"1"}
+
+    def test_duplicate_and_invalid_rows(self, db):
+        """중복 행과 필수 항목 누락 행을 행 단위로 보고하는지 테스트"""
+        result = self.service.import_menu_data(db, [menu("D"), menu("D"), {"menu_no": "E"}, {"menu_nm": "번호 없음"}])
+
+        assert result["success_count"] == 1
+        assert result["error_count"] == 3
+
+    def test_validate_only_writes_nothing(self, db):
+        """검증만 수행하면 저장하지 않는지 테스트"""
+        result = self.service.import_menu_data(db, [menu("V", "1")], validate_only=True)
+
+        assert result["success_count"] == 1
+        assert "V" not in stored(db)
+
+    def test_csv_stream(self, db):
+        """CSV 스트림의 문자열 값을 컬럼 타입으로 변환해 가져오는지 테스트"""
+        payload = "menu_no,menu_nm,progrm_file_nm,upper_menu_no,menu_ordr,menu_dc\nS,스트림,dir,1,3,\n"
+
+        result = self.service.import_menu_data(db, iter_records(io.BytesIO(payload.encode()), "csv"))
+
+        assert result["success_count"] == 1
+        assert stored(db)["S"].menu_ordr == Decimal(3)
+        assert stored(db)["S"].menu_dc is None
+
+
+class TestRecordStream:
+    """레코드 스트림 리더 테스트 클래스"""
+
+    def test_json_array_across_read_boundaries(self):
+        """읽기 경계에 걸친 JSON 원소를 디코딩하는지 테스트"""
+        records = [menu(str(i), menu_nm=f"메뉴 {i}", menu_ordr=12345) for i in range(200)]
+        fp = io.BytesIO(json.dumps(records, ensure_ascii=False).encode())
+
+        assert list(iter_json_records(fp, read_size=7)) == records
+
+    def test_export_document(self):
+        """내보내기 문서의 data 배열만 읽는지 테스트"""
+        document = {"format": "json", "data": [menu("1"), menu("2")], "total_count": 2}
+        fp = io.BytesIO(json.dumps(document).encode())
+
+        assert [record["menu_no"] for record in iter_records(fp, "json")] == ["1", "2"]
+
+    def test_ndjson_and_errors(self):
+        """NDJSON 읽기와 형식 오류 테스트"""
+        assert list(iter_records(io.BytesIO(b'{"a": 1}\n\n{"a": 2}\n'), "ndjson")) == [{"a": 1}, {"a": 2}]
+
+        with pytest.raises(ValueError):
+            list(iter_records(io.BytesIO(b'[{"a": 1}'), "json"))
+        with pytest.raises(ValueError):
+            iter_records(io.BytesIO(b""), "xml")
+
+
+class TestMenuImportEndpoint:
+    """메뉴 파일 가져오기 엔드포인트 테스트 클래스"""
+
+    @pytest.fixture
+    def client(self, db):
+        app = FastAPI()
+        app.include_router(menu_router, prefix="/api/v1")
+        app.dependency_overrides[get_db] = lambda: db
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        return TestClient(app)
+
+    def test_stream_upload(self, client, db):
+        """업로드한 NDJSON 파일을 가져오는지 테스트"""
+        payload = "\n".join(json.dumps(menu(f"U{i}", "1")) for i in range(3))
+
+        response = client.post(
+            "/api/v1/menus/import/stream?format=ndjson",
+            files={"file": ("menus.ndjson", payload.encode(), "application/x-ndjson")}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["success_count"] == 3
+        assert {"U0", "U1", "U2"} <= set(stored(db))
+
+    def test_invalid_file_returns_400(self, client):
+        """형식 오류 파일에 400을 반환하는지 테스트"""
+        response = client.post(
+            "/api/v1/menus/import/stream?format=json",
+            files={"file": ("menus.json", b"[{", "application/json")}
+        )
+
+        assert response.status_code == 400
+
+    def test_json_body_import(self, client, db):
+        """JSON 본문 가져오기가 요청 스키마 필드명을 사용하는지 테스트"""
+        response = client.post("/api/v1/menus/import", json={"menu_data": [menu("J", "1")]})
+
+        assert response.status_code == 200
+        assert response.json()["success_count"] == 1
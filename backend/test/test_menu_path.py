@@ -0,0 +1,150 @@
+"""메뉴 구체화 경로 테스트
+
+create_menu, move_menu, update, copy_menu, import_menu_data가 menu_path/menu_depth를
+유지하는지, 경로 기반 하위 트리/깊이 조회와 정합성 검사가 동작하는지 테스트합니다.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.models.menu_models import MenuInfo
+from app.schemas.menu_schemas import MenuInfoCreate, MenuInfoUpdate
+from app.services.menu_service import MenuInfoService
+from app.utils import menu_tree_cache as menu_tree_cache_module
+from app.utils.menu_tree_cache import MenuTreeCache
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션"""
+    monkeypatch.setattr(menu_tree_cache_module, "menu_tree_cache", MenuTreeCache(ttl=0))
+
+    engine = create_engine("sqlite://").execution_options(schema_translate_map={"skybootcore": None})
+    MenuInfo.__table__.create(engine)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    session = sessionmaker(bind=engine)()
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def create(service, db, menu_no, upper_menu_no=None):
+    """테스트용 메뉴 생성"""
+    return service.create_menu(db, MenuInfoCreate(
+        menu_no=menu_no, menu_nm=f"메뉴{menu_no}", progrm_file_nm="dir",
+        upper_menu_no=upper_menu_no, menu_ordr=Decimal(1), frst_register_id="tester"
+    ))
+
+
+def paths(db):
+    """menu_no -> (menu_path, menu_depth) 맵"""
+    db.expire_all()
+    return {
+        menu.menu_no: (menu.menu_path, int(menu.menu_depth) if menu.menu_depth is not None else None)
+        for menu in db.query(MenuInfo).all()
+    }
+
+
+class TestMenuPath:
+    """메뉴 구체화 경로 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = MenuInfoService()
+
+    @pytest.fixture(autouse=True)
+    def tree(self, db):
+        """1 > 11 > 111, 2 메뉴 트리"""
+        for menu_no, upper_menu_no in [("1", None), ("11", "1"), ("111", "11"), ("2", None)]:
+            create(self.service, db, menu_no, upper_menu_no)
+        db.statements.clear()
+
+    def test_create_sets_path(self, db):
+        """생성 시 경로와 깊이가 설정되는지 테스트"""
+        assert paths(db) == {
+            "1": ("/1/", 1),
+            "11": ("/1/11/", 2),
+            "111": ("/1/11/111/", 3),
+            "2": ("/2/", 1),
+        }
+
+    def test_move_rewrites_subtree(self, db):
+        """이동 시 하위 메뉴 경로까지 한 번에 갱신되는지 테스트"""
+        self.service.move_menu(db, "11", "2")
+
+        updates = [sql for sql in db.statements if sql.lstrip().upper().startswith("UPDATE")]
+        assert len(updates) == 2  # 하위 트리 경로 일괄 갱신 + 메뉴 자신의 상위/순서
+        assert paths(db)["111"] == ("/2/11/111/", 3)
+        assert self.service.check_menu_paths(db)["mismatched"] == []
+
+    def test_move_to_root(self, db):
+        """최상위로 이동 시 깊이가 줄어드는지 테스트"""
+        self.service.move_menu(db, "11", None)
+
+        assert paths(db)["11"] == ("/11/", 1)
+        assert paths(db)["111"] == ("/11/111/", 2)
+
+    def test_update_parent_rewrites_subtree(self, db):
+        """update로 상위 메뉴를 바꿔도 경로가 갱신되는지 테스트"""
+        menu = db.query(MenuInfo).filter(MenuInfo.menu_no == "11").first()
+
+        self.service.update(db, menu, MenuInfoUpdate(upper_menu_no="2"))
+
+        assert paths(db)["11"] == ("/2/11/", 2)
+        assert paths(db)["111"] == ("/2/11/111/", 3)
+
+    def test_copy_sets_paths(self, db):
+        """복사된 메뉴 트리에 경로가 설정되는지 테스트"""
+        self.service.copy_menu(db, "11", "C11", new_parent_id="2", copy_children=True)
+
+        result = paths(db)
+        assert result["C11"] == ("/2/C11/", 2)
+        assert [value for key, value in result.items() if key.startswith("C11_")][0][1] == 3
+        assert self.service.check_menu_paths(db)["mismatched"] == []
+
+    def test_import_computes_paths(self, db):
+        """가져오기 시 상위 메뉴가 나중에 와도 경로가 계산되는지 테스트"""
+        data = [
+            {"menu_no": "31", "menu_nm": "메뉴31", "progrm_file_nm": "dir", "upper_menu_no": "3", "menu_ordr": 1},
+            {"menu_no": "3", "menu_nm": "메뉴3", "progrm_file_nm": "dir", "upper_menu_no": None, "menu_ordr": 3},
+        ]
+
+        self.service.import_menu_data(db, data)
+
+        assert paths(db)["31"] == ("/3/31/", 2)
+
+    def test_subtree_and_depth_use_path_index(self, db):
+        """하위 트리와 깊이 조회가 재귀 쿼리 없이 경로로 처리되는지 테스트"""
+        subtree = self.service.get_menu_subtree(db, "1")
+
+        assert [menu.menu_no for menu in subtree] == ["1", "11", "111"]
+        assert self.service._get_max_child_depth(db, "1") == 2
+        assert self.service._get_menu_depth(db, "111") == 2
+        assert not any("RECURSIVE" in sql.upper() for sql in db.statements)
+
+    def test_like_wildcards_are_escaped(self, db):
+        """메뉴 번호의 '_'가 LIKE 와일드카드로 해석되지 않는지 테스트"""
+        create(self.service, db, "A_1")
+        create(self.service, db, "AB1")
+        create(self.service, db, "AB1X", "AB1")
+
+        assert [menu.menu_no for menu in self.service.get_menu_subtree(db, "A_1")] == ["A_1"]
+
+    def test_check_and_fix(self, db):
+        """정합성 검사가 깨진 경로를 찾고 수정하는지 테스트"""
+        db.query(MenuInfo).filter(MenuInfo.menu_no == "111").update({"menu_path": "/x/", "menu_depth": 9})
+        db.commit()
+
+        assert self.service.check_menu_paths(db)["mismatched"] == ["111"]
+
+        result = self.service.check_menu_paths(db, fix=True)
+
+        assert result["fixed_count"] == 1
+        assert paths(db)["111"] == ("/1/11/111/", 3)
+        assert self.service.check_menu_paths(db)["mismatched"] == []
@@ -0,0 +1,98 @@
+"""메뉴 트리 구성 테스트
+
+get_menu_tree가 메뉴를 한 번의 쿼리로 조회하여 트리를 구성하고,
+실제 계층 깊이를 menu_level로 반환하는지 테스트합니다.
+"""
+
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from app.models.menu_models import MenuInfo
+from app.services.menu_service import MenuInfoService
+
+
+def make_menu(menu_no, upper_menu_no=None, menu_ordr=1, display_yn="Y"):
+    """테스트용 메뉴 객체 생성"""
+    return MenuInfo(
+        menu_no=menu_no,
+        menu_nm=f"메뉴{menu_no}",
+        progrm_file_nm="dir",
+        upper_menu_no=upper_menu_no,
+        menu_ordr=Decimal(menu_ordr),
+        display_yn=display_yn
+    )
+
+
+class TestMenuTree:
+    """메뉴 트리 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.service = MenuInfoService()
+        self.menus = [
+            make_menu("1", None, 1),
+            make_menu("2", None, 2),
+            make_menu("11", "1", 1),
+            make_menu("12", "1", 2),
+            make_menu("111", "11", 1),
+            make_menu("1111", "111", 1),
+            make_menu("13", "1", 3, display_yn="N"),
+            make_menu("131", "13", 1),
+        ]
+        self.db = Mock()
+        self.db.query.return_value.order_by.return_value.all.return_value = self.menus
+
+    def test_tree_is_built_from_single_query(self):
+        """전체 트리를 쿼리 한 번으로 구성하는지 테스트"""
+        tree = self.service.get_menu_tree(self.db)
+
+        assert self.db.query.call_count == 1
+        assert [node["menu_no"] for node in tree] == ["1", "2"]
+        assert [node["menu_no"] for node in tree[0]["children"]] == ["11", "12"]
+        assert tree[0]["children"][0]["children"][0]["children"][0]["menu_no"] == "1111"
+
+    def test_menu_level_is_real_depth(self):
+        """menu_level이 실제 계층 깊이인지 테스트"""
+        tree = self.service.get_menu_tree(self.db)
+
+        level_1 = tree[0]
+        level_3 = level_1["children"][0]["children"][0]
+        level_4 = level_3["children"][0]
+
+        assert level_1["menu_level"] == Decimal(1)
+        assert level_3["menu_level"] == Decimal(3)
+        assert level_4["menu_level"] == Decimal(4)
+        assert level_4["leaf_at"] == "Y"
+        assert level_1["leaf_at"] == "N"
+
+    def test_hidden_menus_and_their_children_are_excluded(self):
+        """표시 여부가 다른 메뉴와 그 하위 메뉴가 제외되는지 테스트"""
+        tree = self.service.get_menu_tree(self.db)
+
+        assert "13" not in [node["menu_no"] for node in tree[0]["children"]]
+
+        hidden_tree = self.service.get_menu_tree(self.db, use_at="N")
+        assert hidden_tree == []
+
+    def test_subtree_keeps_real_depth(self):
+        """상위 메뉴를 지정한 하위 트리도 실제 깊이를 유지하는지 테스트"""
+        subtree = self.service.get_menu_tree(self.db, parent_menu_id="11")
+
+        assert [node["menu_no"] for node in subtree] == ["111"]
+        assert subtree[0]["menu_level"] == Decimal(3)
+        assert subtree[0]["children"][0]["menu_level"] == Decimal(4)
+
+    def test_cyclic_data_does_not_recurse_forever(self):
+        """순환 참조 데이터에서도 트리 구성이 종료되는지 테스트"""
+        self.db.query.return_value.order_by.return_value.all.return_value = [
+            make_menu("A", "B"),
+            make_menu("B", "A"),
+        ]
+
+        assert self.service.get_menu_tree(self.db, parent_menu_id="A")[0]["menu_no"] == "B"
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,216 @@
+"""메뉴 트리 캐시 테스트
+
+버전 기반 무효화, 메뉴 변경 시 캐시 무효화, ETag/304 응답,
+Redis pub/sub을 통한 워커 간 무효화 전파를 테스트합니다.
+"""
+
+import asyncio
+import json
+import warnings
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock, patch
+
+import fakeredis
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes.menu_router import menu_router
+from app.database import get_async_db
+from app.models.menu_models import MenuInfo
+from app.services.menu_service import MenuInfoService
+from app.utils import menu_tree_cache as menu_tree_cache_module
+from app.utils.menu_tree_cache import MenuTreeCache
+
+
+def make_menu(menu_no, upper_menu_no=None, menu_ordr=1):
+    """테스트용 메뉴 객체 생성"""
+    return MenuInfo(
+        menu_no=menu_no,
+        menu_nm=f"메뉴{menu_no}",
+        progrm_file_nm="dir",
+        upper_menu_no=upper_menu_no,
+        menu_ordr=Decimal(menu_ordr),
+        display_yn="Y"
+    )
+
+
+class TestMenuTreeCache:
+    """메뉴 트리 캐시 테스트 클래스"""
+
+    def test_bump_invalidates_entries(self):
+        """bump() 후 기존 항목이 무효화되는지 테스트"""
+        cache = MenuTreeCache(ttl=60)
+        cache.set("Y", cache.version, [], b"[]")
+        assert cache.get("Y") is not None
+
+        cache.bump()
+
+        assert cache.get("Y") is None
+
+    def test_stale_build_is_not_stored(self):
+        """조회 도중 버전이 바뀌면 오래된 트리를 저장하지 않는지 테스트"""
+        cache = MenuTreeCache(ttl=60)
+        version = cache.version
+        cache.bump()
+
+        cache.set("Y", version, [], b"[]")
+
+        assert cache.get("Y") is None
+
+    def test_etag_follows_body(self):
+        """같은 본문은 같은 ETag, 다른 본문은 다른 ETag를 갖는지 테스트"""
+        cache = MenuTreeCache(ttl=60)
+
+        first = cache.set("Y", cache.version, [], b"[1]")
+        same = cache.set("N", cache.version, [], b"[1]")
+        other = cache.set("Y", cache.version, [], b"[2]")
+
+        assert first.etag == same.etag
+        assert first.etag != other.etag
+
+    def test_redis_invalidation_reaches_other_worker(self):
+        """한 워커의 bump()가 Redis 채널을 통해 다른 워커 캐시를 무효화하는지 테스트"""
+        server = fakeredis.FakeServer()
+
+        async def scenario():
+            worker_a = MenuTreeCache(ttl=60, redis_url="redis://fake")
+            worker_b = MenuTreeCache(ttl=60, redis_url="redis://fake")
+            with patch("redis.asyncio.from_url", lambda url: fakeredis.aioredis.FakeRedis(server=server)), \
+                    patch("redis.Redis.from_url", lambda url, **kwargs: fakeredis.FakeRedis(server=server)):
+                await worker_b.start()
+                for _ in range(50):
+                    await asyncio.sleep(0.01)
+                    if worker_b.version > 0:
+                        break
+                worker_b.set("Y", worker_b.version, [], b"[]")
+                assert worker_b.get("Y") is not None
+
+                worker_a.bump()
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if worker_b.get("Y") is None:
+                        break
+                invalidated = worker_b.get("Y") is None
+
+                await worker_b.stop()
+                await worker_a.stop()
+            return invalidated
+
+        assert asyncio.run(scenario()) is True
+
+
+class TestMenuTreeCacheService:
+    """메뉴 서비스 캐시 연동 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.cache = MenuTreeCache(ttl=60)
+        self.patcher = patch.object(menu_tree_cache_module, "menu_tree_cache", self.cache)
+        self.patcher.start()
+        self.service = MenuInfoService()
+        self.db = Mock()
+        self.db.query.return_value.order_by.return_value.all.return_value = [
+            make_menu("1"), make_menu("11", "1")
+        ]
+
+    def teardown_method(self):
+        """테스트 메서드 실행 후 정리"""
+        self.patcher.stop()
+
+    def test_second_call_uses_cache(self):
+        """두 번째 조회는 DB를 조회하지 않는지 테스트"""
+        first = self.service.get_cached_menu_tree(self.db)
+        second = self.service.get_cached_menu_tree(self.db)
+
+        assert self.db.query.call_count == 1
+        assert second is first
+        assert json.loads(first.body)[0]["children"][0]["menu_id"] == "11"
+
+    def test_soft_delete_invalidates_cache(self):
+        """메뉴 삭제 후 트리를 다시 조회하는지 테스트"""
+        self.service.get_cached_menu_tree(self.db)
+        self.db.query.return_value.filter.return_value.first.return_value = make_menu("11", "1")
+
+        self.service.soft_delete(self.db, "11", "admin")
+        self.service.get_cached_menu_tree(self.db)
+
+        assert self.db.query.return_value.order_by.return_value.all.call_count == 2
+
+    def test_update_menu_order_invalidates_cache(self):
+        """메뉴 순서 변경 시 캐시 버전이 올라가는지 테스트"""
+        version = self.cache.version
+
+        self.service.update_menu_order(self.db, [{"menu_no": "1", "menu_ordr": 2}])
+
+        assert self.cache.version == version + 1
+
+
+class TestMenuTreeEndpoint:
+    """메뉴 트리 엔드포인트 ETag 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.cache = MenuTreeCache(ttl=60)
+        self.patcher = patch.object(menu_tree_cache_module, "menu_tree_cache", self.cache)
+        self.patcher.start()
+
+        self.db = Mock()
+        self.db.scalars = AsyncMock(return_value=Mock())
+        self.db.scalars.return_value.all.return_value = [make_menu("1"), make_menu("11", "1")]
+        app = FastAPI()
+        app.include_router(menu_router, prefix="/api/v1")
+        app.dependency_overrides[get_async_db] = lambda: self.db
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        """테스트 메서드 실행 후 정리"""
+        self.patcher.stop()
+
+    def test_public_tree_returns_etag_and_304(self):
+        """ETag 응답 후 If-None-Match 요청에 304를 반환하는지 테스트"""
+        response = self.client.get("/api/v1/menus/tree/public")
+        etag = response.headers["etag"]
+
+        not_modified = self.client.get("/api/v1/menus/tree/public", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()[0]["menu_id"] == "1"
+        assert response.json()[0]["menu_level"] == "1"
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert self.db.scalars.await_count == 1
+
+    def test_tree_body_matches_response_model(self):
+        """캐시된 본문이 MenuTreeNode 필드만 포함하는지 테스트"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            response = self.client.get("/api/v1/menus/tree/public")
+
+        node = response.json()[0]
+        assert set(node) == {"menu_id", "menu_nm", "menu_level", "menu_ordr", "leaf_at", "children"}
+        assert set(node["children"][0]) == set(node)
+
+    def test_invalid_use_at_is_rejected_without_caching(self):
+        """Y/N가 아닌 use_at은 422로 거부하고 캐시 항목을 만들지 않는지 테스트"""
+        for value in ("a1", "a2", "YY"):
+            assert self.client.get("/api/v1/menus/tree/public", params={"use_at": value}).status_code == 422
+
+        assert self.cache._entries == {}
+        assert self.db.scalars.await_count == 0
+
+    def test_etag_changes_after_mutation(self):
+        """메뉴 변경 후 이전 ETag로 요청하면 새 트리를 반환하는지 테스트"""
+        etag = self.client.get("/api/v1/menus/tree/public").headers["etag"]
+        self.db.scalars.return_value.all.return_value = [make_menu("1")]
+
+        self.cache.bump()
+        response = self.client.get("/api/v1/menus/tree/public", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()[0]["children"] == []
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
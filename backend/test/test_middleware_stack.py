@@ -0,0 +1,111 @@
+"""ASGI 미들웨어 스택 테스트
+
+main.py와 동일한 순서로 쌓은 미들웨어가 인증, 요청 본문 재전달,
+응답 헤더 추가, 스트리밍 응답 전달을 올바르게 수행하는지 테스트합니다.
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.api_usage_middleware import APIUsageMiddleware
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.logging_middleware import LoggingMiddleware, RequestSizeMiddleware
+from app.middleware.security import APIKeyMiddleware, SecurityMiddleware
+from app.utils.api_log_writer import get_api_log_writer
+
+
+class TestMiddlewareStack:
+    """미들웨어 스택 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        self.saved_logs = []
+        writer = get_api_log_writer()
+        self.original_write_batch = writer._write_batch
+        writer._write_batch = lambda batch: self.saved_logs.extend(batch)
+
+        app = FastAPI()
+
+        @app.get("/health")
+        async def health_check():
+            return {"status": "healthy"}
+
+        @app.post("/health")
+        async def echo(request: Request):
+            return await request.json()
+
+        @app.get("/static/stream")
+        async def stream():
+            async def chunks():
+                for index in range(3):
+                    yield f"chunk-{index};".encode()
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        @app.get("/api/v1/protected")
+        async def protected():
+            return {"ok": True}
+
+        app.add_middleware(RequestSizeMiddleware, max_size=1024)
+        app.add_middleware(APIUsageMiddleware)
+        app.add_middleware(AuthMiddleware)
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(APIKeyMiddleware, api_keys=["test-key"], exempt_paths=["/health", "/static/"])
+        app.add_middleware(SecurityMiddleware, rate_limit_requests=5, rate_limit_window=60)
+
+        # TestClient의 기본 클라이언트 주소("testclient")는 IP 형식이 아니므로 지정
+        self.client = TestClient(app, headers={"X-Forwarded-For": "127.0.0.1"})
+
+    def teardown_method(self):
+        """테스트 메서드 실행 후 정리"""
+        get_api_log_writer()._write_batch = self.original_write_batch
+
+    def test_health_passes_through_stack(self):
+        """공개 경로 요청 시 처리 시간/보안 헤더 추가 및 API 로그 기록 테스트"""
+        response = self.client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
+        assert "x-process-time" in response.headers
+        assert response.headers["x-frame-options"] == "DENY"
+        assert self.saved_logs[-1]["endpoint"] == "/health"
+        assert self.saved_logs[-1]["response_status"] == 200
+
+    def test_request_body_is_replayed(self):
+        """API 로그용으로 읽은 요청 본문이 엔드포인트에 그대로 전달되는지 테스트"""
+        response = self.client.post("/health", json={"user_id": "admin", "password": "secret"})
+
+        assert response.status_code == 200
+        assert response.json() == {"user_id": "admin", "password": "secret"}
+        assert "secret" not in self.saved_logs[-1]["request_body"]
+
+    def test_streaming_response_is_not_buffered(self):
+        """스트리밍 응답이 청크 단위로 전달되는지 테스트"""
+        with self.client.stream("GET", "/static/stream") as response:
+            chunks = list(response.iter_bytes())
+
+        assert response.status_code == 200
+        assert b"".join(chunks) == b"chunk-0;chunk-1;chunk-2;"
+
+    def test_protected_path_requires_api_key_and_token(self):
+        """보호 경로에서 API 키와 인증 토큰 누락 시 거부되는지 테스트"""
+        no_key = self.client.get("/api/v1/protected")
+        no_token = self.client.get("/api/v1/protected", headers={"X-API-Key": "test-key"})
+
+        assert no_key.status_code == 401
+        assert no_key.json() == {"detail": "Invalid API key"}
+        assert no_token.status_code == 401
+        assert no_token.json()["error"] == "Authorization header missing"
+
+    def test_request_size_and_rate_limit(self):
+        """요청 크기 제한과 rate limit 초과 시 응답 코드 테스트"""
+        too_large = self.client.post("/health", content=b"x" * 2048)
+        assert too_large.status_code == 413
+
+        statuses = [self.client.get("/health").status_code for _ in range(5)]
+        assert statuses[-1] == 429
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
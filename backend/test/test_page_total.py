@@ -0,0 +1,228 @@
+"""목록 전체 개수(total) 산출 전략 테스트
+
+exact/capped/none 전략의 쿼리 형태와 결과, 조회 조건별 개수 캐시,
+PostgreSQL 추정치 경로와 다른 DB에서의 exact 대체, 목록 엔드포인트 응답 필드를 테스트합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.routes.log_router import log_router
+from app.database import get_db
+from app.models.board_models import Bbs
+from app.models.log_models import LoginLog
+from app.schemas.log_schemas import LoginLogSearchParams
+from app.services.board_service import BbsService
+from app.services.log_service import LoginLogService
+from app.utils.auth import get_current_user_from_bearer
+from app.utils.page_total import (
+    TOTAL_CAPPED, TOTAL_ESTIMATED, TOTAL_EXACT, TOTAL_NONE,
+    estimated_count, page_count_cache, resolve_total
+)
+
+BASE_TIME = datetime(2025, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture
+def db():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션 (로그인 로그 12건)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    LoginLog.__table__.create(engine)
+    page_count_cache.clear()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    session = sessionmaker(bind=engine)()
+    for index in range(1, 13):
+        session.add(LoginLog(
+            log_id=f"L{index:03d}", conect_id="admin" if index % 3 else "user",
+            error_occrrnc_at="N", frst_regist_pnttm=BASE_TIME + timedelta(minutes=index)
+        ))
+    session.commit()
+
+    session.statements = statements
+    yield session
+    session.close()
+    page_count_cache.clear()
+
+
+class TestResolveTotal:
+    """전략별 전체 개수 산출 테스트 클래스"""
+
+    def test_exact_counts_without_subquery(self, db):
+        """exact는 목록 조건 그대로 서브쿼리 없이 COUNT하는지 테스트"""
+        page_total = LoginLogService().count_total(db, TOTAL_EXACT, filters={"conect_id": "admin"})
+
+        assert (page_total.total, page_total.total_type) == (8, TOTAL_EXACT)
+        assert page_total.pages(5) == 2
+        assert db.statements[-1].lower().startswith("select count(*) as count_1")
+        assert "(select" not in db.statements[-1].lower()
+
+    def test_capped_stops_at_cap(self, db):
+        """capped는 cap을 넘으면 상한만, 넘지 않으면 정확한 개수를 반환하는지 테스트"""
+        service = LoginLogService()
+
+        over = service.count_total(db, TOTAL_CAPPED, cap=5)
+        under = service.count_total(db, TOTAL_CAPPED, filters={"conect_id": "user"}, cap=5)
+
+        assert (over.total, over.total_type) == (5, TOTAL_CAPPED)
+        assert (under.total, under.total_type) == (4, TOTAL_EXACT)
+        assert "limit" in db.statements[-1].lower()
+
+    def test_none_skips_query(self, db):
+        """none은 쿼리를 실행하지 않는지 테스트"""
+        db.statements.clear()
+
+        page_total = LoginLogService().count_total(db, TOTAL_NONE)
+
+        assert page_total.total is None and page_total.pages(10) is None
+        assert db.statements == []
+
+    def test_cache_is_keyed_by_filters(self, db):
+        """같은 조건은 캐시에서, 다른 조건은 새로 세는지 테스트"""
+        service = LoginLogService()
+        service.count_total(db, TOTAL_EXACT, filters={"conect_id": "admin"})
+        db.statements.clear()
+
+        cached = service.count_total(db, TOTAL_EXACT, filters={"conect_id": "admin"})
+        assert cached.total == 8 and db.statements == []
+
+        other = service.count_total(db, TOTAL_EXACT, filters={"conect_id": "user"})
+        assert other.total == 4 and len(db.statements) == 1
+
+    def test_estimated_falls_back_to_exact(self, db):
+        """PostgreSQL이 아니면 추정 대신 정확한 개수를 반환하는지 테스트"""
+        page_total = resolve_total(db, select(LoginLog), TOTAL_ESTIMATED)
+
+        assert (page_total.total, page_total.total_type) == (12, TOTAL_EXACT)
+
+    def test_unknown_strategy(self, db):
+        """지원하지 않는 전략은 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            resolve_total(db, select(LoginLog), "approximate")
+
+    def test_async_count_posts(self):
+        """게시글 개수를 목록과 같은 조건(게시판/삭제 여부)으로 세는지 테스트"""
+        async def main():
+            engine = create_async_engine(
+                "sqlite+aiosqlite://", poolclass=StaticPool
+            ).execution_options(schema_translate_map={"skybootcore": None})
+            async with engine.begin() as conn:
+                await conn.run_sync(Bbs.__table__.create)
+            try:
+                async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                    for index in range(1, 8):
+                        session.add(Bbs(
+                            ntt_id=Decimal(index), bbs_id="notice" if index != 4 else "free",
+                            ntt_sj=f"제목{index}", delete_at="Y" if index == 6 else "N", frst_register_id="admin"
+                        ))
+                    await session.commit()
+                    return await BbsService().count_posts_async(session, bbs_id="notice", strategy=TOTAL_CAPPED)
+            finally:
+                await engine.dispose()
+
+        page_total = asyncio.run(main())
+
+        assert (page_total.total, page_total.total_type) == (5, TOTAL_EXACT)
+
+
+class TestEstimatedCount:
+    """PostgreSQL 추정치 테스트 클래스"""
+
+    def _postgres_session(self):
+        session = MagicMock()
+        session.connection.return_value.dialect = postgresql.dialect()
+        # SAVEPOINT 블록은 예외를 삼키지 않음
+        session.begin_nested.return_value.__exit__.return_value = False
+        return session
+
+    def test_uses_reltuples_without_conditions(self):
+        """조건이 없으면 pg_class.reltuples를 사용하는지 테스트"""
+        session = self._postgres_session()
+        session.scalar.return_value = 123456
+
+        assert estimated_count(session, select(LoginLog)) == 123456
+        query, params = session.scalar.call_args.args
+        assert "pg_class" in str(query)
+        assert params == {"name": "skybootcore.tb_loginlog"}
+
+    def test_uses_explain_with_conditions(self):
+        """조건이 있으면 EXPLAIN 예상 행 수를 사용하는지 테스트"""
+        session = self._postgres_session()
+        connection = session.connection.return_value
+        connection.exec_driver_sql.return_value.scalar.return_value = [{"Plan": {"Plan Rows": 42}}]
+
+        stmt = select(LoginLog).where(LoginLog.conect_id == "admin")
+
+        assert estimated_count(session, stmt) == 42
+        sql, params = connection.exec_driver_sql.call_args.args
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "admin" in params.values()
+
+    def test_failed_probe_rolls_back_savepoint(self):
+        """EXPLAIN이 실패하면 SAVEPOINT만 되돌리고 None을 반환하는지 테스트"""
+        session = self._postgres_session()
+        connection = session.connection.return_value
+        connection.exec_driver_sql.side_effect = OperationalError("EXPLAIN", {}, Exception("canceling statement"))
+        savepoint = session.begin_nested.return_value
+
+        stmt = select(LoginLog).where(LoginLog.conect_id == "admin")
+
+        assert estimated_count(session, stmt) is None
+        session.begin_nested.assert_called_once()
+        exc_type = savepoint.__exit__.call_args.args[0]
+        assert exc_type is OperationalError
+
+
+class TestLoginLogListEndpoint:
+    """로그인 로그 목록 엔드포인트 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        app = FastAPI()
+        app.include_router(log_router)
+        app.dependency_overrides[get_current_user_from_bearer] = lambda: {"user_id": "admin"}
+        self.app = app
+
+    def test_total_modes(self, db):
+        """total_mode별 total/total_type/pages/has_more 응답을 테스트"""
+        self.app.dependency_overrides[get_db] = lambda: db
+        client = TestClient(self.app)
+
+        default = client.get("/logs/", params={"limit": 5, "user_id": "admin"}).json()
+        omitted = client.get("/logs/", params={"limit": 5, "total_mode": "none"}).json()
+        invalid = client.get("/logs/", params={"total_mode": "approximate"})
+
+        assert (default["total"], default["total_type"], default["pages"]) == (8, "exact", 2)
+        assert default["has_more"] is True
+        assert omitted["total"] is None and omitted["pages"] is None
+        assert omitted["total_type"] == "none" and omitted["has_more"] is True
+        assert invalid.status_code == 422
+
+    def test_filtered_count_matches_search(self, db):
+        """전체 개수가 목록과 같은 검색 조건으로 계산되는지 테스트"""
+        service = LoginLogService()
+        params = LoginLogSearchParams(login_id="user")
+
+        logs, _ = service.search_logs_page(db, params, limit=100)
+
+        assert service.count_logs(db, params).total == len(logs) == 4
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
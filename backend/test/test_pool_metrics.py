@@ -0,0 +1,156 @@
+"""커넥션 풀 계측 테스트
+
+PoolMetrics가 체크아웃/체크인/대기 시간을 집계하고, 유휴 연결만 핑하며,
+환경 변수로 풀 설정을 바꿀 수 있는지 테스트합니다.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, exc, text
+
+from app.database.database import _idle_ping_seconds, get_engine_options
+from app.database.pool_metrics import Histogram, InstrumentedQueuePool, PoolMetrics
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """InstrumentedQueuePool을 사용하는 SQLite 파일 엔진"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool, pool_size=2, max_overflow=1, pool_timeout=0.05
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestPoolMetrics:
+    """커넥션 풀 계측 테스트 클래스"""
+
+    def test_checkout_and_checkin(self, engine):
+        """체크아웃/체크인 횟수와 사용 중 연결 수를 집계하는지 테스트"""
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            assert metrics.get_stats()["in_use"] == 2
+            assert metrics.get_stats()["pool"]["checked_out"] == 2
+
+        stats = metrics.get_stats()
+        assert stats["connects"] == 2
+        assert stats["checkouts"] == 2
+        assert stats["in_use"] == 0
+        assert stats["max_in_use"] == 2
+        assert stats["wait_seconds"]["count"] == 2
+        assert stats["checkout_seconds"]["count"] == 2
+
+    def test_timeout_counted(self, engine):
+        """풀이 가득 차 대기 시간을 넘기면 횟수를 기록하는지 테스트"""
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+
+        connections = [engine.connect() for _ in range(3)]
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        for connection in connections:
+            connection.close()
+
+        stats = metrics.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["wait_seconds"]["buckets"]["+Inf"] == 4
+        assert stats["wait_seconds"]["max"] >= 0.05
+
+    def test_metrics_survive_dispose(self, engine):
+        """dispose로 풀을 다시 만들어도 계측이 유지되는지 테스트"""
+        metrics = PoolMetrics()
+        metrics.attach(engine)
+
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert metrics.get_stats()["wait_seconds"]["count"] == 1
+        assert metrics.get_stats()["checkouts"] == 1
+
+    def test_idle_ping_only_after_idle(self, engine, monkeypatch):
+        """유휴 시간이 지난 연결만 핑하는지 테스트"""
+        metrics = PoolMetrics(idle_ping_seconds=10)
+        metrics.attach(engine)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        clock = [1000.0]
+        monkeypatch.setattr("app.database.pool_metrics.time.monotonic", lambda: clock[0])
+
+        with engine.connect():
+            pass
+        clock[0] += 5
+        with engine.connect():
+            pass
+        assert metrics.get_stats()["pings"] == 0
+
+        clock[0] += 11
+        with engine.connect():
+            pass
+        assert metrics.get_stats()["pings"] == 1
+        assert statements == []  # 핑은 DBAPI 커서로 직접 실행
+
+    def test_histogram_buckets(self):
+        """히스토그램이 누적 구간으로 집계되는지 테스트"""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot["buckets"] == {"0.1": 2, "1": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["max"] == 3.0
+
+
+class TestEngineOptions:
+    """엔진 설정 테스트 클래스"""
+
+    def test_defaults(self, monkeypatch):
+        """기본 설정은 매 체크아웃 핑을 끄는지 테스트"""
+        for name in ("DB_POOL_SIZE", "DB_POOL_PRE_PING", "DB_STATEMENT_TIMEOUT_MS"):
+            monkeypatch.delenv(name, raising=False)
+
+        options = get_engine_options("postgresql://localhost/db")
+
+        assert options["pool_size"] == 5
+        assert options["pool_pre_ping"] is False
+        assert "connect_args" not in options
+
+    def test_from_env(self, monkeypatch):
+        """환경 변수로 풀 크기, 핑 방식, 문장 타임아웃을 설정하는지 테스트"""
+        monkeypatch.setenv("DB_POOL_SIZE", "12")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "3")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "always")
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+
+        options = get_engine_options("postgresql://localhost/db")
+
+        assert options["pool_size"] == 12
+        assert options["max_overflow"] == 3
+        assert options["pool_pre_ping"] is True
+        assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    @pytest.mark.parametrize("value, pre_ping", [("true", True), ("TRUE", True), ("false", False)])
+    def test_legacy_pre_ping(self, monkeypatch, value, pre_ping):
+        """이전 설정값 true/false를 always/off로 읽는지 테스트"""
+        monkeypatch.setenv("DB_POOL_PRE_PING", value)
+
+        assert get_engine_options("postgresql://localhost/db")["pool_pre_ping"] is pre_ping
+        assert _idle_ping_seconds() == 0.0
+
+    def test_invalid_pre_ping(self, monkeypatch, caplog):
+        """알 수 없는 핑 방식은 경고 후 idle로 처리하는지 테스트"""
+        monkeypatch.setenv("DB_POOL_PRE_PING", "sometimes")
+        monkeypatch.setenv("DB_POOL_PING_IDLE_SECONDS", "45")
+
+        options = get_engine_options("postgresql://localhost/db")
+
+        assert options["pool_pre_ping"] is False
+        assert _idle_ping_seconds() == 45.0
+        assert "DB_POOL_PRE_PING" in caplog.text
@@ -0,0 +1,119 @@
+"""로그/게시판 인덱스와 실행 계획 점검 테스트
+
+마이그레이션의 인덱스 정의가 모델과 일치하는지, 순차 스캔 탐지와
+서비스 호출 중 실행된 SELECT 문 수집이 동작하는지 테스트합니다.
+"""
+
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.database import Base
+from app.database.query_advisor import analyze_catalog, capture_statements, find_seq_scans
+from app.models.log_models import LoginLog
+from app.schemas.log_schemas import LoginLogSearchParams
+from app.services.log_service import LoginLogService
+
+MIGRATION = Path(__file__).parent.parent / "migrations" / "versions" / "d5f3b8e21c47_add_log_and_board_query_indexes.py"
+
+
+@pytest.fixture
+def db():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB 세션"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    LoginLog.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(LoginLog(log_id="L001", conect_id="admin", error_occrrnc_at="N", frst_regist_pnttm=datetime(2025, 1, 1)))
+    session.commit()
+    yield session
+    session.close()
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("index_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestQueryIndexes:
+    """인덱스 정의 테스트 클래스"""
+
+    def test_migration_matches_models(self):
+        """마이그레이션과 모델의 인덱스 이름/컬럼/부분 조건이 같은지 테스트"""
+        model_indexes = {
+            index.name: index
+            for table in Base.metadata.tables.values()
+            for index in table.indexes
+        }
+
+        for name, table, columns, options in load_migration().INDEXES:
+            index = model_indexes[name]
+            assert index.table.name == table
+            assert [getattr(expr, "name", str(expr)) for expr in index.expressions] == [str(column) for column in columns]
+            assert str(index.dialect_options["postgresql"]["where"]) == str(options.get("postgresql_where"))
+
+    def test_indexes_are_created(self, db):
+        """SQLite에서도 로그 테이블 인덱스가 생성되는지 테스트"""
+        names = {index["name"] for index in inspect(db.get_bind()).get_indexes("tb_loginlog")}
+
+        assert {"ix_loginlog_01", "ix_loginlog_02", "ix_loginlog_03", "ix_loginlog_04"} <= names
+
+
+class TestQueryAdvisor:
+    """실행 계획 점검 테스트 클래스"""
+
+    def test_find_seq_scans(self):
+        """중첩된 계획에서 순차 스캔을 찾고 작은 스캔은 제외하는지 테스트"""
+        plan = {"Plan": {
+            "Node Type": "Limit",
+            "Plans": [{
+                "Node Type": "Nested Loop",
+                "Plans": [
+                    {
+                        "Node Type": "Seq Scan", "Schema": "skybootcore", "Relation Name": "tb_loginlog",
+                        "Actual Rows": 10, "Rows Removed by Filter": 9990, "Actual Loops": 1,
+                        "Filter": "((error_occrrnc_at)::text = 'Y'::text)"
+                    },
+                    {
+                        "Node Type": "Seq Scan", "Schema": "skybootcore", "Relation Name": "tb_cmmncode",
+                        "Actual Rows": 5, "Actual Loops": 10
+                    },
+                    {"Node Type": "Index Scan", "Relation Name": "tb_userinfo", "Actual Rows": 1}
+                ]
+            }]
+        }}
+
+        scans = find_seq_scans(plan)
+        assert [scan["relation"] for scan in scans] == ["skybootcore.tb_loginlog", "skybootcore.tb_cmmncode"]
+        assert scans[0]["rows_scanned"] == 10000 and scans[0]["rows_returned"] == 10
+        assert scans[1]["rows_scanned"] == 50
+
+        assert [scan["relation"] for scan in find_seq_scans(plan, min_rows=1000)] == ["skybootcore.tb_loginlog"]
+
+    def test_capture_statements(self, db):
+        """서비스 호출 중 실행된 SELECT 문과 파라미터를 수집하는지 테스트"""
+        params = LoginLogSearchParams(login_id="admin")
+
+        statements = capture_statements(db, lambda session: LoginLogService().search_logs_page(session, params, limit=10))
+
+        assert len(statements) == 1
+        statement, parameters = statements[0]
+        assert statement.startswith("SELECT") and "tb_loginlog" in statement
+        assert "admin" in parameters
+
+    def test_requires_postgresql(self, db):
+        """PostgreSQL이 아니면 점검을 거부하는지 테스트"""
+        with pytest.raises(RuntimeError):
+            analyze_catalog(db)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,131 @@
+"""Rate limit 백엔드 테스트
+
+메모리 GCRA 백엔드의 한도/회복/유휴 키 정리와, fakeredis를 사용한
+Redis sliding window 백엔드의 워커 간 한도 공유를 테스트합니다.
+"""
+
+import asyncio
+
+import pytest
+import fakeredis
+from fakeredis import aioredis
+
+from app.middleware.rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RedisRateLimitBackend,
+    create_rate_limit_backend
+)
+
+
+class TestInMemoryRateLimitBackend:
+    """메모리 rate limit 백엔드 테스트 클래스"""
+
+    def test_allows_burst_up_to_limit(self):
+        """윈도우 내 limit건까지 허용하고 이후 거부하는지 테스트"""
+        backend = InMemoryRateLimitBackend(limit=3, window=60)
+
+        results = [backend.hit_at("10.0.0.1", 1000.0) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    def test_recovers_one_request_per_interval(self):
+        """window/limit 간격마다 한 건씩 회복되는지 테스트"""
+        backend = InMemoryRateLimitBackend(limit=3, window=60)
+        for _ in range(3):
+            backend.hit_at("10.0.0.1", 1000.0)
+
+        assert backend.hit_at("10.0.0.1", 1010.0) is False
+        assert backend.hit_at("10.0.0.1", 1020.0) is True
+        assert backend.hit_at("10.0.0.1", 1020.0) is False
+
+    def test_keys_are_independent(self):
+        """클라이언트 키별로 한도가 분리되는지 테스트"""
+        backend = InMemoryRateLimitBackend(limit=1, window=60)
+
+        assert backend.hit_at("10.0.0.1", 1000.0) is True
+        assert backend.hit_at("10.0.0.2", 1000.0) is True
+        assert backend.hit_at("10.0.0.1", 1000.0) is False
+
+    def test_idle_keys_are_evicted(self):
+        """한도가 회복된 유휴 키가 정리되는지 테스트"""
+        backend = InMemoryRateLimitBackend(limit=10, window=60)
+        backend._next_sweep = 1060.0
+        for index in range(100):
+            backend.hit_at(f"10.0.{index // 256}.{index % 256}", 1000.0)
+        assert len(backend) == 100
+
+        backend.hit_at("10.1.0.1", 1100.0)
+
+        assert len(backend) == 1
+
+    def test_active_keys_are_capped_with_lru_eviction(self):
+        """모든 키가 사용 중이어도 max_keys를 넘지 않고 가장 오래된 키부터 제거하는지 테스트"""
+        backend = InMemoryRateLimitBackend(limit=1, window=60, max_keys=3)
+        backend._next_sweep = 2000.0
+        for index in range(3):
+            backend.hit_at(f"10.0.0.{index}", 1000.0)
+        # 10.0.0.0을 최근 사용으로 갱신 (한도 초과라 거부되어도 사용으로 간주)
+        assert backend.hit_at("10.0.0.0", 1000.0) is False
+
+        assert backend.hit_at("10.0.0.9", 1000.0) is True
+
+        assert len(backend) == 3
+        assert backend.evicted_count == 1
+        # 가장 오래된 10.0.0.1이 제거되어 한도가 새로 시작, 10.0.0.0은 유지
+        assert backend.hit_at("10.0.0.0", 1000.0) is False
+        assert backend.hit_at("10.0.0.1", 1000.0) is True
+
+    def test_base_backend_is_abstract(self):
+        """hit()을 구현하지 않은 백엔드는 생성할 수 없는지 테스트"""
+        with pytest.raises(TypeError):
+            RateLimitBackend(limit=1, window=60)
+
+
+class TestRedisRateLimitBackend:
+    """Redis rate limit 백엔드 테스트 클래스"""
+
+    def test_limit_is_shared_between_workers(self):
+        """같은 Redis를 사용하는 두 워커가 한도를 공유하는지 테스트"""
+        async def scenario():
+            server = fakeredis.FakeServer()
+            worker_a = RedisRateLimitBackend(aioredis.FakeRedis(server=server), limit=4, window=60)
+            worker_b = RedisRateLimitBackend(aioredis.FakeRedis(server=server), limit=4, window=60)
+
+            results = []
+            for _ in range(3):
+                results.append(await worker_a.hit("10.0.0.1"))
+                results.append(await worker_b.hit("10.0.0.1"))
+            other = await worker_b.hit("10.0.0.2")
+            ttl = await worker_a.redis.pttl("skyboot:ratelimit:10.0.0.1")
+            return results, other, ttl
+
+        results, other, ttl = asyncio.run(scenario())
+
+        assert results == [True, True, True, True, False, False]
+        assert other is True
+        assert 0 < ttl <= 60000
+
+    def test_falls_back_to_memory_on_redis_error(self):
+        """Redis 오류 시 로컬 백엔드로 대체되는지 테스트"""
+        async def scenario():
+            client = aioredis.FakeRedis()
+            backend = RedisRateLimitBackend(client, limit=1, window=60)
+
+            async def broken_script(*args, **kwargs):
+                raise ConnectionError("redis down")
+
+            backend._script = broken_script
+            return [await backend.hit("10.0.0.1") for _ in range(2)]
+
+        assert asyncio.run(scenario()) == [True, False]
+
+    def test_factory_without_redis_url_uses_memory(self):
+        """REDIS_URL이 없으면 메모리 백엔드를 생성하는지 테스트"""
+        backend = create_rate_limit_backend(limit=10, window=60, backend="redis", redis_url=None)
+
+        assert isinstance(backend, InMemoryRateLimitBackend)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
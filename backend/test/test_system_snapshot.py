@@ -0,0 +1,150 @@
+"""시스템 상태/대시보드 스냅샷 테스트
+
+CPU 사용률을 기다림 없이 측정하는지, 최근 스냅샷은 다시 계산하지 않고 반환하는지,
+오래된 스냅샷은 반환하면서 백그라운드에서 다시 계산하는지(stale-while-revalidate),
+동시에 들어온 재계산 요청을 한 번으로 합치는지 테스트합니다.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.stats_models import StatsWatermark, SysLogDayStats, SysLogHourStats
+from app.models.system_models import SysLog
+from app.models.user_models import UserInfo
+from app.utils.system_snapshot import DASHBOARD, HEALTH, Snapshot, SystemSnapshotEngine
+
+TABLES = [SysLog, UserInfo, SysLogHourStats, SysLogDayStats, StatsWatermark]
+
+
+@pytest.fixture
+def session_factory():
+    """skybootcore 스키마를 제거한 SQLite 메모리 DB (오늘 시스템 로그 3건)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    ).execution_options(schema_translate_map={"skybootcore": None})
+    for model in TABLES:
+        model.__table__.create(engine)
+
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    session.add(UserInfo(user_id="user1", user_nm="사용자1", password="x"))
+    for index, process_se_code in enumerate(["SEL", "SEL", "ERROR"]):
+        session.add(SysLog(
+            requst_id=f"S{index:03d}", rqester_id="user1", occrrnc_de=datetime.now(),
+            trget_menu_nm="menu", process_se_code=process_se_code
+        ))
+    session.commit()
+    session.close()
+    yield factory
+    engine.dispose()
+
+
+def age_snapshot(engine, kind, seconds):
+    """저장된 스냅샷을 seconds초 전에 계산한 것으로 바꿈"""
+    snapshot = engine._snapshots[kind]
+    engine._snapshots[kind] = Snapshot(snapshot.payload, snapshot.taken_at, time.monotonic() - seconds)
+
+
+class TestSystemSnapshotEngine:
+    """스냅샷 엔진 테스트 클래스"""
+
+    def test_run_once_samples_without_blocking(self, session_factory):
+        """CPU 사용률을 interval=None으로 측정하고 두 스냅샷을 모두 계산하는지 테스트"""
+        engine = SystemSnapshotEngine(session_factory=session_factory)
+
+        with patch("app.utils.system_snapshot.psutil.cpu_percent", return_value=12.5) as cpu_percent:
+            results = engine.run_once()
+
+        cpu_percent.assert_called_with(interval=None)
+        assert set(results) == {HEALTH, DASHBOARD}
+        health = engine._snapshots[HEALTH].payload
+        assert health.cpu_usage == 12.5
+        assert health.database_status == "정상"
+        assert (health.log_count_today, health.error_count_today, health.active_users_today) == (3, 1, 1)
+        assert engine._snapshots[DASHBOARD].payload.total_users == 1
+        assert engine.get_stats()["builds"] == 2
+
+    def test_fresh_snapshot_is_reused(self, session_factory):
+        """나이가 stale_after 이하인 스냅샷은 다시 계산하지 않는지 테스트"""
+        engine = SystemSnapshotEngine(interval=15, session_factory=session_factory)
+
+        async def scenario():
+            first = await engine.get(DASHBOARD)
+            second = await engine.get(DASHBOARD)
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert second is first
+        assert engine.build_count == 1
+
+    def test_stale_snapshot_served_while_revalidating(self, session_factory):
+        """오래된 스냅샷은 그대로 반환하고 백그라운드에서 다시 계산하는지 테스트"""
+        engine = SystemSnapshotEngine(interval=15, max_age=300, session_factory=session_factory)
+        engine.build(HEALTH)
+        age_snapshot(engine, HEALTH, 60)
+        stale = engine._snapshots[HEALTH]
+
+        async def scenario():
+            served = await engine.get(HEALTH)
+            await engine._refreshing[HEALTH]
+            return served
+
+        served = asyncio.run(scenario())
+
+        assert served is stale
+        assert engine._snapshots[HEALTH] is not stale
+        assert engine._snapshots[HEALTH].age < 60
+        assert engine.stale_served_count == 1
+
+    def test_expired_snapshot_is_rebuilt(self, session_factory):
+        """max_age를 넘은 스냅샷은 반환하지 않고 다시 계산하는지 테스트"""
+        engine = SystemSnapshotEngine(interval=15, max_age=300, session_factory=session_factory)
+        engine.build(DASHBOARD)
+        age_snapshot(engine, DASHBOARD, 301)
+        expired = engine._snapshots[DASHBOARD]
+
+        served = asyncio.run(engine.get(DASHBOARD))
+
+        assert served is not expired
+        assert served.age < 300
+
+    def test_concurrent_refresh_builds_once(self, session_factory):
+        """스냅샷이 없을 때 동시에 들어온 요청은 한 번만 계산하는지 테스트"""
+        engine = SystemSnapshotEngine(interval=15, session_factory=session_factory)
+
+        async def scenario():
+            return await asyncio.gather(*(engine.get(DASHBOARD) for _ in range(5)))
+
+        snapshots = asyncio.run(scenario())
+
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert engine.build_count == 1
+
+    def test_failed_refresh_keeps_previous_snapshot(self, session_factory):
+        """계산이 실패하면 이전 스냅샷을 유지하고 실패를 기록하는지 테스트"""
+        engine = SystemSnapshotEngine(session_factory=session_factory)
+        engine.run_once()
+        previous = engine._snapshots[DASHBOARD]
+
+        with patch(
+            "app.utils.system_snapshot.SystemMonitoringService.get_dashboard_summary",
+            side_effect=RuntimeError("boom")
+        ):
+            results = engine.run_once()
+
+        assert results[DASHBOARD] == {"error": "boom"}
+        assert "taken_at" in results[HEALTH]
+        assert engine._snapshots[DASHBOARD] is previous
+        assert engine.get_stats()["failed"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
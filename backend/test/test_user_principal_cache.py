@@ -0,0 +1,79 @@
+"""인증 사용자 정보 캐시 테스트
+
+get_current_user_from_token이 활성 사용자 정보를 캐시하여 반복 요청 시
+사용자 테이블 조회를 생략하고, 사용자 변경 시 캐시가 무효화되는지 테스트합니다.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.services.auth_service import AuthorInfoService, user_principal_cache
+from app.services.user_service import UserInfoService
+from app.utils.jwt_utils import create_access_token
+
+
+def _make_db(emplyr_sttus_code: str = "1") -> Mock:
+    """사용자 조회 결과를 반환하는 모킹 세션 생성"""
+    row = SimpleNamespace(
+        emplyr_sttus_code=emplyr_sttus_code,
+        _mapping={
+            "user_id": "admin",
+            "email_adres": "admin@example.com",
+            "group_id": "GROUP_ADMIN",
+            "user_nm": "관리자",
+            "orgnzt_id": "ORG001",
+            "emplyr_sttus_code": emplyr_sttus_code
+        }
+    )
+    db = Mock(spec=Session)
+    db.query.return_value.filter.return_value.first.return_value = row
+    return db
+
+
+class TestUserPrincipalCache:
+    """인증 사용자 정보 캐시 테스트 클래스"""
+
+    def setup_method(self):
+        """테스트 메서드 실행 전 설정"""
+        user_principal_cache.clear()
+        self.service = AuthorInfoService()
+        self.token = create_access_token({"sub": "admin", "user_id": "admin"})
+
+    def test_repeated_calls_use_single_query(self):
+        """같은 사용자의 반복 요청은 한 번만 조회하는지 테스트"""
+        db = _make_db()
+
+        first = self.service.get_current_user_from_token(db, self.token)
+        second = self.service.get_current_user_from_token(db, self.token)
+
+        assert first["user_id"] == "admin"
+        assert second == first
+        assert db.query.call_count == 1
+
+    def test_inactive_user_is_not_cached(self):
+        """비활성 사용자는 거부되고 캐시되지 않는지 테스트"""
+        db = _make_db(emplyr_sttus_code="9")
+
+        assert self.service.get_current_user_from_token(db, self.token) is None
+        assert self.service.get_current_user_from_token(db, self.token) is None
+        assert db.query.call_count == 2
+
+    def test_lock_user_invalidates_cache(self):
+        """사용자 잠금 시 캐시가 무효화되는지 테스트"""
+        db = _make_db()
+        self.service.get_current_user_from_token(db, self.token)
+        assert user_principal_cache.get("admin") is not None
+
+        user = SimpleNamespace(user_id="admin", lock_cnt=None)
+        lock_db = Mock(spec=Session)
+        lock_db.query.return_value.filter.return_value.first.return_value = user
+        UserInfoService().lock_user(lock_db, "admin", "manager")
+
+        assert user_principal_cache.get("admin") is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])